@@ -5,9 +5,18 @@ for different providers (Gemini, Claude, Ollama), as well as agent
 node functions for the LangGraph state machine.
 """
 
+import hashlib
+import json
 import logging
+import os
 import re
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Literal
 
 from langchain_anthropic import ChatAnthropic
@@ -22,9 +31,11 @@ from langchain_core.runnables import Runnable
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_ollama import ChatOllama
 
+from cancellation import invoke_cancellable
 from config import get_config, load_user_settings
+from episodic_memory import recall_text, scene_query
+from metrics import LLM_REQUEST_SECONDS, LLM_TOKENS, TOOL_CALLS
 from models import (
-    AgentMemory,
     AgentSecrets,
     CallbackLog,
     CharacterConfig,
@@ -38,7 +49,9 @@ from models import (
     NarrativeElement,
     NarrativeElementStore,
     NpcProfile,
+    append_to_memory,
 )
+from provider_health import ProviderUnavailableError, get_provider_health
 from tools import (
     apply_character_sheet_update,
     dm_end_combat,
@@ -69,8 +82,11 @@ __all__ = [
     "LLMError",
     "MAX_CALLBACK_SUGGESTIONS",
     "MIN_CALLBACK_SCORE",
+    "MODULE_DISCOVERY_CACHE_DIR",
+    "MODULE_DISCOVERY_CACHE_TTL",
     "MODULE_DISCOVERY_MAX_RETRIES",
     "MODULE_DISCOVERY_PROMPT",
+    "MODULE_DISCOVERY_PROMPT_VERSION",
     "MODULE_DISCOVERY_RETRY_PROMPT",
     "PC_CONTEXT_RECENT_EVENTS_LIMIT",
     "PC_SHARED_CONTEXT_LIMIT",
@@ -92,10 +108,12 @@ __all__ = [
     "_parse_module_json",
     "build_pc_system_prompt",
     "categorize_error",
+    "clear_module_discovery_cache",
     "create_dm_agent",
     "create_pc_agent",
     "detect_network_error",
     "discover_modules",
+    "discover_modules_cached",
     "dm_turn",
     "format_all_secrets_context",
     "format_all_sheets_context",
@@ -107,6 +125,7 @@ __all__ = [
     "get_default_model",
     "get_llm",
     "pc_turn",
+    "prewarm_module_discovery",
     "score_callback_relevance",
 ]
 
@@ -877,6 +896,69 @@ def get_llm(provider: str, model: str, timeout: int | None = None) -> BaseChatMo
             raise ValueError(f"Unknown provider: {provider}")
 
 
+def _invoke_llm(
+    agent: Runnable,  # type: ignore[type-arg]
+    messages: list[BaseMessage],
+    *,
+    session_id: str,
+    provider: str,
+    model: str,
+    agent_name: str,
+) -> BaseMessage:
+    """Invoke an agent's chat model and record the call latency.
+
+    Token usage reported by the provider is added to the LLM token
+    counter, which the autopilot's adaptive pacing budgets against.
+    The call is aborted if the current round is cancelled (see
+    cancellation.invoke_cancellable). Its outcome feeds the provider's
+    circuit breaker, and while the breaker is open the call fails
+    immediately instead of waiting for another client timeout.
+
+    Args:
+        agent: Chat model (or tool-bound runnable) to invoke.
+        messages: Conversation to send.
+        session_id: Session ID for the metric label.
+        provider: LLM provider name for the metric label.
+        model: Model name for the metric label.
+        agent_name: Agent name ("dm" or a PC key) for the metric label.
+
+    Returns:
+        The model's response message.
+
+    Raises:
+        ProviderUnavailableError: If the provider's circuit breaker is open.
+        RoundCancelled: If the round is cancelled; the request is aborted.
+    """
+    health = get_provider_health()
+    if not health.allow_request(provider):
+        breaker = health.breaker(provider)
+        raise ProviderUnavailableError(
+            provider, breaker.last_error_type, breaker.retry_after
+        )
+    try:
+        with LLM_REQUEST_SECONDS.time(
+            session=session_id, provider=provider, model=model, agent=agent_name
+        ):
+            response = invoke_cancellable(agent, messages)
+    except Exception as e:
+        health.record_failure(provider, categorize_error(e))
+        raise
+    health.record_success(provider)
+    usage = getattr(response, "usage_metadata", None)
+    if isinstance(usage, dict):
+        for direction in ("input", "output"):
+            tokens = usage.get(f"{direction}_tokens") or 0
+            if tokens > 0:
+                LLM_TOKENS.inc(
+                    tokens,
+                    session=session_id,
+                    provider=provider,
+                    model=model,
+                    direction=direction,
+                )
+    return response
+
+
 def create_dm_agent(config: DMConfig) -> Runnable:  # type: ignore[type-arg]
     """Create a DM agent with tool bindings.
 
@@ -1486,10 +1568,12 @@ def _build_dm_context(state: GameState) -> str:
     """
     context_parts: list[str] = []
 
-    # Add DM's own long-term summary if available
+    # Add DM's long-term summary and relevant episodes if available
     dm_memory = state["agent_memories"].get("dm")
-    if dm_memory and dm_memory.long_term_summary:
-        context_parts.append(f"## Story So Far\n{dm_memory.long_term_summary}")
+    if dm_memory:
+        story = recall_text(dm_memory, scene_query(state.get("ground_truth_log", [])))
+        if story:
+            context_parts.append(f"## Story So Far\n{story}")
 
     # Add recent events from DM's short-term buffer
     if dm_memory and dm_memory.short_term_buffer:
@@ -1662,9 +1746,12 @@ def _build_pc_context(state: GameState, agent_name: str) -> str:
                 f"## Character Identity\n{format_character_facts(pc_memory.character_facts)}"
             )
 
-        # Add long-term summary if available
-        if pc_memory.long_term_summary:
-            context_parts.append(f"## What You Remember\n{pc_memory.long_term_summary}")
+        # Add long-term summary and relevant episodes if available
+        remembered = recall_text(
+            pc_memory, scene_query(state.get("ground_truth_log", []))
+        )
+        if remembered:
+            context_parts.append(f"## What You Remember\n{remembered}")
 
     # Add PC's own character sheet (Story 8.3 - FR62: PC sees only own sheet)
     # Find this PC's character sheet by matching character name
@@ -1712,9 +1799,11 @@ def _build_pc_turn_prompt(state: GameState, character_name: str) -> str:
 
     # Find the last DM entry
     last_dm_line = ""
-    for entry in reversed(ground_truth_log):
+    last_dm_index = 0
+    for offset, entry in enumerate(reversed(ground_truth_log), start=1):
         if entry.startswith("[DM]:"):
             last_dm_line = entry[len("[DM]:") :].strip()
+            last_dm_index = len(ground_truth_log) - offset
             break
 
     if not last_dm_line:
@@ -1734,10 +1823,11 @@ def _build_pc_turn_prompt(state: GameState, character_name: str) -> str:
         else:
             excerpt = truncated + "..."
 
-    # Collect what other PCs said this round (after the last DM entry)
+    # Collect what other PCs said this round (after the last DM entry).
+    # Scanning from the last DM entry keeps older log segments paged out.
     other_pc_actions: list[str] = []
     found_dm = False
-    for entry in ground_truth_log:
+    for entry in ground_truth_log[last_dm_index:]:
         if (
             entry.startswith("[DM]:")
             and entry[len("[DM]:") :].strip() == last_dm_line[: len(entry) - 5]
@@ -1753,15 +1843,22 @@ def _build_pc_turn_prompt(state: GameState, character_name: str) -> str:
                 if name != character_name and name not in ("DM", "SHEET"):
                     other_pc_actions.append(name)
 
-    # Build "previously on..." context from the character's long-term summary
+    # Build "previously on..." context from the character's latest episode
+    # (or the long-term summary carried over from an earlier session)
     agent_memories = state.get("agent_memories", {})
     # Normalize character name to agent key (lowercase, no spaces)
     agent_key = character_name.lower().replace(" ", "_")
     pc_memory = agent_memories.get(agent_key)
     previously_on = ""
-    if pc_memory and pc_memory.long_term_summary:
+    latest = ""
+    if pc_memory:
+        if pc_memory.episodes:
+            latest = pc_memory.episodes[-1].summary
+        else:
+            latest = pc_memory.long_term_summary
+    if latest:
         # Extract just the first 2 sentences for a brief recap
-        summary = pc_memory.long_term_summary.strip()
+        summary = latest.strip()
         sentences = summary.replace(".\n", ". ").split(". ")
         recap = ". ".join(sentences[:2]).strip()
         if recap and not recap.endswith("."):
@@ -2325,9 +2422,15 @@ def dm_turn(state: GameState) -> GameState:
             dm_config.model,
             _context_chars,
         )
+        llm_labels = {
+            "session_id": state.get("session_id", ""),
+            "provider": dm_config.provider,
+            "model": dm_config.model,
+            "agent_name": "dm",
+        }
         for _iter in range(max_tool_iterations):
             _call_start = _time.time()
-            response = dm_agent.invoke(messages)
+            response = _invoke_llm(dm_agent, messages, **llm_labels)
             logger.info(
                 "DM LLM call returned in %.1fs (iteration %d)",
                 _time.time() - _call_start,
@@ -2343,6 +2446,9 @@ def dm_turn(state: GameState) -> GameState:
             messages.append(response)  # Add AI message with tool calls
             for tool_call in tool_calls:
                 tool_name = tool_call.get("name", "")
+                TOOL_CALLS.inc(
+                    session=state.get("session_id", ""), agent="dm", tool=tool_name
+                )
                 tool_args = tool_call.get("args", {})
                 tool_id = tool_call.get("id", "")
 
@@ -2481,7 +2587,7 @@ def dm_turn(state: GameState) -> GameState:
             messages.append(HumanMessage(content=nudge))
 
             # Retry the invocation
-            response = dm_agent.invoke(messages)
+            response = _invoke_llm(dm_agent, messages, **llm_labels)
             response_content = _extract_response_text(response)
 
         # If still empty after retries, generate a fallback response
@@ -2539,17 +2645,13 @@ def dm_turn(state: GameState) -> GameState:
         new_log.append(f"[SHEET]: {notification}")
     new_log.append(f"[DM]: {response_content}")
 
-    # Update DM's memory
-    new_memories = {k: v.model_copy() for k, v in state["agent_memories"].items()}
-    dm_memory = new_memories.get("dm")
-    if dm_memory is None:
-        dm_memory = AgentMemory(token_limit=dm_config.token_limit)
-        new_memories["dm"] = dm_memory
-
-    # Append to short-term buffer
-    new_buffer = dm_memory.short_term_buffer.copy()
-    new_buffer.append(f"[DM]: {response_content}")
-    new_memories["dm"] = dm_memory.model_copy(update={"short_term_buffer": new_buffer})
+    # Update DM's memory (other agents' memories are shared, not copied)
+    new_memories = append_to_memory(
+        state["agent_memories"],
+        "dm",
+        f"[DM]: {response_content}",
+        token_limit=dm_config.token_limit,
+    )
 
     # Extract narrative elements from DM response (Story 11.1, 11.2, 11.4)
     turn_number = len(new_log)
@@ -3275,9 +3377,15 @@ def pc_turn(state: GameState, agent_name: str) -> GameState:
             character_config.model,
             _context_chars,
         )
+        llm_labels = {
+            "session_id": state.get("session_id", ""),
+            "provider": character_config.provider,
+            "model": character_config.model,
+            "agent_name": agent_name,
+        }
         for _iter in range(max_tool_iterations):
             _call_start = _time.time()
-            response = pc_agent.invoke(messages)
+            response = _invoke_llm(pc_agent, messages, **llm_labels)
             logger.info(
                 "PC [%s] LLM call returned in %.1fs (iteration %d)",
                 agent_name,
@@ -3294,6 +3402,11 @@ def pc_turn(state: GameState, agent_name: str) -> GameState:
             messages.append(response)  # Add AI message with tool calls
             for tool_call in tool_calls:
                 tool_name = tool_call.get("name", "")
+                TOOL_CALLS.inc(
+                    session=state.get("session_id", ""),
+                    agent=agent_name,
+                    tool=tool_name,
+                )
                 tool_args = tool_call.get("args", {})
                 tool_id = tool_call.get("id", "")
 
@@ -3342,7 +3455,7 @@ def pc_turn(state: GameState, agent_name: str) -> GameState:
             messages.append(HumanMessage(content=nudge))
 
             # Retry the invocation
-            response = pc_agent.invoke(messages)
+            response = _invoke_llm(pc_agent, messages, **llm_labels)
             response_content = _extract_response_text(response)
 
         # If still empty after retries, generate a fallback response
@@ -3404,18 +3517,12 @@ def pc_turn(state: GameState, agent_name: str) -> GameState:
     new_log = state["ground_truth_log"].copy()
     new_log.append(f"[{character_config.name}]: {response_content}")
 
-    # Update PC's memory
-    new_memories = {k: v.model_copy() for k, v in state["agent_memories"].items()}
-    pc_memory = new_memories.get(agent_name)
-    if pc_memory is None:
-        pc_memory = AgentMemory(token_limit=character_config.token_limit)
-        new_memories[agent_name] = pc_memory
-
-    # Append to short-term buffer
-    new_buffer = pc_memory.short_term_buffer.copy()
-    new_buffer.append(f"[{character_config.name}]: {response_content}")
-    new_memories[agent_name] = pc_memory.model_copy(
-        update={"short_term_buffer": new_buffer}
+    # Update PC's memory (other agents' memories are shared, not copied)
+    new_memories = append_to_memory(
+        state["agent_memories"],
+        agent_name,
+        f"[{character_config.name}]: {response_content}",
+        token_limit=character_config.token_limit,
     )
 
     # Extract narrative elements from PC response (Story 11.1, 11.2, 11.4)
@@ -3707,3 +3814,265 @@ def discover_modules(dm_config: DMConfig) -> "ModuleDiscoveryResult":
         timestamp=datetime.now(UTC).isoformat().replace("+00:00", "Z"),
         retry_count=retry_count,
     )
+
+
+# =============================================================================
+# Module Discovery Cache
+# =============================================================================
+
+# Discovery answers depend only on (provider, model, prompt), so they are
+# cached on disk and survive restarts. Slow local models take 5-15 minutes
+# per discovery; a new adventure should not wait on that every time.
+MODULE_DISCOVERY_CACHE_DIR = Path(__file__).parent / ".cache" / "module_discovery"
+
+# Entries older than this are still served, but trigger a background refresh
+MODULE_DISCOVERY_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Changes whenever a discovery prompt is edited, so stale answers are not reused
+MODULE_DISCOVERY_PROMPT_VERSION = hashlib.sha256(
+    (MODULE_DISCOVERY_PROMPT + MODULE_DISCOVERY_RETRY_PROMPT).encode("utf-8")
+).hexdigest()[:12]
+
+# In-memory layer over the disk cache: key -> (cached_at epoch, result)
+_module_discovery_cache: dict[
+    tuple[str, str, str], tuple[float, ModuleDiscoveryResult]
+] = {}
+# Discoveries currently running, so concurrent callers share one LLM call
+_module_discovery_inflight: dict[
+    tuple[str, str, str], "Future[ModuleDiscoveryResult]"
+] = {}
+_module_discovery_lock = threading.Lock()
+
+
+def _module_discovery_cache_key(dm_config: DMConfig) -> tuple[str, str, str]:
+    """Build the cache key for a DM config's discovery result."""
+    return (
+        dm_config.provider.lower(),
+        dm_config.model,
+        MODULE_DISCOVERY_PROMPT_VERSION,
+    )
+
+
+def _module_discovery_cache_path(key: tuple[str, str, str]) -> Path:
+    """Get the cache file path for a key.
+
+    Model names may contain characters that are unsafe in file names
+    (e.g., "qwen3:27b", "org/model"), so the file is named by a hash.
+    """
+    digest = hashlib.sha256("\0".join(key).encode("utf-8")).hexdigest()[:32]
+    return MODULE_DISCOVERY_CACHE_DIR / f"{digest}.json"
+
+
+def _load_cached_module_discovery(
+    key: tuple[str, str, str],
+) -> tuple[float, ModuleDiscoveryResult] | None:
+    """Load a cached discovery result from memory, falling back to disk.
+
+    Unreadable or malformed cache files are treated as a miss.
+
+    Args:
+        key: Cache key from _module_discovery_cache_key().
+
+    Returns:
+        Tuple of (cached_at epoch seconds, result), or None on a miss.
+    """
+    with _module_discovery_lock:
+        entry = _module_discovery_cache.get(key)
+    if entry is not None:
+        return entry
+
+    path = _module_discovery_cache_path(key)
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("key") != list(key):
+            return None
+        entry = (
+            float(data["cached_at"]),
+            ModuleDiscoveryResult.model_validate(data["result"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Ignoring unreadable module discovery cache %s: %s", path, e)
+        return None
+
+    with _module_discovery_lock:
+        _module_discovery_cache[key] = entry
+    return entry
+
+
+def _store_module_discovery(
+    key: tuple[str, str, str], result: ModuleDiscoveryResult
+) -> None:
+    """Store a discovery result in memory and atomically on disk.
+
+    Disk write failures are logged and otherwise ignored: the in-memory
+    entry still serves this process.
+
+    Args:
+        key: Cache key from _module_discovery_cache_key().
+        result: Discovery result to cache.
+    """
+    cached_at = time.time()
+    with _module_discovery_lock:
+        _module_discovery_cache[key] = (cached_at, result)
+
+    path = _module_discovery_cache_path(key)
+    payload = json.dumps(
+        {"key": list(key), "cached_at": cached_at, "result": result.model_dump()},
+        indent=2,
+    )
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=".discovery_", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            Path(temp_path).replace(path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        logger.warning("Failed to write module discovery cache %s: %s", path, e)
+
+
+def _run_module_discovery(dm_config: DMConfig) -> ModuleDiscoveryResult:
+    """Run discover_modules() once per key, sharing the result with waiters.
+
+    If a discovery for the same key is already running (e.g. the startup
+    prewarm), this waits for it instead of issuing a second LLM call.
+    Non-empty results are written to the cache.
+
+    Args:
+        dm_config: DM configuration with provider and model settings.
+
+    Returns:
+        Fresh ModuleDiscoveryResult.
+
+    Raises:
+        LLMError: If the LLM API call fails after retries.
+    """
+    key = _module_discovery_cache_key(dm_config)
+    with _module_discovery_lock:
+        future = _module_discovery_inflight.get(key)
+        is_owner = future is None
+        if future is None:
+            future = Future()
+            _module_discovery_inflight[key] = future
+    if not is_owner:
+        return future.result()
+
+    try:
+        result = discover_modules(dm_config)
+        if result.modules:
+            _store_module_discovery(key, result)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _module_discovery_lock:
+            _module_discovery_inflight.pop(key, None)
+
+
+def _refresh_module_discovery_in_background(dm_config: DMConfig) -> bool:
+    """Start a background discovery for a DM config unless one is running.
+
+    Uses a daemon thread so a slow refresh never delays shutdown.
+
+    Args:
+        dm_config: DM configuration with provider and model settings.
+
+    Returns:
+        True if a refresh was started, False if one was already running.
+    """
+    key = _module_discovery_cache_key(dm_config)
+    with _module_discovery_lock:
+        if key in _module_discovery_inflight:
+            return False
+
+    def _refresh() -> None:
+        try:
+            _run_module_discovery(dm_config)
+        except Exception as e:
+            logger.warning(
+                "Background module discovery failed for %s/%s: %s",
+                dm_config.provider,
+                dm_config.model,
+                e,
+            )
+
+    threading.Thread(
+        target=_refresh, name=f"module-discovery-{key[0]}", daemon=True
+    ).start()
+    return True
+
+
+def discover_modules_cached(
+    dm_config: DMConfig, force_refresh: bool = False
+) -> ModuleDiscoveryResult:
+    """Return module discovery results, served from cache when available.
+
+    Stale-while-revalidate: a cached result is returned immediately, and
+    if it is older than MODULE_DISCOVERY_CACHE_TTL a background refresh
+    is started for the next caller. On a miss (or force_refresh) the
+    discovery runs synchronously and its result is cached.
+
+    Args:
+        dm_config: DM configuration with provider and model settings.
+        force_refresh: Skip the cache and query the LLM.
+
+    Returns:
+        ModuleDiscoveryResult; ``cached`` is True when served from cache.
+
+    Raises:
+        LLMError: If a synchronous discovery fails after retries.
+    """
+    if not force_refresh:
+        entry = _load_cached_module_discovery(_module_discovery_cache_key(dm_config))
+        if entry is not None:
+            cached_at, result = entry
+            if time.time() - cached_at > MODULE_DISCOVERY_CACHE_TTL:
+                _refresh_module_discovery_in_background(dm_config)
+            return result.model_copy(update={"cached": True})
+
+    return _run_module_discovery(dm_config)
+
+
+def prewarm_module_discovery(dm_configs: Iterable[DMConfig]) -> int:
+    """Start background discoveries for configs with missing or stale entries.
+
+    Called at server startup so the first "new adventure" is served from
+    cache. Returns immediately; failures are logged by the worker.
+
+    Args:
+        dm_configs: DM configurations to warm (duplicates are ignored).
+
+    Returns:
+        Number of background refreshes started.
+    """
+    started = 0
+    seen: set[tuple[str, str, str]] = set()
+    for dm_config in dm_configs:
+        key = _module_discovery_cache_key(dm_config)
+        if key in seen:
+            continue
+        seen.add(key)
+        entry = _load_cached_module_discovery(key)
+        if entry is not None and time.time() - entry[0] <= MODULE_DISCOVERY_CACHE_TTL:
+            continue
+        if _refresh_module_discovery_in_background(dm_config):
+            started += 1
+    return started
+
+
+def clear_module_discovery_cache() -> None:
+    """Clear the in-memory module discovery cache.
+
+    The on-disk cache is left in place; entries are reloaded on next use.
+    """
+    with _module_discovery_lock:
+        _module_discovery_cache.clear()
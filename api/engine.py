@@ -11,10 +11,26 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from typing import Any
 
-from models import GameState, UserError, create_user_error
+from api.pacing import AutopilotPacer
+from cancellation import CancellationToken, RoundCancelled
+from metrics import (
+    AUTOPILOT_RETRY_WAIT_SECONDS,
+    AUTOPILOT_STALLS,
+    LLM_TOKENS,
+    WS_BROADCAST_LAG_SECONDS,
+)
+from models import (
+    AgentSecrets,
+    GameState,
+    UserError,
+    create_user_error,
+    create_whisper,
+)
+from provider_health import get_provider_health
 
 logger = logging.getLogger("autodungeon.engine")
 
@@ -36,12 +52,13 @@ class GameEngine:
         "slow": 3.0,
         "normal": 1.0,
         "fast": 0.2,
+        "adaptive": 0.2,  # Floor; AutopilotPacer adds to it
     }
     MAX_RETRY_ATTEMPTS: int = 3
     DEFAULT_MAX_TURNS: int = 100
     MAX_ACTION_LENGTH: int = 2000
     MAX_NUDGE_LENGTH: int = 1000
-    VALID_SPEEDS: frozenset[str] = frozenset({"slow", "normal", "fast"})
+    VALID_SPEEDS: frozenset[str] = frozenset({"slow", "normal", "fast", "adaptive"})
     ROUND_TIMEOUT: int = (
         18000  # 5 hours max per round (Qwen thinking-mode agents can run 30+ min each)
     )
@@ -70,11 +87,19 @@ class GameEngine:
         self._human_active: bool = False
         self._controlled_character: str | None = None
         self._pending_nudge: str | None = None
+        # Input submitted while a round runs, applied when the next starts
+        self._pending_whisper: str | None = None
+        self._pending_action: str | None = None
         self._last_error: UserError | None = None
         self._retry_count: int = 0
         self._turn_count: int = 0
         self._max_turns: int = self.DEFAULT_MAX_TURNS
         self._is_generating: bool = False
+        self._cancel_token: CancellationToken | None = None
+        self._pacer: AutopilotPacer | None = None
+        self._providers_cache: (
+            tuple[object, object, frozenset[str], frozenset[str]] | None
+        ) = None
         self._broadcast_callback: Callable[[dict[str, Any]], Awaitable[None]] | None = (
             None
         )
@@ -195,13 +220,35 @@ class GameEngine:
             {"type": "session_state", "state": self._get_state_snapshot()}
         )
 
+    def adopt_state(self, state: GameState) -> None:
+        """Run from a game state loaded by the caller.
+
+        For front-ends that hold the session's state themselves (the
+        Streamlit app) instead of having start_session() load it. Human
+        control is synced from the state.
+
+        Args:
+            state: The game state the next round starts from.
+
+        Raises:
+            RuntimeError: If a turn is in progress.
+        """
+        if self._is_generating:
+            raise RuntimeError("Cannot replace state while a turn is in progress.")
+        self._state = state
+        self._human_active = bool(state.get("human_active", False))
+        self._controlled_character = state.get("controlled_character")
+
     async def stop_session(self) -> None:
         """Stop the game session.
 
-        Stops autopilot if running, saves a checkpoint, and clears state.
+        Stops autopilot if running, cancels any other round in progress,
+        saves a checkpoint, and clears state.
         """
         if self.is_running:
             await self.stop_autopilot()
+        if self._cancel_token is not None:
+            self._cancel_token.cancel("stopped")
 
         if self._state is not None:
             from persistence import save_checkpoint
@@ -218,6 +265,8 @@ class GameEngine:
         self._human_active = False
         self._controlled_character = None
         self._pending_nudge = None
+        self._pending_whisper = None
+        self._pending_action = None
         self._last_error = None
         self._retry_count = 0
         self._turn_count = 0
@@ -257,17 +306,21 @@ class GameEngine:
         if self._state is None:
             raise RuntimeError("No game state loaded.")
 
+        cancel_token = CancellationToken()
+        self._cancel_token = cancel_token
         self._is_generating = True
         try:
-            # Pre-flight: check Ollama health if any PC uses it
-            ollama_err = await self._check_ollama_health()
-            if ollama_err is not None:
-                await self._broadcast(ollama_err)
-                return ollama_err
-
-            # Inject pending nudge into state before running turn
-            if self._pending_nudge is not None:
-                self._state["pending_nudge"] = self._pending_nudge  # type: ignore[literal-required]
+            # Pre-flight: skip the round if a provider's circuit is open
+            health_err = await self._check_provider_health()
+            if health_err is not None:
+                await self._broadcast(health_err)
+                return health_err
+
+            # Inject input submitted since the last round into state
+            injected_nudge = self._pending_nudge
+            if injected_nudge is not None:
+                self._state["pending_nudge"] = injected_nudge  # type: ignore[literal-required]
+            self._apply_pending_input(self._state)
 
             # Record log length before the round so we can compute the
             # delta (new entries) to send to the frontend.
@@ -282,6 +335,10 @@ class GameEngine:
 
             def _on_node_complete(chunk_state: dict[str, Any]) -> None:
                 nonlocal streamed_log_len
+                # A cancelled round must not publish state or write
+                # checkpoints after the engine has moved on.
+                if cancel_token.cancelled:
+                    return
                 # Publish the partial state to the engine so concurrent reads
                 # (e.g. image-generation requests during a round) see the
                 # latest log. Reference-replacement is GIL-atomic.
@@ -331,19 +388,41 @@ class GameEngine:
                         "message_count": len(chunk_log),
                     },
                 }
-                asyncio.run_coroutine_threadsafe(self._broadcast(event), loop)
+                asyncio.run_coroutine_threadsafe(
+                    self._broadcast(event, queued_at=time.monotonic()), loop
+                )
 
             # Run the synchronous graph in a thread with a hard timeout.
-            # If a round exceeds ROUND_TIMEOUT (e.g. Ollama hangs), we
-            # bail out instead of blocking forever. The orphaned thread
-            # will eventually self-terminate at the LLM client's own
-            # timeout (ChatOllama default 300s).
+            # If a round exceeds ROUND_TIMEOUT (e.g. Ollama hangs), or this
+            # task is cancelled (stop_autopilot, stop_session), the token
+            # aborts the in-flight LLM request and the thread unwinds
+            # without further state updates or checkpoint writes.
             try:
                 result = await asyncio.wait_for(
-                    asyncio.to_thread(run_single_round, self._state, _on_node_complete),
+                    asyncio.to_thread(
+                        run_single_round,
+                        self._state,
+                        _on_node_complete,
+                        cancel_token,
+                    ),
                     timeout=self.ROUND_TIMEOUT,
                 )
+            except asyncio.CancelledError:
+                cancel_token.cancel("stopped")
+                raise
+            except RoundCancelled:
+                logger.info(
+                    "Round cancelled (session=%s, reason=%s)",
+                    self._session_id,
+                    cancel_token.reason,
+                )
+                return {
+                    "type": "error",
+                    "message": "Round cancelled.",
+                    "recoverable": True,
+                }
             except asyncio.TimeoutError:
+                cancel_token.cancel("timeout")
                 logger.error(
                     "Round timed out after %ds (session=%s)",
                     self.ROUND_TIMEOUT,
@@ -389,8 +468,9 @@ class GameEngine:
             }
             self._state = clean_result  # type: ignore[assignment]
 
-            # Clear consumed nudge
-            self._pending_nudge = None
+            # Clear consumed nudge, unless a new one arrived during the round
+            if self._pending_nudge is injected_nudge:
+                self._pending_nudge = None
 
             # Clear error on success
             self._last_error = None
@@ -437,6 +517,7 @@ class GameEngine:
             return error_event
         finally:
             self._is_generating = False
+            self._cancel_token = None
 
     async def retry_turn(self) -> dict[str, Any]:
         """Retry a failed turn.
@@ -466,11 +547,16 @@ class GameEngine:
     # Autopilot
     # -------------------------------------------------------------------------
 
-    async def start_autopilot(self, speed: str = "normal") -> None:
+    async def start_autopilot(
+        self, speed: str = "normal", max_turns: int | None = None
+    ) -> None:
         """Start autopilot as an asyncio background task.
 
         Args:
-            speed: Autopilot speed ("slow", "normal", or "fast").
+            speed: Autopilot speed ("slow", "normal", "fast", or
+                "adaptive" to pace rounds with AutopilotPacer).
+            max_turns: Rounds to run before stopping, if not the
+                current limit (DEFAULT_MAX_TURNS unless changed).
 
         Raises:
             RuntimeError: If no state loaded or autopilot already running.
@@ -490,14 +576,17 @@ class GameEngine:
         self._speed = speed
         self._is_paused = False
         self._turn_count = 0
+        if max_turns is not None:
+            self._max_turns = max_turns
         self._task = asyncio.create_task(self._autopilot_loop())
 
         await self._broadcast({"type": "autopilot_started"})
 
     async def stop_autopilot(self, _reason: str = "user_request") -> None:
-        """Stop the autopilot background task gracefully.
+        """Stop the autopilot background task.
 
-        Waits for the current turn to complete before stopping.
+        A round in progress is cancelled: its LLM request is aborted and
+        it publishes no further state or checkpoints.
 
         Args:
             _reason: Internal stop reason for broadcast event. Callers
@@ -523,7 +612,9 @@ class GameEngine:
         Respects pause flag, speed delay, turn limit, and error conditions.
         Retries on recoverable errors with exponential backoff before stopping.
         Broadcasts heartbeat events during backoff so monitors can distinguish
-        "backing off" from "stalled".
+        "backing off" from "stalled". Each round's time, token use and rate
+        limits are reported to the pacer, and an autopilot_pacing event with
+        the next delay and projected completion follows every round.
         """
         import sys
         import time as _time
@@ -551,6 +642,7 @@ class GameEngine:
 
                 # Execute a turn
                 turn_start = _time.time()
+                tokens_before = LLM_TOKENS.total(session=self._session_id)
                 print(
                     f"[{_time.strftime('%H:%M:%S')}] autopilot: "
                     f"executing turn (count={self._turn_count}, "
@@ -566,6 +658,12 @@ class GameEngine:
                 if result.get("type") == "error":
                     consecutive_errors += 1
                     error_msg = result.get("message", "unknown")
+                    error_type = getattr(self._last_error, "error_type", "unknown")
+                    AUTOPILOT_STALLS.inc(
+                        session=self._session_id, error_type=error_type
+                    )
+                    if error_type == "rate_limit":
+                        self._get_pacer().record_rate_limit()
                     print(
                         f"[{_time.strftime('%H:%M:%S')}] autopilot: "
                         f"error {consecutive_errors}/{max_consecutive_errors} "
@@ -586,6 +684,9 @@ class GameEngine:
                         break
                     # Exponential backoff: 10s, 20s, 40s...
                     backoff = 10 * (2 ** (consecutive_errors - 1))
+                    AUTOPILOT_RETRY_WAIT_SECONDS.inc(
+                        backoff, session=self._session_id, error_type=error_type
+                    )
                     logger.warning(
                         "Autopilot error %d/%d, retrying in %ds: %s",
                         consecutive_errors,
@@ -632,8 +733,20 @@ class GameEngine:
                     flush=True,
                 )
 
+                pacer = self._get_pacer()
+                pacer.record_round(
+                    elapsed, LLM_TOKENS.total(session=self._session_id) - tokens_before
+                )
+                delay = self._get_turn_delay()
+                await self._broadcast(
+                    {
+                        "type": "autopilot_pacing",
+                        **pacer.snapshot(self._max_turns - self._turn_count, delay),
+                    }
+                )
+
                 # Wait for speed delay
-                await asyncio.sleep(self._get_turn_delay())
+                await self._sleep_between_rounds(delay)
 
         except asyncio.CancelledError:
             print(
@@ -670,7 +783,7 @@ class GameEngine:
         """Change autopilot speed without interrupting execution.
 
         Args:
-            speed: New speed setting ("slow", "normal", or "fast").
+            speed: New speed setting ("slow", "normal", "fast", or "adaptive").
 
         Raises:
             ValueError: If speed is invalid.
@@ -752,18 +865,33 @@ class GameEngine:
         if not self._human_active:
             raise RuntimeError("Human control is not active. Call drop_in() first.")
 
-        # Sanitize
-        sanitized = action.strip()[: self.MAX_ACTION_LENGTH]
-        if not sanitized:
-            raise ValueError("Action text cannot be empty.")
-
-        # Store in GameState for human_intervention_node to pick up
-        self._state["human_pending_action"] = sanitized  # type: ignore[literal-required]
+        self.queue_human_action(action)
 
         # Run a turn to process the action
         result = await self.run_turn()
         return result
 
+    def queue_human_action(self, action: str) -> None:
+        """Queue a human action for the next round without starting one.
+
+        For front-ends that start rounds themselves (the Streamlit app).
+        While a round runs the action is held and stored in GameState,
+        for human_intervention_node to pick up, when the next round starts.
+
+        Args:
+            action: The human player's action text.
+
+        Raises:
+            ValueError: If action text is empty after sanitization.
+        """
+        sanitized = action.strip()[: self.MAX_ACTION_LENGTH]
+        if not sanitized:
+            raise ValueError("Action text cannot be empty.")
+
+        self._pending_action = sanitized
+        if self._state is not None and not self._is_generating:
+            self._apply_pending_input(self._state)
+
     def submit_nudge(self, nudge: str) -> None:
         """Submit a nudge suggestion for the DM's next turn.
 
@@ -779,7 +907,9 @@ class GameEngine:
 
         self._pending_nudge = sanitized
 
-        if self._state is not None:
+        # A running round's state is replaced when it ends; run_turn()
+        # injects the nudge into the next round instead
+        if self._state is not None and not self._is_generating:
             self._state["pending_nudge"] = sanitized  # type: ignore[literal-required]
 
     MAX_WHISPER_LENGTH: int = 2000
@@ -788,8 +918,9 @@ class GameEngine:
         """Submit a private whisper from the human to the DM.
 
         Stores the whisper in the game state's ``pending_human_whisper``
-        field, which the DM agent reads on the next turn (mirroring the
-        Streamlit implementation in app.py).
+        field, which the DM agent reads on the next turn, and in the DM's
+        whisper history (mirroring the Streamlit implementation in app.py).
+        While a round runs the whisper is held until the next one starts.
 
         Args:
             content: The whisper text from the human player.
@@ -801,8 +932,35 @@ class GameEngine:
         if not sanitized:
             raise ValueError("Whisper text cannot be empty.")
 
-        if self._state is not None:
-            self._state["pending_human_whisper"] = sanitized  # type: ignore[literal-required]
+        self._pending_whisper = sanitized
+        if self._state is not None and not self._is_generating:
+            self._apply_pending_input(self._state)
+
+    def _apply_pending_input(self, state: GameState) -> None:
+        """Move a held whisper and human action into the game state.
+
+        Args:
+            state: State the next round starts from.
+        """
+        if self._pending_action is not None:
+            state["human_pending_action"] = self._pending_action  # type: ignore[literal-required]
+            self._pending_action = None
+
+        if self._pending_whisper is not None:
+            content, self._pending_whisper = self._pending_whisper, None
+            state["pending_human_whisper"] = content  # type: ignore[literal-required]
+            whisper = create_whisper(
+                from_agent="human",
+                to_agent="dm",
+                content=content,
+                turn_created=len(state.get("ground_truth_log", [])),
+            )
+            agent_secrets = dict(state.get("agent_secrets", {}))
+            dm_secrets = agent_secrets.get("dm", AgentSecrets())
+            agent_secrets["dm"] = dm_secrets.model_copy(
+                update={"whispers": [*dm_secrets.whispers, whisper]}
+            )
+            state["agent_secrets"] = agent_secrets
 
     # -------------------------------------------------------------------------
     # Broadcast Callback
@@ -824,20 +982,32 @@ class GameEngine:
         """
         self._broadcast_callback = callback
 
-    async def _broadcast(self, event: dict[str, Any]) -> None:
+    async def _broadcast(
+        self, event: dict[str, Any], queued_at: float | None = None
+    ) -> None:
         """Invoke the registered broadcast callback with an event.
 
         Catches and logs any exceptions from the callback to prevent
-        callback errors from disrupting engine operation.
+        callback errors from disrupting engine operation. Records the
+        broadcast lag metric: time from queued_at (or the call) until the
+        callback returns.
 
         Args:
             event: Event dict to broadcast.
+            queued_at: time.monotonic() when the event was produced, for
+                events scheduled from the graph thread.
         """
         if self._broadcast_callback is not None:
+            start = time.monotonic() if queued_at is None else queued_at
             try:
                 await self._broadcast_callback(event)
             except Exception:
                 logger.exception("Broadcast callback error")
+            WS_BROADCAST_LAG_SECONDS.observe(
+                time.monotonic() - start,
+                session=self._session_id,
+                event=str(event.get("type", "")),
+            )
 
     # -------------------------------------------------------------------------
     # Helpers
@@ -939,93 +1109,144 @@ class GameEngine:
         return result
 
     OLLAMA_MIN_DELAY: float = 3.0  # Minimum delay between rounds for Ollama
-    OLLAMA_HEALTH_TIMEOUT: float = 5.0  # Seconds to wait for Ollama ping
 
-    async def _check_ollama_health(self) -> dict[str, Any] | None:
-        """Ping the Ollama server before starting a round.
+    def _session_providers(self) -> tuple[frozenset[str], frozenset[str]]:
+        """Get the LLM providers this session's agents use.
 
-        If any PC uses Ollama, sends a lightweight request to the Ollama
-        API to verify it's reachable. Fails fast instead of wasting
-        minutes on a doomed round.
+        Cached against the characters and DM config objects, which are
+        carried unchanged from round to round, so the party is rescanned
+        only when it actually changes. New providers are registered with
+        the shared health monitor.
 
         Returns:
-            None if healthy (or no Ollama PCs), error event dict otherwise.
+            (PC providers, all providers including the DM's).
         """
         if self._state is None:
+            return frozenset(), frozenset()
+        characters = self._state.get("characters", {})
+        dm_config = self._state.get("dm_config")
+        cached = self._providers_cache
+        if cached is not None and cached[0] is characters and cached[1] is dm_config:
+            return cached[2], cached[3]
+
+        pc_providers = frozenset(
+            str(getattr(char, "provider", "")).lower()
+            for name, char in characters.items()
+            if name != "dm" and getattr(char, "provider", "")
+        )
+        all_providers = pc_providers
+        dm_provider = str(getattr(dm_config, "provider", "") or "").lower()
+        if dm_provider:
+            all_providers = pc_providers | {dm_provider}
+        get_provider_health().watch(all_providers)
+        self._providers_cache = (characters, dm_config, pc_providers, all_providers)
+        return pc_providers, all_providers
+
+    async def _check_provider_health(self) -> dict[str, Any] | None:
+        """Check cached provider health before starting a round.
+
+        Consults the shared circuit breakers for every provider the
+        session uses, failing fast instead of wasting minutes on a doomed
+        round. No request is made here: breakers are fed by real call
+        outcomes and by the API's background health probes.
+
+        Returns:
+            None if all providers are available, error event dict otherwise.
+        """
+        _, providers = self._session_providers()
+        if not providers:
             return None
 
-        # Find Ollama base URL from any PC character
-        ollama_url: str | None = None
-        characters = self._state.get("characters", {})
-        for name, char in characters.items():
-            if name == "dm":
-                continue
-            provider = (
-                getattr(char, "provider", "").lower()
-                if hasattr(char, "provider")
-                else ""
-            )
-            if provider == "ollama":
-                # Resolve base URL same way as get_llm
-                from agents import _get_effective_api_key
-                from config import get_config
+        health = get_provider_health()
+        provider = health.first_unavailable(providers)
+        if provider is None:
+            return None
 
-                config = get_config()
-                ollama_url = _get_effective_api_key("ollama") or config.ollama_base_url
-                break
+        breaker = health.breaker(provider)
+        logger.error(
+            "Skipping round: %s circuit open (%s), retry in %.0fs",
+            provider,
+            breaker.last_error_type,
+            breaker.retry_after,
+        )
+        error = create_user_error(
+            error_type=breaker.last_error_type or "network_error",
+            provider=provider,
+            agent="health_check",
+            retry_count=self._retry_count,
+            detail_message=(
+                f"{provider} is not responding after repeated "
+                f"{breaker.last_error_type} failures. "
+                f"Retrying in {breaker.retry_after:.0f}s."
+            ),
+        )
+        self._last_error = error
+        return {
+            "type": "error",
+            "message": error.message,
+            "recoverable": True,
+        }
 
-        if ollama_url is None:
-            return None  # No Ollama PCs, skip check
+    def _get_pacer(self) -> AutopilotPacer:
+        """Get the session's autopilot pacer, creating it from config.
 
-        import httpx
+        Returns:
+            The AutopilotPacer, kept across autopilot restarts so the
+            day's token use is not forgotten.
+        """
+        if self._pacer is None:
+            from config import get_config
 
-        try:
-            async with httpx.AsyncClient(timeout=self.OLLAMA_HEALTH_TIMEOUT) as client:
-                resp = await client.get(f"{ollama_url}/api/tags")
-                resp.raise_for_status()
-        except Exception as e:
-            logger.error("Ollama health check failed (url=%s): %s", ollama_url, e)
-            error = create_user_error(
-                error_type="connection",
-                provider="ollama",
-                agent="health_check",
-                retry_count=self._retry_count,
-                detail_message=(
-                    f"Ollama server at {ollama_url} is not responding. Error: {e}"
-                ),
+            config = get_config()
+            self._pacer = AutopilotPacer(
+                rounds_per_hour=config.autopilot_rounds_per_hour,
+                daily_token_budget=config.autopilot_daily_token_budget,
             )
-            self._last_error = error
-            return {
-                "type": "error",
-                "message": error.message,
-                "recoverable": True,
-            }
-
-        return None
+        return self._pacer
 
     def _get_turn_delay(self) -> float:
         """Get the delay between turns based on current speed.
 
         Enforces a minimum delay when any PC uses Ollama to prevent
         saturating the remote Ollama server with back-to-back requests.
+        At "adaptive" speed the pacer extends that minimum to meet the
+        configured round rate and token budget and to back off after
+        rate limits.
 
         Returns:
             Delay in seconds.
         """
         base_delay = self.SPEED_DELAYS.get(self._speed, 1.0)
+        pc_providers, _ = self._session_providers()
+        if "ollama" in pc_providers:
+            base_delay = max(base_delay, self.OLLAMA_MIN_DELAY)
+        if self._speed == "adaptive":
+            return self._get_pacer().next_delay(base_delay)
+        return base_delay
 
-        # Check if any PC uses Ollama
-        if self._state is not None:
-            characters = self._state.get("characters", {})
-            for name, char in characters.items():
-                if name == "dm":
-                    continue
-                provider = (
-                    getattr(char, "provider", "").lower()
-                    if hasattr(char, "provider")
-                    else ""
-                )
-                if provider == "ollama":
-                    return max(base_delay, self.OLLAMA_MIN_DELAY)
+    async def _sleep_between_rounds(self, delay: float) -> None:
+        """Wait out the delay before the next autopilot round.
 
-        return base_delay
+        Long (adaptive) waits sleep in 10s chunks, broadcasting a heartbeat
+        after each so monitors do not mistake pacing for a stall, and end
+        early if the speed is changed.
+
+        Args:
+            delay: Delay in seconds.
+        """
+        speed = self._speed
+        remaining = delay
+        while remaining > 0:
+            chunk = min(remaining, 10)
+            await asyncio.sleep(chunk)
+            remaining -= chunk
+            if remaining > 0:
+                if self._speed != speed:
+                    return
+                await self._broadcast(
+                    {
+                        "type": "autopilot_heartbeat",
+                        "status": "pacing",
+                        "remaining_seconds": remaining,
+                    }
+                )
@@ -0,0 +1,310 @@
+"""Background GameEngine hosting for synchronous front-ends.
+
+The Streamlit app runs rounds through the same GameEngine the API uses
+instead of calling graph.run_single_round() inside its script. Engines
+live on an asyncio event loop in a daemon thread; script reruns submit
+commands (run a round, start or stop autopilot) without waiting for them,
+then poll for the log entries added since their last look. UI latency is
+therefore independent of how long a round takes.
+
+The host has no Streamlit dependency and is shared by every browser
+session of the process, so two tabs on the same game drive one engine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from collections.abc import Callable, Coroutine
+from typing import Any, NamedTuple
+
+from api.engine import GameEngine
+from models import GameState, UserError
+
+logger = logging.getLogger("autodungeon.engine")
+
+__all__ = [
+    "EngineHost",
+    "EngineUpdate",
+    "get_engine_host",
+    "reset_engine_host",
+]
+
+# Seconds to wait for quick engine commands (start/stop autopilot)
+COMMAND_TIMEOUT = 30.0
+
+
+class EngineUpdate(NamedTuple):
+    """What changed in a hosted engine since the caller last polled.
+
+    Attributes:
+        state: The engine's current game state (published per node while
+            a round runs).
+        new_entries: ground_truth_log entries past the caller's log length.
+        busy: Whether a round or autopilot is in progress.
+        last_error: Error from the last round, or None.
+    """
+
+    state: GameState
+    new_entries: list[str]
+    busy: bool
+    last_error: UserError | None
+
+
+class EngineHost:
+    """Runs GameEngines on a background event loop for synchronous callers.
+
+    Attributes:
+        _loop: Event loop the engines run on (started on first use).
+        _thread: Daemon thread running the loop.
+        _engines: Engines by session ID.
+        _rounds: Single rounds in flight, by session ID.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty host; the loop starts on first use."""
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._engines: dict[str, GameEngine] = {}
+        self._rounds: dict[str, concurrent.futures.Future[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future[Any]:
+        """Schedule a coroutine on the host's loop, starting it if needed.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            Future for the coroutine's result.
+        """
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name="engine-host", daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def engine(self, session_id: str) -> GameEngine | None:
+        """Get the hosted engine for a session, or None."""
+        return self._engines.get(session_id)
+
+    def is_busy(self, session_id: str) -> bool:
+        """Whether a round or autopilot is in progress for a session.
+
+        Args:
+            session_id: Session to check.
+
+        Returns:
+            True while the engine owns the session's state.
+        """
+        engine = self._engines.get(session_id)
+        if engine is None:
+            return False
+        pending = self._rounds.get(session_id)
+        return (
+            (pending is not None and not pending.done())
+            or engine.is_running
+            or engine.is_generating
+        )
+
+    def _attach(self, session_id: str, state: GameState) -> GameEngine:
+        """Get the session's engine and hand it the caller's state.
+
+        Must only be called while the session is not busy, so the state
+        the caller edited between rounds (nudges, whispers, human actions)
+        is what the next round starts from.
+
+        Args:
+            session_id: Session the state belongs to.
+            state: The caller's current game state.
+
+        Returns:
+            The session's engine.
+        """
+        with self._lock:
+            engine = self._engines.get(session_id)
+            if engine is None:
+                engine = GameEngine(session_id)
+                self._engines[session_id] = engine
+        engine.adopt_state(state)
+        return engine
+
+    def start_round(self, session_id: str, state: GameState) -> bool:
+        """Start one round in the background.
+
+        Args:
+            session_id: Session to run the round for.
+            state: Game state to run the round from.
+
+        Returns:
+            True if the round was started, False if the session is busy.
+        """
+        if self.is_busy(session_id):
+            return False
+        engine = self._attach(session_id, state)
+        self._rounds[session_id] = self._submit(engine.run_turn())
+        return True
+
+    def start_autopilot(
+        self, session_id: str, state: GameState, speed: str, max_turns: int
+    ) -> bool:
+        """Start autopilot in the background.
+
+        Args:
+            session_id: Session to run autopilot for.
+            state: Game state to start from.
+            speed: Autopilot speed (see GameEngine.VALID_SPEEDS).
+            max_turns: Rounds to run before stopping.
+
+        Returns:
+            True if autopilot was started, False if the session is busy.
+        """
+        if self.is_busy(session_id):
+            return False
+        engine = self._attach(session_id, state)
+        self._submit(engine.start_autopilot(speed, max_turns=max_turns)).result(
+            COMMAND_TIMEOUT
+        )
+        return True
+
+    def stop_autopilot(self, session_id: str) -> None:
+        """Stop a session's autopilot, cancelling the round in progress.
+
+        Args:
+            session_id: Session to stop.
+        """
+        engine = self._engines.get(session_id)
+        if engine is not None and engine.is_running:
+            self._submit(engine.stop_autopilot()).result(COMMAND_TIMEOUT)
+
+    def set_speed(self, session_id: str, speed: str) -> None:
+        """Change a running autopilot's speed.
+
+        Args:
+            session_id: Session to change.
+            speed: New speed (see GameEngine.VALID_SPEEDS).
+        """
+        engine = self._engines.get(session_id)
+        if engine is not None and engine.speed != speed:
+            engine.set_speed(speed)
+
+    def _hand_off(self, session_id: str, submit: Callable[[GameEngine], None]) -> bool:
+        """Give player input to a busy session's engine.
+
+        While a round runs the engine owns the session's state, so input
+        must go through the engine (which holds it for the next round)
+        rather than into the caller's copy of the state.
+
+        Args:
+            session_id: Session the input is for.
+            submit: Applies the input to the engine; runs on the host's loop.
+
+        Returns:
+            True if the engine took the input, False if the session is not
+            busy and the caller should edit its state directly.
+
+        Raises:
+            ValueError: If the engine rejects the input as empty.
+        """
+        engine = self._engines.get(session_id)
+        if engine is None or not self.is_busy(session_id):
+            return False
+
+        async def apply() -> None:
+            submit(engine)
+
+        self._submit(apply()).result(COMMAND_TIMEOUT)
+        return True
+
+    def submit_nudge(self, session_id: str, nudge: str) -> bool:
+        """Send a nudge to a busy session's engine (see _hand_off())."""
+        return self._hand_off(session_id, lambda engine: engine.submit_nudge(nudge))
+
+    def submit_whisper(self, session_id: str, content: str) -> bool:
+        """Send a human whisper to a busy session's engine (see _hand_off())."""
+        return self._hand_off(session_id, lambda engine: engine.submit_whisper(content))
+
+    def submit_human_action(self, session_id: str, action: str) -> bool:
+        """Queue a human action on a busy session's engine (see _hand_off()).
+
+        The action is taken by the next round the caller starts.
+        """
+        return self._hand_off(
+            session_id, lambda engine: engine.queue_human_action(action)
+        )
+
+    def poll(self, session_id: str, log_length: int) -> EngineUpdate | None:
+        """Get what changed in a session's engine since the caller's last look.
+
+        Args:
+            session_id: Session to poll.
+            log_length: Length of the caller's ground_truth_log.
+
+        Returns:
+            EngineUpdate, or None if no engine has run for the session.
+        """
+        engine = self._engines.get(session_id)
+        if engine is None or engine.state is None:
+            return None
+        # Read busy before state, so a round finishing in between is
+        # reported as not busy only once its final state is visible
+        busy = self.is_busy(session_id)
+        state = engine.state
+        log = state.get("ground_truth_log", [])
+        return EngineUpdate(
+            state=state,
+            new_entries=list(log[log_length:]),
+            busy=busy,
+            last_error=engine.last_error,
+        )
+
+    def shutdown(self) -> None:
+        """Stop every hosted session and the event loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            engines = list(self._engines.values())
+            self._engines.clear()
+            self._rounds.clear()
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        # Rounds checkpoint as they go, so stopping autopilot loses nothing
+        for engine in engines:
+            try:
+                asyncio.run_coroutine_threadsafe(engine.stop_autopilot(), loop).result(
+                    COMMAND_TIMEOUT
+                )
+            except Exception:
+                logger.exception("Failed to stop hosted engine %s", engine.session_id)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(COMMAND_TIMEOUT)
+
+
+_host: EngineHost | None = None
+_host_lock = threading.Lock()
+
+
+def get_engine_host() -> EngineHost:
+    """Get the process-wide engine host, created on first use."""
+    global _host
+    with _host_lock:
+        if _host is None:
+            _host = EngineHost()
+        return _host
+
+
+def reset_engine_host() -> None:
+    """Shut down the host so the next use starts fresh (for tests)."""
+    global _host
+    with _host_lock:
+        host, _host = _host, None
+    if host is not None:
+        host.shutdown()
@@ -0,0 +1,714 @@
+"""Background queue for image generation jobs.
+
+Image endpoints submit jobs here instead of spawning their own coroutines:
+
+- Jobs for the same work (session, turn, mode and the scene text the
+  prompt is built from) are deduplicated while one is pending or running,
+  so double-clicks and several spectators trigger one Imagen call.
+- At most ``provider_concurrency`` jobs per image provider run at once;
+  the rest wait in submission order.
+- Every job uses the shared ImageGenerator (one genai client).
+- Jobs are persisted per session in image_jobs.json. Pending and
+  interrupted jobs are resubmitted by recover() when the API starts.
+- Jobs can be listed, inspected and cancelled through the API.
+
+The work itself is done by _generate_image_background() and
+_scan_and_generate_best_image(), which broadcast results and errors to
+WebSocket clients.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import BaseModel, Field, ValidationError
+
+from models import SceneImage
+from persistence import (
+    get_latest_checkpoint,
+    get_session_dir,
+    list_sessions,
+    load_checkpoint,
+)
+
+if TYPE_CHECKING:
+    from image_gen import ImageGenerator
+
+logger = logging.getLogger("autodungeon")
+
+__all__ = [
+    "FINISHED_JOBS_KEPT",
+    "ImageJob",
+    "ImageJobQueue",
+    "build_download_url",
+    "build_thumbnail_url",
+    "get_image_job_queue",
+    "image_job_key",
+    "reset_image_job_queue",
+]
+
+# Finished jobs kept per session for status queries
+FINISHED_JOBS_KEPT = 20
+
+ImageJobStatus = Literal["pending", "running", "done", "failed", "cancelled"]
+
+_ACTIVE_STATUSES = frozenset({"pending", "running"})
+
+
+class ImageJob(BaseModel):
+    """A queued image generation request.
+
+    Attributes:
+        id: Job ID (returned to clients as the task ID).
+        session_id: Session the image belongs to.
+        generation_mode: "current", "specific" or "best".
+        turn_number: Turn to illustrate; None for best-scene jobs until
+            the scanner picks one.
+        dedup_key: Identifies identical work (see image_job_key()).
+        provider: Image provider the job counts against.
+        status: Job state.
+        created_at: ISO timestamp of submission.
+        error: Why the job failed, if it did.
+        image_id: ID of the generated image, once done.
+        log_entries: Scene context for "current"/"specific" jobs. Best-scene
+            jobs scan the whole log, which is not persisted.
+        characters: Character info for the scene prompt.
+        candidates: Highlight candidates for best-scene jobs.
+    """
+
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    session_id: str
+    generation_mode: Literal["current", "best", "specific"]
+    turn_number: int | None = None
+    dedup_key: str
+    provider: str = "gemini"
+    status: ImageJobStatus = "pending"
+    created_at: str = Field(
+        default_factory=lambda: datetime.now(UTC).isoformat().replace("+00:00", "Z")
+    )
+    error: str | None = None
+    image_id: str | None = None
+    log_entries: list[str] = Field(default_factory=list)
+    characters: dict[str, Any] = Field(default_factory=dict)
+    candidates: list[int] = Field(default_factory=list)
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the job is pending or running."""
+        return self.status in _ACTIVE_STATUSES
+
+
+def image_job_key(
+    session_id: str,
+    generation_mode: str,
+    turn_number: int | None,
+    scene: list[str],
+) -> str:
+    """Build the deduplication key for an image job.
+
+    The scene prompt is built by an LLM from the scene's log entries, so
+    identical entries stand in for an identical prompt.
+
+    Args:
+        session_id: Session ID.
+        generation_mode: How the image was requested.
+        turn_number: Turn to illustrate, or None for best-scene jobs.
+        scene: Log entries the prompt is built from (for best-scene jobs,
+            anything identifying the log's current state).
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for part in (session_id, generation_mode, str(turn_number), *scene):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _jobs_path(session_id: str) -> Path:
+    """Path to a session's persisted image jobs."""
+    return get_session_dir(session_id) / "image_jobs.json"
+
+
+def _load_log(session_id: str) -> list[str]:
+    """Load the ground_truth_log of a session's latest checkpoint."""
+    turn = get_latest_checkpoint(session_id)
+    state = load_checkpoint(session_id, turn) if turn is not None else None
+    return list(state.get("ground_truth_log", [])) if state else []
+
+
+def build_download_url(session_id: str, image_id: str) -> str:
+    """Build the download URL for a generated image.
+
+    Args:
+        session_id: Session ID string.
+        image_id: Image UUID string.
+
+    Returns:
+        Relative URL path to the image file.
+    """
+    return f"/api/sessions/{session_id}/images/{image_id}.png"
+
+
+def build_thumbnail_url(session_id: str, image_id: str) -> str:
+    """Build the thumbnail URL for a generated image.
+
+    Args:
+        session_id: Session ID string.
+        image_id: Image UUID string.
+
+    Returns:
+        Relative URL path to the image's WebP thumbnail.
+    """
+    return f"/api/sessions/{session_id}/images/{image_id}/thumbnail"
+
+
+async def _generate_image_background(
+    session_id: str,
+    task_id: str,
+    log_entries: list[str],
+    characters: dict[str, Any],
+    turn_number: int,
+    generation_mode: Literal["current", "best", "specific"],
+    generator: ImageGenerator | None = None,
+) -> SceneImage | None:
+    """Background task for image generation.
+
+    Builds a scene prompt, generates an image, saves metadata,
+    and broadcasts a WebSocket event on completion.
+
+    This function MUST NOT raise exceptions -- all errors are caught
+    and logged to prevent crashing the event loop.
+
+    Args:
+        session_id: Session ID.
+        task_id: Unique task identifier for tracking.
+        log_entries: Narrative log entries for scene context.
+        characters: Character info dict.
+        turn_number: Turn number being illustrated.
+        generation_mode: How the image was requested.
+        generator: Generator to use (the shared one when run from the image
+            job queue); a new one is created if omitted.
+
+    Returns:
+        The generated image, or None if generation failed.
+    """
+    from image_gen import ImageGenerationError, ImageGenerator
+
+    try:
+        generator = generator or ImageGenerator()
+
+        # Step 1: Build scene prompt via LLM
+        prompt = await generator.build_scene_prompt(log_entries, characters)
+
+        # Step 2: Generate image via Imagen API
+        scene_image = await generator.generate_scene_image(
+            prompt=prompt,
+            session_id=session_id,
+            turn_number=turn_number,
+            generation_mode=generation_mode,
+        )
+
+        # Step 3: Save metadata as JSON sidecar
+        # Ensure images dir exists (defensive -- generate_scene_image creates
+        # it for the PNG, but we must guarantee it exists for the sidecar).
+        # Offload blocking file I/O to a thread to avoid stalling the event loop.
+        images_dir = get_session_dir(session_id) / "images"
+        await asyncio.to_thread(images_dir.mkdir, parents=True, exist_ok=True)
+        metadata_path = images_dir / f"{scene_image.id}.json"
+        await asyncio.to_thread(
+            metadata_path.write_text,
+            json.dumps(scene_image.model_dump(), indent=2),
+            encoding="utf-8",
+        )
+
+        # Step 4: Broadcast WebSocket event using schema for validation
+        from api.schemas import SceneImageResponse, WsImageReady
+        from api.websocket import manager
+
+        download_url = build_download_url(session_id, scene_image.id)
+        ws_event = WsImageReady(
+            image=SceneImageResponse(
+                id=scene_image.id,
+                session_id=scene_image.session_id,
+                turn_number=scene_image.turn_number,
+                prompt=scene_image.prompt,
+                image_path=scene_image.image_path,
+                provider=scene_image.provider,
+                model=scene_image.model,
+                generation_mode=scene_image.generation_mode,
+                generated_at=scene_image.generated_at,
+                download_url=download_url,
+                thumbnail_url=build_thumbnail_url(session_id, scene_image.id),
+            ),
+        )
+        await manager.broadcast(session_id, ws_event.model_dump())
+
+        logger.info(
+            "Image generated for session %s turn %d (task %s): %s",
+            session_id,
+            turn_number,
+            task_id,
+            scene_image.id,
+        )
+        return scene_image
+
+    except ImageGenerationError as e:
+        logger.error(
+            "Image generation failed for session %s turn %d (task %s): %s",
+            session_id,
+            turn_number,
+            task_id,
+            e,
+        )
+        # Broadcast error to connected clients
+        from api.websocket import manager
+
+        await manager.broadcast(
+            session_id,
+            {
+                "type": "error",
+                "message": f"Image generation failed: {e}",
+                "recoverable": True,
+            },
+        )
+
+    except Exception as e:
+        logger.exception(
+            "Unexpected error in image generation background task "
+            "(session=%s, turn=%d, task=%s)",
+            session_id,
+            turn_number,
+            task_id,
+        )
+        # Broadcast generic error
+        from api.websocket import manager
+
+        await manager.broadcast(
+            session_id,
+            {
+                "type": "error",
+                "message": f"Image generation failed unexpectedly: {e}",
+                "recoverable": True,
+            },
+        )
+    return None
+
+
+async def _scan_and_generate_best_image(
+    session_id: str,
+    task_id: str,
+    log_entries: list[str],
+    characters: dict[str, Any],
+    candidates: list[int] | None = None,
+    generator: ImageGenerator | None = None,
+) -> SceneImage | None:
+    """Background task that scans for the best scene, then generates an image.
+
+    Combines the scanner phase (LLM choice among highlight candidates, or
+    LLM analysis of the full log when there are none) with the image
+    generation phase (prompt building + Imagen API call) in a single task.
+
+    This function MUST NOT raise exceptions -- all errors are caught
+    and broadcast as WebSocket error events.
+
+    Args:
+        session_id: Session ID.
+        task_id: Unique task identifier for tracking.
+        log_entries: Complete ground_truth_log entries.
+        characters: Character info dict.
+        candidates: Log indexes ranked by the session's highlight reel,
+            best first. None or empty scans the whole log.
+        generator: Generator to use (the shared one when run from the image
+            job queue); a new one is created if omitted.
+
+    Returns:
+        The generated image, or None if scanning or generation failed.
+    """
+    from image_gen import ImageGenerationError, ImageGenerator
+
+    try:
+        generator = generator or ImageGenerator()
+
+        # Phase 1: Scan for best scene
+        if candidates:
+            turn_number, rationale = await generator.scan_candidates(
+                log_entries, candidates
+            )
+        else:
+            turn_number, rationale = await generator.scan_best_scene(log_entries)
+
+        logger.info(
+            "Best scene scan complete for session %s (task %s): Turn %d - %s",
+            session_id,
+            task_id,
+            turn_number,
+            rationale[:150],
+        )
+
+        # Phase 2: Extract context window around identified turn (+/-5 entries)
+        start = max(0, turn_number - 5)
+        end = min(len(log_entries), turn_number + 6)
+        context_entries = list(log_entries[start:end])
+
+        # Phase 3: Build scene prompt
+        prompt = await generator.build_scene_prompt(context_entries, characters)
+
+        # Phase 4: Generate image
+        scene_image = await generator.generate_scene_image(
+            prompt=prompt,
+            session_id=session_id,
+            turn_number=turn_number,
+            generation_mode="best",
+        )
+
+        # Phase 5: Save metadata as JSON sidecar.
+        # Offload blocking file I/O to a thread to avoid stalling the event loop.
+        images_dir = get_session_dir(session_id) / "images"
+        await asyncio.to_thread(images_dir.mkdir, parents=True, exist_ok=True)
+        metadata_path = images_dir / f"{scene_image.id}.json"
+        await asyncio.to_thread(
+            metadata_path.write_text,
+            json.dumps(scene_image.model_dump(), indent=2),
+            encoding="utf-8",
+        )
+
+        # Phase 6: Broadcast WebSocket event
+        from api.schemas import SceneImageResponse as _SceneImageResponse
+        from api.schemas import WsImageReady as _WsImageReady
+        from api.websocket import manager
+
+        download_url = build_download_url(session_id, scene_image.id)
+        ws_event = _WsImageReady(
+            image=_SceneImageResponse(
+                id=scene_image.id,
+                session_id=scene_image.session_id,
+                turn_number=scene_image.turn_number,
+                prompt=scene_image.prompt,
+                image_path=scene_image.image_path,
+                provider=scene_image.provider,
+                model=scene_image.model,
+                generation_mode=scene_image.generation_mode,
+                generated_at=scene_image.generated_at,
+                download_url=download_url,
+                thumbnail_url=build_thumbnail_url(session_id, scene_image.id),
+            ),
+        )
+        await manager.broadcast(session_id, ws_event.model_dump())
+
+        logger.info(
+            "Best scene image generated for session %s turn %d (task %s): %s",
+            session_id,
+            turn_number,
+            task_id,
+            scene_image.id,
+        )
+        return scene_image
+
+    except ImageGenerationError as e:
+        logger.error(
+            "Best scene generation failed for session %s (task %s): %s",
+            session_id,
+            task_id,
+            e,
+        )
+        from api.websocket import manager
+
+        await manager.broadcast(
+            session_id,
+            {
+                "type": "error",
+                "message": f"Best scene generation failed: {e}",
+                "recoverable": True,
+            },
+        )
+
+    except Exception as e:
+        logger.exception(
+            "Unexpected error in best scene generation background task "
+            "(session=%s, task=%s)",
+            session_id,
+            task_id,
+        )
+        from api.websocket import manager
+
+        await manager.broadcast(
+            session_id,
+            {
+                "type": "error",
+                "message": f"Best scene generation failed unexpectedly: {e}",
+                "recoverable": True,
+            },
+        )
+    return None
+
+
+class ImageJobQueue:
+    """Runs image jobs with deduplication and per-provider concurrency limits.
+
+    Attributes:
+        _jobs: Known jobs by ID (active plus recently finished).
+        _tasks: Running or waiting tasks by job ID.
+        _logs: Full logs for best-scene jobs, by job ID (not persisted).
+        _semaphores: Per-provider concurrency limits for the current loop.
+        _save_locks: Per-session locks ordering image_jobs.json writes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self._jobs: dict[str, ImageJob] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._logs: dict[str, list[str]] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._save_locks: dict[str, asyncio.Lock] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._shutting_down = False
+
+    def get(self, job_id: str) -> ImageJob | None:
+        """Get a job by ID."""
+        return self._jobs.get(job_id)
+
+    def list_jobs(self, session_id: str) -> list[ImageJob]:
+        """List a session's known jobs, newest first."""
+        jobs = [j for j in self._jobs.values() if j.session_id == session_id]
+        return sorted(jobs, key=lambda j: j.created_at, reverse=True)
+
+    def active_count(self, session_id: str) -> int:
+        """Number of a session's pending or running jobs."""
+        return sum(
+            1 for j in self._jobs.values() if j.session_id == session_id and j.is_active
+        )
+
+    def find_active(self, dedup_key: str) -> ImageJob | None:
+        """Find a pending or running job doing the same work."""
+        for job in self._jobs.values():
+            if job.dedup_key == dedup_key and job.is_active:
+                return job
+        return None
+
+    def _bind_loop(self) -> None:
+        """Drop loop-bound primitives created on a previous event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Semaphores and locks bind to the loop they are first used on
+            self._semaphores.clear()
+            self._save_locks.clear()
+            self._loop = loop
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        """Get the concurrency limit for a provider on the running loop."""
+        from image_gen import get_image_generator
+
+        self._bind_loop()
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            config = get_image_generator()._get_image_config()
+            limit = config.provider_concurrency
+            semaphore = self._semaphores[provider] = asyncio.Semaphore(limit)
+        return semaphore
+
+    def _snapshot(self, session_id: str) -> list[dict[str, Any]]:
+        """Drop a session's old finished jobs and serialize the rest."""
+        jobs = self.list_jobs(session_id)
+        finished = [j for j in jobs if not j.is_active]
+        for job in finished[FINISHED_JOBS_KEPT:]:
+            self._jobs.pop(job.id, None)
+        return [j.model_dump() for j in reversed(self.list_jobs(session_id))]
+
+    async def _persist(self, session_id: str) -> None:
+        """Persist a session's jobs, writing the file off the event loop.
+
+        The snapshot is taken on the loop thread, where jobs are mutated;
+        the per-session lock keeps an older snapshot from overwriting a
+        newer one.
+        """
+        self._bind_loop()
+        lock = self._save_locks.setdefault(session_id, asyncio.Lock())
+        async with lock:
+            payload = self._snapshot(session_id)
+            await asyncio.to_thread(_write_jobs, session_id, payload)
+
+    async def submit(
+        self, job: ImageJob, log_entries: list[str] | None = None
+    ) -> tuple[ImageJob, bool]:
+        """Queue a job unless identical work is already queued.
+
+        Args:
+            job: The job to run.
+            log_entries: Full log for best-scene jobs.
+
+        Returns:
+            (job, created): the queued job, or the existing one doing the
+            same work with created=False.
+        """
+        existing = self.find_active(job.dedup_key)
+        if existing is not None:
+            return existing, False
+        self._jobs[job.id] = job
+        if log_entries is not None:
+            self._logs[job.id] = log_entries
+        await self._persist(job.session_id)
+        self._start(job)
+        return job, True
+
+    def _start(self, job: ImageJob) -> None:
+        """Create the task that waits for a slot and runs the job."""
+        task = asyncio.create_task(self._run(job))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda t: self._tasks.pop(job.id, None))
+
+    async def _run(self, job: ImageJob) -> None:
+        """Wait for a provider slot, then generate the job's image."""
+        from image_gen import get_image_generator
+
+        try:
+            async with self._semaphore(job.provider):
+                job.status = "running"
+                await self._persist(job.session_id)
+                generator = get_image_generator()
+                if job.generation_mode == "best":
+                    log = self._logs.get(job.id)
+                    if log is None:
+                        log = await asyncio.to_thread(_load_log, job.session_id)
+                    scene_image = await _scan_and_generate_best_image(
+                        session_id=job.session_id,
+                        task_id=job.id,
+                        log_entries=log,
+                        characters=job.characters,
+                        candidates=job.candidates,
+                        generator=generator,
+                    )
+                else:
+                    scene_image = await _generate_image_background(
+                        session_id=job.session_id,
+                        task_id=job.id,
+                        log_entries=job.log_entries,
+                        characters=job.characters,
+                        turn_number=job.turn_number or 0,
+                        generation_mode=job.generation_mode,
+                        generator=generator,
+                    )
+            if scene_image is None:
+                job.status = "failed"
+                job.error = "Image generation failed"
+            else:
+                job.status = "done"
+                job.image_id = scene_image.id
+                job.turn_number = scene_image.turn_number
+        except asyncio.CancelledError:
+            # Shutdown leaves the job to be resumed by recover()
+            job.status = "pending" if self._shutting_down else "cancelled"
+            raise
+        finally:
+            self._logs.pop(job.id, None)
+            await asyncio.shield(self._persist(job.session_id))
+
+    async def cancel(self, job_id: str) -> ImageJob | None:
+        """Cancel a pending or running job.
+
+        Args:
+            job_id: Job to cancel.
+
+        Returns:
+            The job (unchanged if it had already finished), or None if
+            unknown.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or not job.is_active:
+            return job
+        task = self._tasks.get(job_id)
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if job.is_active:
+            job.status = "cancelled"
+            await self._persist(job.session_id)
+        return job
+
+    async def recover(self) -> int:
+        """Resubmit jobs left pending or running by a previous process.
+
+        Returns:
+            Number of jobs resubmitted.
+        """
+        recovered = 0
+        for session_id in await asyncio.to_thread(list_sessions):
+            jobs = await asyncio.to_thread(_read_jobs, session_id)
+            for job in jobs:
+                if job.id in self._jobs:
+                    continue
+                self._jobs[job.id] = job
+                if job.is_active:
+                    job.status = "pending"
+                    self._start(job)
+                    recovered += 1
+        if recovered:
+            logger.info("Resubmitted %d interrupted image jobs", recovered)
+        return recovered
+
+    async def shutdown(self) -> None:
+        """Stop running jobs, leaving them pending for recover()."""
+        self._shutting_down = True
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._shutting_down = False
+
+
+def _write_jobs(session_id: str, payload: list[dict[str, Any]]) -> None:
+    """Atomically write a session's serialized jobs."""
+    path = _jobs_path(session_id)
+    temp_path = path.with_suffix(".json.tmp")
+    try:
+        temp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        temp_path.replace(path)
+    except OSError as e:
+        temp_path.unlink(missing_ok=True)
+        logger.warning("Failed to save image jobs for session %s: %s", session_id, e)
+
+
+def _read_jobs(session_id: str) -> list[ImageJob]:
+    """Read a session's persisted jobs, skipping invalid records."""
+    path = _jobs_path(session_id)
+    if not path.exists():
+        return []
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        return []
+    jobs: list[ImageJob] = []
+    for item in data if isinstance(data, list) else []:
+        try:
+            jobs.append(ImageJob.model_validate(item))
+        except (TypeError, ValidationError):
+            continue
+    return jobs
+
+
+_queue: ImageJobQueue | None = None
+
+
+def get_image_job_queue() -> ImageJobQueue:
+    """Get the process-wide image job queue, created on first use."""
+    global _queue
+    if _queue is None:
+        _queue = ImageJobQueue()
+    return _queue
+
+
+def reset_image_job_queue() -> None:
+    """Forget all jobs so the next use starts fresh (for tests)."""
+    global _queue
+    _queue = None
@@ -0,0 +1,119 @@
+"""Debug monitor that flags code blocking the API event loop.
+
+A heartbeat coroutine stamps the time on every tick while a watchdog
+thread checks how stale the stamp is. When the loop has not run for longer
+than the threshold, the watchdog logs a warning with the loop thread's
+current stack, which names the handler doing synchronous work.
+
+Enabled with ``loop_block_threshold_ms`` in config/defaults.yaml (or the
+LOOP_BLOCK_THRESHOLD_MS environment variable); 0 disables it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+
+logger = logging.getLogger("autodungeon")
+
+__all__ = ["LoopBlockMonitor"]
+
+# Stack frames included in each warning (innermost last)
+_STACK_LIMIT = 12
+
+
+class LoopBlockMonitor:
+    """Watchdog that reports event loop stalls longer than a threshold.
+
+    Attributes:
+        threshold: Stall duration in seconds that triggers a warning.
+        blocked_count: Number of stalls reported so far.
+        max_blocked: Longest stall observed, in seconds.
+    """
+
+    def __init__(self, threshold: float) -> None:
+        """Initialize the monitor.
+
+        Args:
+            threshold: Stall duration in seconds that triggers a warning.
+
+        Raises:
+            ValueError: If threshold is not positive.
+        """
+        if threshold <= 0:
+            raise ValueError("threshold must be positive")
+        self.threshold = threshold
+        self.blocked_count = 0
+        self.max_blocked = 0.0
+        # Tick often enough that a stall is measured to within ~25%
+        self._interval = threshold / 4
+        self._beat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._heartbeat_task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    async def start(self) -> None:
+        """Start the heartbeat on the running loop and the watchdog thread."""
+        if self._heartbeat_task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-block-monitor", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and the watchdog thread."""
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._heartbeat_task
+            self._heartbeat_task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            self._beat = time.monotonic()
+            await asyncio.sleep(self._interval)
+
+    def _watch(self) -> None:
+        reported_beat: float | None = None
+        while not self._stop.wait(self._interval):
+            beat = self._beat
+            # The heartbeat legitimately sleeps for one interval
+            stalled = time.monotonic() - beat - self._interval
+            if stalled < self.threshold:
+                continue
+            self.max_blocked = max(self.max_blocked, stalled)
+            # Report each stall once, while the culprit is still on the stack
+            if reported_beat != beat:
+                reported_beat = beat
+                self.blocked_count += 1
+                self._report(stalled)
+
+    def _report(self, stalled: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id or 0)
+        stack = (
+            "".join(traceback.format_stack(frame, limit=_STACK_LIMIT))
+            if frame is not None
+            else "  <stack unavailable>\n"
+        )
+        logger.warning(
+            "Event loop blocked for at least %.0f ms (threshold %.0f ms); "
+            "loop thread is executing:\n%s",
+            stalled * 1000,
+            self.threshold * 1000,
+            stack,
+        )
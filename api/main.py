@@ -9,29 +9,80 @@ without modifying them. Streamlit app.py continues to work independently.
 
 from __future__ import annotations
 
+import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from api.routes import router as api_router
 from api.schemas import HealthResponse
 from api.websocket import manager as ws_manager
 from api.websocket import router as ws_router
+from metrics import render_metrics
+
+logger = logging.getLogger("autodungeon")
+
+
+def _prewarm_module_discovery() -> None:
+    """Warm the module discovery cache for the configured DM models.
+
+    Covers the DM in config/characters/dm.yaml (used by new adventures)
+    and the DM agent defaults. Discovery itself runs in daemon threads.
+    """
+    from agents import prewarm_module_discovery
+    from config import get_config, load_dm_config
+    from models import DMConfig
+
+    dm_configs: list[DMConfig] = []
+    try:
+        dm_configs.append(load_dm_config())
+    except (ValueError, OSError):
+        pass  # Discovery endpoint reports the config error on use
+    agent_dm = get_config().agents.dm
+    dm_configs.append(DMConfig(provider=agent_dm.provider, model=agent_dm.model))
+    prewarm_module_discovery(dm_configs)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan manager.
 
-    Startup: Load config and initialize empty engine registry.
-    Shutdown: Gracefully stop all active engine sessions.
+    Startup: Load config, initialize empty engine registry, prewarm the
+    module discovery cache, resubmit interrupted image jobs, and start the
+    loop block monitor and the provider health monitor if enabled.
+    Shutdown: Gracefully stop all active engine sessions and leave running
+    image jobs pending for the next start.
     """
+    import asyncio
+
+    from api.image_jobs import get_image_job_queue
+    from api.loop_monitor import LoopBlockMonitor
     from config import get_config
+    from provider_health import ProviderHealthMonitor, get_provider_health
 
     app.state.config = get_config()
     app.state.engines = {}  # session_id -> GameEngine
+    app.state.loop_monitor = None
+    threshold_ms = app.state.config.loop_block_threshold_ms
+    if threshold_ms > 0:
+        app.state.loop_monitor = LoopBlockMonitor(threshold_ms / 1000)
+        await app.state.loop_monitor.start()
+    app.state.health_monitor = None
+    if app.state.config.provider_probe_interval > 0:
+        app.state.health_monitor = ProviderHealthMonitor(get_provider_health())
+        await app.state.health_monitor.start()
+    if app.state.config.module_discovery_prewarm:
+        try:
+            await asyncio.to_thread(_prewarm_module_discovery)
+        except Exception:
+            logger.exception("Module discovery prewarm failed")
+    try:
+        await get_image_job_queue().recover()
+    except Exception:
+        logger.exception("Image job recovery failed")
     yield
     # Shutdown: close all WebSocket connections first
     await ws_manager.disconnect_all()
@@ -42,6 +93,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         except Exception:
             pass  # Best-effort cleanup
     app.state.engines.clear()
+    await get_image_job_queue().shutdown()
+    if app.state.loop_monitor is not None:
+        await app.state.loop_monitor.stop()
+    if app.state.health_monitor is not None:
+        await app.state.health_monitor.stop()
 
 
 app = FastAPI(
@@ -76,3 +132,15 @@ async def health_check() -> HealthResponse:
         Status and version info.
     """
     return HealthResponse(status="ok", version="2.0.0-alpha")
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Prometheus scrape endpoint.
+
+    Returns:
+        Game engine metrics in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
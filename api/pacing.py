@@ -0,0 +1,194 @@
+"""Adaptive pacing for the autopilot loop.
+
+The fixed autopilot speeds sleep the same time between rounds however
+busy the provider is. The "adaptive" speed asks an AutopilotPacer instead,
+which picks the delay from what it has measured:
+
+- Round time: with a rounds-per-hour target, the delay fills the rest of
+  each round's time slot.
+- Token use: with a daily token budget, the remaining budget is spread
+  over the rest of the day (UTC). Once it is spent, the autopilot waits
+  for the next day.
+- Rate limits: every 429 adds a penalty that doubles on repeated limits
+  and halves with each successful round.
+
+Targets are set with ``autopilot_rounds_per_hour`` and
+``autopilot_daily_token_budget`` in config/defaults.yaml.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+__all__ = ["AutopilotPacer"]
+
+
+class AutopilotPacer:
+    """Chooses the delay between autopilot rounds from observed load.
+
+    Every round is reported through record_round() (and rate limits
+    through record_rate_limit()) whatever the speed, so the projected
+    completion time is available for fixed speeds as well.
+
+    Attributes:
+        rounds_per_hour: Target round rate (0 = none).
+        daily_token_budget: Tokens to spend per UTC day (0 = unlimited).
+        avg_round_seconds: Smoothed round duration, None before any round.
+        avg_round_tokens: Smoothed tokens per round, None before any round.
+        rate_limit_penalty: Seconds currently added to every delay.
+    """
+
+    # Weight of the newest round in the smoothed averages
+    SMOOTHING: float = 0.3
+    RATE_LIMIT_PENALTY_MIN: float = 30.0
+    RATE_LIMIT_PENALTY_MAX: float = 900.0
+
+    def __init__(
+        self,
+        rounds_per_hour: float = 0.0,
+        daily_token_budget: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the pacer.
+
+        Args:
+            rounds_per_hour: Target round rate (0 = none).
+            daily_token_budget: Tokens to spend per UTC day (0 = unlimited).
+            clock: Wall clock in epoch seconds (injectable for tests).
+        """
+        self.rounds_per_hour = rounds_per_hour
+        self.daily_token_budget = daily_token_budget
+        self.avg_round_seconds: float | None = None
+        self.avg_round_tokens: float | None = None
+        self.rate_limit_penalty = 0.0
+        self._clock = clock
+        self._day = self._today()
+        self._tokens_today = 0.0
+
+    def _today(self) -> str:
+        return datetime.fromtimestamp(self._clock(), UTC).date().isoformat()
+
+    def _seconds_until_reset(self) -> float:
+        now = datetime.fromtimestamp(self._clock(), UTC)
+        midnight = datetime.combine(
+            now.date() + timedelta(days=1), datetime.min.time(), UTC
+        )
+        return (midnight - now).total_seconds()
+
+    def _smooth(self, average: float | None, sample: float) -> float:
+        if average is None:
+            return sample
+        return average + self.SMOOTHING * (sample - average)
+
+    @property
+    def tokens_today(self) -> float:
+        """Tokens recorded since midnight UTC."""
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._tokens_today = 0.0
+        return self._tokens_today
+
+    def budget_remaining(self) -> float | None:
+        """Tokens left in today's budget, or None without a budget."""
+        if self.daily_token_budget <= 0:
+            return None
+        return max(0.0, self.daily_token_budget - self.tokens_today)
+
+    def record_round(self, seconds: float, tokens: float) -> None:
+        """Record a completed round.
+
+        Args:
+            seconds: Wall time of the round.
+            tokens: Tokens the round used.
+        """
+        self.avg_round_seconds = self._smooth(self.avg_round_seconds, seconds)
+        self.avg_round_tokens = self._smooth(self.avg_round_tokens, tokens)
+        self._tokens_today = self.tokens_today + tokens
+        self.rate_limit_penalty /= 2
+        if self.rate_limit_penalty < 1.0:
+            self.rate_limit_penalty = 0.0
+
+    def record_rate_limit(self) -> None:
+        """Record a round that failed on a provider rate limit."""
+        self.rate_limit_penalty = min(
+            max(self.rate_limit_penalty * 2, self.RATE_LIMIT_PENALTY_MIN),
+            self.RATE_LIMIT_PENALTY_MAX,
+        )
+
+    def next_delay(self, floor: float) -> float:
+        """Compute the delay before the next round.
+
+        Args:
+            floor: Minimum delay (e.g. the Ollama minimum).
+
+        Returns:
+            Delay in seconds.
+        """
+        delay = floor
+        round_seconds = self.avg_round_seconds or 0.0
+        if self.rounds_per_hour > 0:
+            delay = max(delay, 3600 / self.rounds_per_hour - round_seconds)
+        remaining = self.budget_remaining()
+        if remaining is not None:
+            until_reset = self._seconds_until_reset()
+            if remaining <= 0:
+                delay = max(delay, until_reset)
+            elif self.avg_round_tokens:
+                affordable_rounds = remaining / self.avg_round_tokens
+                delay = max(delay, until_reset / affordable_rounds - round_seconds)
+        return delay + self.rate_limit_penalty
+
+    def projected_completion(self, rounds_left: int, delay: float) -> float | None:
+        """Estimate when the remaining rounds will have run.
+
+        Args:
+            rounds_left: Rounds still to run.
+            delay: Delay that will follow each round.
+
+        Returns:
+            Epoch seconds, or None before any round has been measured.
+        """
+        if self.avg_round_seconds is None:
+            return None
+        return self._clock() + max(rounds_left, 0) * (self.avg_round_seconds + delay)
+
+    def snapshot(self, rounds_left: int, delay: float) -> dict[str, Any]:
+        """Describe the current pacing for broadcast.
+
+        Args:
+            rounds_left: Rounds still to run.
+            delay: Delay chosen for the next round.
+
+        Returns:
+            Dict with the delay, averages, budget and projected completion
+            (ISO 8601 UTC, or None).
+        """
+        eta = self.projected_completion(rounds_left, delay)
+        return {
+            "delay_seconds": round(delay, 2),
+            "avg_round_seconds": (
+                round(self.avg_round_seconds, 2)
+                if self.avg_round_seconds is not None
+                else None
+            ),
+            "avg_round_tokens": (
+                round(self.avg_round_tokens)
+                if self.avg_round_tokens is not None
+                else None
+            ),
+            "tokens_today": int(self.tokens_today),
+            "token_budget_remaining": (
+                None if (left := self.budget_remaining()) is None else int(left)
+            ),
+            "rate_limit_penalty_seconds": round(self.rate_limit_penalty, 2),
+            "rounds_left": max(rounds_left, 0),
+            "projected_completion": (
+                datetime.fromtimestamp(eta, UTC).isoformat()
+                if eta is not None
+                else None
+            ),
+        }
@@ -8,18 +8,30 @@ and models.py without modifying them.
 from __future__ import annotations
 
 import asyncio
+import io
 import json as _json
 import logging
+import os
 import re as _re
+import sqlite3
+import threading
 import time
-import uuid as _uuid
+import zipfile
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, cast
 
 import yaml
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import ValidationError
 
+from api.image_jobs import (
+    ImageJob,
+    build_download_url,
+    build_thumbnail_url,
+    get_image_job_queue,
+    image_job_key,
+)
 from api.schemas import (
     BestSceneAccepted,
     CharacterCreateRequest,
@@ -39,6 +51,7 @@ from api.schemas import (
     GameConfigUpdateRequest,
     ImageGenerateAccepted,
     ImageGenerateRequest,
+    ImageJobResponse,
     ModelListResponse,
     ModuleDiscoveryResponse,
     ModuleInfoResponse,
@@ -49,6 +62,8 @@ from api.schemas import (
     SessionImageSummaryResponse,
     SessionResponse,
     SessionStartRequest,
+    TranscriptSearchHitResponse,
+    TranscriptSearchResponse,
     UserSettingsResponse,
     UserSettingsUpdateRequest,
 )
@@ -59,7 +74,8 @@ from config import (
     load_user_settings,
     save_user_settings,
 )
-from models import CharacterConfig, DMConfig, GameConfig
+from highlights import BEST_SCENE_CANDIDATES, get_highlight_reel
+from models import CharacterConfig, DMConfig, GameConfig, GameState
 from persistence import (
     _validate_session_id,
     build_comparison_data,
@@ -74,11 +90,13 @@ from persistence import (
     list_forks,
     list_sessions_with_metadata,
     load_checkpoint,
+    load_latest_checkpoint_cached,
     load_session_metadata,
     promote_fork,
     rename_fork,
     save_checkpoint,
 )
+from transcript_search import SEARCH_RESULT_LIMIT, search_transcript
 
 logger = logging.getLogger(__name__)
 
@@ -120,37 +138,61 @@ async def _aio_load_yaml_defaults() -> dict[str, Any]:
 
 
 # =============================================================================
-# In-Memory State Helper (Image Generation)
+# Session State Read-Through
 # =============================================================================
 
 
-async def _get_state_for_image_gen(session_id: str, request: Request) -> dict[str, Any]:
-    """Get game state for image generation, preferring in-memory engine state.
+async def _read_session_state(session_id: str, request: Request) -> Any:
+    """Get the current game state for a read-only request.
+
+    Prefers the live engine's in-memory state (zero I/O), then the
+    persistence layer's LRU cache of recently loaded checkpoints, and only
+    parses the checkpoint from disk on a cache miss. The returned state
+    may be shared and must not be mutated.
+
+    Args:
+        session_id: Session ID string.
+        request: FastAPI request (for accessing app.state.engines).
+
+    Returns:
+        GameState, or None if the session has no checkpoints.
 
-    Falls back to loading the latest checkpoint from disk when no active
-    engine exists (e.g., viewing a historical session).
+    Raises:
+        HTTPException: 500 if the latest checkpoint exists but fails to load.
     """
     engines: dict[str, Any] = getattr(request.app.state, "engines", {})
     engine = engines.get(session_id)
     if engine is not None and getattr(engine, "state", None) is not None:
-        return engine.state  # Zero I/O - already in memory
+        return engine.state
 
-    # Fallback: load from disk
-    latest_turn = await _aio_get_latest_checkpoint(session_id)
+    latest_turn, state = await asyncio.to_thread(
+        load_latest_checkpoint_cached, session_id
+    )
     if latest_turn is None:
-        raise HTTPException(status_code=400, detail="Session has no checkpoints")
-    state = await _aio_load_checkpoint(session_id, latest_turn)
+        return None
     if state is None:
         raise HTTPException(status_code=500, detail="Failed to load latest checkpoint")
     return state
 
 
+async def _get_state_for_image_gen(session_id: str, request: Request) -> dict[str, Any]:
+    """Get game state for image generation, preferring in-memory engine state.
+
+    Falls back to the latest checkpoint when no active engine exists
+    (e.g., viewing a historical session).
+    """
+    state = await _read_session_state(session_id, request)
+    if state is None:
+        raise HTTPException(status_code=400, detail="Session has no checkpoints")
+    return state
+
+
 def _enrich_char_dict_for_images(state: dict[str, Any]) -> dict[str, Any]:
     """Build character dict for image generation with race/gender populated.
 
     Merges data from state['characters'], state['character_sheets'], and
-    falls back to character library YAML files on disk for any still-empty
-    race or gender fields.
+    falls back to the character library for any still-empty race or gender
+    fields. Reads the library from disk, so call it via asyncio.to_thread.
     """
     characters = state.get("characters", {})
     char_dict: dict[str, Any] = {
@@ -169,31 +211,21 @@ def _enrich_char_dict_for_images(state: dict[str, Any]) -> dict[str, Any]:
         else:
             char_dict[name] = sheet_data
 
-    # Fallback: fill empty race/gender from character library YAML files
-    library_dir = Path("config/characters/library")
-    if library_dir.exists():
-        # Build lookup: lowercase name -> yaml data (lazy, only if needed)
-        _yaml_cache: dict[str, dict[str, Any]] = {}
-        for name, data in char_dict.items():
-            needs_race = not data.get("race")
-            needs_gender = not data.get("gender")
-            if not needs_race and not needs_gender:
-                continue
-            # Populate cache on first miss
-            if not _yaml_cache:
-                for yf in library_dir.glob("*.yaml"):
-                    try:
-                        with open(yf, encoding="utf-8") as f:
-                            yd = yaml.safe_load(f)
-                        if yd and yd.get("name"):
-                            _yaml_cache[yd["name"].lower()] = yd
-                    except Exception:
-                        continue
-            lib = _yaml_cache.get(name.lower(), {})
-            if needs_race and lib.get("race"):
-                data["race"] = lib["race"]
-            if needs_gender and lib.get("gender"):
-                data["gender"] = lib["gender"]
+    # Fallback: fill empty race/gender from the character library
+    library: dict[str, _LibraryEntry] | None = None
+    for name, data in char_dict.items():
+        needs_race = not data.get("race")
+        needs_gender = not data.get("gender")
+        if not needs_race and not needs_gender:
+            continue
+        if library is None:
+            library = _library_index()
+        entry = library.get(name.lower())
+        lib = entry[1] if entry is not None else {}
+        if needs_race and lib.get("race"):
+            data["race"] = lib["race"]
+        if needs_gender and lib.get("gender"):
+            data["gender"] = lib["gender"]
 
     return char_dict
 
@@ -423,17 +455,21 @@ async def delete_session_endpoint(session_id: str) -> None:
 
 
 @router.post("/modules/discover", response_model=ModuleDiscoveryResponse)
-async def discover_modules_endpoint() -> ModuleDiscoveryResponse:
+async def discover_modules_endpoint(refresh: bool = False) -> ModuleDiscoveryResponse:
     """Discover available D&D modules via LLM query.
 
-    Calls the DM's configured LLM to generate a list of known D&D
-    modules/adventures. This is a potentially slow operation (5-15s)
-    as it involves an LLM API call.
+    Results are cached per DM provider/model and returned instantly when
+    available (refreshed in the background once stale). On a cache miss
+    this calls the DM's configured LLM, which is a potentially slow
+    operation (seconds to minutes for local models).
+
+    Args:
+        refresh: Bypass the cache and query the LLM.
 
     Returns:
         Module discovery results with list of modules.
     """
-    from agents import LLMError, discover_modules
+    from agents import LLMError, discover_modules_cached
     from config import load_dm_config
 
     try:
@@ -448,7 +484,7 @@ async def discover_modules_endpoint() -> ModuleDiscoveryResponse:
         )
 
     try:
-        result = await asyncio.to_thread(discover_modules, dm_config)
+        result = await asyncio.to_thread(discover_modules_cached, dm_config, refresh)
     except LLMError as e:
         return ModuleDiscoveryResponse(
             modules=[],
@@ -480,7 +516,7 @@ async def discover_modules_endpoint() -> ModuleDiscoveryResponse:
         ],
         provider=result.provider,
         model=result.model,
-        source="llm",
+        source="cache" if result.cached else "llm",
     )
 
 
@@ -489,6 +525,30 @@ async def discover_modules_endpoint() -> ModuleDiscoveryResponse:
 # =============================================================================
 
 
+def _load_selected_characters(names: list[str]) -> dict[str, CharacterConfig]:
+    """Resolve selected character names against presets and the library.
+
+    Args:
+        names: Character names chosen in the setup wizard.
+
+    Returns:
+        Dict of CharacterConfig keyed by lowercase name, in selection
+        order. Unknown names are skipped.
+    """
+    try:
+        all_presets = load_character_configs()
+    except (ValueError, OSError):
+        all_presets = {}
+
+    # Merge preset + library, keyed by lowercase name
+    all_chars = {**all_presets, **_load_library_characters()}
+    return {
+        name.lower(): all_chars[name.lower()]
+        for name in names
+        if name.lower() in all_chars
+    }
+
+
 @router.post("/sessions/{session_id}/start")
 async def start_session_endpoint(
     session_id: str, request: Request, body: SessionStartRequest | None = None
@@ -536,23 +596,9 @@ async def start_session_endpoint(
     # Build characters_override from selected character names
     characters_override: dict[str, object] | None = None
     if body.selected_characters:
-        try:
-            all_presets = load_character_configs()
-        except (ValueError, OSError):
-            all_presets = {}
-
-        all_library = _load_library_characters()
-
-        # Merge preset + library, keyed by lowercase name
-        all_chars = {**all_presets, **all_library}
-
-        # Filter to selected names
-        selected = {}
-        for name in body.selected_characters:
-            key = name.lower()
-            if key in all_chars:
-                selected[key] = all_chars[key]
-
+        selected = await asyncio.to_thread(
+            _load_selected_characters, body.selected_characters
+        )
         if selected:
             characters_override = selected  # type: ignore[assignment]
 
@@ -595,14 +641,15 @@ async def start_session_endpoint(
 
 
 @router.get("/sessions/{session_id}/config", response_model=GameConfigResponse)
-async def get_session_config(session_id: str) -> GameConfigResponse:
+async def get_session_config(session_id: str, request: Request) -> GameConfigResponse:
     """Get config for a session.
 
-    If the session has checkpoints, loads from the latest checkpoint.
-    Otherwise returns default GameConfig values.
+    If the session is running or has checkpoints, reads the current
+    state. Otherwise returns default GameConfig values.
 
     Args:
         session_id: Session ID string.
+        request: FastAPI request (for accessing app.state.engines).
 
     Returns:
         Game configuration for the session.
@@ -635,36 +682,35 @@ async def get_session_config(session_id: str) -> GameConfigResponse:
         "image_model", img_cfg.get("image_model", "imagen-4.0-generate-001")
     )
 
-    # Try loading from latest checkpoint
-    latest_turn = await _aio_get_latest_checkpoint(session_id)
-    if latest_turn is not None:
-        state = await _aio_load_checkpoint(session_id, latest_turn)
-        if state is not None:
-            game_config = state["game_config"]
-            dm_config = state.get("dm_config")
-            if dm_config is None:
-                dm_config = DMConfig()
-            return GameConfigResponse(
-                combat_mode=game_config.combat_mode,
-                max_combat_rounds=game_config.max_combat_rounds,
-                summarizer_provider=game_config.summarizer_provider,
-                summarizer_model=game_config.summarizer_model,
-                extractor_provider=game_config.extractor_provider,
-                extractor_model=game_config.extractor_model,
-                party_size=game_config.party_size,
-                narrative_display_limit=game_config.narrative_display_limit,
-                dm_provider=dm_config.provider,
-                dm_model=dm_config.model,
-                dm_token_limit=dm_config.token_limit,
-                image_generation_enabled=bool(img_enabled),
-                image_provider=img_cfg.get("image_provider", "gemini"),
-                image_model=str(img_model),
-                image_scanner_provider=img_cfg.get("scanner_provider", "gemini"),
-                image_scanner_model=img_cfg.get(
-                    "scanner_model", "gemini-3-flash-preview"
-                ),
-                image_scanner_token_limit=img_cfg.get("scanner_token_limit", 4000),
-            )
+    # Read from live engine state or the latest checkpoint
+    try:
+        state = await _read_session_state(session_id, request)
+    except HTTPException:
+        state = None  # Unreadable checkpoint: fall back to defaults
+    if state is not None:
+        game_config = state["game_config"]
+        dm_config = state.get("dm_config")
+        if dm_config is None:
+            dm_config = DMConfig()
+        return GameConfigResponse(
+            combat_mode=game_config.combat_mode,
+            max_combat_rounds=game_config.max_combat_rounds,
+            summarizer_provider=game_config.summarizer_provider,
+            summarizer_model=game_config.summarizer_model,
+            extractor_provider=game_config.extractor_provider,
+            extractor_model=game_config.extractor_model,
+            party_size=game_config.party_size,
+            narrative_display_limit=game_config.narrative_display_limit,
+            dm_provider=dm_config.provider,
+            dm_model=dm_config.model,
+            dm_token_limit=dm_config.token_limit,
+            image_generation_enabled=bool(img_enabled),
+            image_provider=img_cfg.get("image_provider", "gemini"),
+            image_model=str(img_model),
+            image_scanner_provider=img_cfg.get("scanner_provider", "gemini"),
+            image_scanner_model=img_cfg.get("scanner_model", "gemini-3-flash-preview"),
+            image_scanner_token_limit=img_cfg.get("scanner_token_limit", 4000),
+        )
 
     # No checkpoint - return defaults
     defaults = GameConfig()
@@ -1116,44 +1162,129 @@ async def list_models(provider: str) -> ModelListResponse:
 
 
 # =============================================================================
-# Character Endpoints
+# Character Library Registry
 # =============================================================================
+# Library characters are parsed once and indexed by lowercase name. Each
+# access re-stats the directory (a cheap scandir, no YAML parsing) and only
+# re-parses files whose mtime/size changed, so edits made outside the API
+# are still picked up. Call these helpers from a worker thread (sync def
+# endpoints or asyncio.to_thread), never directly on the event loop.
 
+# A file modified this recently may change again within the same mtime tick
+# on coarse-timestamp filesystems, so its parsed contents are not reused.
+_LIBRARY_RACY_SECONDS = 2.0
 
-def _load_library_characters() -> dict[str, CharacterConfig]:
-    """Load characters from the library directory.
+# Parsed library entry: (config or None if invalid, raw YAML data, file path)
+_LibraryEntry = tuple[CharacterConfig | None, dict[str, Any], Path]
+
+# Cached file: ((mtime_ns, size), entry or None if unparseable)
+_LibraryFile = tuple[tuple[int, int], _LibraryEntry | None]
+
+# library dir -> {filename: cached file}
+_library_files: dict[str, dict[str, _LibraryFile]] = {}
+_library_lock = threading.Lock()
+
+
+def _library_dir() -> Path:
+    """Return the character library directory."""
+    return PROJECT_ROOT / "config" / "characters" / "library"
+
+
+def _parse_library_file(yaml_file: Path) -> _LibraryEntry | None:
+    """Parse one library YAML file.
+
+    Args:
+        yaml_file: Path to the character YAML file.
 
     Returns:
-        Dict of CharacterConfig keyed by lowercase name.
+        Library entry, or None if the file is unreadable or empty. The
+        config is None when the data does not validate as a character.
     """
-    library_dir = PROJECT_ROOT / "config" / "characters" / "library"
-    configs: dict[str, CharacterConfig] = {}
+    try:
+        with open(yaml_file, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+    except (yaml.YAMLError, OSError):
+        return None
+    if not isinstance(data, dict):
+        return None
 
-    if not library_dir.exists():
-        return configs
+    # Map YAML 'class' to Pydantic 'character_class' if needed
+    fields = dict(data)
+    if "class" in fields and "character_class" not in fields:
+        fields["character_class"] = fields.pop("class")
 
-    for yaml_file in library_dir.glob("*.yaml"):
-        try:
-            with open(yaml_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-        except yaml.YAMLError:
-            continue
+    try:
+        config: CharacterConfig | None = CharacterConfig(**fields)
+    except (ValidationError, ValueError, TypeError):
+        config = None
+    return config, data, yaml_file
 
-        if data is None:
-            continue
 
-        # Map YAML 'class' to Pydantic 'character_class' if needed
-        if "class" in data and "character_class" not in data:
-            data["character_class"] = data.pop("class")
+def _library_index() -> dict[str, _LibraryEntry]:
+    """Get library entries keyed by lowercase character name.
 
-        try:
-            config = CharacterConfig(**data)
-        except (ValidationError, ValueError):
+    Includes files whose data fails CharacterConfig validation (config is
+    None) so mutation endpoints can still locate them by name.
+
+    Returns:
+        Dict of lowercase name -> library entry, in filename order.
+    """
+    library_dir = _library_dir()
+    key = str(library_dir)
+    try:
+        with os.scandir(library_dir) as it:
+            stamps: dict[str, tuple[int, int]] = {}
+            for entry in it:
+                if entry.name.endswith(".yaml") and entry.is_file():
+                    st = entry.stat()
+                    stamps[entry.name] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamps = {}
+
+    with _library_lock:
+        cached = dict(_library_files.get(key, {}))
+
+    now_ns = time.time_ns()
+    racy_ns = int(_LIBRARY_RACY_SECONDS * 1e9)
+    files: dict[str, _LibraryFile] = {}
+    for name in sorted(stamps):
+        stamp = stamps[name]
+        hit = cached.get(name)
+        if hit is not None and hit[0] == stamp and now_ns - stamp[0] >= racy_ns:
+            files[name] = hit
+        else:
+            files[name] = (stamp, _parse_library_file(library_dir / name))
+
+    with _library_lock:
+        _library_files[key] = files
+
+    index: dict[str, _LibraryEntry] = {}
+    for _, entry in files.values():
+        if entry is None:
             continue
+        name = entry[1].get("name")
+        if isinstance(name, str) and name:
+            index[name.lower()] = entry
+    return index
+
+
+def _find_library_file(name_lower: str) -> Path | None:
+    """Locate a library character's YAML file by lowercase name."""
+    entry = _library_index().get(name_lower)
+    return entry[2] if entry is not None else None
 
-        configs[config.name.lower()] = config
 
-    return configs
+def _load_library_characters() -> dict[str, CharacterConfig]:
+    """Load characters from the library directory.
+
+    Returns:
+        Dict of CharacterConfig keyed by lowercase name.
+    """
+    return {
+        name: config
+        for name, (config, _, _) in _library_index().items()
+        if config is not None
+    }
 
 
 def _load_library_backstory(name_lower: str) -> str:
@@ -1165,29 +1296,23 @@ def _load_library_backstory(name_lower: str) -> str:
     Returns:
         Backstory string, or empty string if not found.
     """
-    library_dir = PROJECT_ROOT / "config" / "characters" / "library"
-    if not library_dir.exists():
-        return ""
+    entry = _library_index().get(name_lower)
+    return str(entry[1].get("backstory", "")) if entry is not None else ""
 
-    for yaml_file in library_dir.glob("*.yaml"):
-        try:
-            with open(yaml_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-        except yaml.YAMLError:
-            continue
-        if data and data.get("name", "").lower() == name_lower:
-            return str(data.get("backstory", ""))
 
-    return ""
+# =============================================================================
+# Character Endpoints
+# =============================================================================
 
 
 @router.get("/characters", response_model=list[CharacterResponse])
-async def list_characters() -> list[CharacterResponse]:
+def list_characters() -> list[CharacterResponse]:
     """List all available characters from presets and library.
 
     Excludes DM config. Combines preset characters from
     config/characters/*.yaml with library characters from
-    config/characters/library/*.yaml.
+    config/characters/library/*.yaml. Uses sync def so FastAPI runs it
+    in a threadpool, keeping YAML parsing off the event loop.
 
     Returns:
         List of character objects with source indicated.
@@ -1231,10 +1356,11 @@ async def list_characters() -> list[CharacterResponse]:
 
 
 @router.get("/characters/{name}", response_model=CharacterDetailResponse)
-async def get_character(name: str) -> CharacterDetailResponse:
+def get_character(name: str) -> CharacterDetailResponse:
     """Get character details by name (case-insensitive).
 
-    Searches presets first, then library.
+    Searches presets first, then library. Uses sync def so FastAPI runs
+    it in a threadpool, keeping YAML parsing off the event loop.
 
     Args:
         name: Character name (lowercase match).
@@ -1370,7 +1496,7 @@ def _find_preset_yaml(name: str) -> Path | None:
     return None
 
 
-async def _update_preset_character(
+def _update_preset_character(
     name: str, update_data: dict[str, object]
 ) -> CharacterDetailResponse:
     """Update LLM config fields on a preset character.
@@ -1429,9 +1555,11 @@ async def _update_preset_character(
 
 
 @router.post("/characters", response_model=CharacterDetailResponse, status_code=201)
-async def create_character(body: CharacterCreateRequest) -> CharacterDetailResponse:
+def create_character(body: CharacterCreateRequest) -> CharacterDetailResponse:
     """Create a new custom character and save to the library.
 
+    Uses sync def so FastAPI runs it in a threadpool (file I/O).
+
     Args:
         body: Character creation data.
 
@@ -1442,7 +1570,7 @@ async def create_character(body: CharacterCreateRequest) -> CharacterDetailRespo
         HTTPException: 400 for invalid name, 409 if name already exists.
     """
     safe_filename = _sanitize_character_name(body.name)
-    library_dir = PROJECT_ROOT / "config" / "characters" / "library"
+    library_dir = _library_dir()
     library_dir.mkdir(parents=True, exist_ok=True)
 
     # Check for name collision with presets
@@ -1517,12 +1645,13 @@ async def create_character(body: CharacterCreateRequest) -> CharacterDetailRespo
 
 
 @router.put("/characters/{name}", response_model=CharacterDetailResponse)
-async def update_character(
+def update_character(
     name: str, body: CharacterUpdateRequest
 ) -> CharacterDetailResponse:
     """Update an existing library character.
 
-    Only library characters can be updated; presets are read-only.
+    Only library characters can be updated; presets are read-only. Uses
+    sync def so FastAPI runs it in a threadpool (file I/O).
 
     Args:
         name: Character name (case-insensitive lookup).
@@ -1559,10 +1688,10 @@ async def update_character(
                 status_code=400,
                 detail="No fields to update",
             )
-        return await _update_preset_character(name, update_data)
+        return _update_preset_character(name, update_data)
 
     # Find existing library character
-    library_dir = PROJECT_ROOT / "config" / "characters" / "library"
+    library_dir = _library_dir()
     library_configs = _load_library_characters()
 
     if lookup not in library_configs:
@@ -1605,16 +1734,7 @@ async def update_character(
             )
 
     # Find the existing YAML file
-    existing_file = None
-    for yaml_file in library_dir.glob("*.yaml"):
-        try:
-            with open(yaml_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-        except yaml.YAMLError:
-            continue
-        if data and data.get("name", "").lower() == lookup:
-            existing_file = yaml_file
-            break
+    existing_file = _find_library_file(lookup)
 
     if existing_file is None:
         raise HTTPException(
@@ -1695,10 +1815,11 @@ async def update_character(
 
 
 @router.delete("/characters/{name}", status_code=204)
-async def delete_character(name: str) -> None:
+def delete_character(name: str) -> None:
     """Delete a library character.
 
-    Only library characters can be deleted; presets are protected.
+    Only library characters can be deleted; presets are protected. Uses
+    sync def so FastAPI runs it in a threadpool (file I/O).
 
     Args:
         name: Character name (case-insensitive lookup).
@@ -1720,21 +1841,8 @@ async def delete_character(name: str) -> None:
             detail="Preset characters cannot be deleted",
         )
 
-    lookup = name.lower()
-    library_dir = PROJECT_ROOT / "config" / "characters" / "library"
-
     # Find the YAML file
-    found_file = None
-    if library_dir.exists():
-        for yaml_file in library_dir.glob("*.yaml"):
-            try:
-                with open(yaml_file, encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-            except yaml.YAMLError:
-                continue
-            if data and data.get("name", "").lower() == lookup:
-                found_file = yaml_file
-                break
+    found_file = _find_library_file(name.lower())
 
     if found_file is None:
         raise HTTPException(
@@ -2223,6 +2331,62 @@ async def preview_checkpoint(session_id: str, turn: int) -> CheckpointPreviewRes
     return CheckpointPreviewResponse(turn_number=turn, entries=entries)
 
 
+# =============================================================================
+# Transcript Search
+# =============================================================================
+
+# Upper bound on the ``limit`` query parameter of the search endpoint
+_MAX_SEARCH_RESULTS = 100
+
+
+@router.get(
+    "/sessions/{session_id}/search",
+    response_model=TranscriptSearchResponse,
+)
+def search_session_transcript(
+    session_id: str, q: str, limit: int = SEARCH_RESULT_LIMIT
+) -> TranscriptSearchResponse:
+    """Full-text search over a session's transcript.
+
+    Uses sync def so FastAPI runs it in a threadpool, avoiding
+    event loop blocking during index I/O.
+
+    Args:
+        session_id: Session ID string.
+        q: Words to search for.
+        limit: Maximum number of hits (1 to 100).
+
+    Returns:
+        Matching entries with turn numbers and snippets, best first.
+    """
+    _validate_and_check_session(session_id)
+
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="Search query is empty")
+    if not 1 <= limit <= _MAX_SEARCH_RESULTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid limit: {limit}. Must be 1 to {_MAX_SEARCH_RESULTS}.",
+        )
+
+    try:
+        hits = search_transcript(session_id, q, limit)
+    except (sqlite3.Error, OSError) as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to search transcript: {e}"
+        ) from None
+
+    return TranscriptSearchResponse(
+        query=q,
+        hits=[
+            TranscriptSearchHitResponse(
+                turn=hit.turn, agent=hit.agent, snippet=hit.snippet, score=hit.score
+            )
+            for hit in hits
+        ],
+    )
+
+
 @router.post("/sessions/{session_id}/checkpoints/{turn}/restore", status_code=200)
 async def restore_checkpoint(session_id: str, turn: int) -> dict[str, object]:
     """Restore game state to a specific checkpoint.
@@ -2270,15 +2434,17 @@ async def restore_checkpoint(session_id: str, turn: int) -> dict[str, object]:
     response_model=CharacterSheetResponse,
 )
 async def get_character_sheet(
-    session_id: str, character_name: str
+    session_id: str, character_name: str, request: Request
 ) -> CharacterSheetResponse:
     """Get the full character sheet for a character in a session.
 
-    Loads the latest game state and extracts the character sheet.
+    Reads the current game state (live engine or latest checkpoint) and
+    extracts the character sheet.
 
     Args:
         session_id: Session ID string.
         character_name: Character name (case-insensitive lookup).
+        request: FastAPI request (for accessing app.state.engines).
 
     Returns:
         Full character sheet data.
@@ -2292,21 +2458,13 @@ async def get_character_sheet(
             detail="Character name contains invalid characters",
         )
 
-    # Load latest checkpoint
-    latest_turn = await _aio_get_latest_checkpoint(session_id)
-    if latest_turn is None:
+    state = await _read_session_state(session_id, request)
+    if state is None:
         raise HTTPException(
             status_code=404,
             detail="Session has no checkpoints",
         )
 
-    state = await _aio_load_checkpoint(session_id, latest_turn)
-    if state is None:
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to load latest checkpoint",
-        )
-
     # Find character sheet from state
     character_sheets = state.get("character_sheets", {})
     if not character_sheets:
@@ -2494,10 +2652,12 @@ async def get_character_sheet(
     "/sessions/{session_id}/npcs/{npc_key}",
     response_model=NpcProfileResponse,
 )
-async def get_npc_profile(session_id: str, npc_key: str) -> NpcProfileResponse:
+async def get_npc_profile(
+    session_id: str, npc_key: str, request: Request
+) -> NpcProfileResponse:
     """Get the full NPC profile for an active combat encounter.
 
-    Loads the latest game state and extracts the NPC from
+    Reads the current game state and extracts the NPC from
     `combat_state.npc_profiles`. Returns 404 if combat is inactive or
     the NPC key is unknown. Mirrors the PC `get_character_sheet`
     endpoint contract (Story 16-10) for path-traversal validation,
@@ -2507,6 +2667,7 @@ async def get_npc_profile(session_id: str, npc_key: str) -> NpcProfileResponse:
         session_id: Session ID string.
         npc_key: NPC key from `combat_state.npc_profiles`
             (case-insensitive lookup).
+        request: FastAPI request (for accessing app.state.engines).
 
     Returns:
         Full NPC profile data (NpcProfileResponse).
@@ -2524,20 +2685,13 @@ async def get_npc_profile(session_id: str, npc_key: str) -> NpcProfileResponse:
             detail="NPC key contains invalid characters",
         )
 
-    latest_turn = await _aio_get_latest_checkpoint(session_id)
-    if latest_turn is None:
+    state = await _read_session_state(session_id, request)
+    if state is None:
         raise HTTPException(
             status_code=404,
             detail="Session has no checkpoints",
         )
 
-    state = await _aio_load_checkpoint(session_id, latest_turn)
-    if state is None:
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to load latest checkpoint",
-        )
-
     combat = state.get("combat_state")
     if combat is None:
         raise HTTPException(
@@ -2594,9 +2748,7 @@ _IMAGE_ID_RE = _re.compile(
 # Valid generation_mode values for filename sanitization.
 _VALID_GENERATION_MODES = frozenset({"current", "best", "specific", "scene"})
 
-# Track active image generation tasks per session to prevent concurrent overload.
-# Maps session_id -> set of asyncio.Task references (also keeps strong refs to tasks).
-_active_image_tasks: dict[str, set[asyncio.Task[None]]] = {}
+# Pending or running image jobs allowed per session (see api.image_jobs)
 _MAX_CONCURRENT_IMAGE_TASKS = 3
 
 
@@ -2624,17 +2776,190 @@ def _check_image_generation_enabled() -> None:
     )
 
 
-def _build_download_url(session_id: str, image_id: str) -> str:
-    """Build the download URL for a generated image.
+def _check_image_job_capacity(session_id: str, dedup_key: str) -> None:
+    """Raise HTTP 429 if a session already has too many image jobs queued.
+
+    Requests for work that is already queued are let through, since they
+    join the existing job rather than adding one.
 
     Args:
         session_id: Session ID string.
-        image_id: Image UUID string.
+        dedup_key: Deduplication key of the requested job.
+
+    Raises:
+        HTTPException: 429 if the session is at its image job limit.
+    """
+    queue = get_image_job_queue()
+    if queue.find_active(dedup_key) is not None:
+        return
+    if queue.active_count(session_id) >= _MAX_CONCURRENT_IMAGE_TASKS:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Too many concurrent image generation requests "
+            f"(max {_MAX_CONCURRENT_IMAGE_TASKS}). Please wait for "
+            f"current tasks to complete.",
+        )
+
+
+def _image_provider() -> str:
+    """Get the configured image provider that jobs count against."""
+    from image_gen import get_image_generator
+
+    return get_image_generator()._get_image_config().image_provider
+
+
+def _image_job_response(job: ImageJob) -> ImageJobResponse:
+    """Convert a queued image job to its API response."""
+    return ImageJobResponse(
+        job_id=job.id,
+        session_id=job.session_id,
+        status=job.status,
+        generation_mode=job.generation_mode,
+        turn_number=job.turn_number,
+        provider=job.provider,
+        created_at=job.created_at,
+        error=job.error,
+        image_id=job.image_id,
+        download_url=(
+            build_download_url(job.session_id, job.image_id) if job.image_id else None
+        ),
+    )
+
+
+# Generated images and thumbnails are UUID-named and never rewritten, so
+# browsers and proxies may cache them indefinitely.
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _is_not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """Check conditional request headers against a file's validators.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+
+    Args:
+        request: Incoming request.
+        etag: Quoted strong ETag of the file.
+        mtime: File modification time (epoch seconds).
 
     Returns:
-        Relative URL path to the image file.
+        True if the client's cached copy is current (respond 304).
     """
-    return f"/api/sessions/{session_id}/images/{image_id}.png"
+    from email.utils import parsedate_to_datetime
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or any(
+            tag.removeprefix("W/") == etag for tag in candidates
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(mtime) <= since
+    return False
+
+
+def _cached_file_response(
+    request: Request,
+    path: Path,
+    media_type: str,
+    headers: dict[str, str] | None = None,
+) -> Any:
+    """Serve an immutable image file with HTTP caching headers.
+
+    Sets ETag, Last-Modified and an immutable Cache-Control, and answers
+    conditional requests with 304 Not Modified without reading the file.
+
+    Args:
+        request: Incoming request (for conditional headers).
+        path: File to serve.
+        media_type: Response content type.
+        headers: Extra response headers (e.g. Content-Disposition).
+
+    Returns:
+        FileResponse, or an empty 304 Response.
+
+    Raises:
+        HTTPException: 404 if the file disappeared.
+    """
+    from email.utils import formatdate
+
+    from fastapi.responses import FileResponse, Response
+
+    try:
+        stat_result = path.stat()
+    except OSError:
+        raise HTTPException(status_code=404, detail="Image not found") from None
+
+    etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    cache_headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "Cache-Control": _IMMUTABLE_CACHE_CONTROL,
+    }
+    if _is_not_modified(request, etag, stat_result.st_mtime):
+        return Response(status_code=304, headers=cache_headers)
+
+    return FileResponse(
+        str(path),
+        media_type=media_type,
+        headers={**cache_headers, **(headers or {})},
+        stat_result=stat_result,
+    )
+
+
+# Parsed image sidecars per images directory: path -> (dir mtime_ns, sidecars).
+# Sidecars are written once into new files, so adding or removing an image
+# bumps the directory mtime and invalidates the entry.
+_image_sidecar_cache: dict[str, tuple[int, list[dict[str, Any]]]] = {}
+
+# A directory modified this recently may change again within the same mtime
+# tick on coarse-timestamp filesystems, so its listing is not cached yet.
+_SIDECAR_CACHE_RACY_SECONDS = 2.0
+
+
+def _load_image_sidecars(images_dir: Path) -> list[dict[str, Any]]:
+    """Load all parsed JSON sidecars in an images directory, with caching.
+
+    Synchronous -- call from sync handlers or via asyncio.to_thread.
+
+    Args:
+        images_dir: Session images directory.
+
+    Returns:
+        Parsed sidecar dicts sorted by filename; unreadable files skipped.
+        Callers must not mutate the returned dicts.
+    """
+    key = str(images_dir)
+    try:
+        dir_mtime_ns = images_dir.stat().st_mtime_ns
+    except OSError:
+        _image_sidecar_cache.pop(key, None)
+        return []
+
+    cached = _image_sidecar_cache.get(key)
+    if cached is not None and cached[0] == dir_mtime_ns:
+        return cached[1]
+
+    sidecars: list[dict[str, Any]] = []
+    for json_file in sorted(images_dir.glob("*.json")):
+        try:
+            data = _json.loads(json_file.read_text(encoding="utf-8"))
+        except (ValueError, OSError) as e:
+            logger.warning("Skipping invalid image metadata %s: %s", json_file, e)
+            continue
+        if not isinstance(data, dict):
+            logger.warning("Skipping invalid image metadata %s", json_file)
+            continue
+        sidecars.append(data)  # type: ignore[arg-type]
+
+    if time.time() - dir_mtime_ns / 1e9 >= _SIDECAR_CACHE_RACY_SECONDS:
+        _image_sidecar_cache[key] = (dir_mtime_ns, sidecars)
+    return sidecars
 
 
 def _get_safe_session_name(session_id: str) -> str:
@@ -2660,127 +2985,117 @@ def _get_safe_session_name(session_id: str) -> str:
     return safe[:50] if safe else f"session_{session_id}"
 
 
-async def _generate_image_background(
-    session_id: str,
-    task_id: str,
-    log_entries: list[str],
-    characters: dict[str, Any],
-    turn_number: int,
-    generation_mode: Literal["current", "best", "specific"],
-) -> None:
-    """Background task for image generation.
+def _read_image_sidecar_meta(images_dir: Path, image_id: str) -> tuple[int, str]:
+    """Read turn number and generation mode from an image's JSON sidecar.
+
+    Args:
+        images_dir: Session images directory.
+        image_id: Image UUID string (without extension).
+
+    Returns:
+        Tuple of (turn_number, generation_mode). Defaults to (0, "scene")
+        when the sidecar is missing or invalid.
+    """
+    turn_number = 0
+    generation_mode = "scene"
+    metadata_path = images_dir / f"{image_id}.json"
+    if metadata_path.exists():
+        try:
+            data = _json.loads(metadata_path.read_text(encoding="utf-8"))
+            turn_number = int(data.get("turn_number", 0))
+            raw_mode = data.get("generation_mode", "scene")
+            generation_mode = (
+                raw_mode if raw_mode in _VALID_GENERATION_MODES else "scene"
+            )
+        except (KeyError, ValueError, OSError, TypeError):
+            pass  # Use defaults
+    return turn_number, generation_mode
 
-    Builds a scene prompt, generates an image, saves metadata,
-    and broadcasts a WebSocket event on completion.
 
-    This function MUST NOT raise exceptions -- all errors are caught
-    and logged to prevent crashing the event loop.
+# Read size when copying image files into a streamed zip archive
+_ZIP_STREAM_CHUNK_SIZE = 64 * 1024
 
-    Args:
-        session_id: Session ID.
-        task_id: Unique task identifier for tracking.
-        log_entries: Narrative log entries for scene context.
-        characters: Character info dict.
-        turn_number: Turn number being illustrated.
-        generation_mode: How the image was requested.
+
+class _ZipStreamSink(io.RawIOBase):
+    """Write-only, unseekable sink that hands zip output out in pieces.
+
+    zipfile detects that the sink cannot tell()/seek() and writes a data
+    descriptor after each entry instead of patching local headers, so the
+    archive is produced strictly front to back.
     """
-    from image_gen import ImageGenerationError, ImageGenerator
 
-    try:
-        generator = ImageGenerator()
+    def __init__(self) -> None:
+        super().__init__()
+        self._pending: list[bytes] = []
 
-        # Step 1: Build scene prompt via LLM
-        prompt = await generator.build_scene_prompt(log_entries, characters)
+    def writable(self) -> bool:
+        return True
 
-        # Step 2: Generate image via Imagen API
-        scene_image = await generator.generate_scene_image(
-            prompt=prompt,
-            session_id=session_id,
-            turn_number=turn_number,
-            generation_mode=generation_mode,
-        )
-
-        # Step 3: Save metadata as JSON sidecar
-        # Ensure images dir exists (defensive -- generate_scene_image creates
-        # it for the PNG, but we must guarantee it exists for the sidecar).
-        # Offload blocking file I/O to a thread to avoid stalling the event loop.
-        images_dir = get_session_dir(session_id) / "images"
-        await asyncio.to_thread(images_dir.mkdir, parents=True, exist_ok=True)
-        metadata_path = images_dir / f"{scene_image.id}.json"
-        await asyncio.to_thread(
-            metadata_path.write_text,
-            _json.dumps(scene_image.model_dump(), indent=2),
-            encoding="utf-8",
-        )
-
-        # Step 4: Broadcast WebSocket event using schema for validation
-        from api.schemas import SceneImageResponse, WsImageReady
-        from api.websocket import manager
-
-        download_url = _build_download_url(session_id, scene_image.id)
-        ws_event = WsImageReady(
-            image=SceneImageResponse(
-                id=scene_image.id,
-                session_id=scene_image.session_id,
-                turn_number=scene_image.turn_number,
-                prompt=scene_image.prompt,
-                image_path=scene_image.image_path,
-                provider=scene_image.provider,
-                model=scene_image.model,
-                generation_mode=scene_image.generation_mode,
-                generated_at=scene_image.generated_at,
-                download_url=download_url,
-            ),
-        )
-        await manager.broadcast(session_id, ws_event.model_dump())
-
-        logger.info(
-            "Image generated for session %s turn %d (task %s): %s",
-            session_id,
-            turn_number,
-            task_id,
-            scene_image.id,
-        )
-
-    except ImageGenerationError as e:
-        logger.error(
-            "Image generation failed for session %s turn %d (task %s): %s",
-            session_id,
-            turn_number,
-            task_id,
-            e,
-        )
-        # Broadcast error to connected clients
-        from api.websocket import manager
-
-        await manager.broadcast(
-            session_id,
-            {
-                "type": "error",
-                "message": f"Image generation failed: {e}",
-                "recoverable": True,
-            },
-        )
+    def write(self, b: Any) -> int:
+        data = bytes(b)
+        self._pending.append(data)
+        return len(data)
 
-    except Exception as e:
-        logger.exception(
-            "Unexpected error in image generation background task "
-            "(session=%s, turn=%d, task=%s)",
-            session_id,
-            turn_number,
-            task_id,
-        )
-        # Broadcast generic error
-        from api.websocket import manager
+    def drain(self) -> bytes:
+        """Return and clear everything written since the last drain."""
+        data = b"".join(self._pending)
+        self._pending.clear()
+        return data
 
-        await manager.broadcast(
-            session_id,
-            {
-                "type": "error",
-                "message": f"Image generation failed unexpectedly: {e}",
-                "recoverable": True,
-            },
-        )
+
+def _iter_images_zip(
+    png_files: list[Path], images_dir: Path, session_name: str
+) -> Iterator[bytes]:
+    """Generate a zip archive of session images incrementally.
+
+    PNGs are already compressed, so entries are stored rather than
+    deflated. Each file is read in chunks and the archive bytes are
+    yielded as they are produced, keeping memory flat regardless of
+    gallery size. Files that disappear mid-download are skipped.
+
+    Args:
+        png_files: PNG files to include, in archive order.
+        images_dir: Session images directory (for JSON sidecars).
+        session_name: Sanitized session name for archive entry names.
+
+    Yields:
+        Consecutive pieces of the zip archive.
+    """
+    sink = _ZipStreamSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED) as zf:
+        used_names: set[str] = set()
+        for png_path in png_files:
+            turn_number, generation_mode = _read_image_sidecar_meta(
+                images_dir, png_path.stem
+            )
+
+            # Filename inside the zip: session_turn_N_mode.png
+            base = f"{session_name}_turn_{turn_number + 1}_{generation_mode}"
+            archive_name = f"{base}.png"
+            # Deduplicate: append counter if name already used
+            if archive_name in used_names:
+                counter = 2
+                while f"{base}_{counter}.png" in used_names:
+                    counter += 1
+                archive_name = f"{base}_{counter}.png"
+
+            try:
+                src = png_path.open("rb")
+            except OSError:
+                continue  # Deleted since listing
+            with src:
+                # from_file records size and mtime; size lets zipfile
+                # decide up front whether the entry needs ZIP64
+                zinfo = zipfile.ZipInfo.from_file(str(png_path), archive_name)
+                zinfo.compress_type = zipfile.ZIP_STORED
+                used_names.add(archive_name)
+                with zf.open(zinfo, "w") as dest:
+                    while chunk := src.read(_ZIP_STREAM_CHUNK_SIZE):
+                        dest.write(chunk)
+                        yield sink.drain()
+            yield sink.drain()
+    # Central directory is written on close
+    yield sink.drain()
 
 
 @router.post(
@@ -2808,19 +3123,6 @@ async def generate_current_scene_image(
     _validate_and_check_session(session_id)
     _check_image_generation_enabled()
 
-    # Guard against too many concurrent image tasks for this session
-    active = _active_image_tasks.get(session_id, set())
-    # Prune completed tasks
-    active = {t for t in active if not t.done()}
-    _active_image_tasks[session_id] = active
-    if len(active) >= _MAX_CONCURRENT_IMAGE_TASKS:
-        raise HTTPException(
-            status_code=429,
-            detail=f"Too many concurrent image generation requests "
-            f"(max {_MAX_CONCURRENT_IMAGE_TASKS}). Please wait for "
-            f"current tasks to complete.",
-        )
-
     # Load game state (prefer in-memory engine state to avoid large checkpoint I/O)
     state = await _get_state_for_image_gen(session_id, request)
 
@@ -2834,26 +3136,26 @@ async def generate_current_scene_image(
     entries = list(log[-context_entries:])
     turn_number = len(log) - 1
 
-    char_dict = _enrich_char_dict_for_images(state)
+    # Identical requests (double-clicks, several viewers) share one job
+    dedup_key = image_job_key(session_id, "current", turn_number, entries)
+    _check_image_job_capacity(session_id, dedup_key)
 
-    task_id = str(_uuid.uuid4())
+    char_dict = await asyncio.to_thread(_enrich_char_dict_for_images, state)
 
-    # Launch background task and store reference to prevent GC
-    task = asyncio.create_task(
-        _generate_image_background(
+    job, _ = await get_image_job_queue().submit(
+        ImageJob(
             session_id=session_id,
-            task_id=task_id,
+            generation_mode="current",
+            turn_number=turn_number,
+            dedup_key=dedup_key,
+            provider=_image_provider(),
             log_entries=entries,
             characters=char_dict,
-            turn_number=turn_number,
-            generation_mode="current",
         )
     )
-    active.add(task)
-    task.add_done_callback(lambda t: active.discard(t))
 
     return ImageGenerateAccepted(
-        task_id=task_id,
+        task_id=job.id,
         session_id=session_id,
         turn_number=turn_number,
     )
@@ -2884,19 +3186,6 @@ async def generate_turn_image(
     _validate_and_check_session(session_id)
     _check_image_generation_enabled()
 
-    # Guard against too many concurrent image tasks for this session
-    active = _active_image_tasks.get(session_id, set())
-    # Prune completed tasks
-    active = {t for t in active if not t.done()}
-    _active_image_tasks[session_id] = active
-    if len(active) >= _MAX_CONCURRENT_IMAGE_TASKS:
-        raise HTTPException(
-            status_code=429,
-            detail=f"Too many concurrent image generation requests "
-            f"(max {_MAX_CONCURRENT_IMAGE_TASKS}). Please wait for "
-            f"current tasks to complete.",
-        )
-
     # Load game state (prefer in-memory engine state to avoid large checkpoint I/O)
     state = await _get_state_for_image_gen(session_id, request)
 
@@ -2919,26 +3208,26 @@ async def generate_turn_image(
     end = min(len(log), turn_number + 6)  # +6 because slice is exclusive
     entries = list(log[start:end])
 
-    char_dict = _enrich_char_dict_for_images(state)
+    # Identical requests (double-clicks, several viewers) share one job
+    dedup_key = image_job_key(session_id, "specific", turn_number, entries)
+    _check_image_job_capacity(session_id, dedup_key)
 
-    task_id = str(_uuid.uuid4())
+    char_dict = await asyncio.to_thread(_enrich_char_dict_for_images, state)
 
-    # Launch background task and store reference to prevent GC
-    task = asyncio.create_task(
-        _generate_image_background(
+    job, _ = await get_image_job_queue().submit(
+        ImageJob(
             session_id=session_id,
-            task_id=task_id,
+            generation_mode="specific",
+            turn_number=turn_number,
+            dedup_key=dedup_key,
+            provider=_image_provider(),
             log_entries=entries,
             characters=char_dict,
-            turn_number=turn_number,
-            generation_mode="specific",
         )
     )
-    active.add(task)
-    task.add_done_callback(lambda t: active.discard(t))
 
     return ImageGenerateAccepted(
-        task_id=task_id,
+        task_id=job.id,
         session_id=session_id,
         turn_number=turn_number,
     )
@@ -2949,136 +3238,6 @@ async def generate_turn_image(
 # =============================================================================
 
 
-async def _scan_and_generate_best_image(
-    session_id: str,
-    task_id: str,
-    log_entries: list[str],
-    characters: dict[str, Any],
-) -> None:
-    """Background task that scans for the best scene, then generates an image.
-
-    Combines the scanner phase (LLM analysis of full log) with the image
-    generation phase (prompt building + Imagen API call) in a single task.
-
-    This function MUST NOT raise exceptions -- all errors are caught
-    and broadcast as WebSocket error events.
-
-    Args:
-        session_id: Session ID.
-        task_id: Unique task identifier for tracking.
-        log_entries: Complete ground_truth_log entries.
-        characters: Character info dict.
-    """
-    from image_gen import ImageGenerationError, ImageGenerator
-
-    try:
-        generator = ImageGenerator()
-
-        # Phase 1: Scan for best scene
-        turn_number, rationale = await generator.scan_best_scene(log_entries)
-
-        logger.info(
-            "Best scene scan complete for session %s (task %s): Turn %d - %s",
-            session_id,
-            task_id,
-            turn_number,
-            rationale[:150],
-        )
-
-        # Phase 2: Extract context window around identified turn (+/-5 entries)
-        start = max(0, turn_number - 5)
-        end = min(len(log_entries), turn_number + 6)
-        context_entries = list(log_entries[start:end])
-
-        # Phase 3: Build scene prompt
-        prompt = await generator.build_scene_prompt(context_entries, characters)
-
-        # Phase 4: Generate image
-        scene_image = await generator.generate_scene_image(
-            prompt=prompt,
-            session_id=session_id,
-            turn_number=turn_number,
-            generation_mode="best",
-        )
-
-        # Phase 5: Save metadata as JSON sidecar.
-        # Offload blocking file I/O to a thread to avoid stalling the event loop.
-        images_dir = get_session_dir(session_id) / "images"
-        await asyncio.to_thread(images_dir.mkdir, parents=True, exist_ok=True)
-        metadata_path = images_dir / f"{scene_image.id}.json"
-        await asyncio.to_thread(
-            metadata_path.write_text,
-            _json.dumps(scene_image.model_dump(), indent=2),
-            encoding="utf-8",
-        )
-
-        # Phase 6: Broadcast WebSocket event
-        from api.schemas import SceneImageResponse as _SceneImageResponse
-        from api.schemas import WsImageReady as _WsImageReady
-        from api.websocket import manager
-
-        download_url = _build_download_url(session_id, scene_image.id)
-        ws_event = _WsImageReady(
-            image=_SceneImageResponse(
-                id=scene_image.id,
-                session_id=scene_image.session_id,
-                turn_number=scene_image.turn_number,
-                prompt=scene_image.prompt,
-                image_path=scene_image.image_path,
-                provider=scene_image.provider,
-                model=scene_image.model,
-                generation_mode=scene_image.generation_mode,
-                generated_at=scene_image.generated_at,
-                download_url=download_url,
-            ),
-        )
-        await manager.broadcast(session_id, ws_event.model_dump())
-
-        logger.info(
-            "Best scene image generated for session %s turn %d (task %s): %s",
-            session_id,
-            turn_number,
-            task_id,
-            scene_image.id,
-        )
-
-    except ImageGenerationError as e:
-        logger.error(
-            "Best scene generation failed for session %s (task %s): %s",
-            session_id,
-            task_id,
-            e,
-        )
-        from api.websocket import manager
-
-        await manager.broadcast(
-            session_id,
-            {
-                "type": "error",
-                "message": f"Best scene generation failed: {e}",
-                "recoverable": True,
-            },
-        )
-
-    except Exception as e:
-        logger.exception(
-            "Unexpected error in best scene generation background task "
-            "(session=%s, task=%s)",
-            session_id,
-            task_id,
-        )
-        from api.websocket import manager
-
-        await manager.broadcast(
-            session_id,
-            {
-                "type": "error",
-                "message": f"Best scene generation failed unexpectedly: {e}",
-                "recoverable": True,
-            },
-        )
-
-
 @router.post(
     "/sessions/{session_id}/images/generate-best",
     response_model=BestSceneAccepted,
@@ -3090,8 +3249,10 @@ async def generate_best_scene_image(
 ) -> BestSceneAccepted:
     """Generate an image of the most visually dramatic scene in the session.
 
-    Uses an LLM scanner to analyze the entire ground_truth_log, identify the
-    most visually dramatic scene, and then generate an illustration of it.
+    The session's highlight reel (scored locally as rounds complete) ranks
+    candidate scenes; an LLM scanner picks the most visually dramatic of
+    the top few and an illustration of it is generated. Sessions without
+    highlights fall back to scanning the entire ground_truth_log.
     Runs as a background task with WebSocket notification on completion.
 
     Story 17-4: Best Scene Scanner.
@@ -3105,19 +3266,6 @@ async def generate_best_scene_image(
     _validate_and_check_session(session_id)
     _check_image_generation_enabled()
 
-    # Guard against too many concurrent image tasks for this session
-    active = _active_image_tasks.get(session_id, set())
-    # Prune completed tasks
-    active = {t for t in active if not t.done()}
-    _active_image_tasks[session_id] = active
-    if len(active) >= _MAX_CONCURRENT_IMAGE_TASKS:
-        raise HTTPException(
-            status_code=429,
-            detail=f"Too many concurrent image generation requests "
-            f"(max {_MAX_CONCURRENT_IMAGE_TASKS}). Please wait for "
-            f"current tasks to complete.",
-        )
-
     # Load game state (prefer in-memory engine state to avoid large checkpoint I/O)
     state = await _get_state_for_image_gen(session_id, request)
 
@@ -3127,31 +3275,123 @@ async def generate_best_scene_image(
             status_code=400, detail="Session has no narrative log entries"
         )
 
-    # Extract complete log (entire session history)
-    all_entries = list(log)
+    # Extract complete log (entire session history). Older segments page in
+    # from disk, so copy it off the event loop.
+    all_entries = await asyncio.to_thread(list, log)
 
-    char_dict = _enrich_char_dict_for_images(state)
+    # The log's length and last entry identify its current state
+    scene = [str(len(all_entries)), all_entries[-1]]
+    dedup_key = image_job_key(session_id, "best", None, scene)
+    _check_image_job_capacity(session_id, dedup_key)
 
-    task_id = str(_uuid.uuid4())
+    # Catch the reel up on anything scored outside this process's rounds
+    reel = get_highlight_reel(session_id)
+    await asyncio.to_thread(reel.update, cast(GameState, state))
+    candidates = reel.candidates(BEST_SCENE_CANDIDATES)
 
-    # Launch background task and store reference to prevent GC
-    task = asyncio.create_task(
-        _scan_and_generate_best_image(
+    char_dict = await asyncio.to_thread(_enrich_char_dict_for_images, state)
+
+    job, _ = await get_image_job_queue().submit(
+        ImageJob(
             session_id=session_id,
-            task_id=task_id,
-            log_entries=all_entries,
+            generation_mode="best",
+            dedup_key=dedup_key,
+            provider=_image_provider(),
             characters=char_dict,
-        )
+            candidates=candidates,
+        ),
+        log_entries=all_entries,
     )
-    active.add(task)
-    task.add_done_callback(lambda t: active.discard(t))
 
     return BestSceneAccepted(
-        task_id=task_id,
+        task_id=job.id,
         session_id=session_id,
     )
 
 
+# Job routes are declared before /images/{image_filename}, which would
+# otherwise match "jobs".
+
+
+@router.get(
+    "/sessions/{session_id}/images/jobs",
+    response_model=list[ImageJobResponse],
+)
+async def list_image_jobs(session_id: str) -> list[ImageJobResponse]:
+    """List a session's image generation jobs, newest first.
+
+    Includes pending and running jobs and the most recent finished ones.
+
+    Args:
+        session_id: Session ID string.
+
+    Returns:
+        The session's known image jobs.
+    """
+    _validate_and_check_session(session_id)
+    return [
+        _image_job_response(job) for job in get_image_job_queue().list_jobs(session_id)
+    ]
+
+
+def _get_session_image_job(session_id: str, job_id: str) -> ImageJob:
+    """Look up a session's image job.
+
+    Raises:
+        HTTPException: 404 if the job does not exist in the session.
+    """
+    job = get_image_job_queue().get(job_id)
+    if job is None or job.session_id != session_id:
+        raise HTTPException(status_code=404, detail=f"Image job '{job_id}' not found")
+    return job
+
+
+@router.get(
+    "/sessions/{session_id}/images/jobs/{job_id}",
+    response_model=ImageJobResponse,
+)
+async def get_image_job(session_id: str, job_id: str) -> ImageJobResponse:
+    """Get the status of an image generation job.
+
+    Args:
+        session_id: Session ID string.
+        job_id: Job ID (the task_id returned when the image was requested).
+
+    Returns:
+        The job's status.
+    """
+    _validate_and_check_session(session_id)
+    return _image_job_response(_get_session_image_job(session_id, job_id))
+
+
+@router.post(
+    "/sessions/{session_id}/images/jobs/{job_id}/cancel",
+    response_model=ImageJobResponse,
+)
+async def cancel_image_job(session_id: str, job_id: str) -> ImageJobResponse:
+    """Cancel a pending or running image generation job.
+
+    Args:
+        session_id: Session ID string.
+        job_id: Job ID to cancel.
+
+    Returns:
+        The cancelled job.
+
+    Raises:
+        HTTPException: 409 if the job has already finished.
+    """
+    _validate_and_check_session(session_id)
+    job = _get_session_image_job(session_id, job_id)
+    if not job.is_active:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Image job '{job_id}' has already finished ({job.status})",
+        )
+    await get_image_job_queue().cancel(job_id)
+    return _image_job_response(job)
+
+
 @router.get(
     "/sessions/{session_id}/images",
     response_model=list[SceneImageResponse],
@@ -3178,10 +3418,9 @@ def list_session_images(
         return []
 
     results: list[SceneImageResponse] = []
-    for json_file in sorted(images_dir.glob("*.json")):
+    for data in _load_image_sidecars(images_dir):
         try:
-            data = _json.loads(json_file.read_text(encoding="utf-8"))
-            image_id = data.get("id", json_file.stem)
+            image_id = data["id"]
             results.append(
                 SceneImageResponse(
                     id=data["id"],
@@ -3193,11 +3432,12 @@ def list_session_images(
                     model=data["model"],
                     generation_mode=data["generation_mode"],
                     generated_at=data["generated_at"],
-                    download_url=_build_download_url(session_id, image_id),
+                    download_url=build_download_url(session_id, image_id),
+                    thumbnail_url=build_thumbnail_url(session_id, image_id),
                 )
             )
-        except (KeyError, ValueError, OSError) as e:
-            logger.warning("Skipping invalid image metadata %s: %s", json_file, e)
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning("Skipping invalid image metadata %s: %s", data.get("id"), e)
             continue
 
     return results
@@ -3207,20 +3447,19 @@ def list_session_images(
 async def download_all_session_images(session_id: str) -> Any:
     """Download all generated images for a session as a zip archive.
 
-    Creates an in-memory zip file containing all PNG images from the
-    session's images directory, with descriptive filenames derived from
-    the JSON sidecar metadata.
+    Streams a zip containing all PNG images from the session's images
+    directory, with descriptive filenames derived from the JSON sidecar
+    metadata. The archive is generated incrementally as files are read,
+    so the first bytes arrive immediately and memory use does not grow
+    with gallery size.
 
     Args:
         session_id: Session ID string.
 
     Returns:
-        Response with zip file as attachment.
+        StreamingResponse with zip file as attachment.
     """
-    import io
-    import zipfile
-
-    from fastapi.responses import Response
+    from fastapi.responses import StreamingResponse
 
     _validate_and_check_session(session_id)
 
@@ -3241,51 +3480,10 @@ async def download_all_session_images(session_id: str) -> Any:
     session_name = _get_safe_session_name(session_id)
     zip_filename = f"{session_name}_images.zip"
 
-    def _build_zip() -> bytes:
-        """Build zip archive synchronously (run via to_thread)."""
-        buf = io.BytesIO()
-        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-            used_names: set[str] = set()
-            for png_path in png_files:
-                # Derive archive filename from sidecar metadata
-                image_id = png_path.stem
-                metadata_path = images_dir / f"{image_id}.json"
-
-                turn_number = 0
-                generation_mode = "scene"
-                if metadata_path.exists():
-                    try:
-                        data = _json.loads(metadata_path.read_text(encoding="utf-8"))
-                        turn_number = int(data.get("turn_number", 0))
-                        raw_mode = data.get("generation_mode", "scene")
-                        generation_mode = (
-                            raw_mode if raw_mode in _VALID_GENERATION_MODES else "scene"
-                        )
-                    except (KeyError, ValueError, OSError, TypeError):
-                        pass
-
-                # Filename inside the zip: session_turn_N_mode.png
-                archive_name = (
-                    f"{session_name}_turn_{turn_number + 1}_{generation_mode}.png"
-                )
-                # Deduplicate: append counter if name already used
-                if archive_name in used_names:
-                    counter = 2
-                    base = f"{session_name}_turn_{turn_number + 1}_{generation_mode}"
-                    while f"{base}_{counter}.png" in used_names:
-                        counter += 1
-                    archive_name = f"{base}_{counter}.png"
-                used_names.add(archive_name)
-                zf.write(str(png_path), archive_name)
-
-        return buf.getvalue()
-
-    # Offload synchronous zip building to a thread to avoid blocking the
-    # event loop for sessions with many images.
-    zip_bytes = await asyncio.to_thread(_build_zip)
-
-    return Response(
-        content=zip_bytes,
+    # A sync iterator is consumed in Starlette's threadpool, so file reads
+    # never block the event loop.
+    return StreamingResponse(
+        _iter_images_zip(png_files, images_dir, session_name),
         media_type="application/zip",
         headers={
             "Content-Disposition": f'attachment; filename="{zip_filename}"',
@@ -3294,7 +3492,9 @@ async def download_all_session_images(session_id: str) -> Any:
 
 
 @router.get("/sessions/{session_id}/images/{image_id}/download")
-async def download_session_image(session_id: str, image_id: str) -> Any:
+async def download_session_image(
+    session_id: str, image_id: str, request: Request
+) -> Any:
     """Download a generated image with a descriptive filename.
 
     Returns the PNG file with Content-Disposition: attachment header
@@ -3303,12 +3503,11 @@ async def download_session_image(session_id: str, image_id: str) -> Any:
     Args:
         session_id: Session ID string.
         image_id: Image UUID string (without .png extension).
+        request: Incoming request (for conditional caching headers).
 
     Returns:
-        FileResponse with attachment disposition.
+        FileResponse with attachment disposition (or 304 Not Modified).
     """
-    from fastapi.responses import FileResponse
-
     _validate_and_check_session(session_id)
 
     # Validate image_id format (UUID without extension)
@@ -3321,44 +3520,72 @@ async def download_session_image(session_id: str, image_id: str) -> Any:
         raise HTTPException(status_code=404, detail="Image not found")
 
     # Load metadata sidecar for turn number and mode
-    metadata_path = images_dir / f"{image_id}.json"
-    turn_number = 0
-    generation_mode = "scene"
-    if metadata_path.exists():
-        try:
-            data = _json.loads(metadata_path.read_text(encoding="utf-8"))
-            turn_number = int(data.get("turn_number", 0))
-            raw_mode = data.get("generation_mode", "scene")
-            generation_mode = (
-                raw_mode if raw_mode in _VALID_GENERATION_MODES else "scene"
-            )
-        except (KeyError, ValueError, OSError, TypeError):
-            pass  # Use defaults
+    turn_number, generation_mode = _read_image_sidecar_meta(images_dir, image_id)
 
     # Build descriptive filename
     session_name = _get_safe_session_name(session_id)
     filename = f"{session_name}_turn_{turn_number + 1}_{generation_mode}.png"
 
-    return FileResponse(
-        str(image_path),
-        media_type="image/png",
+    return _cached_file_response(
+        request,
+        image_path,
+        "image/png",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
+@router.get("/sessions/{session_id}/images/{image_id}/thumbnail")
+async def serve_session_image_thumbnail(
+    session_id: str, image_id: str, request: Request
+) -> Any:
+    """Serve the WebP gallery thumbnail for a generated image.
+
+    Thumbnails are written when an image is saved; for older images the
+    thumbnail is created on first request and cached on disk.
+
+    Args:
+        session_id: Session ID string.
+        image_id: Image UUID string (without extension).
+        request: Incoming request (for conditional caching headers).
+
+    Returns:
+        The thumbnail as a FileResponse (or 304 Not Modified).
+    """
+    from image_gen import ensure_thumbnail
+
+    _validate_and_check_session(session_id)
+
+    if not _IMAGE_ID_RE.match(image_id):
+        raise HTTPException(status_code=400, detail="Invalid image ID format")
+
+    image_path = get_session_dir(session_id) / "images" / f"{image_id}.png"
+    if not image_path.exists():
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    try:
+        thumb_path = await asyncio.to_thread(ensure_thumbnail, image_path)
+    except (OSError, ValueError) as e:
+        # Unreadable/corrupt source PNG (PIL raises OSError subclasses)
+        logger.warning("Thumbnail unavailable for %s: %s", image_path, e)
+        raise HTTPException(status_code=404, detail="Thumbnail unavailable") from e
+
+    return _cached_file_response(request, thumb_path, "image/webp")
+
+
 @router.get("/sessions/{session_id}/images/{image_filename}")
-async def serve_session_image(session_id: str, image_filename: str) -> Any:
+async def serve_session_image(
+    session_id: str, image_filename: str, request: Request
+) -> Any:
     """Serve a generated image file.
 
     Args:
         session_id: Session ID string.
         image_filename: Image filename (e.g., "uuid.png").
+        request: Incoming request (for conditional caching headers).
 
     Returns:
-        The image file as a FileResponse.
+        The image file as a FileResponse (or 304 Not Modified).
     """
-    from fastapi.responses import FileResponse
-
     _validate_and_check_session(session_id)
 
     # Validate filename format: UUID.png only
@@ -3372,4 +3599,4 @@ async def serve_session_image(session_id: str, image_filename: str) -> Any:
     if not image_path.exists():
         raise HTTPException(status_code=404, detail="Image not found")
 
-    return FileResponse(str(image_path), media_type="image/png")
+    return _cached_file_response(request, image_path, "image/png")
@@ -322,6 +322,29 @@ class CheckpointPreviewResponse(BaseModel):
     entries: list[str] = Field(default_factory=list, description="Recent log entries")
 
 
+# =============================================================================
+# Transcript Search Schemas
+# =============================================================================
+
+
+class TranscriptSearchHitResponse(BaseModel):
+    """A transcript entry matching a search query."""
+
+    turn: int = Field(..., ge=1, description="Transcript turn number (1-indexed)")
+    agent: str = Field(..., description="Agent who produced the entry")
+    snippet: str = Field(..., description="Excerpt with matched words wrapped in **")
+    score: float = Field(..., description="Relevance score (higher is better)")
+
+
+class TranscriptSearchResponse(BaseModel):
+    """Response for a transcript search, best matches first."""
+
+    query: str = Field(..., description="The search query")
+    hits: list[TranscriptSearchHitResponse] = Field(
+        default_factory=list, description="Matching entries"
+    )
+
+
 # =============================================================================
 # Character Sheet Schema (Story 16-10)
 # =============================================================================
@@ -605,6 +628,30 @@ class WsAutopilotStopped(BaseModel):
     reason: str = Field(..., description="Why autopilot stopped")
 
 
+class WsAutopilotPacing(BaseModel):
+    """Pacing after an autopilot round: next delay and projected finish."""
+
+    type: Literal["autopilot_pacing"] = "autopilot_pacing"
+    delay_seconds: float = Field(..., description="Delay before the next round")
+    avg_round_seconds: float | None = Field(
+        None, description="Smoothed round duration in seconds"
+    )
+    avg_round_tokens: int | None = Field(
+        None, description="Smoothed LLM tokens per round"
+    )
+    tokens_today: int = Field(0, description="LLM tokens used since midnight UTC")
+    token_budget_remaining: int | None = Field(
+        None, description="Tokens left in today's budget (None if unlimited)"
+    )
+    rate_limit_penalty_seconds: float = Field(
+        0.0, description="Extra delay currently added after rate limits"
+    )
+    rounds_left: int = Field(0, description="Rounds until the turn limit")
+    projected_completion: str | None = Field(
+        None, description="Projected time the turn limit is reached (ISO 8601)"
+    )
+
+
 class WsError(BaseModel):
     """Error event from the engine or WebSocket handler."""
 
@@ -721,8 +768,10 @@ class ModuleDiscoveryResponse(BaseModel):
     )
     provider: str = Field(..., description="LLM provider used")
     model: str = Field(..., description="Model used")
-    source: Literal["llm", "error"] = Field(
-        ..., description="Whether modules came from LLM or an error occurred"
+    source: Literal["llm", "cache", "error"] = Field(
+        ...,
+        description="Whether modules came from the LLM, the discovery cache, "
+        "or an error occurred",
     )
     error: str | None = Field(
         default=None, description="Error message if discovery failed"
@@ -783,6 +832,29 @@ class BestSceneAccepted(BaseModel):
     )
 
 
+class ImageJobResponse(BaseModel):
+    """Status of a queued image generation job."""
+
+    job_id: str = Field(..., description="Job ID (the task_id returned on submit)")
+    session_id: str = Field(..., description="Session ID")
+    status: Literal["pending", "running", "done", "failed", "cancelled"] = Field(
+        ..., description="Job status"
+    )
+    generation_mode: Literal["current", "best", "specific"] = Field(
+        ..., description="How the image was requested"
+    )
+    turn_number: int | None = Field(
+        default=None, description="Turn illustrated (None until a best scene is chosen)"
+    )
+    provider: str = Field(..., description="Image provider the job runs on")
+    created_at: str = Field(..., description="ISO timestamp of submission")
+    error: str | None = Field(default=None, description="Failure reason")
+    image_id: str | None = Field(default=None, description="Generated image ID")
+    download_url: str | None = Field(
+        default=None, description="Download URL of the generated image"
+    )
+
+
 class SessionImageSummaryResponse(BaseModel):
     """Lightweight summary of a session's images for gallery population."""
 
@@ -808,3 +880,6 @@ class SceneImageResponse(BaseModel):
     )
     generated_at: str = Field(..., description="ISO timestamp of generation")
     download_url: str = Field(..., description="URL to download the image")
+    thumbnail_url: str | None = Field(
+        default=None, description="URL of the WebP gallery thumbnail"
+    )
@@ -20,6 +20,7 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from api.engine import GameEngine
 from api.schemas import (
     SceneImageResponse,
+    WsAutopilotPacing,
     WsAutopilotStarted,
     WsAutopilotStopped,
     WsAwaitingInput,
@@ -274,6 +275,8 @@ def _engine_event_to_schema(event: dict[str, Any]) -> dict[str, Any]:
         return WsAutopilotStarted().model_dump()
     elif event_type == "autopilot_stopped":
         return WsAutopilotStopped(reason=event.get("reason", "unknown")).model_dump()
+    elif event_type == "autopilot_pacing":
+        return WsAutopilotPacing.model_validate(event).model_dump()
     elif event_type == "error":
         return WsError(
             message=event.get("message", "Unknown error"),
@@ -22,12 +22,14 @@ logging.basicConfig(
 # Set autodungeon logger to show debug messages
 logging.getLogger("autodungeon").setLevel(logging.DEBUG)
 from datetime import date
+from functools import lru_cache
 from html import escape as escape_html
 from pathlib import Path
 
 import streamlit as st
 
 from agents import LLMError, discover_modules
+from api.engine_host import get_engine_host
 from config import (
     MINIMUM_TOKEN_LIMIT,
     AppConfig,
@@ -68,6 +70,7 @@ from models import (
     ValidationResult,
     Weapon,
     create_user_error,
+    parse_entry,
     populate_game_state,
 )
 from persistence import (
@@ -103,6 +106,9 @@ SPEED_DELAYS: dict[str, float] = {
     "fast": 0.2,  # 200ms between turns (near-instant)
 }
 
+# Seconds between polls of the background engine while a round runs
+ENGINE_POLL_INTERVAL = 1.0
+
 # Module-level compiled regex for action text styling
 ACTION_PATTERN = re.compile(r"\*([^*]+)\*")
 
@@ -171,8 +177,13 @@ def run_game_turn() -> bool:
     - Stops autopilot when error occurs
     - Does NOT update game state with corrupted data
 
+    In engine-backed mode the round is started on the background
+    GameEngine instead and this returns without waiting for it;
+    sync_engine_state() picks up its entries and errors.
+
     Returns:
-        True if turn was executed successfully, False if skipped/error.
+        True if turn was executed successfully (or started, in
+        engine-backed mode), False if skipped/error.
     """
     if st.session_state.get("is_paused", False):
         return False
@@ -192,6 +203,9 @@ def run_game_turn() -> bool:
     # Clear waiting flag since we're proceeding
     st.session_state["waiting_for_human"] = False
 
+    if st.session_state.get("engine_backed", False):
+        return start_engine_round()
+
     # Set generating flag
     st.session_state["is_generating"] = True
 
@@ -233,6 +247,69 @@ def run_game_turn() -> bool:
         st.session_state["is_generating"] = False
 
 
+def start_engine_round() -> bool:
+    """Start one round on the background engine without waiting for it.
+
+    Returns:
+        True if the round was started, False if the engine is busy.
+    """
+    game: GameState = st.session_state.get("game", {})
+    if not get_engine_host().start_round(game.get("session_id", "001"), game):
+        return False
+    st.session_state["is_generating"] = True
+    return True
+
+
+def stop_engine_autopilot() -> None:
+    """Stop autopilot on the background engine if this session started it."""
+    if not st.session_state.get("engine_autopilot_started", False):
+        return
+    st.session_state["engine_autopilot_started"] = False
+    game = st.session_state.get("game", {})
+    get_engine_host().stop_autopilot(game.get("session_id", "001"))
+
+
+def sync_engine_state() -> bool:
+    """Pull new log entries and results from the background engine.
+
+    Only runs while this session has a round or autopilot in flight, so
+    states loaded in the meantime (forks, other sessions) are never
+    overwritten. The game state is replaced by the engine's, which is
+    published after every node of the round.
+
+    Returns:
+        True if the round or autopilot run just finished.
+    """
+    in_flight = st.session_state.get("is_generating", False) or st.session_state.get(
+        "engine_autopilot_started", False
+    )
+    if not st.session_state.get("engine_backed", False) or not in_flight:
+        return False
+
+    game: GameState = st.session_state.get("game", {})
+    update = get_engine_host().poll(
+        game.get("session_id", "001"), len(game.get("ground_truth_log", []))
+    )
+    if update is None:
+        return False
+    if update.new_entries or not update.busy:
+        st.session_state["game"] = update.state
+    if update.busy:
+        return False
+
+    st.session_state["is_generating"] = False
+    if st.session_state.get("engine_autopilot_started", False):
+        st.session_state["engine_autopilot_started"] = False
+        st.session_state["is_autopilot_running"] = False
+    if update.last_error is not None:
+        st.session_state["error"] = update.last_error
+        st.session_state["is_autopilot_running"] = False
+    else:
+        st.session_state["error"] = None
+        st.session_state["error_retry_count"] = 0
+    return True
+
+
 # Default maximum turns per session to prevent infinite loops
 DEFAULT_MAX_TURNS_PER_SESSION = 100
 
@@ -303,17 +380,25 @@ def run_autopilot_step() -> None:
 
     This respects Streamlit's execution model while providing
     continuous turn execution.
+
+    In engine-backed mode autopilot runs on the background GameEngine:
+    this starts it once, stops it when a stopping condition is met, and
+    never reruns the script itself. The narrative fragment polls the
+    engine for new entries instead.
     """
     if not st.session_state.get("is_autopilot_running", False):
+        stop_engine_autopilot()
         return
 
     # Check stopping conditions
     if st.session_state.get("is_paused", False):
         st.session_state["is_autopilot_running"] = False
+        stop_engine_autopilot()
         return
 
     if st.session_state.get("human_active", False):
         st.session_state["is_autopilot_running"] = False
+        stop_engine_autopilot()
         return
 
     # Check turn limit safety
@@ -325,6 +410,17 @@ def run_autopilot_step() -> None:
         st.session_state["is_autopilot_running"] = False
         return
 
+    if st.session_state.get("engine_backed", False):
+        game: GameState = st.session_state.get("game", {})
+        session_id = game.get("session_id", "001")
+        speed = st.session_state.get("playback_speed", "normal")
+        host = get_engine_host()
+        if st.session_state.get("engine_autopilot_started", False):
+            host.set_speed(session_id, speed)
+        elif host.start_autopilot(session_id, game, speed, max_turns - turn_count):
+            st.session_state["engine_autopilot_started"] = True
+        return
+
     # Execute one turn
     success = run_game_turn()
     if success:
@@ -1251,6 +1347,12 @@ def render_input_context_bar_html(name: str, char_class: str) -> str:
     )
 
 
+# Rendered message HTML kept per (content, speaker, highlight). Reruns
+# re-render the whole visible narrative, so only new entries miss.
+MESSAGE_HTML_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=MESSAGE_HTML_CACHE_SIZE)
 def render_dm_message_html(content: str, is_current: bool = False) -> str:
     """Generate HTML for DM narration message.
 
@@ -1279,6 +1381,7 @@ def render_dm_message(content: str, is_current: bool = False) -> None:
     st.markdown(render_dm_message_html(content, is_current), unsafe_allow_html=True)
 
 
+@lru_cache(maxsize=MESSAGE_HTML_CACHE_SIZE)
 def render_sheet_message_html(content: str, is_current: bool = False) -> str:
     """Generate HTML for sheet change notification.
 
@@ -1463,6 +1566,7 @@ def format_pc_content(content: str) -> str:
     return ACTION_PATTERN.sub(r'<span class="action-text">\1</span>', escaped)
 
 
+@lru_cache(maxsize=MESSAGE_HTML_CACHE_SIZE)
 def render_pc_message_html(
     name: str, char_class: str, content: str, is_current: bool = False
 ) -> str:
@@ -1625,8 +1729,6 @@ def render_narrative_messages(state: GameState) -> None:
     Args:
         state: Current game state with ground_truth_log.
     """
-    from models import parse_log_entry
-
     log = state.get("ground_truth_log", [])
 
     if not log:
@@ -1668,7 +1770,7 @@ def render_narrative_messages(state: GameState) -> None:
     last_index = len(log) - 1
 
     for i, entry in enumerate(visible_log, start=start_index):
-        message = parse_log_entry(entry)
+        message = parse_entry(entry, i)
         is_current = i == last_index
 
         if message.message_type == "sheet_update":
@@ -1687,6 +1789,30 @@ def render_narrative_messages(state: GameState) -> None:
             render_pc_message(name, char_class, message.content, is_current)
 
 
+def render_live_narrative() -> None:
+    """Render the narrative, polling the background engine while it runs.
+
+    The narrative is a fragment: while a round or autopilot is in flight
+    it reruns on its own every ENGINE_POLL_INTERVAL seconds to show new
+    entries, without re-executing the rest of the script. When the run
+    finishes the whole app reruns once so controls and panels catch up.
+    """
+    game = st.session_state.get("game", {})
+    busy = get_engine_host().is_busy(game.get("session_id", "001"))
+    st.fragment(
+        _render_live_narrative_fragment,
+        run_every=ENGINE_POLL_INTERVAL if busy else None,
+    )()
+
+
+def _render_live_narrative_fragment() -> None:
+    """Sync from the engine and render the narrative (fragment body)."""
+    finished = sync_engine_state()
+    render_narrative_messages(st.session_state.get("game", {}))
+    if finished:
+        st.rerun()
+
+
 def initialize_session_state() -> None:
     """Initialize game state in session state if not present."""
     # Load persisted user settings on first run
@@ -1778,6 +1904,9 @@ def initialize_session_state() -> None:
         st.session_state["is_autopilot_running"] = False
         st.session_state["autopilot_turn_count"] = 0
         st.session_state["max_turns_per_session"] = DEFAULT_MAX_TURNS_PER_SESSION
+        # Run rounds on the background GameEngine
+        st.session_state["engine_backed"] = get_config().streamlit_engine_backed
+        st.session_state["engine_autopilot_started"] = False
         # Human intervention state (Story 3.2)
         st.session_state["human_pending_action"] = None
         st.session_state["waiting_for_human"] = False
@@ -3709,7 +3838,9 @@ def handle_nudge_submit(nudge: str) -> None:
     """Handle submission of nudge suggestion.
 
     Stores the nudge in session state for the DM's next turn context.
-    Shows confirmation toast and clears input.
+    Shows confirmation toast and clears input. While the background engine
+    runs a round, the nudge goes to the engine for its next round instead
+    of into the game state the engine is using.
 
     Args:
         nudge: The user's suggestion text.
@@ -3721,7 +3852,9 @@ def handle_nudge_submit(nudge: str) -> None:
         st.session_state["nudge_submitted"] = True
         # Story 16.2: Dual-write to GameState for API engine compatibility
         game = st.session_state.get("game")
-        if game:
+        if game and not get_engine_host().submit_nudge(
+            game.get("session_id", "001"), sanitized
+        ):
             game["pending_nudge"] = sanitized
 
 
@@ -3730,7 +3863,8 @@ def handle_human_whisper_submit(whisper_text: str) -> None:
 
     Stores the whisper for DM context and persists in whisper history.
     Unlike nudges (suggestions), whispers are private questions/secrets
-    that are tracked in the whisper history.
+    that are tracked in the whisper history. While the background engine
+    runs a round, the engine records the whisper for its next round.
 
     Story 10.4: Human Whisper to DM.
     FR73: Human can whisper to DM.
@@ -3750,6 +3884,10 @@ def handle_human_whisper_submit(whisper_text: str) -> None:
 
         # Create whisper for history tracking
         game: GameState | None = st.session_state.get("game")
+        if game and get_engine_host().submit_whisper(
+            game.get("session_id", "001"), sanitized
+        ):
+            return
         # Story 16.2: Dual-write to GameState for API engine compatibility
         if game:
             game["pending_human_whisper"] = sanitized
@@ -3777,7 +3915,8 @@ def handle_human_action_submit(action: str) -> None:
     """Handle submission of human action.
 
     Stores the submitted action in session state for processing
-    by the human_intervention_node in the game loop.
+    by the human_intervention_node in the game loop. While the background
+    engine runs a round, the engine holds the action for the next round.
 
     Args:
         action: The user's action text.
@@ -3789,7 +3928,9 @@ def handle_human_action_submit(action: str) -> None:
         st.session_state["human_pending_action"] = sanitized
         # Story 16.2: Dual-write to GameState for API engine compatibility
         game = st.session_state.get("game")
-        if game:
+        if game and not get_engine_host().submit_human_action(
+            game.get("session_id", "001"), sanitized
+        ):
             game["human_pending_action"] = sanitized
 
 
@@ -7481,13 +7622,17 @@ def _render_comparison_turn(
 
     # Render entries (truncated for overview)
     if turn.entries:
+        parsed = [parse_entry(entry) for entry in turn.entries]
+        first = parsed[0]
         with st.expander(
-            _truncate_entry(turn.entries[0], 150),
+            _truncate_entry(f"{first.agent}: {first.content}", 150),
             expanded=turn.is_branch_point,
             key=f"cmp_{safe_label}_{index}",
         ):
-            for entry in turn.entries:
-                st.markdown(escape_html(entry))
+            for message in parsed:
+                st.markdown(
+                    f"**{escape_html(message.agent)}:** {escape_html(message.content)}"
+                )
     elif not turn.is_ended:
         st.caption("[No entries]")
 
@@ -7968,7 +8113,10 @@ def render_main_content() -> None:
         st.markdown('<div class="narrative-container">', unsafe_allow_html=True)
 
         # Render messages from ground_truth_log
-        render_narrative_messages(game)
+        if st.session_state.get("engine_backed", False):
+            render_live_narrative()
+        else:
+            render_narrative_messages(game)
 
         # Auto-scroll indicator for resuming after manual scroll (Story 2.6)
         render_auto_scroll_indicator()
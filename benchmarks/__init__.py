@@ -0,0 +1,42 @@
+"""Deterministic, offline performance benchmarks for the game loop.
+
+Run with ``python -m benchmarks`` (see ``--help``). LLM calls are served
+from recorded responses, so results measure the non-LLM overhead of a
+round and can be compared across commits.
+"""
+
+from benchmarks.harness import (
+    DEFAULT_CAMPAIGN_TURNS,
+    BenchmarkResult,
+    TimingCollector,
+    build_synthetic_campaign,
+    format_results,
+    get_peak_rss_bytes,
+    run_benchmarks,
+    run_engine_benchmark,
+    run_graph_benchmark,
+)
+from benchmarks.replay import (
+    DEFAULT_RECORDING_PATH,
+    ReplayChatModel,
+    ReplayScript,
+    load_recording,
+    replay_llms,
+)
+
+__all__ = [
+    "DEFAULT_CAMPAIGN_TURNS",
+    "DEFAULT_RECORDING_PATH",
+    "BenchmarkResult",
+    "ReplayChatModel",
+    "ReplayScript",
+    "TimingCollector",
+    "build_synthetic_campaign",
+    "format_results",
+    "get_peak_rss_bytes",
+    "load_recording",
+    "replay_llms",
+    "run_benchmarks",
+    "run_engine_benchmark",
+    "run_graph_benchmark",
+]
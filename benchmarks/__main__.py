@@ -0,0 +1,75 @@
+"""Command-line entry point: ``python -m benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from pathlib import Path
+
+from benchmarks.harness import DEFAULT_CAMPAIGN_TURNS, format_results, run_benchmarks
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite and print a report.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Replay-based round throughput benchmarks.",
+    )
+    parser.add_argument(
+        "--turns",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_CAMPAIGN_TURNS),
+        help="Synthetic campaign lengths (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=3, help="Rounds per run (default: 3)"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Simulated seconds per LLM call (default: 0)",
+    )
+    parser.add_argument(
+        "--recording", type=Path, default=None, help="Recording JSON file"
+    )
+    parser.add_argument(
+        "--driver",
+        choices=["graph", "engine"],
+        action="append",
+        help="Driver(s) to run (default: both)",
+    )
+    parser.add_argument(
+        "--json", type=Path, default=None, help="Also write results as JSON"
+    )
+    args = parser.parse_args(argv)
+
+    # Game code logs every LLM call at INFO; keep the report readable
+    logging.getLogger("autodungeon").setLevel(logging.WARNING)
+
+    results = run_benchmarks(
+        campaign_sizes=tuple(args.turns),
+        rounds=args.rounds,
+        latency=args.latency,
+        recording=args.recording,
+        drivers=tuple(args.driver or ("graph", "engine")),
+    )
+    print(format_results(results))
+    if args.json is not None:
+        args.json.write_text(
+            json.dumps([r.to_dict() for r in results], indent=2), encoding="utf-8"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
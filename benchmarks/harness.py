@@ -0,0 +1,518 @@
+"""Round-throughput benchmarks driven by replayed LLM responses.
+
+Builds synthetic campaigns of a given length, then runs a few rounds
+through ``graph.run_single_round`` directly and through the GameEngine
+autopilot loop, with every LLM call served by ReplayChatModel. Because
+the model responses are fixed (and latency is configurable, default
+zero), the measured time is the game's own overhead: graph execution,
+prompt building, memory compression, and checkpoint/transcript I/O.
+
+Each run is isolated in a temporary campaigns directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+from unittest.mock import patch
+
+from benchmarks.replay import (
+    REPLAY_MODEL_PREFIX,
+    ReplayScript,
+    load_recording,
+    replay_llms,
+)
+from models import (
+    AgentMemory,
+    CharacterConfig,
+    DMConfig,
+    GameConfig,
+    GameState,
+    populate_game_state,
+)
+
+__all__ = [
+    "DEFAULT_CAMPAIGN_TURNS",
+    "BenchmarkResult",
+    "TimingCollector",
+    "build_synthetic_campaign",
+    "format_results",
+    "get_peak_rss_bytes",
+    "run_benchmarks",
+    "run_engine_benchmark",
+    "run_graph_benchmark",
+]
+
+DEFAULT_CAMPAIGN_TURNS: tuple[int, ...] = (10, 500, 2000)
+
+BENCH_SESSION_ID = "900"
+
+# Keep agent memory windows small so compression runs within a few rounds
+SYNTHETIC_TOKEN_LIMIT = 1000
+
+_SYNTHETIC_PARTY: tuple[tuple[str, str, str], ...] = (
+    ("Thorin", "Fighter", "#8B4513"),
+    ("Shadowmere", "Rogue", "#6B8E6B"),
+    ("Elara", "Wizard", "#7B68EE"),
+    ("Brother Aldric", "Cleric", "#4A90A4"),
+)
+
+_SYNTHETIC_LINES: tuple[str, ...] = (
+    "The lantern light catches on wet stone as the corridor bends toward the "
+    "old cistern, where something large shifts beneath the black water.",
+    '*draws steel and advances a careful step* "Whatever lives down here has '
+    'been feeding well. Keep your torches high and your backs together."',
+    "A ledger lies open on the desk, its last entry smeared in fresh ink: a "
+    "list of names, three of them crossed out, the fourth belonging to the party.",
+    '*kneels to trace a rune scratched into the threshold* "This ward is '
+    'recent. Someone expected us, or expected something worse than us."',
+)
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# Instrumentation
+# =============================================================================
+
+
+class TimingCollector:
+    """Thread-safe accumulator of wall-clock samples per label."""
+
+    def __init__(self) -> None:
+        self._samples: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, label: str, seconds: float) -> None:
+        """Record one timing sample.
+
+        Args:
+            label: Metric name (e.g., "node:dm", "io:checkpoint").
+            seconds: Elapsed wall time.
+        """
+        with self._lock:
+            self._samples.setdefault(label, []).append(seconds)
+
+    def wrap(self, label: str, func: Callable[..., T]) -> Callable[..., T]:
+        """Return a wrapper around func that records each call's duration.
+
+        Args:
+            label: Metric name to record under.
+            func: Callable to time.
+
+        Returns:
+            Wrapped callable with the same signature.
+        """
+
+        def _timed(*args: Any, **kwargs: Any) -> T:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(label, time.perf_counter() - start)
+
+        return _timed
+
+    def samples(self, label: str) -> list[float]:
+        """Return a copy of the samples recorded under label."""
+        with self._lock:
+            return list(self._samples.get(label, []))
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Summarize samples as count/total/mean/max seconds per label.
+
+        Returns:
+            Dict mapping label to its statistics, sorted by label.
+        """
+        with self._lock:
+            samples = {k: list(v) for k, v in self._samples.items()}
+        return {
+            label: {
+                "count": len(values),
+                "total": sum(values),
+                "mean": sum(values) / len(values),
+                "max": max(values),
+            }
+            for label, values in sorted(samples.items())
+        }
+
+
+@contextmanager
+def _instrumented(collector: TimingCollector) -> Iterator[None]:
+    """Patch graph nodes, persistence I/O and compression with timers.
+
+    create_game_workflow(), run_single_round() and the engine resolve
+    these names at call time, so patching the module attributes is enough
+    to time every round, node and checkpoint/transcript write, including
+    the engine's per-node saves.
+    """
+    import graph
+    import memory
+    import persistence
+
+    def _timed_pc_turn(state: GameState, agent_name: str) -> GameState:
+        start = time.perf_counter()
+        try:
+            return original_pc_turn(state, agent_name)
+        finally:
+            collector.record(f"node:{agent_name}", time.perf_counter() - start)
+
+    original_pc_turn = graph._safe_pc_turn
+    targets: list[tuple[Any, str, str]] = [
+        (graph, "run_single_round", "round"),
+        (graph, "context_manager", "node:context_manager"),
+        (graph, "dm_turn", "node:dm"),
+        (persistence, "save_checkpoint", "io:checkpoint_save"),
+        (persistence, "save_fork_checkpoint", "io:checkpoint_save"),
+        (persistence, "get_latest_checkpoint", "io:checkpoint_scan"),
+        (persistence, "append_transcript_entry", "io:transcript_append"),
+        (memory.MemoryManager, "compress_buffer", "memory:compress_buffer"),
+        (
+            memory.MemoryManager,
+            "compress_long_term_summary",
+            "memory:compress_summary",
+        ),
+    ]
+    with ExitStack() as stack:
+        for owner, attr, label in targets:
+            stack.enter_context(
+                patch.object(owner, attr, collector.wrap(label, getattr(owner, attr)))
+            )
+        stack.enter_context(patch.object(graph, "_safe_pc_turn", _timed_pc_turn))
+        yield
+
+
+def get_peak_rss_bytes() -> int | None:
+    """Return the process's peak resident set size in bytes.
+
+    Returns:
+        Peak RSS in bytes, or None where the resource module is
+        unavailable (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# =============================================================================
+# Synthetic Campaigns
+# =============================================================================
+
+
+def build_synthetic_campaign(
+    turns: int, session_id: str = BENCH_SESSION_ID
+) -> GameState:
+    """Build a game state that looks like a campaign already `turns` long.
+
+    The log cycles DM narration and PC actions, and each agent's
+    short-term buffer holds its recent share of the log, as it would
+    after real play. Long campaigns also carry a long-term summary.
+    All agents use ``replay-<role>`` models so replay_llms() can route
+    them.
+
+    Args:
+        turns: Number of log entries to pre-populate.
+        session_id: Session ID to stamp on the state.
+
+    Returns:
+        A GameState ready to pass to run_single_round().
+    """
+    characters = {
+        name.split()[-1].lower(): CharacterConfig(
+            name=name,
+            character_class=char_class,
+            personality="Steady under pressure, curious about old ruins.",
+            color=color,
+            provider="claude",
+            model=f"{REPLAY_MODEL_PREFIX}pc",
+            token_limit=SYNTHETIC_TOKEN_LIMIT,
+        )
+        for name, char_class, color in _SYNTHETIC_PARTY
+    }
+    state = populate_game_state(
+        include_sample_messages=False, characters_override=characters
+    )
+    state["session_id"] = session_id
+    state["dm_config"] = DMConfig(
+        provider="claude",
+        model=f"{REPLAY_MODEL_PREFIX}dm",
+        token_limit=SYNTHETIC_TOKEN_LIMIT,
+    )
+    state["game_config"] = GameConfig(
+        summarizer_provider="claude",
+        summarizer_model=f"{REPLAY_MODEL_PREFIX}summarizer",
+        extractor_provider="claude",
+        extractor_model=f"{REPLAY_MODEL_PREFIX}extractor",
+    )
+
+    queue = state["turn_queue"]
+    log: list[str] = []
+    for i in range(turns):
+        agent = queue[i % len(queue)]
+        speaker = "DM" if agent == "dm" else characters[agent].name
+        log.append(f"[{speaker}]: {_SYNTHETIC_LINES[i % len(_SYNTHETIC_LINES)]}")
+    state["ground_truth_log"] = log
+
+    summary = (
+        "The party has explored the cistern tunnels for several sessions, "
+        "tracking a cult that marks its victims in a shared ledger. " * 4
+        if turns >= 100
+        else ""
+    )
+    recent = log[-24:]
+    memories: dict[str, AgentMemory] = {}
+    for agent_name, mem in state["agent_memories"].items():
+        memories[agent_name] = mem.model_copy(
+            update={
+                "long_term_summary": summary,
+                "short_term_buffer": list(recent),
+                "token_limit": SYNTHETIC_TOKEN_LIMIT,
+            }
+        )
+    state["agent_memories"] = memories
+    return state
+
+
+# =============================================================================
+# Runners
+# =============================================================================
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings for one driver over one synthetic campaign.
+
+    Attributes:
+        driver: "graph" (run_single_round) or "engine" (GameEngine autopilot).
+        campaign_turns: Log length the campaign started with.
+        rounds: Rounds executed.
+        round_times: Wall time of each round in seconds.
+        timings: TimingCollector.summary() for the run.
+        llm_calls: Replayed LLM calls per role.
+        peak_rss_bytes: Process peak RSS after the run, if available.
+    """
+
+    driver: str
+    campaign_turns: int
+    rounds: int
+    round_times: list[float] = field(default_factory=list)
+    timings: dict[str, dict[str, float]] = field(default_factory=dict)
+    llm_calls: dict[str, int] = field(default_factory=dict)
+    peak_rss_bytes: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable dict of this result."""
+        return {
+            "driver": self.driver,
+            "campaign_turns": self.campaign_turns,
+            "rounds": self.rounds,
+            "round_times": self.round_times,
+            "timings": self.timings,
+            "llm_calls": self.llm_calls,
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+
+
+def _finish_result(
+    result: BenchmarkResult,
+    collector: TimingCollector,
+    scripts: dict[str, ReplayScript],
+) -> None:
+    """Copy collected timings, call counts and peak RSS into result."""
+    result.round_times = collector.samples("round")
+    result.timings = collector.summary()
+    result.llm_calls = {role: s.calls for role, s in scripts.items()}
+    result.peak_rss_bytes = get_peak_rss_bytes()
+
+
+@contextmanager
+def _benchmark_env(
+    recording: Path | None, latency: float, seed: int
+) -> Iterator[tuple[TimingCollector, dict[str, ReplayScript]]]:
+    """Set up an isolated, replayed, instrumented run."""
+    collector = TimingCollector()
+    scripts = load_recording(recording)
+    random.seed(seed)  # dice rolls in tool calls
+    with (
+        tempfile.TemporaryDirectory(prefix="autodungeon-bench-") as tmp,
+        patch("persistence.CAMPAIGNS_DIR", Path(tmp)),
+        replay_llms(scripts, latency=latency),
+        _instrumented(collector),
+    ):
+        yield collector, scripts
+
+
+def run_graph_benchmark(
+    campaign_turns: int,
+    rounds: int = 3,
+    latency: float = 0.0,
+    recording: Path | None = None,
+    seed: int = 0,
+) -> BenchmarkResult:
+    """Benchmark graph.run_single_round over a synthetic campaign.
+
+    Args:
+        campaign_turns: Pre-populated log length.
+        rounds: Number of rounds to execute.
+        latency: Simulated seconds per LLM call.
+        recording: Recording file; defaults to the bundled recording.
+        seed: Random seed for dice rolls.
+
+    Returns:
+        BenchmarkResult for the "graph" driver.
+
+    Raises:
+        RuntimeError: If a round returns an error.
+    """
+    import graph
+
+    result = BenchmarkResult("graph", campaign_turns, rounds)
+    with _benchmark_env(recording, latency, seed) as (collector, scripts):
+        state = build_synthetic_campaign(campaign_turns)
+        for _ in range(rounds):
+            outcome = graph.run_single_round(state)
+            if "error" in outcome:
+                raise RuntimeError(f"Benchmark round failed: {outcome['error']}")
+            state = outcome  # type: ignore[assignment]
+        _finish_result(result, collector, scripts)
+    return result
+
+
+def run_engine_benchmark(
+    campaign_turns: int,
+    rounds: int = 3,
+    latency: float = 0.0,
+    recording: Path | None = None,
+    seed: int = 0,
+) -> BenchmarkResult:
+    """Benchmark the GameEngine autopilot loop over a synthetic campaign.
+
+    Runs the real autopilot task with the inter-round delay set to zero,
+    so per-node broadcasts, the engine's per-turn saves, and the
+    asyncio.to_thread hand-off are all included.
+
+    Args:
+        campaign_turns: Pre-populated log length.
+        rounds: Number of autopilot rounds to execute.
+        latency: Simulated seconds per LLM call.
+        recording: Recording file; defaults to the bundled recording.
+        seed: Random seed for dice rolls.
+
+    Returns:
+        BenchmarkResult for the "engine" driver.
+
+    Raises:
+        RuntimeError: If the autopilot stops before completing all rounds.
+    """
+    from api.engine import GameEngine
+
+    result = BenchmarkResult("engine", campaign_turns, rounds)
+
+    async def _run(collector: TimingCollector) -> None:
+        engine = GameEngine(BENCH_SESSION_ID)
+        engine._state = build_synthetic_campaign(campaign_turns)
+        engine._max_turns = rounds
+        engine.SPEED_DELAYS = dict.fromkeys(engine.VALID_SPEEDS, 0.0)
+        await engine.start_autopilot("fast")
+        assert engine._task is not None
+        start = time.perf_counter()
+        await engine._task
+        collector.record("engine:autopilot_total", time.perf_counter() - start)
+        if engine.turn_count < rounds:
+            raise RuntimeError(f"Autopilot stopped early: {engine.last_error}")
+
+    with _benchmark_env(recording, latency, seed) as (collector, scripts):
+        asyncio.run(_run(collector))
+        _finish_result(result, collector, scripts)
+    return result
+
+
+def run_benchmarks(
+    campaign_sizes: tuple[int, ...] = DEFAULT_CAMPAIGN_TURNS,
+    rounds: int = 3,
+    latency: float = 0.0,
+    recording: Path | None = None,
+    drivers: tuple[str, ...] = ("graph", "engine"),
+) -> list[BenchmarkResult]:
+    """Run every driver over every campaign size, smallest first.
+
+    A short warm-up run is executed first and discarded. Peak RSS is
+    process-wide and monotonic, so running small campaigns first keeps
+    each reading attributable to the largest campaign so far.
+
+    Args:
+        campaign_sizes: Log lengths of the synthetic campaigns.
+        rounds: Rounds per run.
+        latency: Simulated seconds per LLM call.
+        recording: Recording file; defaults to the bundled recording.
+        drivers: Which drivers to run ("graph", "engine").
+
+    Returns:
+        One BenchmarkResult per (campaign size, driver).
+
+    Raises:
+        ValueError: If an unknown driver is requested.
+    """
+    runners = {"graph": run_graph_benchmark, "engine": run_engine_benchmark}
+    unknown = set(drivers) - runners.keys()
+    if unknown:
+        raise ValueError(f"Unknown benchmark drivers: {sorted(unknown)}")
+    # Discarded warm-up run so import and first-call costs don't land on
+    # the first measured campaign
+    run_graph_benchmark(10, rounds=1, recording=recording)
+
+    results: list[BenchmarkResult] = []
+    for turns in sorted(campaign_sizes):
+        for driver in drivers:
+            results.append(
+                runners[driver](
+                    turns, rounds=rounds, latency=latency, recording=recording
+                )
+            )
+    return results
+
+
+def format_results(results: list[BenchmarkResult]) -> str:
+    """Render benchmark results as a plain-text report.
+
+    Args:
+        results: Results from run_benchmarks().
+
+    Returns:
+        Multi-line report with per-round and per-metric timings in ms.
+    """
+    lines: list[str] = []
+    for r in results:
+        mean_round = sum(r.round_times) / len(r.round_times) if r.round_times else 0.0
+        rss = (
+            f"{r.peak_rss_bytes / (1024 * 1024):.1f} MiB"
+            if r.peak_rss_bytes is not None
+            else "n/a"
+        )
+        lines.append(
+            f"== {r.driver} | {r.campaign_turns} turns | {r.rounds} rounds | "
+            f"mean round {mean_round * 1000:.1f} ms | peak RSS {rss}"
+        )
+        for label, stats in r.timings.items():
+            lines.append(
+                f"   {label:<28} n={int(stats['count']):<4} "
+                f"total={stats['total'] * 1000:9.1f} ms  "
+                f"mean={stats['mean'] * 1000:8.2f} ms  "
+                f"max={stats['max'] * 1000:8.2f} ms"
+            )
+        calls = ", ".join(f"{k}={v}" for k, v in sorted(r.llm_calls.items()))
+        lines.append(f"   llm calls: {calls}")
+    return "\n".join(lines)
@@ -0,0 +1,216 @@
+"""Replaying chat model for deterministic, offline benchmarks.
+
+Provides a LangChain BaseChatModel that returns pre-recorded responses
+(including tool calls) instead of calling a provider, plus a context
+manager that routes every ``get_llm()`` call in the game through it.
+
+Recordings are JSON files mapping a role ("dm", "pc", "summarizer",
+"extractor") to a list of responses. Each response is an object with a
+``content`` string and an optional ``tool_calls`` list of
+``{"name": ..., "args": {...}}`` entries. Responses are replayed in order
+per role and wrap around when exhausted.
+
+The role is taken from the model name: the synthetic campaigns configure
+every agent with a model named ``replay-<role>``.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import ConfigDict
+
+__all__ = [
+    "DEFAULT_RECORDING_PATH",
+    "REPLAY_MODEL_PREFIX",
+    "ReplayChatModel",
+    "ReplayScript",
+    "load_recording",
+    "replay_llms",
+]
+
+DEFAULT_RECORDING_PATH = Path(__file__).parent / "recordings" / "default.json"
+
+# Model names of the form "replay-<role>" select the recording for <role>
+REPLAY_MODEL_PREFIX = "replay-"
+
+
+class ReplayScript:
+    """Thread-safe cursor over a list of recorded responses for one role.
+
+    The graph runs in a worker thread under the engine, and several chat
+    model instances for the same role share one script, so the cursor is
+    guarded by a lock.
+
+    Attributes:
+        role: Role name the responses were recorded for.
+        calls: Number of responses handed out so far.
+    """
+
+    def __init__(self, role: str, responses: Sequence[dict[str, Any]]) -> None:
+        """Initialize the script.
+
+        Args:
+            role: Role name the responses were recorded for.
+            responses: Recorded responses, replayed in order.
+
+        Raises:
+            ValueError: If responses is empty.
+        """
+        if not responses:
+            raise ValueError(f"Recording for role '{role}' has no responses")
+        self.role = role
+        self.calls = 0
+        self._responses = list(responses)
+        self._lock = threading.Lock()
+
+    def next_message(self) -> AIMessage:
+        """Return the next recorded response as an AIMessage.
+
+        Tool call IDs are generated from the call counter so they are
+        unique and identical across runs.
+
+        Returns:
+            AIMessage with the recorded content and tool calls.
+        """
+        with self._lock:
+            index = self.calls
+            self.calls += 1
+        recorded = self._responses[index % len(self._responses)]
+        tool_calls = [
+            {
+                "name": call["name"],
+                "args": dict(call.get("args", {})),
+                "id": f"replay_{self.role}_{index}_{n}",
+                "type": "tool_call",
+            }
+            for n, call in enumerate(recorded.get("tool_calls", []))
+        ]
+        return AIMessage(content=recorded.get("content", ""), tool_calls=tool_calls)
+
+
+class ReplayChatModel(BaseChatModel):
+    """Chat model that replays a ReplayScript with a configurable latency.
+
+    ``bind_tools`` returns the model itself: tool calls come from the
+    recording, so the bound tool schemas are irrelevant.
+
+    Attributes:
+        script: Recorded responses to replay.
+        latency: Seconds to sleep per call, simulating provider latency.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    script: ReplayScript
+    latency: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return ChatResult(
+            generations=[ChatGeneration(message=self.script.next_message())]
+        )
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> ReplayChatModel:  # type: ignore[override]
+        return self
+
+
+def load_recording(path: Path | None = None) -> dict[str, ReplayScript]:
+    """Load a recording file into per-role replay scripts.
+
+    Args:
+        path: Recording JSON file. Defaults to DEFAULT_RECORDING_PATH.
+
+    Returns:
+        Dict mapping role name to a fresh ReplayScript.
+
+    Raises:
+        ValueError: If the file is not a JSON object of response lists.
+        OSError: If the file cannot be read.
+    """
+    recording_path = path or DEFAULT_RECORDING_PATH
+    data = json.loads(recording_path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"Recording must be a JSON object: {recording_path}")
+    return {role: ReplayScript(role, responses) for role, responses in data.items()}
+
+
+@contextmanager
+def replay_llms(
+    scripts: dict[str, ReplayScript], latency: float = 0.0
+) -> Iterator[dict[str, ReplayScript]]:
+    """Route all LLM construction through ReplayChatModel.
+
+    Patches ``get_llm`` in both agents and memory (memory imports it by
+    name), points the app-level summarizer and extractor configs at the
+    "summarizer" and "extractor" recordings, and clears the memory
+    module's client caches so no real client created earlier in the
+    process is reused.
+
+    Args:
+        scripts: Per-role replay scripts, as returned by load_recording().
+        latency: Seconds to sleep per LLM call.
+
+    Yields:
+        The scripts dict, so callers can inspect call counts afterwards.
+
+    Raises:
+        ValueError: From the patched get_llm if a model name does not map
+            to a recorded role.
+    """
+    import memory
+    from config import AgentConfig, get_config
+
+    def _replay_get_llm(
+        provider: str, model: str, timeout: int | None = None
+    ) -> BaseChatModel:
+        role = model.removeprefix(REPLAY_MODEL_PREFIX)
+        if role not in scripts:
+            raise ValueError(f"No replay recording for model '{model}'")
+        return ReplayChatModel(script=scripts[role], latency=latency)
+
+    agents_config = get_config().agents
+    memory._summarizer_cache.clear()
+    memory._extractor_cache.clear()
+    try:
+        with (
+            patch("agents.get_llm", _replay_get_llm),
+            patch("memory.get_llm", _replay_get_llm),
+            patch.object(
+                agents_config,
+                "summarizer",
+                AgentConfig(
+                    provider="claude", model=f"{REPLAY_MODEL_PREFIX}summarizer"
+                ),
+            ),
+            patch.object(
+                agents_config,
+                "extractor",
+                AgentConfig(provider="claude", model=f"{REPLAY_MODEL_PREFIX}extractor"),
+            ),
+        ):
+            yield scripts
+    finally:
+        memory._summarizer_cache.clear()
+        memory._extractor_cache.clear()
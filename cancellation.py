@@ -0,0 +1,221 @@
+"""Cooperative cancellation for game rounds.
+
+A round runs synchronously in a worker thread (see api/engine.py), so it
+cannot be interrupted from the event loop. Instead the engine hands
+run_single_round() a CancellationToken. While the round runs, the token is
+the current token for the worker's context:
+
+- Graph nodes call check_cancelled() before they start, so a cancelled
+  round does not begin another agent's turn.
+- LLM calls go through invoke_cancellable(), which runs the model's native
+  async invocation on a shared worker event loop and cancels it the moment
+  the token fires. The HTTP request is aborted and its connection released
+  instead of running on until the client's own timeout. The loop lives for
+  the whole process because cached models keep async HTTP clients whose
+  connection pools are bound to the loop they were first used on.
+
+Cancellation surfaces as RoundCancelled. Like asyncio.CancelledError it
+derives from BaseException, so the agents' broad ``except Exception``
+error handling (and the PC fallback turn) does not swallow it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+__all__ = [
+    "CancellationToken",
+    "RoundCancelled",
+    "cancellation_scope",
+    "check_cancelled",
+    "current_token",
+    "invoke_cancellable",
+]
+
+
+class RoundCancelled(BaseException):
+    """Raised inside a round when its CancellationToken is cancelled."""
+
+
+class CancellationToken:
+    """Thread-safe, one-shot cancellation signal.
+
+    Attributes:
+        reason: Why the token was cancelled ("timeout", "stopped", ...),
+            empty until cancel() is called.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an uncancelled token."""
+        self.reason = ""
+        self._event = threading.Event()
+        self._callbacks: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Cancel the token and run its callbacks.
+
+        Only the first call has any effect.
+
+        Args:
+            reason: Why the round is being cancelled.
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run callback when the token is cancelled.
+
+        If the token is already cancelled the callback runs immediately.
+        Callbacks run on the thread that calls cancel().
+
+        Args:
+            callback: Function to call on cancellation.
+
+        Returns:
+            A function that unregisters the callback.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+
+                def remove() -> None:
+                    with self._lock:
+                        if callback in self._callbacks:
+                            self._callbacks.remove(callback)
+
+                return remove
+        callback()
+        return lambda: None
+
+    def raise_if_cancelled(self) -> None:
+        """Raise RoundCancelled if the token has been cancelled.
+
+        Raises:
+            RoundCancelled: If cancel() has been called.
+        """
+        if self._event.is_set():
+            raise RoundCancelled(self.reason)
+
+
+_current_token: ContextVar[CancellationToken | None] = ContextVar(
+    "autodungeon_cancel_token", default=None
+)
+
+
+def current_token() -> CancellationToken | None:
+    """Get the cancellation token of the round running in this context."""
+    return _current_token.get()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken | None) -> Generator[None, None, None]:
+    """Make token the current token for the duration of the block.
+
+    Args:
+        token: Token for the round, or None for an uncancellable block.
+    """
+    reset = _current_token.set(token)
+    try:
+        yield
+    finally:
+        _current_token.reset(reset)
+
+
+def check_cancelled() -> None:
+    """Raise RoundCancelled if the current round has been cancelled.
+
+    Raises:
+        RoundCancelled: If the current token is cancelled.
+    """
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+# How long a cancelled call may take to unwind before invoke_cancellable()
+# returns anyway (a runnable that swallows CancelledError cannot hold the
+# round open).
+_CANCEL_GRACE_SECONDS = 1.0
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the worker event loop, starting its thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="cancellable-llm-loop",
+                daemon=True,
+            ).start()
+            _loop = loop
+        return _loop
+
+
+def invoke_cancellable(runnable: Any, messages: Any) -> Any:
+    """Invoke a chat model, aborting the request if the round is cancelled.
+
+    Without a current token this is runnable.invoke(messages). With one,
+    the model's ainvoke() runs on the shared worker loop while the calling
+    thread waits, and is cancelled as soon as the token fires.
+
+    Args:
+        runnable: Chat model or other LangChain runnable.
+        messages: Input for the runnable.
+
+    Returns:
+        The runnable's output.
+
+    Raises:
+        RoundCancelled: If the round was cancelled before or during the call.
+    """
+    token = _current_token.get()
+    if token is None:
+        return runnable.invoke(messages)
+    token.raise_if_cancelled()
+
+    finished = threading.Event()
+
+    async def run() -> Any:
+        try:
+            return await runnable.ainvoke(messages)
+        finally:
+            finished.set()
+
+    future = asyncio.run_coroutine_threadsafe(run(), _get_loop())
+
+    def cancel() -> None:
+        future.cancel()
+
+    remove = token.add_callback(cancel)
+    try:
+        return future.result()
+    except concurrent.futures.CancelledError:
+        # Give the task a moment to abort its request and release the
+        # connection before the round unwinds
+        finished.wait(_CANCEL_GRACE_SECONDS)
+        raise RoundCancelled(token.reason) from None
+    finally:
+        remove()
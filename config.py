@@ -9,8 +9,11 @@ This module handles configuration from multiple sources:
 from __future__ import annotations
 
 import os
+import threading
+from collections.abc import Callable, Mapping
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 import yaml
 
@@ -25,6 +28,8 @@ __all__ = [
     "AgentsConfig",
     "AppConfig",
     "CLAUDE_MODELS",
+    "ConfigSnapshot",
+    "ConfigStore",
     "DEFAULT_MAX_CONTEXT",
     "GEMINI_MODELS",
     "MINIMUM_TOKEN_LIMIT",
@@ -34,6 +39,7 @@ __all__ = [
     "get_api_key_source",
     "get_available_models",
     "get_config",
+    "get_config_store",
     "get_effective_api_key",
     "get_max_context_for_provider",
     "get_model_max_context",
@@ -66,6 +72,238 @@ PROJECT_ROOT = Path(__file__).parent
 USER_SETTINGS_PATH = PROJECT_ROOT / "user-settings.yaml"
 
 
+# =============================================================================
+# Configuration Store
+# =============================================================================
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of parsed YAML (dicts and lists)."""
+    if isinstance(value, dict):
+        items = cast(dict[Any, Any], value).items()
+        return MappingProxyType({k: _freeze(v) for k, v in items})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in cast(list[Any], value))
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return a mutable deep copy of a value frozen by _freeze()."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _fingerprint(paths: list[Path]) -> tuple[Any, ...]:
+    """Identify the current on-disk version of a set of files."""
+    marks: list[tuple[Any, ...]] = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            marks.append((str(path), None))
+        else:
+            marks.append((str(path), st.st_mtime_ns, st.st_size, st.st_ino))
+    return tuple(marks)
+
+
+class ConfigSnapshot(NamedTuple):
+    """Frozen view of the settings files at one config version."""
+
+    version: int
+    user_settings: Mapping[str, Any]
+    defaults: Mapping[str, Any]
+
+
+class ConfigStore:
+    """Loads the YAML config files once and serves frozen copies.
+
+    Sources are user-settings.yaml, config/defaults.yaml,
+    config/dnd5e_data.yaml and the character presets in
+    config/characters/. Each read only stats the source's files; the YAML
+    is parsed again when a file changes (mtime, size or inode) or after
+    invalidate(), e.g. from save_user_settings().
+
+    When a reload changes a previously loaded value the version is bumped
+    and subscribers are notified, so dependents holding clients built from
+    the config (API keys, base URLs) rebuild them on the next use instead
+    of re-reading the files themselves.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._lock = threading.RLock()
+        self._entries: dict[str, tuple[tuple[Any, ...], Any]] = {}
+        self._version = 0
+        self._subscribers: list[Callable[[str, int], None]] = []
+
+    @property
+    def _sources(
+        self,
+    ) -> dict[str, tuple[Callable[[], list[Path]], Callable[[], Any]]]:
+        # Paths are resolved on every read so tests can patch
+        # PROJECT_ROOT and USER_SETTINGS_PATH
+        characters_dir = PROJECT_ROOT / "config" / "characters"
+        return {
+            "user_settings": (lambda: [USER_SETTINGS_PATH], _read_user_settings),
+            "defaults": (
+                lambda: [PROJECT_ROOT / "config" / "defaults.yaml"],
+                _read_yaml_defaults,
+            ),
+            "dnd5e_data": (lambda: [_DND5E_DATA_PATH], _read_dnd5e_data),
+            "characters": (
+                lambda: [
+                    characters_dir,
+                    *sorted(p for p in characters_dir.glob("*.yaml") if p.stem != "dm"),
+                ],
+                _read_character_configs,
+            ),
+            "dm": (lambda: [characters_dir / "dm.yaml"], _read_dm_config),
+        }
+
+    @property
+    def version(self) -> int:
+        """Current config version, after checking loaded sources for changes."""
+        sources = self._sources
+        with self._lock:
+            loaded = list(self._entries)
+        for name in loaded:
+            self._get(name, sources)
+        return self._version
+
+    def _get(
+        self,
+        name: str,
+        sources: dict[str, tuple[Callable[[], list[Path]], Callable[[], Any]]]
+        | None = None,
+    ) -> Any:
+        paths, load = (sources or self._sources)[name]
+        notify: list[Callable[[str, int], None]] = []
+        with self._lock:
+            fingerprint = _fingerprint(paths())
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == fingerprint:
+                return entry[1]
+            value = _freeze(load())
+            self._entries[name] = (fingerprint, value)
+            version = self._version
+            if entry is not None and entry[1] != value:
+                self._version += 1
+                version = self._version
+                notify = list(self._subscribers)
+        for callback in notify:
+            callback(name, version)
+        return value
+
+    def user_settings(self) -> Mapping[str, Any]:
+        """Frozen user-settings.yaml contents ({} if missing or invalid)."""
+        return self._get("user_settings")
+
+    def defaults(self) -> Mapping[str, Any]:
+        """Frozen config/defaults.yaml contents.
+
+        Raises:
+            yaml.YAMLError: If the file is malformed.
+        """
+        return self._get("defaults")
+
+    def dnd5e_data(self) -> Mapping[str, Any]:
+        """Frozen config/dnd5e_data.yaml contents.
+
+        Raises:
+            FileNotFoundError: If dnd5e_data.yaml doesn't exist.
+            yaml.YAMLError: If the file is malformed.
+        """
+        return self._get("dnd5e_data")
+
+    def character_configs(self) -> Mapping[str, CharacterConfig]:
+        """Character presets keyed by lowercase name (shared; do not mutate).
+
+        Raises:
+            ValueError: If a preset is malformed or invalid.
+        """
+        return self._get("characters")
+
+    def dm_config(self) -> DMConfig:
+        """DM preset from dm.yaml (shared; do not mutate).
+
+        Raises:
+            ValueError: If dm.yaml is malformed or invalid.
+        """
+        return self._get("dm")
+
+    def snapshot(self) -> ConfigSnapshot:
+        """Get the current user settings and defaults with their version."""
+        user_settings = self.user_settings()
+        defaults = self.defaults()
+        return ConfigSnapshot(self.version, user_settings, defaults)
+
+    def subscribe(self, callback: Callable[[str, int], None]) -> Callable[[], None]:
+        """Call callback(source, version) whenever a loaded source changes.
+
+        Callbacks run on the thread whose read detected the change.
+
+        Args:
+            callback: Function taking the source name ("user_settings",
+                "defaults", "dnd5e_data", "characters" or "dm") and the
+                new version.
+
+        Returns:
+            A function that unsubscribes the callback.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Re-read a source (or every source) on its next read.
+
+        Unlike clear(), the reloaded value is still compared with the old
+        one, so a change bumps the version and notifies subscribers.
+
+        Args:
+            name: Source name, or None for all sources.
+        """
+        with self._lock:
+            names = list(self._entries) if name is None else [name]
+            for key in names:
+                if key in self._entries:
+                    self._entries[key] = ((), self._entries[key][1])
+
+    def clear(self) -> None:
+        """Forget every loaded source without notifying subscribers."""
+        with self._lock:
+            self._entries.clear()
+
+
+_config_store = ConfigStore()
+
+
+def get_config_store() -> ConfigStore:
+    """Get the process-wide configuration store."""
+    return _config_store
+
+
+def _read_user_settings() -> dict[str, Any]:
+    """Parse user-settings.yaml ({} if missing or invalid)."""
+    if not USER_SETTINGS_PATH.exists():
+        return {}
+    try:
+        with open(USER_SETTINGS_PATH, encoding="utf-8") as f:
+            settings = yaml.safe_load(f)
+            return settings if settings else {}
+    except (yaml.YAMLError, OSError):
+        return {}
+
+
 def load_user_settings() -> dict[str, Any]:
     """Load user settings from user-settings.yaml.
 
@@ -76,16 +314,12 @@ def load_user_settings() -> dict[str, Any]:
         "token_limit_overrides": {"dm": 8000, ...}
     }
 
+    Served from the config store, so the file is only parsed when it
+    changes. The dict is a private copy the caller may modify.
+
     Returns empty dict if file doesn't exist.
     """
-    if not USER_SETTINGS_PATH.exists():
-        return {}
-    try:
-        with open(USER_SETTINGS_PATH, encoding="utf-8") as f:
-            settings = yaml.safe_load(f)
-            return settings if settings else {}
-    except (yaml.YAMLError, OSError):
-        return {}
+    return _thaw(get_config_store().user_settings())
 
 
 def save_user_settings(settings: dict[str, Any]) -> None:
@@ -99,10 +333,11 @@ def save_user_settings(settings: dict[str, Any]) -> None:
             yaml.dump(settings, f, default_flow_style=False, sort_keys=False)
     except OSError:
         pass  # Silently fail if can't write
+    get_config_store().invalidate("user_settings")
 
 
-def _load_yaml_defaults() -> dict[str, Any]:
-    """Load defaults from config/defaults.yaml."""
+def _read_yaml_defaults() -> dict[str, Any]:
+    """Parse config/defaults.yaml."""
     defaults_path = PROJECT_ROOT / "config" / "defaults.yaml"
     if defaults_path.exists():
         with open(defaults_path, encoding="utf-8") as f:
@@ -110,6 +345,11 @@ def _load_yaml_defaults() -> dict[str, Any]:
     return {}
 
 
+def _load_yaml_defaults() -> dict[str, Any]:
+    """Load defaults from config/defaults.yaml."""
+    return _thaw(get_config_store().defaults())
+
+
 class AgentConfig(BaseSettings):
     """Configuration for a single agent."""
 
@@ -158,6 +398,27 @@ class AppConfig(BaseSettings):
     party_size: int = 4
     auto_save: bool = True
 
+    # Warm the module discovery cache for the configured DM at API startup
+    module_discovery_prewarm: bool = True
+
+    # Debug: warn when the API event loop is blocked longer than this (0 = off)
+    loop_block_threshold_ms: int = 0
+
+    # Seconds between background health probes of providers in use (0 = off)
+    provider_probe_interval: float = 30.0
+
+    # Consecutive timeouts/rate limits/network errors that open a provider's
+    # circuit breaker, and seconds it stays open before a trial call
+    circuit_breaker_threshold: int = 3
+    circuit_breaker_cooldown: float = 60.0
+
+    # Targets for the "adaptive" autopilot speed (0 = no target)
+    autopilot_rounds_per_hour: float = 0.0
+    autopilot_daily_token_budget: int = 0
+
+    # Run Streamlit rounds on a background GameEngine instead of in-script
+    streamlit_engine_backed: bool = True
+
     # Agent-specific configs
     agents: AgentsConfig = Field(default_factory=AgentsConfig)
 
@@ -195,12 +456,44 @@ class AppConfig(BaseSettings):
             kwargs["party_size"] = yaml_defaults.get("party_size", 4)
         if "AUTO_SAVE" not in os.environ:
             kwargs["auto_save"] = yaml_defaults.get("auto_save", True)
+        if "MODULE_DISCOVERY_PREWARM" not in os.environ:
+            kwargs["module_discovery_prewarm"] = yaml_defaults.get(
+                "module_discovery_prewarm", True
+            )
+        if "LOOP_BLOCK_THRESHOLD_MS" not in os.environ:
+            kwargs["loop_block_threshold_ms"] = yaml_defaults.get(
+                "loop_block_threshold_ms", 0
+            )
+        if "PROVIDER_PROBE_INTERVAL" not in os.environ:
+            kwargs["provider_probe_interval"] = yaml_defaults.get(
+                "provider_probe_interval", 30.0
+            )
+        if "CIRCUIT_BREAKER_THRESHOLD" not in os.environ:
+            kwargs["circuit_breaker_threshold"] = yaml_defaults.get(
+                "circuit_breaker_threshold", 3
+            )
+        if "CIRCUIT_BREAKER_COOLDOWN" not in os.environ:
+            kwargs["circuit_breaker_cooldown"] = yaml_defaults.get(
+                "circuit_breaker_cooldown", 60.0
+            )
+        if "AUTOPILOT_ROUNDS_PER_HOUR" not in os.environ:
+            kwargs["autopilot_rounds_per_hour"] = yaml_defaults.get(
+                "autopilot_rounds_per_hour", 0.0
+            )
+        if "AUTOPILOT_DAILY_TOKEN_BUDGET" not in os.environ:
+            kwargs["autopilot_daily_token_budget"] = yaml_defaults.get(
+                "autopilot_daily_token_budget", 0
+            )
+        if "STREAMLIT_ENGINE_BACKED" not in os.environ:
+            kwargs["streamlit_engine_backed"] = yaml_defaults.get(
+                "streamlit_engine_backed", True
+            )
 
         return cls(**kwargs)
 
 
-def load_character_configs() -> dict[str, CharacterConfig]:
-    """Load all PC character configs from config/characters/*.yaml.
+def _read_character_configs() -> dict[str, CharacterConfig]:
+    """Parse all PC character configs from config/characters/*.yaml.
 
     Discovers and loads all YAML files in the characters directory except dm.yaml.
     Each character config is keyed by lowercase name for turn_queue consistency.
@@ -253,8 +546,28 @@ def load_character_configs() -> dict[str, CharacterConfig]:
     return configs
 
 
-def load_dm_config() -> DMConfig:
-    """Load DM configuration from config/characters/dm.yaml.
+def load_character_configs() -> dict[str, CharacterConfig]:
+    """Load all PC character configs from config/characters/*.yaml.
+
+    Discovers and loads all YAML files in the characters directory except dm.yaml.
+    Each character config is keyed by lowercase name for turn_queue consistency.
+    Served from the config store; the configs are copies the caller may modify.
+
+    Returns:
+        Dict of CharacterConfig instances keyed by lowercase character name.
+        Returns empty dict if characters directory doesn't exist.
+
+    Raises:
+        ValueError: If a YAML file is malformed or contains invalid data.
+    """
+    return {
+        name: config.model_copy(deep=True)
+        for name, config in get_config_store().character_configs().items()
+    }
+
+
+def _read_dm_config() -> DMConfig:
+    """Parse DM configuration from config/characters/dm.yaml.
 
     Returns:
         DMConfig instance. Returns default DMConfig if file doesn't exist.
@@ -287,6 +600,20 @@ def load_dm_config() -> DMConfig:
         raise ValueError(f"Invalid DM config in dm.yaml: {e}") from e
 
 
+def load_dm_config() -> DMConfig:
+    """Load DM configuration from config/characters/dm.yaml.
+
+    Served from the config store; the config is a copy the caller may modify.
+
+    Returns:
+        DMConfig instance. Returns default DMConfig if file doesn't exist.
+
+    Raises:
+        ValueError: If dm.yaml is malformed or contains invalid data.
+    """
+    return get_config_store().dm_config().model_copy(deep=True)
+
+
 def validate_api_keys(config: AppConfig) -> list[str]:
     """Validate API keys and return warnings for missing ones.
 
@@ -736,11 +1063,26 @@ def get_max_context_for_provider(provider: str, model: str) -> int:
 # =============================================================================
 
 
+_DND5E_DATA_PATH = Path(__file__).parent / "config" / "dnd5e_data.yaml"
+
+
+def _read_dnd5e_data() -> dict[str, Any]:
+    """Parse config/dnd5e_data.yaml."""
+    if not _DND5E_DATA_PATH.exists():
+        raise FileNotFoundError(f"D&D 5e data file not found: {_DND5E_DATA_PATH}")
+
+    with open(_DND5E_DATA_PATH, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+
+    return data
+
+
 def load_dnd5e_data() -> dict[str, Any]:
     """Load D&D 5e character creation data from config/dnd5e_data.yaml.
 
     Loads races, classes, backgrounds, abilities, skills, and point buy rules
-    used by the character creation wizard.
+    used by the character creation wizard. Served from the config store;
+    the dict is a private copy the caller may modify.
 
     Story 9.1: Character Creation Wizard.
 
@@ -751,14 +1093,7 @@ def load_dnd5e_data() -> dict[str, Any]:
         FileNotFoundError: If dnd5e_data.yaml doesn't exist.
         yaml.YAMLError: If the YAML file is malformed.
     """
-    config_path = Path(__file__).parent / "config" / "dnd5e_data.yaml"
-    if not config_path.exists():
-        raise FileNotFoundError(f"D&D 5e data file not found: {config_path}")
-
-    with open(config_path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-
-    return data
+    return _thaw(get_config_store().dnd5e_data())
 
 
 def get_dnd5e_races() -> list[dict[str, Any]]:
@@ -767,8 +1102,7 @@ def get_dnd5e_races() -> list[dict[str, Any]]:
     Returns:
         List of race dictionaries with id, name, description, ability_bonuses, etc.
     """
-    data = load_dnd5e_data()
-    return data.get("races", [])
+    return _thaw(get_config_store().dnd5e_data().get("races", ()))
 
 
 def get_dnd5e_classes() -> list[dict[str, Any]]:
@@ -777,8 +1111,7 @@ def get_dnd5e_classes() -> list[dict[str, Any]]:
     Returns:
         List of class dictionaries with id, name, description, hit_die, etc.
     """
-    data = load_dnd5e_data()
-    return data.get("classes", [])
+    return _thaw(get_config_store().dnd5e_data().get("classes", ()))
 
 
 def get_dnd5e_backgrounds() -> list[dict[str, Any]]:
@@ -787,8 +1120,7 @@ def get_dnd5e_backgrounds() -> list[dict[str, Any]]:
     Returns:
         List of background dictionaries with id, name, skill_proficiencies, etc.
     """
-    data = load_dnd5e_data()
-    return data.get("backgrounds", [])
+    return _thaw(get_config_store().dnd5e_data().get("backgrounds", ()))
 
 
 def get_point_buy_config() -> dict[str, Any]:
@@ -797,8 +1129,8 @@ def get_point_buy_config() -> dict[str, Any]:
     Returns:
         Dictionary with 'budget' (27 standard) and 'costs' mapping score to cost.
     """
-    data = load_dnd5e_data()
-    return data.get("point_buy", {"budget": 27, "costs": {}})
+    data = get_config_store().dnd5e_data()
+    return _thaw(data.get("point_buy", {"budget": 27, "costs": {}}))
 
 
 def get_standard_array() -> list[int]:
@@ -807,8 +1139,8 @@ def get_standard_array() -> list[int]:
     Returns:
         List of six ability scores: [15, 14, 13, 12, 10, 8]
     """
-    data = load_dnd5e_data()
-    return data.get("standard_array", [15, 14, 13, 12, 10, 8])
+    data = get_config_store().dnd5e_data()
+    return _thaw(data.get("standard_array", [15, 14, 13, 12, 10, 8]))
 
 
 def get_default_token_limit(provider: str, model: str) -> int:
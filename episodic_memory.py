@@ -0,0 +1,232 @@
+"""Episodic memory recall for agent prompts.
+
+Memory compression stores each summary as a MemoryEpisode instead of
+appending it to an ever-growing long_term_summary. When an agent's
+context is built, recall_episodes() picks the episodes worth showing for
+the current scene:
+
+- The latest episode is always recalled, so the story picks up where the
+  buffer left off.
+- The remaining slots go to the earlier episodes that best match the
+  scene, ranked with Okapi BM25 over their summaries and entity names.
+  Entity names are counted twice, so an episode about "Skrix" outranks
+  one that mentions him in passing.
+- Slots left over when nothing matches go to the most recent episodes.
+
+Scoring is local and lexical (no embeddings, no network), and prompt size
+stays bounded by EPISODE_RECALL_LIMIT however long the campaign runs.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+
+from models import AgentMemory, MemoryEpisode
+
+__all__ = [
+    "EPISODE_QUERY_ENTRIES",
+    "EPISODE_RECALL_LIMIT",
+    "episode_entities",
+    "format_episodes",
+    "recall_episodes",
+    "recall_text",
+    "scene_query",
+    "tokenize",
+]
+
+# Episodes included in an agent's context
+EPISODE_RECALL_LIMIT = 4
+
+# Recent ground_truth_log entries used as the recall query
+EPISODE_QUERY_ENTRIES = 5
+
+# BM25 term-frequency saturation and length normalization
+_BM25_K1 = 1.5
+_BM25_B = 0.75
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+# Words too common in game narration to say anything about relevance
+# ("dm" is the log entry prefix)
+_STOP_WORDS = frozenset(
+    """
+    a about after all an and are as at be been but by can could did do for
+    from had has have he her him his in into is it its me my no not of on or
+    our out she so that the their them then there they this to up us was we
+    were what when which who will with would you your dm
+    """.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase index terms, dropping stop words.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        Terms in order of appearance.
+    """
+    return [
+        word
+        for word in _WORD_RE.findall(text.lower())
+        if len(word) > 1 and word not in _STOP_WORDS
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _episode_terms(summary: str, entities: tuple[str, ...]) -> Counter[str]:
+    """Term frequencies of an episode (entity names counted twice)."""
+    terms = Counter(tokenize(summary))
+    for entity in entities:
+        terms.update(tokenize(entity))
+    return terms
+
+
+def _bm25_scores(
+    documents: Sequence[Counter[str]], query_terms: Iterable[str]
+) -> list[float]:
+    """Score documents against a query with Okapi BM25.
+
+    Args:
+        documents: Term frequencies per document.
+        query_terms: Query terms (duplicates are ignored).
+
+    Returns:
+        One score per document; 0 when no query term occurs.
+    """
+    if not documents:
+        return []
+    lengths = [sum(doc.values()) for doc in documents]
+    avg_length = sum(lengths) / len(documents) or 1.0
+    scores = [0.0] * len(documents)
+    for term in set(query_terms):
+        containing = [i for i, doc in enumerate(documents) if term in doc]
+        if not containing:
+            continue
+        df = len(containing)
+        idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+        for i in containing:
+            tf = documents[i][term]
+            norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * lengths[i] / avg_length)
+            scores[i] += idf * tf * (_BM25_K1 + 1) / (tf + norm)
+    return scores
+
+
+def recall_episodes(
+    episodes: Sequence[MemoryEpisode],
+    query: str,
+    limit: int = EPISODE_RECALL_LIMIT,
+) -> list[MemoryEpisode]:
+    """Pick the episodes to include in an agent's context.
+
+    Args:
+        episodes: The agent's episodes, oldest first.
+        query: Text describing the current scene.
+        limit: Maximum episodes to return.
+
+    Returns:
+        Up to limit episodes in chronological order: the latest one plus
+        the best BM25 matches for the query, topped up with recent ones.
+    """
+    if limit <= 0 or not episodes:
+        return []
+    if len(episodes) <= limit:
+        return list(episodes)
+
+    earlier = episodes[:-1]
+    scores = _bm25_scores(
+        [_episode_terms(e.summary, tuple(e.entities)) for e in earlier],
+        tokenize(query),
+    )
+    ranked = sorted(
+        (i for i, score in enumerate(scores) if score > 0),
+        key=lambda i: (-scores[i], -i),
+    )
+    chosen = set(ranked[: limit - 1])
+    for i in range(len(earlier) - 1, -1, -1):
+        if len(chosen) >= limit - 1:
+            break
+        chosen.add(i)
+    return [earlier[i] for i in sorted(chosen)] + [episodes[-1]]
+
+
+def format_episodes(episodes: Sequence[MemoryEpisode]) -> str:
+    """Format recalled episodes for a prompt, one paragraph each.
+
+    Args:
+        episodes: Episodes in chronological order.
+
+    Returns:
+        Episodes labelled with their turn ranges, separated by blank lines.
+        Episodes carried over from an earlier session (turn 0) are labelled
+        as such.
+    """
+    parts: list[str] = []
+    for episode in episodes:
+        if episode.turn_end == 0:
+            label = "Previous session"
+        elif episode.turn_end > episode.turn_start:
+            label = f"Turns {episode.turn_start}-{episode.turn_end}"
+        else:
+            label = f"Turn {episode.turn_end}"
+        parts.append(f"[{label}] {episode.summary}")
+    return "\n\n".join(parts)
+
+
+def episode_entities(summary: str, names: Iterable[str]) -> list[str]:
+    """Find which known names a summary mentions.
+
+    Args:
+        summary: Episode summary.
+        names: Character and narrative element names to look for.
+
+    Returns:
+        The mentioned names (case-insensitive whole-word match), deduplicated
+        in the order given.
+    """
+    text = summary.lower()
+    found: list[str] = []
+    for name in names:
+        key = name.strip()
+        if len(key) < 3 or key in found:
+            continue
+        if re.search(rf"\b{re.escape(key.lower())}\b", text):
+            found.append(key)
+    return found
+
+
+def scene_query(ground_truth_log: Sequence[str]) -> str:
+    """Build the recall query for the current scene from the shared log.
+
+    Args:
+        ground_truth_log: The game's log, oldest first.
+
+    Returns:
+        The last EPISODE_QUERY_ENTRIES entries joined by newlines.
+    """
+    return "\n".join(ground_truth_log[-EPISODE_QUERY_ENTRIES:])
+
+
+def recall_text(memory: AgentMemory, query: str) -> str:
+    """Build the remembered-history text for an agent's prompt.
+
+    Args:
+        memory: The agent's memory.
+        query: Recall query (see scene_query()).
+
+    Returns:
+        The standing long_term_summary followed by the recalled episodes,
+        or empty string if there is neither.
+    """
+    parts: list[str] = []
+    if memory.long_term_summary:
+        parts.append(memory.long_term_summary)
+    recalled = recall_episodes(memory.episodes, query)
+    if recalled:
+        parts.append(format_episodes(recalled))
+    return "\n\n".join(parts)
@@ -155,4 +155,27 @@ describe('GalleryGrid', () => {
     const thumbnail = container.querySelector('.gallery-thumbnail');
     expect(thumbnail).not.toBeNull();
   });
+
+  it('uses the thumbnail derivative when available', () => {
+    images.set([
+      makeSceneImage({
+        id: 'img-a',
+        thumbnail_url: '/api/sessions/session-001/images/img-a/thumbnail',
+      }),
+    ]);
+    const { container } = render(GalleryGrid);
+    const thumbnail = container.querySelector('.gallery-thumbnail');
+    expect(thumbnail!.getAttribute('src')).toBe(
+      '/api/sessions/session-001/images/img-a/thumbnail',
+    );
+  });
+
+  it('falls back to the full image without a thumbnail', () => {
+    images.set([makeSceneImage({ id: 'img-a' })]);
+    const { container } = render(GalleryGrid);
+    const thumbnail = container.querySelector('.gallery-thumbnail');
+    expect(thumbnail!.getAttribute('src')).toBe(
+      '/api/sessions/session-001/images/img-001.png',
+    );
+  });
 });
@@ -202,6 +202,18 @@ export interface WsAutopilotStopped {
   reason: string;
 }
 
+export interface WsAutopilotPacing {
+  type: 'autopilot_pacing';
+  delay_seconds: number;
+  avg_round_seconds: number | null;
+  avg_round_tokens: number | null;
+  tokens_today: number;
+  token_budget_remaining: number | null;
+  rate_limit_penalty_seconds: number;
+  rounds_left: number;
+  projected_completion: string | null;
+}
+
 export interface WsDropIn {
   type: 'drop_in';
   character: string;
@@ -257,6 +269,7 @@ export type WsServerEvent =
   | WsError
   | WsAutopilotStarted
   | WsAutopilotStopped
+  | WsAutopilotPacing
   | WsDropIn
   | WsReleaseControl
   | WsAwaitingInput
@@ -387,7 +400,7 @@ export interface ModuleDiscoveryResponse {
   modules: ModuleInfo[];
   provider: string;
   model: string;
-  source: 'llm' | 'error';
+  source: 'llm' | 'cache' | 'error';
   error: string | null;
 }
 
@@ -617,6 +630,7 @@ export interface SceneImage {
   generation_mode: 'current' | 'best' | 'specific';
   generated_at: string;
   download_url: string;
+  thumbnail_url?: string | null;
 }
 
 export interface ImageGenerateAccepted {
@@ -15,14 +15,29 @@ for subsequent rounds.
 """
 
 import logging
-from typing import Callable
+from typing import Callable, Protocol
 
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
 from agents import LLMError, dm_turn, pc_turn
-from memory import MemoryManager
-from models import CombatState, GameConfig, GameState, create_user_error
+from cancellation import (
+    CancellationToken,
+    RoundCancelled,
+    cancellation_scope,
+    check_cancelled,
+)
+from highlights import update_highlight_reel
+from memory import RETAIN_AFTER_COMPRESSION, MemoryManager
+from metrics import NODE_SECONDS, ROUND_SECONDS
+from models import (
+    CombatState,
+    GameConfig,
+    GameState,
+    append_to_memory,
+    create_user_error,
+    parse_entry,
+)
 
 logger = logging.getLogger("autodungeon")
 
@@ -63,6 +78,11 @@ def context_manager(state: GameState) -> GameState:
     - Multi-pass compression: if still over limit, re-compress long_term_summary
     - MAX_COMPRESSION_PASSES limits compression attempts to prevent infinite loops
 
+    Agents are compressed together so that each window of public events is
+    summarized once for the whole party (see MemoryManager.compress_buffer),
+    and their summarization requests are batched into as few LLM calls as
+    possible (see Summarizer.generate_summaries).
+
     Args:
         state: Current game state with agent_memories.
 
@@ -70,65 +90,97 @@ def context_manager(state: GameState) -> GameState:
         Updated game state with compressed memories if needed.
         Sets summarization_in_progress flag during operation.
     """
-    # Create a typed copy to avoid mutating original state
+    # Create a typed copy to avoid mutating original state. AgentMemory
+    # objects are shared between successive states, so an agent's memory
+    # is copied before compression updates it in place.
+    agent_memories = dict(state["agent_memories"])
     updated_state: GameState = {
         **state,
+        "agent_memories": agent_memories,
         "summarization_in_progress": True,
     }
 
     # Get memory manager for this state
     memory_manager = MemoryManager(updated_state)
 
-    # Check each agent's memory and compress if near limit
-    agent_memories = updated_state["agent_memories"]
-    for agent_name in agent_memories:
-        passes = 0
+    # When any agent needs compression, every agent with compressible
+    # entries is compressed in the same pass. Their episodes then cover
+    # the same ground_truth_log window, whose public events are summarized
+    # once for all of them.
+    near_limits = {name: memory_manager.is_near_limit(name) for name in agent_memories}
+    compaction_due = any(near_limits.values())
 
+    # Check each agent's memory and decide which to compress
+    to_compress: list[str] = []
+    for agent_name in agent_memories:
         # Debug: log buffer sizes for all agents each round
         mem = agent_memories[agent_name]
         buf_chars = sum(len(s) for s in mem.short_term_buffer)
         buf_entries = len(mem.short_term_buffer)
         buf_tokens = memory_manager.get_buffer_token_count(agent_name)
-        near_limit = memory_manager.is_near_limit(agent_name)
+        near_limit = near_limits[agent_name]
         if near_limit or buf_entries > 15:
             logger.info(
                 "Memory check: %s — buffer=%d entries (%d chars, ~%d tokens), "
-                "summary=%d chars, near_limit=%s",
+                "summary=%d chars, episodes=%d, near_limit=%s",
                 agent_name,
                 buf_entries,
                 buf_chars,
                 buf_tokens,
                 len(mem.long_term_summary),
+                len(mem.episodes),
                 near_limit,
             )
 
-        # Pass 1: Compress buffer if near limit
-        if near_limit:
+        # Pass 1: Compress buffer if near limit (or alongside an agent that is)
+        if near_limit or (compaction_due and buf_entries > RETAIN_AFTER_COMPRESSION):
             logger.info(
-                "Triggering compression for %s (buffer ~%d tokens, limit %d)",
+                "Triggering compression for %s (buffer ~%d tokens, limit %d%s)",
                 agent_name,
                 buf_tokens,
                 mem.token_limit,
+                "" if near_limit else ", aligned with party",
             )
-            memory_manager.compress_buffer(agent_name)
-            passes += 1
-
-            # Post-compression validation (Story 5.5, AC #5)
-            # Pass 2: If still over limit, re-compress summary
-            while (
-                passes < MAX_COMPRESSION_PASSES
+            agent_memories[agent_name] = mem.model_copy(
+                update={"short_term_buffer": list(mem.short_term_buffer)}
+            )
+            to_compress.append(agent_name)
+
+    # Summarize every buffer being compressed in one batch, then apply
+    if to_compress:
+        memory_manager.prepare_buffer_compression(to_compress)
+    for agent_name in to_compress:
+        memory_manager.compress_buffer(agent_name)
+    passes = dict.fromkeys(to_compress, 1)
+
+    # Post-compression validation (Story 5.5, AC #5)
+    # Pass 2+: Re-compress the summaries of agents still over limit, batched
+    # across agents, until each fits or reaches MAX_COMPRESSION_PASSES
+    pending = to_compress
+    while pending:
+        over_limit = [
+            agent_name
+            for agent_name in pending
+            if passes[agent_name] < MAX_COMPRESSION_PASSES
+            and memory_manager.is_total_context_over_limit(agent_name)
+        ]
+        for agent_name in pending:
+            # Log warning if still over limit after max passes
+            if (
+                agent_name not in over_limit
                 and memory_manager.is_total_context_over_limit(agent_name)
             ):
-                memory_manager.compress_long_term_summary(agent_name)
-                passes += 1
-
-            # Log warning if still over limit after max passes
-            if memory_manager.is_total_context_over_limit(agent_name):
                 logger.warning(
                     "Agent %s still over token limit after %d compression passes",
                     agent_name,
-                    passes,
+                    passes[agent_name],
                 )
+        if over_limit:
+            memory_manager.prepare_summary_compression(over_limit)
+        for agent_name in over_limit:
+            memory_manager.compress_long_term_summary(agent_name)
+            passes[agent_name] += 1
+        pending = over_limit
 
     # Clear the summarization flag after completion
     updated_state["summarization_in_progress"] = False
@@ -166,8 +218,7 @@ def context_manager(state: GameState) -> GameState:
             # Reset combat state
             updated_state["combat_state"] = CombatState()
             # Append system notification to ground truth log
-            updated_state["ground_truth_log"] = [
-                *updated_state["ground_truth_log"],
+            updated_state["ground_truth_log"] = updated_state["ground_truth_log"] + [
                 "[System]: Combat ended after reaching the maximum round limit.",
             ]
 
@@ -199,8 +250,7 @@ def context_manager(state: GameState) -> GameState:
                     "defeat_nudge_round": combat_after_round.round_number,
                 }
             )
-            updated_state["ground_truth_log"] = [
-                *updated_state["ground_truth_log"],
+            updated_state["ground_truth_log"] = updated_state["ground_truth_log"] + [
                 "[System]: All hostile combatants are defeated. "
                 "The DM should end this encounter.",
             ]
@@ -251,8 +301,7 @@ def context_manager(state: GameState) -> GameState:
         # Reset combat state — also clears defeat_nudge_* via defaults
         updated_state["combat_state"] = CombatState()
         # Append system notification
-        updated_state["ground_truth_log"] = [
-            *updated_state["ground_truth_log"],
+        updated_state["ground_truth_log"] = updated_state["ground_truth_log"] + [
             "[System]: Combat force-ended after DM failed to call "
             "dm_end_combat following NPC defeat.",
         ]
@@ -389,7 +438,7 @@ def human_intervention_node(state: GameState) -> GameState:
     """
     from datetime import UTC, datetime
 
-    from models import AgentMemory, TranscriptEntry
+    from models import TranscriptEntry
     from persistence import (
         append_transcript_entry,
         save_checkpoint,
@@ -419,24 +468,18 @@ def human_intervention_node(state: GameState) -> GameState:
     log_entry = f"[{controlled}]: {pending_action}"
 
     # Add to ground truth log
-    new_log = list(state.get("ground_truth_log", []))
+    new_log = state.get("ground_truth_log", []).copy()
     new_log.append(log_entry)
 
-    # Update character's agent memory (matches PC turn behavior)
-    agent_memories = state.get("agent_memories", {})
-    new_memories = {k: v.model_copy() for k, v in agent_memories.items()}
-
     # Get character name for memory entry
     char_config = state.get("characters", {}).get(controlled)
     char_name = char_config.name if char_config else controlled.title()
 
-    # Create memory if it doesn't exist
-    if controlled not in new_memories:
-        new_memories[controlled] = AgentMemory()
-
     # Add action to character's short-term buffer (like pc_turn does)
     memory_entry = f"{char_name}: {pending_action}"
-    new_memories[controlled].short_term_buffer.append(memory_entry)
+    new_memories = append_to_memory(
+        state.get("agent_memories", {}), controlled, memory_entry
+    )
 
     # Advance combat initiative index if combat is active
     combat_for_return = state.get("combat_state", CombatState())
@@ -529,24 +572,15 @@ def _safe_pc_turn(state: GameState, agent_name: str) -> GameState:
         )
 
         # Append to ground truth log
-        new_log = list(state.get("ground_truth_log", []))
+        new_log = state.get("ground_truth_log", []).copy()
         new_log.append(fallback_entry)
 
         # Update agent memory so context stays consistent
-        from models import AgentMemory
-
-        agent_memories = state.get("agent_memories", {})
-        new_memories = {k: v.model_copy() for k, v in agent_memories.items()}
-        if agent_name in new_memories:
-            new_memories[agent_name].short_term_buffer.append(
-                f"{char_name}: *holds position, watchful and alert.*"
-            )
-        else:
-            mem = AgentMemory()
-            mem.short_term_buffer.append(
-                f"{char_name}: *holds position, watchful and alert.*"
-            )
-            new_memories[agent_name] = mem
+        new_memories = append_to_memory(
+            state.get("agent_memories", {}),
+            agent_name,
+            f"{char_name}: *holds position, watchful and alert.*",
+        )
 
         # Advance combat initiative index if combat is active
         combat_st = state.get("combat_state")
@@ -567,6 +601,34 @@ def _safe_pc_turn(state: GameState, agent_name: str) -> GameState:
         return updated
 
 
+class _GameNode(Protocol):
+    """A graph node function (LangGraph passes the state as ``state``)."""
+
+    def __call__(self, state: GameState) -> GameState: ...
+
+
+def _timed_node(node: str, fn: Callable[[GameState], GameState]) -> _GameNode:
+    """Wrap a graph node so its duration is recorded per session.
+
+    The wrapped node raises RoundCancelled instead of running if the
+    current round has been cancelled.
+
+    Args:
+        node: Node name used as the metric label.
+        fn: Node function to wrap.
+
+    Returns:
+        Node function with the same signature.
+    """
+
+    def timed(state: GameState) -> GameState:
+        check_cancelled()
+        with NODE_SECONDS.time(session=state.get("session_id", ""), node=node):
+            return fn(state)
+
+    return timed
+
+
 def create_game_workflow(  # type: ignore[return-value]
     turn_queue: list[str] | None = None,
 ) -> CompiledStateGraph:  # type: ignore[type-arg]
@@ -578,6 +640,10 @@ def create_game_workflow(  # type: ignore[return-value]
     - Human intervention node for Epic 3 integration
     - Conditional edges implementing turn-based routing
 
+    Agent and context manager nodes record their duration in the
+    node duration metric, and do not start once the round has been
+    cancelled.
+
     Args:
         turn_queue: List of agent names in turn order.
                     First should be "dm", rest are PC names.
@@ -593,10 +659,12 @@ def create_game_workflow(  # type: ignore[return-value]
 
     # Add context_manager node (Story 5.2)
     # Runs before DM to check and compress memory buffers
-    workflow.add_node("context_manager", context_manager)
+    workflow.add_node(
+        "context_manager", _timed_node("context_manager", context_manager)
+    )
 
     # Add DM node
-    workflow.add_node("dm", dm_turn)
+    workflow.add_node("dm", _timed_node("dm", dm_turn))
 
     # Add PC nodes dynamically based on turn_queue
     # Use _safe_pc_turn wrapper for resilience: if a PC's LLM fails,
@@ -606,7 +674,10 @@ def create_game_workflow(  # type: ignore[return-value]
             # type: ignore needed due to langgraph's complex generic typing
             workflow.add_node(
                 agent_name,
-                lambda s, name=agent_name: _safe_pc_turn(s, name),  # type: ignore[misc, arg-type]
+                _timed_node(
+                    agent_name,
+                    lambda s, name=agent_name: _safe_pc_turn(s, name),  # type: ignore[misc]
+                ),
             )
 
     # Add human intervention node (placeholder for Epic 3)
@@ -647,8 +718,9 @@ def _append_transcript_for_new_entries(
     """Append transcript entries for new log entries added during round.
 
     Compares state before and after round execution to identify new entries,
-    then appends a TranscriptEntry for each. Tool calls are not captured
-    at this level (would require agent-level integration).
+    then appends a TranscriptEntry for each and adds them to the session's
+    search index. Tool calls are not captured at this level (would require
+    agent-level integration).
 
     Args:
         state: GameState before round execution.
@@ -659,6 +731,7 @@ def _append_transcript_for_new_entries(
 
     from models import TranscriptEntry
     from persistence import append_transcript_entry
+    from transcript_search import index_transcript_entries
 
     old_log = state.get("ground_truth_log", [])
     new_log = result.get("ground_truth_log", [])
@@ -666,21 +739,16 @@ def _append_transcript_for_new_entries(
     # Find new entries added during this round
     old_count = len(old_log)
     new_entries = new_log[old_count:]
+    appended: list[TranscriptEntry] = []
 
     for i, entry in enumerate(new_entries):
         turn_number = old_count + i + 1  # 1-indexed
 
-        # Parse agent from log entry format "[agent]: content"
-        agent = "dm"  # default
-        content = entry
-
-        if entry.startswith("["):
-            bracket_end = entry.find("]")
-            if bracket_end > 0:
-                agent = entry[1:bracket_end]
-                # Content is everything after "]: " or just after "]"
-                rest = entry[bracket_end + 1 :]
-                content = rest.lstrip(": ").strip()
+        # Parse agent from log entry format "[agent]: content" (shares the
+        # parse cache with the narrative renderer)
+        parsed = parse_entry(entry, turn_number - 1)
+        agent = parsed.agent
+        content = parsed.content.strip()
 
         # Generate ISO timestamp
         timestamp = datetime.now(UTC).isoformat().replace("+00:00", "Z")
@@ -696,14 +764,19 @@ def _append_transcript_for_new_entries(
 
         try:
             append_transcript_entry(session_id, transcript_entry)
+            appended.append(transcript_entry)
         except OSError:
             # Log error but don't fail game execution (graceful degradation)
             pass
 
+    # Keep the session's search index in step with the transcript
+    index_transcript_entries(session_id, appended)
+
 
 def run_single_round(
     state: GameState,
     on_node_complete: Callable[[GameState], None] | None = None,
+    cancel_token: CancellationToken | None = None,
 ) -> GameStateWithError:
     """Execute one complete round (DM + all PCs).
 
@@ -726,11 +799,18 @@ def run_single_round(
             each graph node completes. Used by the engine to broadcast
             per-turn updates over WebSocket without waiting for the round
             to finish. Callback exceptions are caught and logged.
+        cancel_token: Optional token the caller cancels to abort the round.
+            Cancellation aborts the in-flight LLM request, skips the
+            remaining nodes and node callbacks, and saves no transcript
+            or checkpoint for the round.
 
     Returns:
         Updated state after all agents have acted once. If an error occurred,
         the dict will include an "error" key with a UserError instance.
         The original state fields are preserved in case of error for recovery.
+
+    Raises:
+        RoundCancelled: If cancel_token was cancelled during the round.
     """
     from persistence import get_latest_checkpoint, save_checkpoint, save_fork_checkpoint
 
@@ -770,17 +850,20 @@ def run_single_round(
         # updates. stream_mode='values' yields the full state after each
         # node executes; the first yielded value is the initial state.
         result: GameState = state  # type: ignore[assignment]
-        for chunk in workflow.stream(
-            state,
-            config={"recursion_limit": recursion_limit},
-            stream_mode="values",
-        ):
-            result = chunk  # type: ignore[assignment]
-            if on_node_complete is not None:
-                try:
-                    on_node_complete(chunk)
-                except Exception:
-                    logger.exception("on_node_complete callback failed")
+        with cancellation_scope(cancel_token):
+            for chunk in workflow.stream(
+                state,
+                config={"recursion_limit": recursion_limit},
+                stream_mode="values",
+            ):
+                check_cancelled()
+                result = chunk  # type: ignore[assignment]
+                if on_node_complete is not None:
+                    try:
+                        on_node_complete(chunk)
+                    except Exception:
+                        logger.exception("on_node_complete callback failed")
+            check_cancelled()
         print(
             f"[{_time.strftime('%H:%M:%S')}] run_single_round: COMPLETE — "
             f"elapsed {_time.time() - _round_start:.1f}s",
@@ -788,6 +871,13 @@ def run_single_round(
             flush=True,
         )
 
+    except RoundCancelled as e:
+        logger.info("Round cancelled (session=%s, reason=%s)", session_id, e)
+        ROUND_SECONDS.observe(
+            _time.time() - _round_start, session=session_id, outcome="cancelled"
+        )
+        raise
+
     except LLMError as e:
         # Create user-friendly error without corrupting game state (Story 4.5)
         detail = str(e)
@@ -806,6 +896,9 @@ def run_single_round(
         # This ensures game state is not corrupted by partial turn (Task 3.4)
         error_result: GameStateWithError = dict(state)
         error_result["error"] = user_error
+        ROUND_SECONDS.observe(
+            _time.time() - _round_start, session=session_id, outcome="error"
+        )
         return error_result
 
     except Exception as e:
@@ -824,6 +917,9 @@ def run_single_round(
 
         error_result = dict(state)
         error_result["error"] = user_error
+        ROUND_SECONDS.observe(
+            _time.time() - _round_start, session=session_id, outcome="error"
+        )
         return error_result
 
     # Get session_id for persistence operations
@@ -833,6 +929,9 @@ def run_single_round(
     # Append transcript entries for new log entries (FR39, Story 4.4)
     _append_transcript_for_new_entries(state, result, session_id)
 
+    # Score the round's entries as best-scene candidates
+    update_highlight_reel(session_id, result)
+
     # Auto-checkpoint: save after each round (FR33, NFR11)
     if turn_number > 0:  # Only save if there's content
         active_fork_id = result.get("active_fork_id")
@@ -843,5 +942,7 @@ def run_single_round(
             # Main timeline save
             save_checkpoint(result, session_id, turn_number)
 
+    ROUND_SECONDS.observe(_time.time() - _round_start, session=session_id, outcome="ok")
+
     # Return result without error key
     return dict(result)
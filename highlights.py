@@ -0,0 +1,233 @@
+"""Incremental highlight tracking for best-scene image generation.
+
+The best-scene scanner used to send the whole ground_truth_log to an LLM
+on every request. Instead, each session keeps a HighlightReel: as rounds
+complete, the new log entries are scored with cheap local heuristics and
+the best-scene endpoint only asks the LLM to choose between the top few
+candidates.
+
+Scoring (see score_entry()):
+
+- Natural 20s and critical hits, and killing blows.
+- Visually dramatic vocabulary (dragons, fire, spells, clashing blades).
+- Entries written while combat is active.
+- Callbacks to earlier narrative elements, with a larger bonus for story
+  moments (CallbackEntry.is_story_moment).
+- DM narration over player dialogue; [SHEET] updates are never candidates.
+
+Reels live in memory. A reel that has never seen a session (after a
+restart) catches up from the log on first use; one whose log was
+rewound or switched to a fork starts over.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+
+from models import CallbackLog, GameState, parse_entry
+
+logger = logging.getLogger("autodungeon")
+
+__all__ = [
+    "BEST_SCENE_CANDIDATES",
+    "HighlightReel",
+    "get_highlight_reel",
+    "reset_highlight_reels",
+    "score_entry",
+    "update_highlight_reel",
+]
+
+# Candidates the best-scene scanner compares
+BEST_SCENE_CANDIDATES = 5
+
+# Candidates closer than this many entries are one scene; only the best
+# of them is offered
+CANDIDATE_SPACING = 3
+
+# Score weights
+_CRITICAL_SCORE = 3.0
+_CLIMAX_SCORE = 1.5
+_DRAMA_WORD_SCORE = 0.5
+_DRAMA_WORD_LIMIT = 4
+_COMBAT_SCORE = 1.0
+_DM_SCORE = 1.0
+_CALLBACK_SCORE = 2.0
+_STORY_MOMENT_SCORE = 3.0
+
+_CRITICAL_RE = re.compile(
+    r"\b(?:nat(?:ural)?\s*20|critical\s+(?:hit|success|strike)|crits?)\b",
+    re.IGNORECASE,
+)
+_CLIMAX_RE = re.compile(
+    r"\b(?:killing blow|slain|slays?|falls? dead|collapses?|defeated|"
+    r"final blow|last breath)\b",
+    re.IGNORECASE,
+)
+_DRAMA_RE = re.compile(
+    r"\b(dragon|demon|fire|flame|inferno|lightning|thunder|storm|explo\w*|"
+    r"blood|blade|sword|arrow|spell|arcane|glow\w*|radian\w*|roar\w*|"
+    r"shatter\w*|charg\w*|clash\w*|battle|ambush\w*|portal|ruins?|"
+    r"undead|titan|giant)\b",
+    re.IGNORECASE,
+)
+
+
+def score_entry(entry: str, in_combat: bool = False) -> float:
+    """Score how likely a log entry is to make a good illustration.
+
+    Args:
+        entry: A ground_truth_log entry.
+        in_combat: Whether combat was active when the entry was written.
+
+    Returns:
+        Heuristic score; 0 for entries that should never be candidates.
+    """
+    parsed = parse_entry(entry)
+    if parsed.message_type == "sheet_update" or not parsed.content.strip():
+        return 0.0
+    content = parsed.content
+    score = 0.0
+    if _CRITICAL_RE.search(content):
+        score += _CRITICAL_SCORE
+    if _CLIMAX_RE.search(content):
+        score += _CLIMAX_SCORE
+    drama = {match.lower() for match in _DRAMA_RE.findall(content)}
+    score += _DRAMA_WORD_SCORE * min(len(drama), _DRAMA_WORD_LIMIT)
+    if score == 0.0:
+        return 0.0
+    if in_combat:
+        score += _COMBAT_SCORE
+    if parsed.message_type == "dm_narration":
+        score += _DM_SCORE
+    return score
+
+
+class HighlightReel:
+    """Ranked best-scene candidates for one session.
+
+    Attributes:
+        _scores: Score by ground_truth_log index (positive scores only).
+        _scored: Number of log entries scored so far.
+        _last_entry: The last scored entry, to notice a rewound or
+            forked log.
+        _callbacks_seen: Number of callback_log entries already counted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty reel."""
+        self._scores: dict[int, float] = {}
+        self._scored = 0
+        self._last_entry: str | None = None
+        self._callbacks_seen = 0
+        self._lock = threading.Lock()
+
+    def _reset(self) -> None:
+        """Forget everything scored so far."""
+        self._scores.clear()
+        self._scored = 0
+        self._last_entry = None
+        self._callbacks_seen = 0
+
+    def _add(self, index: int, score: float) -> None:
+        """Add to an entry's score."""
+        if score > 0:
+            self._scores[index] = self._scores.get(index, 0.0) + score
+
+    def update(self, state: GameState) -> None:
+        """Score log entries and callbacks added since the last update.
+
+        Args:
+            state: The session's current game state.
+        """
+        log = state.get("ground_truth_log", [])
+        callback_entries = state.get("callback_log", CallbackLog()).entries
+        with self._lock:
+            if len(log) < self._scored or (
+                self._scored and log[self._scored - 1] != self._last_entry
+            ):
+                self._reset()
+            if len(callback_entries) < self._callbacks_seen:
+                self._reset()
+
+            # Combat state only describes the latest round, so a catch-up
+            # over an unseen log does not count it
+            combat = state.get("combat_state")
+            in_combat = bool(combat and combat.active and self._scored)
+            for index in range(self._scored, len(log)):
+                self._add(index, score_entry(log[index], in_combat))
+            if len(log) > self._scored:
+                self._scored = len(log)
+                self._last_entry = log[-1]
+
+            # Callbacks are detected at turn len(log), i.e. the entry at
+            # index turn_detected - 1
+            for callback in callback_entries[self._callbacks_seen :]:
+                index = callback.turn_detected - 1
+                if 0 <= index < self._scored:
+                    bonus = _CALLBACK_SCORE
+                    if callback.is_story_moment:
+                        bonus += _STORY_MOMENT_SCORE
+                    self._add(index, bonus)
+            self._callbacks_seen = len(callback_entries)
+
+    def candidates(self, limit: int = BEST_SCENE_CANDIDATES) -> list[int]:
+        """Get the best-scoring entries, one per scene.
+
+        Args:
+            limit: Maximum candidates to return.
+
+        Returns:
+            ground_truth_log indexes, best first (later entries win ties).
+        """
+        with self._lock:
+            ranked = sorted(self._scores.items(), key=lambda item: (-item[1], -item[0]))
+        chosen: list[int] = []
+        for index, _ in ranked:
+            if len(chosen) >= limit:
+                break
+            if all(abs(index - other) >= CANDIDATE_SPACING for other in chosen):
+                chosen.append(index)
+        return chosen
+
+
+_reels: dict[str, HighlightReel] = {}
+_reels_lock = threading.Lock()
+
+
+def get_highlight_reel(session_id: str) -> HighlightReel:
+    """Get a session's highlight reel, created on first use.
+
+    Args:
+        session_id: Session ID string.
+
+    Returns:
+        The session's HighlightReel.
+    """
+    with _reels_lock:
+        reel = _reels.get(session_id)
+        if reel is None:
+            reel = _reels[session_id] = HighlightReel()
+        return reel
+
+
+def update_highlight_reel(session_id: str, state: GameState) -> None:
+    """Score a session's new entries after a round.
+
+    Errors are logged, not raised: highlights must not interrupt the game.
+
+    Args:
+        session_id: Session ID string.
+        state: Game state after the round.
+    """
+    try:
+        get_highlight_reel(session_id).update(state)
+    except Exception as e:
+        logger.warning("Failed to update highlights for session %s: %s", session_id, e)
+
+
+def reset_highlight_reels() -> None:
+    """Drop every session's highlight reel (for tests)."""
+    with _reels_lock:
+        _reels.clear()
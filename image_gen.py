@@ -11,15 +11,26 @@ Architecture:
 - build_scene_prompt(): Uses a fast LLM to summarize narrative into a visual prompt
 - generate_scene_image(): Calls Google Imagen API and saves result as PNG
 - scan_best_scene(): Analyzes session log to find the most dramatic scene
-- Images stored in campaigns/session_{id}/images/{uuid}.png
+  (chunks scanned concurrently, winners cached by chunk content hash)
+- scan_candidates(): Picks the best scene among locally ranked highlights
+  (see highlights.py), without scanning the whole log
+- build_scene_prompt(): Built prompts cached on disk in .cache/scene_prompts,
+  so regenerating a turn skips the prompt-building LLM call
+- get_image_generator(): Shared instance used by the image job queue
+- Images stored in campaigns/session_{id}/images/{uuid}.png, with WebP
+  gallery thumbnails in campaigns/session_{id}/images/thumbs/{uuid}.webp
 """
 
 import asyncio
+import hashlib
 import io
 import json
 import logging
+import os
 import re
+import tempfile
 import uuid
+from collections.abc import Coroutine
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal
@@ -27,6 +38,7 @@ from typing import Any, Literal
 from agents import _extract_response_text
 from models import ImageGenerationConfig, SceneImage, create_scene_image
 from persistence import get_session_dir
+from token_counter import count_tokens
 
 logger = logging.getLogger("autodungeon")
 
@@ -50,17 +62,31 @@ to clearly separate them from the party's races and classes."""
 # Maximum log entries to include in scene context
 SCENE_CONTEXT_ENTRIES = 10
 
+# Built scene prompts depend only on the prompt-building request (scanner
+# model, system prompt, scene entries and party), so they are cached on disk
+# and survive restarts. Regenerating a turn, or rendering it with another
+# image model, then skips the LLM round trip.
+SCENE_PROMPT_CACHE_DIR = Path(__file__).parent / ".cache" / "scene_prompts"
+
+# Changes whenever SCENE_PROMPT_SYSTEM is edited, so stale prompts are not reused
+SCENE_PROMPT_VERSION = hashlib.sha256(SCENE_PROMPT_SYSTEM.encode()).hexdigest()[:12]
+
+# Max scene prompts kept in memory over the disk cache
+SCENE_PROMPT_CACHE_SIZE = 256
+
 # Imagen API maximum prompt length in characters (480 tokens ~ 1920 chars).
 # We use a conservative character limit for safety.
 MAX_PROMPT_CHARS = 1900
 
+# Gallery thumbnails: WebP derivatives bounded to this size (16:9 source
+# images become 480x270), stored in images/thumbs/{uuid}.webp
+THUMBNAIL_MAX_SIZE = (480, 270)
+THUMBNAIL_QUALITY = 80
+
 # =============================================================================
 # Best Scene Scanner Constants (Story 17-4)
 # =============================================================================
 
-# Token estimation: words * 1.3 (consistent with MEMORY.md guidance)
-TOKENS_PER_WORD = 1.3
-
 # Number of overlapping entries between adjacent chunks to avoid cutting scenes
 CHUNK_OVERLAP_ENTRIES = 20
 
@@ -70,6 +96,13 @@ CHUNK_FILL_FACTOR = 0.8
 # Scanner timeout matches Summarizer.LLM_TIMEOUT (5 minutes for large sessions)
 SCANNER_LLM_TIMEOUT = 300
 
+# Max chunk winners compared in one LLM call; more winners are reduced in
+# rounds of concurrent group comparisons (tree reduce)
+SCANNER_COMPARISON_FAN_IN = 16
+
+# Max cached per-chunk winners (process-wide, shared by all ImageGenerators)
+CHUNK_WINNER_CACHE_SIZE = 1024
+
 # System prompt instructing the LLM to identify the best visual scene
 BEST_SCENE_SYSTEM_PROMPT = """\
 You are analyzing a D&D session log to find the single most visually dramatic, \
@@ -110,9 +143,191 @@ scene overall. Respond with the same JSON format:
   "rationale": "<brief explanation>"
 }}"""
 
+# Log entries shown on each side of a highlight candidate
+CANDIDATE_CONTEXT_ENTRIES = 2
+
+# Prompt for choosing between locally ranked highlight candidates
+BEST_SCENE_CANDIDATES_PROMPT = """\
+Here are excerpts around the strongest candidate scenes of a D&D session:
+
+{excerpts}
+
+Select the single most visually dramatic scene from these excerpts. \
+Respond with the same JSON format:
+{{
+  "turn_number": <integer>,
+  "rationale": "<brief explanation>"
+}}"""
+
 # Regex for fallback turn number extraction from plain text
 _TURN_NUMBER_RE = re.compile(r"[Tt]urn\s*(?:#|number[:\s]*)?\s*(\d+)")
 
+# Per-chunk scanner winners keyed by a hash of scanner model, prompt and the
+# formatted chunk text. Earlier chunks of a growing log keep the same
+# boundaries and content, so rescans only pay for new chunks.
+_chunk_winner_cache: dict[str, tuple[int, str]] = {}
+
+
+def clear_chunk_winner_cache() -> None:
+    """Clear cached per-chunk scanner winners."""
+    _chunk_winner_cache.clear()
+
+
+# In-memory layer over the scene prompt disk cache: key -> prompt
+_scene_prompt_cache: dict[str, str] = {}
+
+
+def clear_scene_prompt_cache() -> None:
+    """Clear in-memory cached scene prompts (the disk cache is kept)."""
+    _scene_prompt_cache.clear()
+
+
+def _scene_prompt_cache_key(provider: str, model: str, user_message: str) -> str:
+    """Build the cache key for a scene prompt request.
+
+    Args:
+        provider: Scanner LLM provider that builds the prompt.
+        model: Scanner LLM model.
+        user_message: Scene context sent to the LLM (entries and party).
+
+    Returns:
+        Hex SHA-256 digest identifying the request.
+    """
+    digest = hashlib.sha256()
+    for part in (provider.lower(), model, SCENE_PROMPT_VERSION, user_message):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _load_cached_scene_prompt(key: str) -> str | None:
+    """Load a cached scene prompt from memory, falling back to disk.
+
+    Unreadable or malformed cache files are treated as a miss.
+
+    Args:
+        key: Cache key from _scene_prompt_cache_key().
+
+    Returns:
+        The cached prompt, or None on a miss.
+    """
+    prompt = _scene_prompt_cache.get(key)
+    if prompt is not None:
+        return prompt
+
+    path = SCENE_PROMPT_CACHE_DIR / f"{key[:32]}.json"
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("key") != key or not isinstance(data.get("prompt"), str):
+            return None
+        prompt = data["prompt"]
+    except (OSError, ValueError, AttributeError) as e:
+        logger.warning("Ignoring unreadable scene prompt cache %s: %s", path, e)
+        return None
+    _remember_scene_prompt(key, prompt)
+    return prompt
+
+
+def _remember_scene_prompt(key: str, prompt: str) -> None:
+    """Add a scene prompt to the bounded in-memory cache."""
+    _scene_prompt_cache[key] = prompt
+    while len(_scene_prompt_cache) > SCENE_PROMPT_CACHE_SIZE:
+        # Evict oldest entry (dicts preserve insertion order)
+        del _scene_prompt_cache[next(iter(_scene_prompt_cache))]
+
+
+def _store_scene_prompt(key: str, prompt: str) -> None:
+    """Store a scene prompt in memory and atomically on disk.
+
+    Disk write failures are logged and otherwise ignored: the in-memory
+    entry still serves this process.
+
+    Args:
+        key: Cache key from _scene_prompt_cache_key().
+        prompt: Built scene prompt.
+    """
+    _remember_scene_prompt(key, prompt)
+
+    path = SCENE_PROMPT_CACHE_DIR / f"{key[:32]}.json"
+    payload = json.dumps({"key": key, "prompt": prompt}, indent=2)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=".prompt_", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            Path(temp_path).replace(path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        logger.warning("Failed to write scene prompt cache %s: %s", path, e)
+
+
+def get_thumbnail_path(image_path: Path) -> Path:
+    """Get the thumbnail derivative path for a generated PNG.
+
+    Args:
+        image_path: Path to the full-size PNG.
+
+    Returns:
+        Path to the WebP thumbnail (images/thumbs/{uuid}.webp).
+    """
+    return image_path.parent / "thumbs" / f"{image_path.stem}.webp"
+
+
+def _write_thumbnail(image: Any, thumb_path: Path) -> None:
+    """Downscale an image and write it as WebP atomically.
+
+    Args:
+        image: PIL Image (not modified).
+        thumb_path: Destination .webp path.
+    """
+    thumb = image.copy()
+    thumb.thumbnail(THUMBNAIL_MAX_SIZE)
+    if thumb.mode not in ("RGB", "RGBA"):
+        thumb = thumb.convert("RGBA" if "A" in thumb.getbands() else "RGB")
+    thumb_path.parent.mkdir(parents=True, exist_ok=True)
+    # Temp file + rename so concurrent lazy requests never see a partial file
+    temp_path = thumb_path.with_name(f"{thumb_path.stem}.{uuid.uuid4().hex}.tmp")
+    try:
+        thumb.save(str(temp_path), format="WEBP", quality=THUMBNAIL_QUALITY)
+        temp_path.replace(thumb_path)
+    except Exception:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def ensure_thumbnail(image_path: Path) -> Path:
+    """Return the WebP thumbnail for a PNG, creating it if needed.
+
+    Thumbnails are normally written at save time; this lazily creates
+    them for images saved before thumbnails existed (or if the save-time
+    write failed). Synchronous -- call via asyncio.to_thread from async code.
+
+    Args:
+        image_path: Path to the full-size PNG.
+
+    Returns:
+        Path to the thumbnail file.
+
+    Raises:
+        OSError: If the PNG cannot be read or the thumbnail written.
+    """
+    thumb_path = get_thumbnail_path(image_path)
+    if thumb_path.exists():
+        return thumb_path
+
+    from PIL import Image
+
+    with Image.open(image_path) as image:
+        _write_thumbnail(image, thumb_path)
+    return thumb_path
+
 
 class ImageGenerationError(Exception):
     """Raised when image generation fails."""
@@ -133,13 +348,15 @@ class ImageGenerator:
     def __init__(self) -> None:
         self._client: Any = None  # Lazy initialization
         self._client_api_key: str | None = None  # Track key for staleness detection
+        self._client_config_version: int | None = None
 
     def _get_client(self) -> Any:
         """Get or create the genai client (lazy init).
 
         On first call, resolves the API key and creates the client.
-        On subsequent calls, checks if the API key has changed and
-        recreates the client if so (handles user updating settings via UI).
+        On subsequent calls, the client is reused until the config store's
+        version changes; then the API key is resolved again and the client
+        recreated if it changed (handles user updating settings via UI).
 
         Returns:
             A google.genai.Client instance configured with the effective API key.
@@ -147,6 +364,11 @@ class ImageGenerator:
         Raises:
             ImageGenerationError: If the API key is not configured.
         """
+        from config import get_config_store
+
+        version = get_config_store().version
+        if self._client is not None and version == self._client_config_version:
+            return self._client
         if self._client is None:
             api_key = self._get_api_key()
             from google import genai
@@ -167,6 +389,7 @@ class ImageGenerator:
 
                 self._client = genai.Client(api_key=current_key)
                 self._client_api_key = current_key
+        self._client_config_version = version
         return self._client
 
     def _get_api_key(self) -> str:
@@ -245,6 +468,10 @@ class ImageGenerator:
     def _save_image_to_disk(image_bytes: bytes, image_path: Path) -> None:
         """Save raw image bytes as PNG to disk (synchronous, for thread offload).
 
+        Also writes the gallery thumbnail derivative while the decoded
+        image is in memory. A thumbnail failure is logged, not raised;
+        ensure_thumbnail() recreates it on first request.
+
         Args:
             image_bytes: Raw image data from the API.
             image_path: Destination file path.
@@ -253,6 +480,10 @@ class ImageGenerator:
 
         image = Image.open(io.BytesIO(image_bytes))
         image.save(str(image_path), format="PNG")
+        try:
+            _write_thumbnail(image, get_thumbnail_path(image_path))
+        except (OSError, ValueError) as e:
+            logger.warning("Thumbnail generation failed for %s: %s", image_path, e)
 
     async def generate_scene_image(
         self,
@@ -472,6 +703,14 @@ class ImageGenerator:
 
         user_message = "\n\n".join(context_parts)
 
+        cache_key = _scene_prompt_cache_key(
+            scanner_provider, scanner_model, user_message
+        )
+        cached = await asyncio.to_thread(_load_cached_scene_prompt, cache_key)
+        if cached is not None:
+            logger.debug("Scene prompt cache hit (%s)", cache_key[:12])
+            return cached
+
         try:
             llm = get_llm(scanner_provider, scanner_model)
             messages = [
@@ -481,9 +720,9 @@ class ImageGenerator:
             response = await llm.ainvoke(messages)
             content = response.content
             if isinstance(content, str):
-                return content.strip()
+                prompt = content.strip()
             # Handle list-type content (some providers return list of blocks)
-            if isinstance(content, list):
+            elif isinstance(content, list):
                 text_parts: list[str] = []
                 for block in content:
                     if isinstance(block, str):
@@ -492,34 +731,44 @@ class ImageGenerator:
                         text_parts.append(block["text"])
                     else:
                         text_parts.append(str(block))
-                return " ".join(text_parts).strip()
-            return str(content).strip()
+                prompt = " ".join(text_parts).strip()
+            else:
+                prompt = str(content).strip()
         except Exception as e:
             logger.error("Scene prompt building failed: %s", e)
             raise ImageGenerationError(f"Failed to build scene prompt: {e}") from e
 
+        if prompt:
+            await asyncio.to_thread(_store_scene_prompt, cache_key, prompt)
+        return prompt
+
     # =========================================================================
     # Best Scene Scanner (Story 17-4)
     # =========================================================================
 
     @staticmethod
-    def _estimate_tokens(text: str) -> int:
-        """Estimate token count from text using words * 1.3.
+    def _estimate_tokens(text: str, provider: str = "", model: str = "") -> int:
+        """Estimate token count for the scanner model.
 
-        This matches the project-wide convention documented in MEMORY.md.
+        Uses the shared, memoized token_counter so the scanner and memory
+        compression agree on counts.
 
         Args:
             text: The text to estimate tokens for.
+            provider: Scanner LLM provider; empty for the default family.
+            model: Scanner model name.
 
         Returns:
             Estimated token count.
         """
-        word_count = len(text.split())
-        return int(word_count * TOKENS_PER_WORD)
+        return count_tokens(text, provider, model)
 
     @staticmethod
     def _chunk_log_entries(
-        log_entries: list[str], token_limit: int
+        log_entries: list[str],
+        token_limit: int,
+        provider: str = "",
+        model: str = "",
     ) -> list[tuple[int, list[str]]]:
         """Split log entries into chunks that fit within the token limit.
 
@@ -531,6 +780,8 @@ class ImageGenerator:
         Args:
             log_entries: Full list of log entry strings.
             token_limit: Maximum tokens per chunk (from scanner config).
+            provider: Scanner LLM provider, for token counting.
+            model: Scanner model name, for token counting.
 
         Returns:
             List of ``(start_offset, entries)`` tuples. The start_offset
@@ -552,7 +803,7 @@ class ImageGenerator:
             end = start
             running_tokens = 0
             while end < total:
-                entry_tokens = int(len(log_entries[end].split()) * TOKENS_PER_WORD)
+                entry_tokens = count_tokens(log_entries[end], provider, model)
                 if running_tokens + entry_tokens > effective_limit and end > start:
                     break
                 running_tokens += entry_tokens
@@ -646,13 +897,198 @@ class ImageGenerator:
             formatted.append(f"[Turn {start_index + i}] {entry}")
         return "\n\n".join(formatted)
 
+    @staticmethod
+    def _chunk_cache_key(provider: str, model: str, formatted_chunk: str) -> str:
+        """Build the cache key for a chunk's scanner winner.
+
+        Args:
+            provider: Scanner LLM provider.
+            model: Scanner LLM model.
+            formatted_chunk: Chunk text as sent to the scanner (with turn
+                numbers, so identical text at another offset is distinct).
+
+        Returns:
+            Hex SHA-256 digest identifying the scan request.
+        """
+        digest = hashlib.sha256()
+        for part in (provider, model, BEST_SCENE_SYSTEM_PROMPT, formatted_chunk):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @staticmethod
+    async def _gather_bounded(
+        coros: list[Coroutine[Any, Any, tuple[int, str]]],
+        semaphore: asyncio.Semaphore,
+    ) -> list[tuple[int, str]]:
+        """Run scanner coroutines concurrently under a shared semaphore.
+
+        Results are returned in input order. If any call fails, the
+        remaining calls are cancelled before the error propagates.
+
+        Args:
+            coros: Scanner call coroutines.
+            semaphore: Limits concurrent in-flight LLM calls.
+
+        Returns:
+            List of (turn_number, rationale) results.
+        """
+
+        async def _bounded(
+            coro: Coroutine[Any, Any, tuple[int, str]],
+        ) -> tuple[int, str]:
+            async with semaphore:
+                return await coro
+
+        tasks = [asyncio.ensure_future(_bounded(c)) for c in coros]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _scan_chunks(
+        self,
+        llm: Any,
+        config: ImageGenerationConfig,
+        chunks: list[tuple[int, list[str]]],
+        semaphore: asyncio.Semaphore,
+    ) -> list[tuple[int, str]]:
+        """Find the best scene in each chunk, concurrently and with caching.
+
+        Args:
+            llm: Scanner chat model.
+            config: Image generation config (scanner provider/model).
+            chunks: ``(start_offset, entries)`` tuples from _chunk_log_entries.
+            semaphore: Limits concurrent in-flight LLM calls.
+
+        Returns:
+            One (turn_number, rationale) winner per chunk, in chunk order.
+        """
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        total = len(chunks)
+
+        async def _scan_chunk(
+            index: int, formatted: str, cache_key: str
+        ) -> tuple[int, str]:
+            response = await llm.ainvoke(
+                [
+                    SystemMessage(content=BEST_SCENE_SYSTEM_PROMPT),
+                    HumanMessage(content=formatted),
+                ]
+            )
+            content = (
+                response.content
+                if isinstance(response.content, str)
+                else str(response.content)
+            )
+            winner = self._parse_scanner_response(content)
+            _chunk_winner_cache[cache_key] = winner
+            while len(_chunk_winner_cache) > CHUNK_WINNER_CACHE_SIZE:
+                # Evict oldest entry (dicts preserve insertion order)
+                del _chunk_winner_cache[next(iter(_chunk_winner_cache))]
+            logger.debug(
+                "Scanner chunk %d/%d winner: Turn %d - %s",
+                index + 1,
+                total,
+                winner[0],
+                winner[1][:100],
+            )
+            return winner
+
+        winners: list[tuple[int, str] | None] = [None] * total
+        pending: list[int] = []
+        coros: list[Coroutine[Any, Any, tuple[int, str]]] = []
+        for i, (chunk_offset, chunk) in enumerate(chunks):
+            formatted = self._format_log_for_scanner(chunk, start_index=chunk_offset)
+            cache_key = self._chunk_cache_key(
+                config.scanner_provider, config.scanner_model, formatted
+            )
+            cached = _chunk_winner_cache.get(cache_key)
+            if cached is not None:
+                winners[i] = cached
+            else:
+                pending.append(i)
+                coros.append(_scan_chunk(i, formatted, cache_key))
+
+        logger.debug(
+            "Scanner: %d chunks, %d cached, %d to scan",
+            total,
+            total - len(pending),
+            len(pending),
+        )
+        for i, winner in zip(
+            pending, await self._gather_bounded(coros, semaphore), strict=True
+        ):
+            winners[i] = winner
+
+        return [w for w in winners if w is not None]
+
+    async def _compare_winners(
+        self,
+        llm: Any,
+        winners: list[tuple[int, str]],
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[int, str]:
+        """Reduce chunk winners to a single best scene.
+
+        Up to SCANNER_COMPARISON_FAN_IN winners are compared in one call.
+        Larger sets are split into groups compared concurrently, and the
+        group winners are reduced again until one remains.
+
+        Args:
+            llm: Scanner chat model.
+            winners: (turn_number, rationale) candidates, at least one.
+            semaphore: Limits concurrent in-flight LLM calls.
+
+        Returns:
+            The winning (turn_number, rationale).
+        """
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        async def _compare(group: list[tuple[int, str]]) -> tuple[int, str]:
+            if len(group) == 1:
+                return group[0]
+            winners_text = "\n".join(f"- Turn {t}: {r}" for t, r in group)
+            comparison_prompt = BEST_SCENE_CHUNK_COMPARISON_PROMPT.format(
+                chunk_winners=winners_text
+            )
+            response = await llm.ainvoke(
+                [
+                    SystemMessage(content=BEST_SCENE_SYSTEM_PROMPT),
+                    HumanMessage(content=comparison_prompt),
+                ]
+            )
+            content = (
+                response.content
+                if isinstance(response.content, str)
+                else str(response.content)
+            )
+            return self._parse_scanner_response(content)
+
+        while len(winners) > 1:
+            groups = [
+                winners[i : i + SCANNER_COMPARISON_FAN_IN]
+                for i in range(0, len(winners), SCANNER_COMPARISON_FAN_IN)
+            ]
+            if len(groups) == 1:
+                return await _compare(groups[0])
+            winners = await self._gather_bounded(
+                [_compare(g) for g in groups], semaphore
+            )
+        return winners[0]
+
     async def scan_best_scene(self, log_entries: list[str]) -> tuple[int, str]:
         """Scan the session log and identify the most visually dramatic scene.
 
         Uses the configured scanner LLM to analyze the full ground_truth_log.
         If the log fits within the scanner's token limit, processes in a
         single pass. Otherwise, chunks the log with overlapping windows,
-        finds the best scene in each chunk, and runs a final comparison.
+        finds the best scene in each chunk concurrently (bounded by
+        ``scanner_concurrency``, reusing cached winners for unchanged chunks),
+        and tree-reduces the chunk winners with comparison calls.
 
         Args:
             log_entries: Complete ground_truth_log for the session.
@@ -680,7 +1116,9 @@ class ImageGenerator:
         # Estimate tokens on the formatted text (with [Turn N] prefixes and
         # double-newline separators) to accurately reflect what the LLM sees.
         formatted_full = self._format_log_for_scanner(log_entries)
-        estimated_tokens = self._estimate_tokens(formatted_full)
+        estimated_tokens = self._estimate_tokens(
+            formatted_full, config.scanner_provider, config.scanner_model
+        )
 
         try:
             if estimated_tokens <= config.scanner_token_limit:
@@ -695,61 +1133,18 @@ class ImageGenerator:
                 turn_number, rationale = self._parse_scanner_response(content)
                 chunked = False
             else:
-                # Multi-chunk with final comparison
+                # Multi-chunk map (concurrent scans) + reduce (comparisons)
                 chunks = self._chunk_log_entries(
-                    log_entries, config.scanner_token_limit
+                    log_entries,
+                    config.scanner_token_limit,
+                    config.scanner_provider,
+                    config.scanner_model,
+                )
+                semaphore = asyncio.Semaphore(config.scanner_concurrency)
+                chunk_winners = await self._scan_chunks(llm, config, chunks, semaphore)
+                turn_number, rationale = await self._compare_winners(
+                    llm, chunk_winners, semaphore
                 )
-                chunk_winners: list[tuple[int, str]] = []
-
-                for i, (chunk_offset, chunk) in enumerate(chunks):
-                    formatted = self._format_log_for_scanner(
-                        chunk, start_index=chunk_offset
-                    )
-                    response = await llm.ainvoke(
-                        [
-                            SystemMessage(content=BEST_SCENE_SYSTEM_PROMPT),
-                            HumanMessage(content=formatted),
-                        ]
-                    )
-                    content = (
-                        response.content
-                        if isinstance(response.content, str)
-                        else str(response.content)
-                    )
-                    winner_turn, winner_rationale = self._parse_scanner_response(
-                        content
-                    )
-                    chunk_winners.append((winner_turn, winner_rationale))
-                    logger.debug(
-                        "Scanner chunk %d/%d winner: Turn %d - %s",
-                        i + 1,
-                        len(chunks),
-                        winner_turn,
-                        winner_rationale[:100],
-                    )
-
-                if len(chunk_winners) == 1:
-                    turn_number, rationale = chunk_winners[0]
-                else:
-                    # Final comparison round across chunk winners
-                    winners_text = "\n".join(
-                        f"- Turn {t}: {r}" for t, r in chunk_winners
-                    )
-                    comparison_prompt = BEST_SCENE_CHUNK_COMPARISON_PROMPT.format(
-                        chunk_winners=winners_text
-                    )
-                    response = await llm.ainvoke(
-                        [
-                            SystemMessage(content=BEST_SCENE_SYSTEM_PROMPT),
-                            HumanMessage(content=comparison_prompt),
-                        ]
-                    )
-                    content = (
-                        response.content
-                        if isinstance(response.content, str)
-                        else str(response.content)
-                    )
-                    turn_number, rationale = self._parse_scanner_response(content)
                 chunked = True
 
         except ImageGenerationError:
@@ -776,3 +1171,110 @@ class ImageGenerator:
         )
 
         return (turn_number, rationale)
+
+    async def scan_candidates(
+        self, log_entries: list[str], candidates: list[int]
+    ) -> tuple[int, str]:
+        """Pick the most visually dramatic scene among highlight candidates.
+
+        Only short excerpts around each candidate are sent to the scanner
+        LLM, so the cost does not grow with the length of the session.
+
+        Args:
+            log_entries: Complete ground_truth_log for the session.
+            candidates: Log indexes to choose from, best first
+                (see HighlightReel.candidates()).
+
+        Returns:
+            Tuple of (turn_number, rationale) identifying the best scene.
+            A reply outside the excerpts falls back to the top candidate.
+
+        Raises:
+            ImageGenerationError: If there are no valid candidates or the
+                scanner fails.
+        """
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        from agents import get_llm
+
+        candidates = [c for c in candidates if 0 <= c < len(log_entries)]
+        if not candidates:
+            raise ImageGenerationError("No highlight candidates to scan")
+        if len(candidates) == 1:
+            return (candidates[0], "Only highlight candidate")
+
+        excerpts: list[str] = []
+        shown: set[int] = set()
+        for turn in sorted(candidates):
+            start = max(0, turn - CANDIDATE_CONTEXT_ENTRIES)
+            end = min(len(log_entries), turn + CANDIDATE_CONTEXT_ENTRIES + 1)
+            excerpts.append(
+                self._format_log_for_scanner(log_entries[start:end], start_index=start)
+            )
+            shown.update(range(start, end))
+
+        config = self._get_image_config()
+        llm = get_llm(
+            config.scanner_provider,
+            config.scanner_model,
+            timeout=SCANNER_LLM_TIMEOUT,
+        )
+        try:
+            response = await llm.ainvoke(
+                [
+                    SystemMessage(content=BEST_SCENE_SYSTEM_PROMPT),
+                    HumanMessage(
+                        content=BEST_SCENE_CANDIDATES_PROMPT.format(
+                            excerpts="\n\n---\n\n".join(excerpts)
+                        )
+                    ),
+                ]
+            )
+            content = _extract_response_text(response)
+            turn_number, rationale = self._parse_scanner_response(content)
+        except ImageGenerationError:
+            raise
+        except Exception as e:
+            logger.error("Scanner LLM failed: %s", e)
+            raise ImageGenerationError(f"Scanner LLM failed: {e}") from e
+
+        if turn_number not in shown:
+            logger.warning(
+                "Scanner returned turn %d outside the candidate excerpts, "
+                "using top candidate %d",
+                turn_number,
+                candidates[0],
+            )
+            turn_number = candidates[0]
+
+        logger.info(
+            "Scanner picked best scene from %d candidates: Turn %d - %s",
+            len(candidates),
+            turn_number,
+            rationale[:150],
+        )
+        return (turn_number, rationale)
+
+
+_shared_generator: ImageGenerator | None = None
+
+
+def get_image_generator() -> ImageGenerator:
+    """Get the process-wide ImageGenerator, created on first use.
+
+    Sharing one instance keeps a single genai client (recreated only when
+    the API key changes) for every image job.
+
+    Returns:
+        The shared ImageGenerator.
+    """
+    global _shared_generator
+    if _shared_generator is None:
+        _shared_generator = ImageGenerator()
+    return _shared_generator
+
+
+def reset_image_generator() -> None:
+    """Drop the shared ImageGenerator so the next use creates one (for tests)."""
+    global _shared_generator
+    _shared_generator = None
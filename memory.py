@@ -42,7 +42,7 @@ This architecture means callbacks "just work" when:
 import json
 import logging
 import re
-from typing import TypedDict
+from typing import Any, TypedDict
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
@@ -56,17 +56,22 @@ from agents import (
     format_character_facts,
     get_llm,
 )
-from config import get_config
+from cancellation import invoke_cancellable
+from config import get_config, get_config_store
+from episodic_memory import episode_entities, recall_text, scene_query
+from metrics import COMPRESSION_SECONDS
 from models import (
     CallbackEntry,
     CallbackLog,
     CharacterFacts,
     GameState,
+    MemoryEpisode,
     NarrativeElement,
     NarrativeElementStore,
     create_callback_entry,
     create_narrative_element,
 )
+from token_counter import count_tokens
 
 
 class ExtractionResult(TypedDict):
@@ -99,6 +104,9 @@ __all__ = [
 # Default number of entries to retain after compression
 RETAIN_AFTER_COMPRESSION = 3
 
+# Name the shared public-event summary is generated for
+SHARED_SUMMARY_AGENT = "the party"
+
 # Module-level cache for Summarizer instance to avoid re-creating LLM clients
 # NOTE: This cache is not thread-safe. Streamlit runs single-threaded by design,
 # so this is acceptable for MVP. If async/multi-threaded compression is needed,
@@ -132,6 +140,15 @@ Use bullet points for lists of items or status effects.
 Keep the summary under 500 words.
 Focus on what would be important for the character to remember."""
 
+# Instructions appended to the Janitor prompt for batched summarization
+BATCH_SUMMARY_PROMPT = """## BATCHED REQUESTS:
+You will receive several numbered sections, each holding the events to
+summarize for one recipient. Summarize every section independently, following
+the rules above, as that recipient would remember it.
+
+Return ONLY a JSON object mapping each section number to its summary:
+{"1": "summary of section 1", "2": "summary of section 2"}"""
+
 
 class Summarizer:
     """Summarizer class for generating memory compression summaries.
@@ -224,79 +241,212 @@ class Summarizer:
         try:
             # Invoke LLM synchronously (blocking per architecture)
             llm = self._get_llm()
-            response = llm.invoke(messages)
-
-            # Extract content from response - handle str, list[str], and
-            # list[dict] formats (Gemini returns [{'type':'text','text':'...'}])
-            content = response.content
-            if isinstance(content, str):
-                return content
-            if hasattr(content, "__iter__"):
-                text_parts: list[str] = []
-                for part in content:
-                    if isinstance(part, str):
-                        text_parts.append(part)
-                    elif isinstance(part, dict) and "text" in part:
-                        text_parts.append(part["text"])
-                return "".join(text_parts)
-            # Fallback for unexpected types
-            return str(content) if content else ""
+            response = invoke_cancellable(llm, messages)
+            return _response_text(response.content)
 
         except Exception as e:
             # Categorize and log error, return empty string for graceful degradation
-            error_type = categorize_error(e)
-            llm_error = LLMError(
-                provider=self.provider,
-                agent=f"summarizer-{agent_name}",
-                error_type=error_type,
-                original_error=e,
-            )
-            logger.error(
-                "Summarization failed",
-                extra={
-                    "provider": llm_error.provider,
-                    "agent": llm_error.agent,
-                    "error_type": llm_error.error_type,
-                    "original_error": str(e),
-                },
-            )
+            self._log_failure(agent_name, e)
             return ""
 
+    def generate_summaries(self, requests: list[tuple[str, list[str]]]) -> list[str]:
+        """Generate summaries for several agents in as few LLM calls as possible.
+
+        Requests are packed into batches of at most MAX_BUFFER_CHARS of
+        entry text. Each batch is sent as one request with a numbered
+        section per agent, and the LLM answers with a JSON object holding
+        one summary per section. A request too large to share a batch, or
+        left alone in one, goes through generate_summary(). Sections the
+        response is missing (or the whole batch, if it cannot be parsed)
+        fall back to one generate_summary() call each. If the batched call
+        itself fails, its requests are left empty rather than retried
+        against the same failing provider.
+
+        Args:
+            requests: (agent_name, buffer_entries) pairs to summarize.
+
+        Returns:
+            Summaries in the order of requests, empty string where a
+            request had no entries or summarization failed.
+        """
+        summaries = [""] * len(requests)
+        for batch in self._split_batches(requests):
+            if len(batch) == 1:
+                summaries[batch[0]] = self.generate_summary(*requests[batch[0]])
+                continue
+            batched = self._generate_batch([requests[i] for i in batch])
+            if batched is None:
+                continue
+            for i, summary in zip(batch, batched, strict=True):
+                summaries[i] = summary or self.generate_summary(*requests[i])
+        return summaries
+
+    def _split_batches(self, requests: list[tuple[str, list[str]]]) -> list[list[int]]:
+        """Group request indices into batches that fit MAX_BUFFER_CHARS.
+
+        Args:
+            requests: (agent_name, buffer_entries) pairs to summarize.
+
+        Returns:
+            Batches of indices into requests, in order. Requests with no
+            entries are left out.
+        """
+        batches: list[list[int]] = []
+        batch_chars = 0
+        for i, (_, entries) in enumerate(requests):
+            if not entries:
+                continue
+            chars = len("\n".join(entries))
+            if not batches or batch_chars + chars > self.MAX_BUFFER_CHARS:
+                batches.append([])
+                batch_chars = 0
+            batches[-1].append(i)
+            batch_chars += chars
+        return batches
+
+    def _generate_batch(
+        self, requests: list[tuple[str, list[str]]]
+    ) -> list[str] | None:
+        """Summarize several requests in one LLM call.
+
+        Args:
+            requests: (agent_name, buffer_entries) pairs, small enough
+                together to fit MAX_BUFFER_CHARS.
+
+        Returns:
+            Summaries in the order of requests, empty string for any
+            section the response did not provide, or None if the call
+            failed.
+        """
+        names = ", ".join(name for name, _ in requests)
+        sections = "\n\n".join(
+            f"## Section {i}: events for {name}\n" + "\n".join(entries)
+            for i, (name, entries) in enumerate(requests, start=1)
+        )
+        messages: list[BaseMessage] = [
+            SystemMessage(content=f"{JANITOR_SYSTEM_PROMPT}\n\n{BATCH_SUMMARY_PROMPT}"),
+            HumanMessage(content=f"Please summarize each section:\n\n{sections}"),
+        ]
+
+        try:
+            llm = self._get_llm()
+            response = invoke_cancellable(llm, messages)
+            text = _response_text(response.content)
+        except Exception as e:
+            self._log_failure(names, e)
+            return None
+
+        summaries = _parse_batch_response(text, len(requests))
+        if not all(summaries):
+            logger.warning(
+                "Batched summarization incomplete, summarizing %d of %d sections "
+                "individually",
+                summaries.count(""),
+                len(requests),
+            )
+        return summaries
+
+    def _log_failure(self, agent_name: str, error: Exception) -> None:
+        """Log a failed summarization call.
 
-def estimate_tokens(text: str) -> int:
-    """Estimate token count using word-based heuristic.
+        Args:
+            agent_name: Agent (or comma-separated agents) being summarized.
+            error: The exception raised by the LLM call.
+        """
+        error_type = categorize_error(error)
+        llm_error = LLMError(
+            provider=self.provider,
+            agent=f"summarizer-{agent_name}",
+            error_type=error_type,
+            original_error=error,
+        )
+        logger.error(
+            "Summarization failed",
+            extra={
+                "provider": llm_error.provider,
+                "agent": llm_error.agent,
+                "error_type": llm_error.error_type,
+                "original_error": str(error),
+            },
+        )
 
-    Uses a simple approximation: ~1.3 tokens per word for English text.
-    This is faster than calling a tokenizer and accurate enough for
-    buffer management decisions.
 
-    NOTE: This heuristic is calibrated for English/Latin-script text where
-    words are space-delimited. For CJK (Chinese, Japanese, Korean) or other
-    non-space-delimited languages, this will significantly underestimate.
-    Consider using a proper tokenizer (like tiktoken) for multilingual support.
+def _response_text(content: Any) -> str:
+    """Extract text from an LLM response's content.
+
+    Handles str, list[str], and list[dict] formats (Gemini returns
+    [{'type':'text','text':'...'}]).
 
     Args:
-        text: Text to estimate tokens for.
+        content: The response's content attribute.
 
     Returns:
-        Estimated token count. Returns character-based estimate for
-        non-space-delimited text (detected by low word count).
+        The response text.
     """
-    if not text:
-        return 0
-    # Split on whitespace, count words
-    word_count = len(text.split())
+    if isinstance(content, str):
+        return content
+    if hasattr(content, "__iter__"):
+        text_parts: list[str] = []
+        for part in content:
+            if isinstance(part, str):
+                text_parts.append(part)
+            elif isinstance(part, dict) and "text" in part:
+                text_parts.append(part["text"])
+        return "".join(text_parts)
+    # Fallback for unexpected types
+    return str(content) if content else ""
+
+
+def _parse_batch_response(response_text: str, count: int) -> list[str]:
+    """Parse the JSON object of section summaries from a batched response.
+
+    Args:
+        response_text: Raw text from LLM response.
+        count: Number of sections in the request.
+
+    Returns:
+        Summaries for sections 1..count, empty string for any section that
+        is missing or not a non-empty string. All empty on parse failure.
+    """
+    text = response_text.strip()
+    start_idx = text.find("{")
+    end_idx = text.rfind("}")
+    if start_idx == -1 or end_idx == -1:
+        return [""] * count
+
+    try:
+        data = json.loads(text[start_idx : end_idx + 1])
+    except json.JSONDecodeError:
+        logger.warning("Failed to parse batched summary JSON response")
+        return [""] * count
+
+    if not isinstance(data, dict):
+        return [""] * count
+
+    summaries: list[str] = []
+    for i in range(1, count + 1):
+        summary = data.get(str(i))
+        summaries.append(summary.strip() if isinstance(summary, str) else "")
+    return summaries
+
 
-    # If text has very few words but many characters, it's likely CJK or similar
-    # Use character-based estimate instead (~0.5 tokens per character for CJK)
-    # Threshold: fewer than 2 words and at least 20 chars suggests non-English
-    char_count = len(text)
-    if word_count < 2 and char_count > 20:
-        # Likely non-space-delimited text, use character estimate
-        return int(char_count * 0.5)
+def estimate_tokens(text: str, provider: str = "", model: str = "") -> int:
+    """Estimate token count for an agent's model.
 
-    # Standard English heuristic: ~1.3 tokens per word
-    return int(word_count * 1.3)
+    Delegates to token_counter.count_tokens(), which uses a local
+    tokenizer when one is available for the model family and a calibrated
+    word/character/CJK heuristic otherwise. Counts are memoized, so
+    re-counting unchanged buffer entries is a cache hit.
+
+    Args:
+        text: Text to estimate tokens for.
+        provider: LLM provider of the agent; empty for the default family.
+        model: Model name of the agent.
+
+    Returns:
+        Estimated token count.
+    """
+    return count_tokens(text, provider, model)
 
 
 class MemoryManager:
@@ -313,6 +463,15 @@ class MemoryManager:
 
     Attributes:
         _state: Reference to the current GameState.
+        _shared_summaries: Public-event summaries by (turn_start, turn_end)
+            window, so agents compressed together summarize it once.
+        _first_turn: Where agents' first episodes start, found on first
+            use (see _first_buffered_turn()).
+        _private_notes: Batched summaries of each agent's private entries,
+            with the entries they cover, awaiting compress_buffer().
+        _compressed_summaries: Batched re-compressions of long-term
+            summaries, with the summary they replace, awaiting
+            compress_long_term_summary().
     """
 
     def __init__(self, state: GameState) -> None:
@@ -322,6 +481,10 @@ class MemoryManager:
             state: Current game state containing agent_memories.
         """
         self._state = state
+        self._shared_summaries: dict[tuple[int, int], str] = {}
+        self._first_turn: int | None = None
+        self._private_notes: dict[str, tuple[list[str], str]] = {}
+        self._compressed_summaries: dict[str, tuple[str, str]] = {}
 
     def get_context(self, agent_name: str) -> str:
         """Get prompt-ready context string for an agent.
@@ -358,11 +521,12 @@ class MemoryManager:
         """
         context_parts: list[str] = []
 
-        # Add DM's own long-term summary if available
+        # Add DM's long-term summary and relevant episodes if available
         dm_memory = self._state["agent_memories"].get("dm")
         if dm_memory:
-            if dm_memory.long_term_summary:
-                context_parts.append(f"## Story So Far\n{dm_memory.long_term_summary}")
+            story = recall_text(dm_memory, self._scene_query())
+            if story:
+                context_parts.append(f"## Story So Far\n{story}")
             # Add recent events from DM's short-term buffer
             if dm_memory.short_term_buffer:
                 recent_events = "\n".join(
@@ -423,11 +587,10 @@ class MemoryManager:
                     f"## Character Identity\n{format_character_facts(pc_memory.character_facts)}"
                 )
 
-            # Add long-term summary if available
-            if pc_memory.long_term_summary:
-                context_parts.append(
-                    f"## What You Remember\n{pc_memory.long_term_summary}"
-                )
+            # Add long-term summary and relevant episodes if available
+            remembered = recall_text(pc_memory, self._scene_query())
+            if remembered:
+                context_parts.append(f"## What You Remember\n{remembered}")
 
             # Add recent events from short-term buffer
             if pc_memory.short_term_buffer:
@@ -438,6 +601,43 @@ class MemoryManager:
 
         return "\n\n".join(context_parts)
 
+    def _scene_query(self) -> str:
+        """Episode recall query for the current scene."""
+        return scene_query(self._state.get("ground_truth_log", []))
+
+    def _agent_model(self, agent_name: str) -> tuple[str, str]:
+        """Get the (provider, model) an agent runs on, for token counting.
+
+        Args:
+            agent_name: "dm" or a character name.
+
+        Returns:
+            The agent's provider and model, or ("", "") if unknown.
+        """
+        if agent_name == "dm":
+            config = self._state.get("dm_config")
+        else:
+            config = self._state.get("characters", {}).get(agent_name)
+        if config is None:
+            return "", ""
+        return config.provider, config.model
+
+    def _count_entries(self, agent_name: str, entries: list[str]) -> int:
+        """Count tokens of buffer entries one entry at a time.
+
+        Entries persist across turns, so counting them individually lets
+        the memo cache answer for everything but the newest entries.
+
+        Args:
+            agent_name: Agent whose model the count is for.
+            entries: Buffer entries.
+
+        Returns:
+            Summed token count.
+        """
+        provider, model = self._agent_model(agent_name)
+        return sum(estimate_tokens(entry, provider, model) for entry in entries)
+
     def get_buffer_token_count(self, agent_name: str) -> int:
         """Get estimated token count of an agent's short_term_buffer.
 
@@ -450,8 +650,7 @@ class MemoryManager:
         memory = self._state["agent_memories"].get(agent_name)
         if not memory or not memory.short_term_buffer:
             return 0
-        buffer_text = "\n".join(memory.short_term_buffer)
-        return estimate_tokens(buffer_text)
+        return self._count_entries(agent_name, memory.short_term_buffer)
 
     def is_near_limit(self, agent_name: str, threshold: float = 0.8) -> bool:
         """Check if agent's buffer is approaching token limit.
@@ -502,7 +701,7 @@ class MemoryManager:
         Story 5.5: Memory Compression System (FR16, AC #5).
 
         Includes:
-        - long_term_summary tokens
+        - long_term_summary and recalled episode tokens
         - short_term_buffer tokens (all entries)
         - character_facts tokens (if present)
 
@@ -518,19 +717,21 @@ class MemoryManager:
 
         total = 0
 
-        # Long-term summary
-        if memory.long_term_summary:
-            total += estimate_tokens(memory.long_term_summary)
+        provider, model = self._agent_model(agent_name)
+
+        # Long-term summary and the episodes recalled for this scene
+        remembered = recall_text(memory, self._scene_query())
+        if remembered:
+            total += estimate_tokens(remembered, provider, model)
 
         # Short-term buffer
         if memory.short_term_buffer:
-            buffer_text = "\n".join(memory.short_term_buffer)
-            total += estimate_tokens(buffer_text)
+            total += self._count_entries(agent_name, memory.short_term_buffer)
 
         # Character facts (Story 5.4)
         if memory.character_facts:
             facts_text = format_character_facts(memory.character_facts)
-            total += estimate_tokens(facts_text)
+            total += estimate_tokens(facts_text, provider, model)
 
         return total
 
@@ -574,21 +775,20 @@ class MemoryManager:
         if not memory or not memory.long_term_summary:
             return ""
 
-        # Get summarizer configuration from config (cached for efficiency)
-        config = get_config()
-        cache_key = (config.agents.summarizer.provider, config.agents.summarizer.model)
-        if cache_key not in _summarizer_cache:
-            _summarizer_cache[cache_key] = Summarizer(
-                provider=config.agents.summarizer.provider,
-                model=config.agents.summarizer.model,
-            )
-        summarizer = _summarizer_cache[cache_key]
-
-        # Use Summarizer to compress the summary itself
-        compressed = summarizer.generate_summary(
-            agent_name,
-            [memory.long_term_summary],
-        )
+        prepared = self._compressed_summaries.pop(agent_name, None)
+        if prepared is not None and prepared[0] == memory.long_term_summary:
+            compressed = prepared[1]
+        else:
+            # Use Summarizer to compress the summary itself
+            with COMPRESSION_SECONDS.time(
+                session=self._state.get("session_id", ""),
+                agent=agent_name,
+                stage="summary",
+            ):
+                compressed = _get_summarizer().generate_summary(
+                    agent_name,
+                    [memory.long_term_summary],
+                )
 
         if compressed:
             memory.long_term_summary = compressed
@@ -601,6 +801,35 @@ class MemoryManager:
 
         return compressed
 
+    def prepare_summary_compression(self, agent_names: list[str]) -> None:
+        """Re-compress several agents' long-term summaries in one batch.
+
+        The results are held until compress_long_term_summary() is called
+        for each agent, which uses them instead of its own LLM call as long
+        as the summary has not changed in between.
+
+        Args:
+            agent_names: Agents whose summaries are about to be compressed.
+        """
+        requests: list[tuple[str, list[str]]] = []
+        for agent_name in agent_names:
+            memory = self._state["agent_memories"].get(agent_name)
+            if memory and memory.long_term_summary:
+                requests.append((agent_name, [memory.long_term_summary]))
+
+        # A single request gains nothing from batching
+        if len(requests) < 2:
+            return
+
+        with COMPRESSION_SECONDS.time(
+            session=self._state.get("session_id", ""), agent="batch", stage="summary"
+        ):
+            summaries = _get_summarizer().generate_summaries(requests)
+        for (agent_name, (summary,)), compressed in zip(
+            requests, summaries, strict=True
+        ):
+            self._compressed_summaries[agent_name] = (summary, compressed)
+
     def get_cross_session_summary(self, agent_name: str) -> str:
         """Get an agent's cross-session summary (alias for long_term_summary).
 
@@ -710,11 +939,20 @@ class MemoryManager:
     def compress_buffer(
         self, agent_name: str, retain_count: int = RETAIN_AFTER_COMPRESSION
     ) -> str:
-        """Compress buffer entries into long_term_summary.
+        """Compress buffer entries into a new memory episode.
 
         Gets buffer entries for the agent, generates a summary using the
-        Summarizer, updates the agent's long_term_summary field, and
-        clears compressed entries while retaining the most recent ones.
+        Summarizer, appends it to the agent's episodes (with the turn range
+        it covers and the characters and narrative elements it mentions),
+        and clears compressed entries while retaining the most recent ones.
+        Episodes are recalled by relevance when context is built, so the
+        prompt does not grow with the length of the campaign.
+
+        Buffer entries that are also in the public ground_truth_log are
+        covered by a shared summary of the episode's log window, generated
+        once per window for every agent this manager compresses. Only the
+        agent's private entries get a summary of their own, appended to the
+        shared one as the agent's perspective.
 
         WARNING: This modifies the state in-place. For LangGraph nodes,
         use the immutable version that returns an updated state copy.
@@ -731,33 +969,34 @@ class MemoryManager:
         if not memory:
             return ""
 
-        buffer = memory.short_term_buffer
-        if not buffer:
-            return ""
-
-        # Skip if not enough entries to compress
-        if len(buffer) <= retain_count:
-            return ""
-
-        # Get entries to compress (all but the most recent)
-        entries_to_compress = buffer[:-retain_count]
-        entries_to_keep = buffer[-retain_count:]
-
-        if not entries_to_compress:
+        split = _split_buffer(memory.short_term_buffer, retain_count)
+        if split is None:
             return ""
+        entries_to_compress, entries_to_keep = split
 
-        # Get summarizer configuration from config (cached for efficiency)
-        config = get_config()
-        cache_key = (config.agents.summarizer.provider, config.agents.summarizer.model)
-        if cache_key not in _summarizer_cache:
-            _summarizer_cache[cache_key] = Summarizer(
-                provider=config.agents.summarizer.provider,
-                model=config.agents.summarizer.model,
-            )
-        summarizer = _summarizer_cache[cache_key]
-
-        # Generate summary
-        summary = summarizer.generate_summary(agent_name, entries_to_compress)
+        turn_start, turn_end = self._episode_window(
+            memory.episodes, len(entries_to_keep)
+        )
+        public_log = self._state.get("ground_truth_log", [])[turn_start - 1 : turn_end]
+        shared = self._shared_summary(turn_start, turn_end, public_log)
+        if shared:
+            private = _private_entries(entries_to_compress, public_log)
+        else:
+            private = entries_to_compress
+
+        # Generate summary of what only this agent saw
+        note = ""
+        prepared = self._private_notes.pop(agent_name, None)
+        if prepared is not None and prepared[0] == private:
+            note = prepared[1]
+        elif private:
+            with COMPRESSION_SECONDS.time(
+                session=self._state.get("session_id", ""),
+                agent=agent_name,
+                stage="buffer",
+            ):
+                note = _get_summarizer().generate_summary(agent_name, private)
+        summary = "\n\n".join(part for part in (shared, note) if part)
 
         if not summary:
             # Summarization failed — apply emergency fallback compression.
@@ -774,31 +1013,244 @@ class MemoryManager:
             memory.short_term_buffer.extend(entries_to_keep)
             return ""
 
-        # Merge with existing summary
-        new_summary = _merge_summaries(memory.long_term_summary, summary)
-
-        # Update memory state in-place (for non-LangGraph contexts)
-        memory.long_term_summary = new_summary
+        # Update memory state in-place (for non-LangGraph contexts).
+        # Assign a new list so state copies sharing the old one are unchanged.
+        memory.episodes = [
+            *memory.episodes,
+            self._new_episode(turn_start, turn_end, summary),
+        ]
         memory.short_term_buffer.clear()
         memory.short_term_buffer.extend(entries_to_keep)
 
         return summary
 
+    def prepare_buffer_compression(
+        self, agent_names: list[str], retain_count: int = RETAIN_AFTER_COMPRESSION
+    ) -> None:
+        """Summarize several agents' buffers in one batch ahead of compression.
+
+        Makes a single batched Summarizer call covering the shared summary
+        of each public-event window and each agent's private entries. The
+        results are held until compress_buffer() is called for each agent,
+        which uses them instead of its own LLM calls as long as the buffer
+        has not changed in between.
+
+        Args:
+            agent_names: Agents whose buffers are about to be compressed.
+            retain_count: Number of recent entries compress_buffer() will
+                keep in each buffer.
+        """
+        ground_truth_log = self._state.get("ground_truth_log", [])
+        requests: list[tuple[str, list[str]]] = []
+        # What each request summarizes: a shared window or an agent's notes
+        targets: list[tuple[int, int] | str] = []
+        for agent_name in agent_names:
+            memory = self._state["agent_memories"].get(agent_name)
+            if memory is None:
+                continue
+            split = _split_buffer(memory.short_term_buffer, retain_count)
+            if split is None:
+                continue
+            entries_to_compress, entries_to_keep = split
+
+            window = self._episode_window(memory.episodes, len(entries_to_keep))
+            public_log = ground_truth_log[window[0] - 1 : window[1]]
+            if public_log:
+                if window not in self._shared_summaries and window not in targets:
+                    requests.append((SHARED_SUMMARY_AGENT, public_log))
+                    targets.append(window)
+                private = _private_entries(entries_to_compress, public_log)
+            else:
+                private = entries_to_compress
+            if private:
+                requests.append((agent_name, private))
+                targets.append(agent_name)
+
+        # A single request gains nothing from batching
+        if len(requests) < 2:
+            return
+
+        with COMPRESSION_SECONDS.time(
+            session=self._state.get("session_id", ""), agent="batch", stage="buffer"
+        ):
+            summaries = _get_summarizer().generate_summaries(requests)
+        for target, (_, entries), summary in zip(
+            targets, requests, summaries, strict=True
+        ):
+            if isinstance(target, str):
+                self._private_notes[target] = (entries, summary)
+            else:
+                self._shared_summaries[target] = summary
+
+    def _episode_window(
+        self, episodes: list[MemoryEpisode], retained: int
+    ) -> tuple[int, int]:
+        """Get the ground_truth_log turns a new episode covers.
+
+        Args:
+            episodes: The agent's existing episodes.
+            retained: Buffer entries kept back from compression.
+
+        Returns:
+            (turn_start, turn_end), 1-based and inclusive: from after the
+            previous episode (or, for an agent's first episode in the
+            session, from the oldest buffered turn) to before the retained
+            entries.
+        """
+        log_length = len(self._state.get("ground_truth_log", []))
+        if episodes and episodes[-1].turn_end > 0:
+            turn_start = episodes[-1].turn_end + 1
+        else:
+            turn_start = self._first_buffered_turn()
+        turn_end = max(turn_start, log_length - retained)
+        return turn_start, turn_end
+
+    def _first_buffered_turn(self) -> int:
+        """Get the turn of the oldest entry still in any agent's buffer.
+
+        A session saved before episodes existed has a long log but only
+        recent turns in its buffers, so first episodes start here rather
+        than at turn 1. Found once per manager, so agents compressed
+        together share the window.
+
+        Returns:
+            1-based turn number (the start of the scanned tail of the log
+            if no buffered entry appears in it).
+        """
+        if self._first_turn is not None:
+            return self._first_turn
+        log = self._state.get("ground_truth_log", [])
+        remaining = {
+            _entry_body(entry)
+            for memory in self._state["agent_memories"].values()
+            for entry in memory.short_term_buffer
+        }
+        # Each agent buffers only its own turns, so together the buffers
+        # span about as many log entries as they hold. Twice that leaves
+        # room for entries that are never buffered ([SHEET] notes) without
+        # paging in the whole log for an entry that is not in it.
+        start = max(0, len(log) - 2 * len(remaining))
+        tail = log[start:]
+        turn = start + 1
+        for index in range(len(tail) - 1, -1, -1):
+            body = _entry_body(tail[index])
+            if body in remaining:
+                remaining.discard(body)
+                turn = start + index + 1
+                if not remaining:
+                    break
+        self._first_turn = turn
+        return turn
+
+    def _shared_summary(
+        self, turn_start: int, turn_end: int, public_log: list[str]
+    ) -> str:
+        """Summarize a window of public events, once per window.
+
+        Args:
+            turn_start: First turn of the window.
+            turn_end: Last turn of the window.
+            public_log: The ground_truth_log entries of the window.
+
+        Returns:
+            Summary of the window, or empty string if it is empty or
+            summarization failed.
+        """
+        window = (turn_start, turn_end)
+        if window not in self._shared_summaries:
+            summary = ""
+            if public_log:
+                with COMPRESSION_SECONDS.time(
+                    session=self._state.get("session_id", ""),
+                    agent=SHARED_SUMMARY_AGENT,
+                    stage="shared",
+                ):
+                    summary = _get_summarizer().generate_summary(
+                        SHARED_SUMMARY_AGENT, public_log
+                    )
+            self._shared_summaries[window] = summary
+        return self._shared_summaries[window]
+
+    def _new_episode(
+        self, turn_start: int, turn_end: int, summary: str
+    ) -> MemoryEpisode:
+        """Build the episode for a freshly compressed stretch of the buffer.
+
+        Args:
+            turn_start: First ground_truth_log turn the episode covers.
+            turn_end: Last ground_truth_log turn the episode covers.
+            summary: Summary of the compressed entries.
+
+        Returns:
+            Episode tagged with the names its summary mentions.
+        """
+        names = [c.name for c in self._state.get("characters", {}).values()]
+        store = self._state.get("callback_database", NarrativeElementStore())
+        names.extend(e.name for e in store.elements)
+        return MemoryEpisode(
+            turn_start=turn_start,
+            turn_end=turn_end,
+            summary=summary,
+            entities=episode_entities(summary, names),
+        )
+
+
+def _get_summarizer() -> "Summarizer":
+    """Get the configured Summarizer (cached for efficiency)."""
+    config = get_config()
+    cache_key = (config.agents.summarizer.provider, config.agents.summarizer.model)
+    if cache_key not in _summarizer_cache:
+        _summarizer_cache[cache_key] = Summarizer(
+            provider=config.agents.summarizer.provider,
+            model=config.agents.summarizer.model,
+        )
+    return _summarizer_cache[cache_key]
+
 
-def _merge_summaries(existing: str, new_summary: str) -> str:
-    """Merge new summary with existing long-term summary.
+def _split_buffer(
+    buffer: list[str], retain_count: int
+) -> tuple[list[str], list[str]] | None:
+    """Split a buffer into the entries to compress and the entries to keep.
 
     Args:
-        existing: The existing long_term_summary content.
-        new_summary: The newly generated summary to append.
+        buffer: The agent's short_term_buffer.
+        retain_count: Number of recent entries to keep.
 
     Returns:
-        Merged summary string.
+        (entries_to_compress, entries_to_keep), or None if the buffer does
+        not hold more than retain_count entries.
     """
-    if not existing:
-        return new_summary
-    # Append new summary as continuation with separator
-    return f"{existing}\n\n---\n\n{new_summary}"
+    # Skip if not enough entries to compress
+    if len(buffer) <= retain_count:
+        return None
+    return buffer[:-retain_count], buffer[-retain_count:]
+
+
+def _entry_body(entry: str) -> str:
+    """Strip the "[Name]: " or "Name: " speaker prefix from a log entry."""
+    return entry.split(": ", 1)[-1]
+
+
+def _private_entries(entries: list[str], public_log: list[str]) -> list[str]:
+    """Get the buffer entries that are not part of the public log.
+
+    Entries match on their text with or without the speaker prefix, since
+    some buffer entries name the speaker differently from the log.
+
+    Args:
+        entries: Buffer entries being compressed.
+        public_log: ground_truth_log entries up to the end of the window.
+
+    Returns:
+        Entries missing from the public log, in order.
+    """
+    public = set(public_log)
+    public_bodies = {_entry_body(entry) for entry in public_log}
+    return [
+        entry
+        for entry in entries
+        if entry not in public and _entry_body(entry) not in public_bodies
+    ]
 
 
 # =============================================================================
@@ -1066,6 +1518,20 @@ def detect_callbacks(
 # Keyed by (provider, model) tuple, matching _summarizer_cache pattern.
 _extractor_cache: dict[tuple[str, str], "NarrativeElementExtractor"] = {}
 
+
+def _drop_cached_llm_clients(source: str, version: int) -> None:
+    """Forget cached summarizers/extractors when user settings change.
+
+    Their LLM clients hold the API key and Ollama URL that were current
+    when they were created.
+    """
+    if source == "user_settings":
+        _summarizer_cache.clear()
+        _extractor_cache.clear()
+
+
+get_config_store().subscribe(_drop_cached_llm_clients)
+
 # Type aliases for normalizing LLM-returned element types to valid Literal values.
 # LLMs often return "npc" instead of "character", "place" instead of "location", etc.
 _ELEMENT_TYPE_ALIASES: dict[str, str] = {
@@ -1316,7 +1782,7 @@ class NarrativeElementExtractor:
                     content=f"Extract narrative elements from this turn:\n\n{content}"
                 ),
             ]
-            response = llm.invoke(messages)
+            response = invoke_cancellable(llm, messages)
 
             # Extract text from response - handle str, list[str], and
             # list[dict] formats (Gemini returns [{'type':'text','text':'...'}])
@@ -1417,10 +1883,16 @@ def extract_narrative_elements(
 
     # Also merge into campaign-level callback database (Story 11.2)
     callback_db = state.get("callback_database", NarrativeElementStore())
-    # Create a copy to avoid mutating state
-    callback_db_copy = NarrativeElementStore(
-        elements=[e.model_copy() for e in callback_db.elements]
-    )
+    # Create a copy to avoid mutating state. Only elements this turn can
+    # change (merged by name or going dormant) are copied; the rest are
+    # shared with the previous state.
+    new_names = {e.name.lower() for e in new_elements}
+    touched_ids = {
+        e.id
+        for e in callback_db.elements
+        if e.name.lower() in new_names or callback_db.is_due_dormant(e, turn_number)
+    }
+    callback_db_copy = callback_db.copy_for_update(touched_ids)
     for element in new_elements:
         callback_db_copy.add_element(element.model_copy())
 
@@ -1439,6 +1911,9 @@ def extract_narrative_elements(
         )
 
         # Record references for detected callbacks in callback_database
+        referenced_ids = {cb.element_id for cb in detected_callbacks} - touched_ids
+        if referenced_ids:
+            callback_db_copy = callback_db_copy.copy_for_update(referenced_ids)
         for cb_entry in detected_callbacks:
             callback_db_copy.record_reference(cb_entry.element_id, turn_number)
     except Exception as e:
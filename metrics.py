@@ -0,0 +1,351 @@
+"""In-process metrics with Prometheus text exposition.
+
+Hooks in graph.py, agents.py, memory.py, persistence.py and api/engine.py
+record into the module-level metrics defined at the bottom of this file;
+the API serves them at ``GET /metrics`` in the Prometheus text format
+(version 0.0.4), so any Prometheus-compatible scraper can collect them.
+
+Every game metric carries a ``session`` label. Metric objects are
+thread-safe: the game graph runs in worker threads while the API event
+loop renders the exposition.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+
+__all__ = [
+    "AUTOPILOT_RETRY_WAIT_SECONDS",
+    "AUTOPILOT_STALLS",
+    "CHECKPOINT_SAVE_BYTES",
+    "CHECKPOINT_SAVE_SECONDS",
+    "COMPRESSION_SECONDS",
+    "Counter",
+    "DEFAULT_BUCKETS",
+    "Histogram",
+    "LLM_REQUEST_SECONDS",
+    "LLM_TOKENS",
+    "NODE_SECONDS",
+    "ROUND_SECONDS",
+    "TOOL_CALLS",
+    "WS_BROADCAST_LAG_SECONDS",
+    "render_metrics",
+    "reset_metrics",
+]
+
+# Latency buckets in seconds, from fast file I/O up to slow local models
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+# Size buckets in bytes (1 KiB .. 64 MiB)
+BYTE_BUCKETS: tuple[float, ...] = tuple(float(1024 * 4**i) for i in range(9))
+
+_registry: list[_Metric] = []
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric(ABC):
+    """Base class: a named metric with a fixed set of label names."""
+
+    kind = ""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {sorted(self.labelnames)}, "
+                f"got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def _reset(self) -> None:
+        """Drop all recorded values."""
+
+    @abstractmethod
+    def _render_samples(self) -> list[str]:
+        """Render the sample lines in Prometheus text format."""
+
+    def render(self) -> str:
+        """Render the metric in Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._render_samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Non-negative amount to add.
+            **labels: Value for every label name.
+
+        Raises:
+            ValueError: If amount is negative or labels do not match.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Get the current value for a label set (0 if never incremented)."""
+        key = self._key(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def total(self, **labels: str) -> float:
+        """Sum the counter over every label set matching the given labels.
+
+        Args:
+            **labels: Values for any subset of the label names; omitted
+                labels match anything.
+
+        Raises:
+            ValueError: If a label name is unknown.
+        """
+        unknown = set(labels) - set(self.labelnames)
+        if unknown:
+            raise ValueError(f"Unknown labels for {self.name}: {sorted(unknown)}")
+        wanted = [
+            (i, str(labels[name]))
+            for i, name in enumerate(self.labelnames)
+            if name in labels
+        ]
+        with self._lock:
+            return sum(
+                v
+                for key, v in self._values.items()
+                if all(key[i] == value for i, value in wanted)
+            )
+
+    def _reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}"
+            for key, v in items
+        ]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label key -> (per-bucket counts incl. +Inf, sum)
+        self._series: dict[tuple[str, ...], tuple[list[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value (seconds, bytes, ...).
+            **labels: Value for every label name.
+
+        Raises:
+            ValueError: If labels do not match the metric's label names.
+        """
+        key = self._key(labels)
+        # First bucket whose upper bound is >= value (len(buckets) = +Inf)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[index] += 1
+            self._series[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall-clock duration of a block, even if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Get the number of observations for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+        return sum(series[0]) if series else 0
+
+    def sum(self, **labels: str) -> float:
+        """Get the sum of observations for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+        return series[1] if series else 0.0
+
+    def _reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, (list(c), s)) for k, (c, s) in self._series.items())
+        lines: list[str] = []
+        le_names = (*self.labelnames, "le")
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, n in zip((*self.buckets, float("inf")), counts, strict=True):
+                cumulative += n
+                labels = _format_labels(le_names, (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+def render_metrics() -> str:
+    """Render every registered metric in Prometheus text format.
+
+    Returns:
+        Exposition text, newline-terminated.
+    """
+    return "\n".join(metric.render() for metric in _registry) + "\n"
+
+
+def reset_metrics() -> None:
+    """Clear all recorded samples (metric definitions are kept)."""
+    for metric in _registry:
+        metric._reset()
+
+
+# =============================================================================
+# Game Metrics
+# =============================================================================
+
+ROUND_SECONDS = Histogram(
+    "autodungeon_round_duration_seconds",
+    "Wall time of one game round (DM plus all PCs).",
+    ("session", "outcome"),
+)
+NODE_SECONDS = Histogram(
+    "autodungeon_node_duration_seconds",
+    "Wall time of one game graph node.",
+    ("session", "node"),
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "autodungeon_llm_request_duration_seconds",
+    "Latency of one chat model invocation.",
+    ("session", "provider", "model", "agent"),
+)
+LLM_TOKENS = Counter(
+    "autodungeon_llm_tokens_total",
+    "Tokens reported by chat model responses (direction: input or output).",
+    ("session", "provider", "model", "direction"),
+)
+TOOL_CALLS = Counter(
+    "autodungeon_tool_calls_total",
+    "Tool calls requested by agents.",
+    ("session", "agent", "tool"),
+)
+COMPRESSION_SECONDS = Histogram(
+    "autodungeon_memory_compression_duration_seconds",
+    "Wall time of one summarizer call compressing an agent's memory "
+    "(stage: buffer or summary).",
+    ("session", "agent", "stage"),
+)
+CHECKPOINT_SAVE_SECONDS = Histogram(
+    "autodungeon_checkpoint_save_duration_seconds",
+    "Wall time of one checkpoint save.",
+    ("session",),
+)
+CHECKPOINT_SAVE_BYTES = Histogram(
+    "autodungeon_checkpoint_save_bytes",
+    "Bytes written by one checkpoint save (manifest plus new blobs).",
+    ("session",),
+    buckets=BYTE_BUCKETS,
+)
+WS_BROADCAST_LAG_SECONDS = Histogram(
+    "autodungeon_ws_broadcast_lag_seconds",
+    "Time from an engine event being queued to its broadcast completing.",
+    ("session", "event"),
+)
+AUTOPILOT_STALLS = Counter(
+    "autodungeon_autopilot_stalls_total",
+    "Autopilot turns that failed and forced a retry or stop.",
+    ("session", "error_type"),
+)
+AUTOPILOT_RETRY_WAIT_SECONDS = Counter(
+    "autodungeon_autopilot_retry_wait_seconds_total",
+    "Seconds the autopilot spent backing off after errors (rate limits included).",
+    ("session", "error_type"),
+)
@@ -13,14 +13,18 @@ for validation and serialization benefits.
 """
 
 import re
+import threading
 import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
 from datetime import UTC, datetime
-from typing import Any, ClassVar, Literal, TypedDict
+from typing import Any, ClassVar, Literal, NamedTuple, TypedDict, overload
 
 from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
 
 __all__ = [
     "AgentMemory",
+    "MemoryEpisode",
     "AgentSecrets",
     "ApiKeyFieldState",
     "Armor",
@@ -35,6 +39,9 @@ __all__ = [
     "ERROR_TYPES",
     "GameConfig",
     "GameState",
+    "GroundTruthLog",
+    "LOG_SEGMENT_SIZE",
+    "LogSegment",
     "ModuleDiscoveryResult",
     "ModuleInfo",
     "NarrativeMessage",
@@ -56,6 +63,8 @@ __all__ = [
     "ForkRegistry",
     "NarrativeElement",
     "NarrativeElementStore",
+    "clear_log_segment_cache",
+    "append_to_memory",
     "create_agent_memory",
     "create_callback_entry",
     "create_character_facts_from_config",
@@ -68,6 +77,9 @@ __all__ = [
     "generate_character_sheet_from_config",
     "load_character_sheet_from_library",
     "populate_game_state",
+    "ParsedEntry",
+    "clear_parsed_entry_cache",
+    "parse_entry",
     "parse_log_entry",
     "parse_message_content",
     "SceneImage",
@@ -132,6 +144,30 @@ class CharacterFacts(BaseModel):
         return v
 
 
+class MemoryEpisode(BaseModel):
+    """One compressed stretch of an agent's memory.
+
+    Each buffer compression produces an episode. Agent prompts include
+    only the episodes relevant to the current scene (see episodic_memory.py)
+    instead of the whole history.
+
+    Attributes:
+        turn_start: First ground_truth_log turn the episode covers (0 for
+            episodes carried over from an earlier session).
+        turn_end: Last ground_truth_log turn the episode covers.
+        summary: Summarizer output for the compressed entries.
+        entities: Known characters and narrative elements it mentions.
+    """
+
+    turn_start: int = Field(default=0, ge=0, description="First turn covered")
+    turn_end: int = Field(default=0, ge=0, description="Last turn covered")
+    summary: str = Field(..., min_length=1, description="Summary of the episode")
+    entities: list[str] = Field(
+        default_factory=list,
+        description="Characters and narrative elements mentioned",
+    )
+
+
 class AgentMemory(BaseModel):
     """Per-agent memory for context management.
 
@@ -140,14 +176,17 @@ class AgentMemory(BaseModel):
     - DM agent has read access to ALL agent memories (enables dramatic irony)
 
     Attributes:
-        long_term_summary: Compressed history from the summarizer agent.
-            Contains key events, character facts, and narrative threads.
+        long_term_summary: Standing summary always included in context:
+            history carried over from earlier sessions or saves that
+            predate episodes. New compressions are stored as episodes.
         short_term_buffer: Recent turns, candidates for compression when
             approaching token_limit. Newest entries at the end.
         token_limit: Maximum tokens for this agent's context window.
             Context Manager node checks this before each turn.
         character_facts: Persistent character identity (Story 5.4).
             Carries across sessions and is always included in context.
+        episodes: Compressed history as indexed episodes, oldest first.
+            Only the episodes relevant to the current scene are recalled.
     """
 
     long_term_summary: str = Field(
@@ -167,6 +206,10 @@ class AgentMemory(BaseModel):
         default=None,
         description="Persistent character identity (Story 5.4)",
     )
+    episodes: list[MemoryEpisode] = Field(
+        default_factory=list,
+        description="Compressed history as indexed episodes, oldest first",
+    )
 
 
 class CharacterConfig(BaseModel):
@@ -708,6 +751,21 @@ class NarrativeElementStore(BaseModel):
                 return element
         return None
 
+    def is_due_dormant(self, element: NarrativeElement, current_turn: int) -> bool:
+        """Check whether update_dormancy() would mark an element dormant.
+
+        Args:
+            element: The element to check.
+            current_turn: Current turn number.
+
+        Returns:
+            True if the element is active and unreferenced for
+            DORMANT_THRESHOLD turns or more.
+        """
+        if element.resolved or element.dormant:
+            return False
+        return current_turn - element.last_referenced_turn >= self.DORMANT_THRESHOLD
+
     def update_dormancy(self, current_turn: int) -> int:
         """Mark elements as dormant if unreferenced for DORMANT_THRESHOLD turns.
 
@@ -721,13 +779,32 @@ class NarrativeElementStore(BaseModel):
         """
         newly_dormant = 0
         for element in self.elements:
-            if element.resolved or element.dormant:
-                continue
-            if current_turn - element.last_referenced_turn >= self.DORMANT_THRESHOLD:
+            if self.is_due_dormant(element, current_turn):
                 element.dormant = True
                 newly_dormant += 1
         return newly_dormant
 
+    def copy_for_update(self, element_ids: Collection[str]) -> "NarrativeElementStore":
+        """Return a copy of the store that can be updated for the given elements.
+
+        Elements listed in element_ids are deep-copied so the in-place
+        mutators (add_element, record_reference, update_dormancy) can
+        change them; every other element is shared with this store. A
+        turn that touches a handful of elements copies only those.
+
+        Args:
+            element_ids: IDs of the elements the caller will modify.
+
+        Returns:
+            A new NarrativeElementStore.
+        """
+        return NarrativeElementStore(
+            elements=[
+                e.model_copy(deep=True) if e.id in element_ids else e
+                for e in self.elements
+            ]
+        )
+
     def get_dormant(self) -> list[NarrativeElement]:
         """Return dormant, non-resolved elements.
 
@@ -1257,6 +1334,7 @@ class ModuleDiscoveryResult(BaseModel):
         model: Model name used for discovery (e.g., "gemini-1.5-flash").
         timestamp: ISO timestamp when discovery completed.
         retry_count: Number of retries needed to get valid JSON response.
+        cached: True when served from the module discovery cache.
     """
 
     modules: list[ModuleInfo] = Field(default_factory=list)
@@ -1264,6 +1342,7 @@ class ModuleDiscoveryResult(BaseModel):
     model: str = Field(..., description="Model used for discovery")
     timestamp: str = Field(..., description="ISO timestamp of discovery")
     retry_count: int = Field(default=0, ge=0, description="Number of retries needed")
+    cached: bool = Field(default=False, description="Served from discovery cache")
 
 
 # =============================================================================
@@ -1361,6 +1440,8 @@ class ImageGenerationConfig(BaseModel):
         scanner_provider: LLM provider for scene scanning / prompt building.
         scanner_model: LLM model for scene scanning / prompt building.
         scanner_token_limit: Token limit for the scanner LLM context.
+        scanner_concurrency: Max concurrent scanner LLM calls for chunked scans.
+        provider_concurrency: Max image jobs running at once per image provider.
     """
 
     enabled: bool = Field(
@@ -1386,6 +1467,16 @@ class ImageGenerationConfig(BaseModel):
         ge=1,
         description="Token limit for the scanner LLM context",
     )
+    scanner_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Max concurrent scanner LLM calls when scanning chunks",
+    )
+    provider_concurrency: int = Field(
+        default=2,
+        ge=1,
+        description="Max image generation jobs running at once per image provider",
+    )
 
 
 # =============================================================================
@@ -1964,6 +2055,273 @@ class CharacterSheet(BaseModel):
         return self
 
 
+# =============================================================================
+# Ground Truth Log (segment-backed)
+# =============================================================================
+
+# Entries per sealed log segment. Sealed segments are immutable, shared by
+# every copy of the log, and stored once as checkpoint blobs.
+LOG_SEGMENT_SIZE = 256
+
+# Paged-in segments kept in memory after they were released to disk
+_SEGMENT_CACHE_SIZE = 8
+
+_segment_cache: OrderedDict[str, list[str]] = OrderedDict()
+_segment_cache_lock = threading.Lock()
+
+
+def clear_log_segment_cache() -> None:
+    """Drop all paged-in log segments (e.g. after deleting a session)."""
+    with _segment_cache_lock:
+        _segment_cache.clear()
+
+
+class LogSegment:
+    """A sealed, immutable run of LOG_SEGMENT_SIZE ground truth log entries.
+
+    A segment starts out resident. Once persistence has stored it (see
+    mark_persisted), release() drops the entries from memory; they are
+    paged back in through the loader on demand and kept in a small LRU.
+
+    Attributes:
+        digest: Content hash of the stored segment blob, or None if the
+            segment has not been persisted yet.
+    """
+
+    __slots__ = ("_entries", "_loader", "digest")
+
+    def __init__(
+        self,
+        entries: list[str] | None,
+        digest: str | None = None,
+        loader: Callable[[str], list[str]] | None = None,
+    ) -> None:
+        """Initialize a segment.
+
+        Args:
+            entries: Resident entries, or None for a segment on disk.
+            digest: Blob hash if the segment is already stored.
+            loader: Callable reading a stored segment by digest.
+
+        Raises:
+            ValueError: If neither entries nor a digest with a loader is given.
+        """
+        if entries is None and (digest is None or loader is None):
+            raise ValueError("A non-resident log segment needs a digest and loader")
+        self._entries = entries
+        self.digest = digest
+        self._loader = loader
+
+    @property
+    def loader(self) -> Callable[[str], list[str]] | None:
+        """Callable paging the segment in, set once it is persisted."""
+        return self._loader
+
+    @property
+    def resident(self) -> bool:
+        """Whether the entries are held in memory."""
+        return self._entries is not None
+
+    def entries(self) -> list[str]:
+        """Get the segment's entries, paging them in if released.
+
+        Returns:
+            The entries. Callers must not mutate the returned list.
+
+        Raises:
+            OSError: If a released segment's blob cannot be read.
+        """
+        entries = self._entries
+        if entries is not None:
+            return entries
+        digest, loader = self.digest, self._loader
+        if digest is None or loader is None:  # pragma: no cover - see release()
+            raise RuntimeError("Log segment has no entries and no loader")
+        with _segment_cache_lock:
+            cached = _segment_cache.get(digest)
+            if cached is not None:
+                _segment_cache.move_to_end(digest)
+                return cached
+        loaded = loader(digest)
+        with _segment_cache_lock:
+            _segment_cache[digest] = loaded
+            while len(_segment_cache) > _SEGMENT_CACHE_SIZE:
+                _segment_cache.popitem(last=False)
+        return loaded
+
+    def mark_persisted(self, digest: str, loader: Callable[[str], list[str]]) -> None:
+        """Record that the segment is stored and can be paged back in.
+
+        Args:
+            digest: Blob hash of the stored segment.
+            loader: Callable reading a stored segment by digest.
+        """
+        self._loader = loader
+        self.digest = digest
+
+    def release(self) -> None:
+        """Drop resident entries if the segment is persisted."""
+        if self.digest is not None and self._loader is not None:
+            self._entries = None
+
+
+class GroundTruthLog(Sequence[str]):
+    """Append-only game log backed by sealed segments plus an in-memory tail.
+
+    Behaves like a read-only list of entries (len, indexing, slicing,
+    iteration, equality with lists) and supports append/extend/copy, which
+    is all the graph and agents need. copy() shares the sealed segments, so
+    it costs O(tail) instead of O(history). Slices return plain lists.
+
+    Older history is paged in from checkpoint blobs only when indexed, so
+    a long campaign keeps roughly one segment of entries resident.
+    """
+
+    __slots__ = ("_segments", "_tail")
+
+    def __init__(self, entries: Iterable[str] = ()) -> None:
+        """Initialize the log.
+
+        Args:
+            entries: Initial entries, in order.
+        """
+        self._segments: list[LogSegment] = []
+        self._tail: list[str] = []
+        self.extend(entries)
+
+    @classmethod
+    def from_segments(
+        cls, segments: Iterable[LogSegment], tail: Iterable[str]
+    ) -> "GroundTruthLog":
+        """Build a log from sealed segments and tail entries.
+
+        Args:
+            segments: Full segments of LOG_SEGMENT_SIZE entries, oldest first.
+            tail: Entries after the last sealed segment.
+
+        Returns:
+            A new GroundTruthLog.
+        """
+        log = cls()
+        log._segments = list(segments)
+        log.extend(tail)
+        return log
+
+    @property
+    def segments(self) -> tuple[LogSegment, ...]:
+        """Sealed segments, oldest first."""
+        return tuple(self._segments)
+
+    @property
+    def tail(self) -> list[str]:
+        """Entries after the last sealed segment (a copy)."""
+        return list(self._tail)
+
+    def append(self, entry: str) -> None:
+        """Append an entry, sealing the tail into a segment when full.
+
+        Args:
+            entry: Log entry to append.
+        """
+        self._tail.append(entry)
+        if len(self._tail) >= LOG_SEGMENT_SIZE:
+            self._segments.append(LogSegment(self._tail))
+            self._tail = []
+
+    def extend(self, entries: Iterable[str]) -> None:
+        """Append several entries in order.
+
+        Args:
+            entries: Log entries to append.
+        """
+        for entry in entries:
+            self.append(entry)
+
+    def copy(self) -> "GroundTruthLog":
+        """Copy the log, sharing its sealed segments.
+
+        Returns:
+            A new GroundTruthLog with the same entries.
+        """
+        new = GroundTruthLog()
+        new._segments = list(self._segments)
+        new._tail = list(self._tail)
+        return new
+
+    def release_persisted(self) -> None:
+        """Drop resident entries of every segment that has been persisted."""
+        for segment in self._segments:
+            segment.release()
+
+    def __len__(self) -> int:
+        return len(self._segments) * LOG_SEGMENT_SIZE + len(self._tail)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        length = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(length)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self._range(start, stop)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("GroundTruthLog index out of range")
+        segment_index, offset = divmod(index, LOG_SEGMENT_SIZE)
+        if segment_index == len(self._segments):
+            return self._tail[offset]
+        return self._segments[segment_index].entries()[offset]
+
+    def _range(self, start: int, stop: int) -> list[str]:
+        """Get entries [start, stop), touching only the segments involved."""
+        result: list[str] = []
+        sealed = len(self._segments) * LOG_SEGMENT_SIZE
+        position = start
+        while position < min(stop, sealed):
+            segment_index, offset = divmod(position, LOG_SEGMENT_SIZE)
+            end = min(stop - position + offset, LOG_SEGMENT_SIZE)
+            result.extend(self._segments[segment_index].entries()[offset:end])
+            position += end - offset
+        if stop > sealed:
+            result.extend(self._tail[max(start, sealed) - sealed : stop - sealed])
+        return result
+
+    def __iter__(self) -> Iterator[str]:
+        for segment in self._segments:
+            yield from segment.entries()
+        yield from self._tail
+
+    def __reversed__(self) -> Iterator[str]:
+        yield from reversed(self._tail)
+        for segment in reversed(self._segments):
+            yield from reversed(segment.entries())
+
+    def __add__(self, other: Iterable[str]) -> "GroundTruthLog":
+        new = self.copy()
+        new.extend(other)
+        return new
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GroundTruthLog | list | tuple):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        if isinstance(other, GroundTruthLog) and other._segments == self._segments:
+            return self._tail == other._tail
+        return all(a == b for a, b in zip(self, other, strict=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"GroundTruthLog({list(self)!r})"
+
+
 class GameState(TypedDict):
     """LangGraph-compatible state container for the game.
 
@@ -1973,7 +2331,9 @@ class GameState(TypedDict):
 
     Attributes:
         ground_truth_log: Append-only complete history of all game events.
-            Used for transcript export and debugging.
+            Used for transcript export and debugging. A GroundTruthLog
+            (segment-backed); plain lists are accepted, so consumers use
+            only the sequence interface plus copy()/append().
         turn_queue: List of agent names in turn order (e.g., ["dm", "fighter", "rogue"]).
         current_turn: Name of the agent whose turn it currently is.
         agent_memories: Per-agent memory with isolated context.
@@ -1999,7 +2359,7 @@ class GameState(TypedDict):
             Tracks initiative order, NPC profiles, and round number.
     """
 
-    ground_truth_log: list[str]
+    ground_truth_log: GroundTruthLog | list[str]
     turn_queue: list[str]
     current_turn: str
     agent_memories: dict[str, AgentMemory]
@@ -2065,11 +2425,16 @@ class NarrativeMessage(BaseModel):
             "sheet_update" if agent is "SHEET",
             otherwise "pc_dialogue"
         """
-        if self.agent.lower() == "dm":
-            return "dm_narration"
-        if self.agent.upper() == "SHEET":
-            return "sheet_update"
-        return "pc_dialogue"
+        return _message_type(self.agent)
+
+
+def _message_type(agent: str) -> Literal["dm_narration", "pc_dialogue", "sheet_update"]:
+    """Get the message type for an agent name (see NarrativeMessage)."""
+    if agent.lower() == "dm":
+        return "dm_narration"
+    if agent.upper() == "SHEET":
+        return "sheet_update"
+    return "pc_dialogue"
 
 
 def parse_log_entry(entry: str) -> NarrativeMessage:
@@ -2089,6 +2454,12 @@ def parse_log_entry(entry: str) -> NarrativeMessage:
     Returns:
         NarrativeMessage with agent and content extracted
     """
+    parsed = parse_entry(entry)
+    return NarrativeMessage(agent=parsed.agent, content=parsed.content)
+
+
+def _split_log_entry(entry: str) -> tuple[str, str]:
+    """Split a log entry into agent and content (see parse_log_entry)."""
     # Use simple string parsing for reliability (regex had caching issues)
     if entry.startswith("["):
         bracket_end = entry.find("]")
@@ -2100,9 +2471,9 @@ def parse_log_entry(entry: str) -> NarrativeMessage:
             # Handle duplicate prefix: LLM sometimes echoes "[agent]:" in response
             if content.startswith(f"[{agent}]"):
                 content = content[len(agent) + 2 :].lstrip(": ")
-            return NarrativeMessage(agent=agent, content=content)
+            return agent, content
     # No brackets at start - treat as DM narration
-    return NarrativeMessage(agent="dm", content=entry)
+    return "dm", entry
 
 
 def parse_message_content(content: str) -> list[MessageSegment]:
@@ -2117,7 +2488,21 @@ def parse_message_content(content: str) -> list[MessageSegment]:
     Returns:
         List of MessageSegment with type and text for each segment
     """
-    segments: list[MessageSegment] = []
+    return [
+        MessageSegment(segment_type=segment_type, text=text)
+        for segment_type, text in _split_segments(content)
+    ]
+
+
+_SegmentType = Literal["dialogue", "action", "narration"]
+
+
+def _split_segments(content: str) -> list[tuple[_SegmentType, str]]:
+    """Split message content into (segment_type, text) pairs.
+
+    See parse_message_content().
+    """
+    segments: list[tuple[_SegmentType, str]] = []
     pos = 0
 
     while pos < len(content):
@@ -2130,9 +2515,7 @@ def parse_message_content(content: str) -> list[MessageSegment]:
             # No more special markers - rest is narration
             remaining = content[pos:]
             if remaining:
-                segments.append(
-                    MessageSegment(segment_type="narration", text=remaining)
-                )
+                segments.append(("narration", remaining))
             break
 
         # Find the nearest marker
@@ -2151,37 +2534,103 @@ def parse_message_content(content: str) -> list[MessageSegment]:
 
         # Add any narration before the marker
         if next_marker > pos:
-            segments.append(
-                MessageSegment(segment_type="narration", text=content[pos:next_marker])
-            )
+            segments.append(("narration", content[pos:next_marker]))
 
         if marker_type == "action":
             # Find closing asterisk
             action_end = content.find("*", next_marker + 1)
             if action_end == -1:
                 # No closing asterisk - treat as narration
-                segments.append(
-                    MessageSegment(segment_type="narration", text=content[next_marker:])
-                )
+                segments.append(("narration", content[next_marker:]))
                 break
             action_text = content[next_marker + 1 : action_end]
-            segments.append(MessageSegment(segment_type="action", text=action_text))
+            segments.append(("action", action_text))
             pos = action_end + 1
         else:
             # Find closing quote
             quote_end = content.find('"', next_marker + 1)
             if quote_end == -1:
                 # No closing quote - treat as narration
-                segments.append(
-                    MessageSegment(segment_type="narration", text=content[next_marker:])
-                )
+                segments.append(("narration", content[next_marker:]))
                 break
             dialogue_text = content[next_marker + 1 : quote_end]
-            segments.append(MessageSegment(segment_type="dialogue", text=dialogue_text))
+            segments.append(("dialogue", dialogue_text))
             pos = quote_end + 1
 
     # Filter out empty segments (e.g., from ** double asterisks **)
-    return [s for s in segments if s.text]
+    return [(segment_type, text) for segment_type, text in segments if text]
+
+
+# =============================================================================
+# Parsed Log Entry Cache
+# =============================================================================
+
+
+class ParsedEntry(NamedTuple):
+    """A parsed ground_truth_log entry in compact, immutable form.
+
+    Shared by everything that splits log entries into speaker and text:
+    the narrative renderers, the transcript writer, the recap and the
+    fork comparison view.
+
+    Attributes:
+        agent: Agent key (see parse_log_entry).
+        content: Message content without the "[agent]: " prefix.
+        segments: (segment_type, text) pairs (see parse_message_content).
+    """
+
+    agent: str
+    content: str
+    segments: tuple[tuple[_SegmentType, str], ...]
+
+    @property
+    def message_type(self) -> Literal["dm_narration", "pc_dialogue", "sheet_update"]:
+        """Message type for the agent (see NarrativeMessage.message_type)."""
+        return _message_type(self.agent)
+
+
+# Parsed log entries kept in memory. Covers the visible narrative window
+# (narrative_display_limit plus "Load earlier" pages) with room to spare.
+_PARSED_ENTRY_CACHE_SIZE = 4096
+
+_parsed_entry_cache: OrderedDict[tuple[int, str], ParsedEntry] = OrderedDict()
+_parsed_entry_cache_lock = threading.Lock()
+
+
+def parse_entry(entry: str, index: int = -1) -> ParsedEntry:
+    """Parse a ground_truth_log entry, memoized.
+
+    Entries are cached by (log index, entry text), so re-rendering the
+    same log, or writing the transcript and recap for entries already
+    shown, does not parse them again.
+
+    Args:
+        entry: A raw log entry string.
+        index: The entry's position in ground_truth_log, or -1 if the
+            caller does not know it.
+
+    Returns:
+        The parsed entry.
+    """
+    key = (index, entry)
+    with _parsed_entry_cache_lock:
+        cached = _parsed_entry_cache.get(key)
+        if cached is not None:
+            _parsed_entry_cache.move_to_end(key)
+            return cached
+    agent, content = _split_log_entry(entry)
+    parsed = ParsedEntry(agent, content, tuple(_split_segments(content)))
+    with _parsed_entry_cache_lock:
+        _parsed_entry_cache[key] = parsed
+        if len(_parsed_entry_cache) > _PARSED_ENTRY_CACHE_SIZE:
+            _parsed_entry_cache.popitem(last=False)
+    return parsed
+
+
+def clear_parsed_entry_cache() -> None:
+    """Drop all cached parsed log entries (for tests)."""
+    with _parsed_entry_cache_lock:
+        _parsed_entry_cache.clear()
 
 
 def create_agent_memory(
@@ -2199,6 +2648,41 @@ def create_agent_memory(
     return AgentMemory(token_limit=token_limit, character_facts=character_facts)
 
 
+def append_to_memory(
+    agent_memories: dict[str, AgentMemory],
+    agent_name: str,
+    entry: str,
+    token_limit: int | None = None,
+) -> dict[str, AgentMemory]:
+    """Return agent memories with an entry appended to one agent's buffer.
+
+    The input dict and its AgentMemory objects are not modified. Only the
+    named agent's memory and buffer are copied; every other agent's
+    AgentMemory is shared with the input, so a turn costs the size of the
+    acting agent's buffer rather than of every agent's memory.
+
+    Args:
+        agent_memories: Current agent memories from GameState.
+        agent_name: Agent whose short-term buffer receives the entry.
+        entry: Buffer entry to append.
+        token_limit: Token limit for a new memory if the agent has none.
+
+    Returns:
+        A new agent memories dict.
+    """
+    new_memories = dict(agent_memories)
+    memory = new_memories.get(agent_name)
+    if memory is None:
+        if token_limit is None:
+            memory = AgentMemory()
+        else:
+            memory = AgentMemory(token_limit=token_limit)
+    new_memories[agent_name] = memory.model_copy(
+        update={"short_term_buffer": [*memory.short_term_buffer, entry]}
+    )
+    return new_memories
+
+
 def create_character_facts_from_config(config: "CharacterConfig") -> CharacterFacts:
     """Create CharacterFacts from a CharacterConfig.
 
@@ -2728,7 +3212,7 @@ def create_initial_game_state() -> GameState:
         A new GameState ready for initialization.
     """
     return GameState(
-        ground_truth_log=[],
+        ground_truth_log=GroundTruthLog(),
         turn_queue=[],
         current_turn="",
         agent_memories={},
@@ -2843,7 +3327,7 @@ def populate_game_state(
     session_id = f"{session_number:03d}"
 
     return GameState(
-        ground_truth_log=sample_messages,
+        ground_truth_log=GroundTruthLog(sample_messages),
         turn_queue=turn_queue,
         current_turn="dm",
         agent_memories=agent_memories,
@@ -7,12 +7,24 @@ This module implements checkpoint persistence for game state recovery:
 - Checkpoint metadata extraction for browser UI
 
 Checkpoint format: campaigns/session_XXX/turn_XXX.json
-Each checkpoint is self-contained (no delta encoding).
+Each checkpoint is a small manifest: frequently-changing fields (the log
+tail, turn queue, combat state, scalars) are stored inline, while bulky
+sections (configs, characters, memories, sheets, secrets, narrative stores)
+and sealed ground_truth_log segments are stored once as content-addressed
+blobs in campaigns/session_XXX/objects/ and referenced by hash. Consecutive
+checkpoints and forks share blobs for unchanged sections and for all log
+history; collect_garbage() removes blobs no manifest references.
 """
 
+import functools
+import hashlib
 import json
 import os
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -20,7 +32,9 @@ from typing import Any
 import yaml
 from pydantic import BaseModel, Field, ValidationError
 
+from metrics import CHECKPOINT_SAVE_BYTES, CHECKPOINT_SAVE_SECONDS
 from models import (
+    LOG_SEGMENT_SIZE,
     AgentMemory,
     AgentSecrets,
     CallbackEntry,
@@ -36,6 +50,8 @@ from models import (
     ForkRegistry,
     GameConfig,
     GameState,
+    GroundTruthLog,
+    LogSegment,
     ModuleInfo,
     NarrativeElement,
     NarrativeElementStore,
@@ -43,6 +59,7 @@ from models import (
     SessionMetadata,
     TranscriptEntry,
     Whisper,
+    parse_entry,
 )
 
 __all__ = [
@@ -64,6 +81,7 @@ __all__ = [
     "get_fork_registry_path",
     "get_latest_checkpoint",
     "get_next_session_number",
+    "get_object_store_dir",
     "get_session_dir",
     "get_transcript_download_data",
     "get_transcript_path",
@@ -74,6 +92,7 @@ __all__ = [
     "list_sessions",
     "list_sessions_with_metadata",
     "load_checkpoint",
+    "load_latest_checkpoint_cached",
     "load_fork_registry",
     "load_session_metadata",
     "load_transcript",
@@ -90,6 +109,8 @@ __all__ = [
     "load_timeline_log_at_turn",
     "load_fork_log_at_turn",
     "build_comparison_data",
+    "clear_checkpoint_cache",
+    "collect_garbage",
     "extract_turns_from_logs",
     "extract_turns_from_single_log",
     "promote_fork",
@@ -201,17 +222,19 @@ def ensure_session_dir(session_id: str) -> Path:
     return session_dir
 
 
-def serialize_game_state(state: GameState) -> str:
-    """Serialize GameState to JSON string.
+def _game_state_to_dict(state: GameState, include_log: bool = True) -> dict[str, Any]:
+    """Convert GameState to a JSON-serializable dict.
 
     Handles the TypedDict + Pydantic hybrid by converting
-    Pydantic models to dicts before JSON serialization.
+    Pydantic models to dicts.
 
     Args:
-        state: The GameState to serialize.
+        state: The GameState to convert.
+        include_log: If False, leave ground_truth_log out (manifests store
+            it as segments, without paging in the whole history).
 
     Returns:
-        JSON string representation of the state.
+        Dict representation of the state.
     """
     # Handle selected_module serialization (Story 7.3)
     selected_module = state.get("selected_module")
@@ -221,7 +244,6 @@ def serialize_game_state(state: GameState) -> str:
 
     # Convert Pydantic models to dicts
     serializable: dict[str, Any] = {
-        "ground_truth_log": state["ground_truth_log"],
         "turn_queue": state["turn_queue"],
         "current_turn": state["current_turn"],
         "agent_memories": {
@@ -265,16 +287,39 @@ def serialize_game_state(state: GameState) -> str:
         "pending_nudge": state.get("pending_nudge", None),
         "pending_human_whisper": state.get("pending_human_whisper", None),
     }
-    return json.dumps(serializable, indent=2)
+    if include_log:
+        serializable = {
+            "ground_truth_log": list(state["ground_truth_log"]),
+            **serializable,
+        }
+    return serializable
 
 
-def deserialize_game_state(json_str: str) -> GameState:
+def serialize_game_state(state: GameState) -> str:
+    """Serialize GameState to JSON string.
+
+    Produces a self-contained document with every section inline
+    (no blob references), suitable for export and tests.
+
+    Args:
+        state: The GameState to serialize.
+
+    Returns:
+        JSON string representation of the state.
+    """
+    return json.dumps(_game_state_to_dict(state), indent=2)
+
+
+def deserialize_game_state(json_str: str, objects_dir: Path | None = None) -> GameState:
     """Deserialize JSON string to GameState.
 
     Reconstructs Pydantic models from their dict representations.
+    Accepts both self-contained checkpoints and checkpoint manifests;
+    manifests need the object store their section blobs live in.
 
     Args:
         json_str: JSON string representation of GameState.
+        objects_dir: Object store directory for resolving manifest sections.
 
     Returns:
         Reconstructed GameState.
@@ -283,10 +328,27 @@ def deserialize_game_state(json_str: str) -> GameState:
         json.JSONDecodeError: If JSON is invalid.
         KeyError: If required fields are missing.
         TypeError: If field types are invalid.
+        ValueError: If a manifest cannot be resolved (no store, bad hash).
+        OSError: If a referenced section blob cannot be read.
         ValidationError: If Pydantic model validation fails.
     """
     data = json.loads(json_str)
+    if isinstance(data, dict) and "sections" in data:
+        if objects_dir is None:
+            raise ValueError("Checkpoint manifest requires an object store")
+        data = _expand_manifest(data, objects_dir)
+    return _game_state_from_dict(data)
+
 
+def _game_state_from_dict(data: dict[str, Any]) -> GameState:
+    """Rebuild GameState from its dict representation.
+
+    Args:
+        data: Dict produced by _game_state_to_dict (or an older checkpoint).
+
+    Returns:
+        Reconstructed GameState.
+    """
     # Handle selected_module deserialization (Story 7.3)
     # Backward compatible: old checkpoints may not have this field
     selected_module_data = data.get("selected_module")
@@ -367,8 +429,12 @@ def deserialize_game_state(json_str: str) -> GameState:
     else:
         combat_state = CombatState()
 
+    log = data["ground_truth_log"]
+    if not isinstance(log, GroundTruthLog):
+        log = GroundTruthLog(log)
+
     return GameState(
-        ground_truth_log=data["ground_truth_log"],
+        ground_truth_log=log,
         turn_queue=data["turn_queue"],
         current_turn=data["current_turn"],
         agent_memories={k: AgentMemory(**v) for k, v in data["agent_memories"].items()},
@@ -396,6 +462,452 @@ def deserialize_game_state(json_str: str) -> GameState:
     )
 
 
+# =============================================================================
+# Content-Addressed Section Store
+# =============================================================================
+
+# Manifest format version written into every checkpoint manifest.
+# Version 2 stores sealed ground_truth_log segments as blobs ("log_segments").
+CHECKPOINT_MANIFEST_VERSION = 2
+
+# Manifest versions _expand_manifest() can read
+_READABLE_MANIFEST_VERSIONS = (1, 2)
+
+# Sections stored as a single blob each
+_BLOB_SECTIONS = (
+    "game_config",
+    "dm_config",
+    "selected_module",
+    "narrative_elements",
+    "callback_database",
+    "callback_log",
+)
+
+# Keyed sections stored as one blob per entry, so one agent's change
+# does not rewrite every other agent's data
+_KEYED_BLOB_SECTIONS = (
+    "agent_memories",
+    "characters",
+    "character_sheets",
+    "agent_secrets",
+)
+
+# Unreferenced blobs younger than this are kept by collect_garbage(), since
+# a concurrent save writes its blobs before the manifest that references them
+GC_GRACE_SECONDS = 300
+
+
+def get_object_store_dir(session_id: str) -> Path:
+    """Get path to a session's content-addressed object store.
+
+    The store is shared by the main timeline and all forks of the session.
+
+    Args:
+        session_id: Session ID string.
+
+    Returns:
+        Path to the objects directory in the session directory.
+    """
+    return get_session_dir(session_id) / "objects"
+
+
+def _validate_blob_hash(digest: str) -> None:
+    """Validate a blob hash to prevent path traversal via manifests.
+
+    Args:
+        digest: Hex SHA-256 digest string.
+
+    Raises:
+        ValueError: If digest is not a 64-character lowercase hex string.
+    """
+    if (
+        not isinstance(digest, str)  # type: ignore[redundant-expr]
+        or len(digest) != 64
+        or any(c not in "0123456789abcdef" for c in digest)
+    ):
+        raise ValueError(f"Invalid blob hash: {digest!r}")
+
+
+def _get_blob_path(objects_dir: Path, digest: str) -> Path:
+    """Get the path of a blob, fanned out by the first two hex digits.
+
+    Args:
+        objects_dir: Object store directory.
+        digest: Hex SHA-256 digest of the blob content.
+
+    Returns:
+        Path to the blob file.
+    """
+    _validate_blob_hash(digest)
+    return objects_dir / digest[:2] / f"{digest}.json"
+
+
+def _write_blob(
+    objects_dir: Path, payload: Any, written: list[int] | None = None
+) -> str:
+    """Store a JSON payload in the object store, returning its hash.
+
+    Writing is skipped when a blob with the same hash already exists, so
+    saving an unchanged section costs one hash and one stat. Existing blobs
+    are touched so collect_garbage() treats them as recently used.
+
+    Args:
+        objects_dir: Object store directory.
+        payload: JSON-serializable section data.
+        written: If given, the size of a newly written blob is appended.
+
+    Returns:
+        Hex SHA-256 digest of the serialized payload.
+    """
+    content = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    data = content.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    blob_path = _get_blob_path(objects_dir, digest)
+
+    if blob_path.exists():
+        try:
+            os.utime(blob_path)
+            return digest
+        except OSError:
+            pass  # Removed concurrently - fall through and rewrite it
+
+    blob_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_fd, temp_path = tempfile.mkstemp(dir=blob_path.parent, suffix=".json.tmp")
+    try:
+        with os.fdopen(temp_fd, "wb") as f:
+            f.write(data)
+        Path(temp_path).replace(blob_path)
+    except Exception:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+    if written is not None:
+        written.append(len(data))
+    return digest
+
+
+def _read_blob(objects_dir: Path, digest: str) -> Any:
+    """Load a JSON payload from the object store.
+
+    Args:
+        objects_dir: Object store directory.
+        digest: Hex SHA-256 digest of the blob.
+
+    Returns:
+        The decoded section data.
+
+    Raises:
+        ValueError: If digest is malformed.
+        OSError: If the blob is missing or unreadable.
+        json.JSONDecodeError: If the blob is corrupt.
+    """
+    blob_path = _get_blob_path(objects_dir, digest)
+    return json.loads(blob_path.read_text(encoding="utf-8"))
+
+
+# Manifest keys that are not GameState fields
+_MANIFEST_ONLY_KEYS = (
+    "manifest_version",
+    "sections",
+    "log_segments",
+    "log_segment_size",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _segment_loader(objects_dir: Path) -> Callable[[str], list[str]]:
+    """Get the loader paging log segments in from one object store.
+
+    Cached so every segment stored in a given store shares one loader,
+    which lets _write_log_segments tell which store a segment lives in.
+
+    Args:
+        objects_dir: Object store directory.
+
+    Returns:
+        Callable reading a segment blob by digest.
+    """
+
+    def load(digest: str) -> list[str]:
+        return _read_blob(objects_dir, digest)  # type: ignore[no-any-return]
+
+    return load
+
+
+def _write_log_segments(
+    log: GroundTruthLog, objects_dir: Path, written: list[int] | None = None
+) -> list[str]:
+    """Store a log's sealed segments as blobs and release them from memory.
+
+    Segments already stored in this object store are not re-serialized,
+    so a save costs O(new entries) instead of O(history).
+
+    Args:
+        log: Log whose sealed segments to store.
+        objects_dir: Object store directory.
+        written: If given, sizes of newly written blobs are appended.
+
+    Returns:
+        Segment blob hashes, oldest first.
+    """
+    loader = _segment_loader(objects_dir)
+    digests: list[str] = []
+    for segment in log.segments:
+        if segment.digest is None or segment.loader is not loader:
+            digest = _write_blob(objects_dir, segment.entries(), written)
+            segment.mark_persisted(digest, loader)
+        assert segment.digest is not None
+        digests.append(segment.digest)
+    log.release_persisted()
+    return digests
+
+
+def _load_log_from_segments(
+    digests: list[str],
+    segment_size: Any,
+    tail: list[str],
+    objects_dir: Path,
+) -> GroundTruthLog:
+    """Rebuild a segment-backed log from a manifest without reading segments.
+
+    Args:
+        digests: Segment blob hashes, oldest first.
+        segment_size: Entries per segment the manifest was written with.
+        tail: Inline entries after the last segment.
+        objects_dir: Object store directory holding the segment blobs.
+
+    Returns:
+        GroundTruthLog whose segments page in on demand.
+
+    Raises:
+        ValueError: If a hash is invalid.
+        OSError: If segments must be read (size mismatch) and one is missing.
+    """
+    for digest in digests:
+        _validate_blob_hash(digest)
+    if segment_size != LOG_SEGMENT_SIZE:
+        # Written with a different segment size: re-segment in memory
+        entries = [e for d in digests for e in _read_blob(objects_dir, d)]
+        return GroundTruthLog([*entries, *tail])
+    loader = _segment_loader(objects_dir)
+    return GroundTruthLog.from_segments(
+        (LogSegment(None, digest, loader) for digest in digests), tail
+    )
+
+
+def _build_manifest(
+    state: GameState, objects_dir: Path, written: list[int] | None = None
+) -> dict[str, Any]:
+    """Write a state's bulky sections as blobs and build its manifest.
+
+    Args:
+        state: Game state to store.
+        objects_dir: Object store directory to write blobs into.
+        written: If given, sizes of newly written blobs are appended.
+
+    Returns:
+        Manifest dict: inline fields plus a "sections" map of blob hashes.
+    """
+    log = state["ground_truth_log"]
+    if not isinstance(log, GroundTruthLog):
+        log = GroundTruthLog(log)
+    log_segments = _write_log_segments(log, objects_dir, written)
+
+    data = _game_state_to_dict(state, include_log=False)
+    data["ground_truth_log"] = log.tail
+    sections: dict[str, Any] = {}
+    for name in _BLOB_SECTIONS:
+        sections[name] = _write_blob(objects_dir, data.pop(name), written)
+    for name in _KEYED_BLOB_SECTIONS:
+        entries: dict[str, Any] = data.pop(name)
+        sections[name] = {
+            key: _write_blob(objects_dir, value, written)
+            for key, value in entries.items()
+        }
+    data["manifest_version"] = CHECKPOINT_MANIFEST_VERSION
+    data["sections"] = sections
+    data["log_segments"] = log_segments
+    data["log_segment_size"] = LOG_SEGMENT_SIZE
+    return data
+
+
+def _expand_manifest(manifest: dict[str, Any], objects_dir: Path) -> dict[str, Any]:
+    """Resolve a checkpoint manifest's blob references into a full state dict.
+
+    Args:
+        manifest: Parsed manifest dict.
+        objects_dir: Object store directory holding the section blobs.
+
+    Returns:
+        Dict in the self-contained checkpoint layout.
+
+    Raises:
+        ValueError: If the manifest version is unsupported or a hash is invalid.
+        OSError: If a referenced blob is missing.
+    """
+    version = manifest.get("manifest_version")
+    if version not in _READABLE_MANIFEST_VERSIONS:
+        raise ValueError(f"Unsupported checkpoint manifest version: {version!r}")
+
+    data = {k: v for k, v in manifest.items() if k not in _MANIFEST_ONLY_KEYS}
+    digests = manifest.get("log_segments")
+    if digests:
+        data["ground_truth_log"] = _load_log_from_segments(
+            digests,
+            manifest.get("log_segment_size"),
+            data["ground_truth_log"],
+            objects_dir,
+        )
+    sections: dict[str, Any] = manifest["sections"]
+    for name, ref in sections.items():
+        if isinstance(ref, dict):
+            data[name] = {
+                key: _read_blob(objects_dir, digest)
+                for key, digest in ref.items()  # type: ignore[union-attr]
+            }
+        else:
+            data[name] = _read_blob(objects_dir, ref)
+    return data
+
+
+def _write_checkpoint_file(
+    state: GameState, checkpoint_path: Path, objects_dir: Path
+) -> int:
+    """Write a checkpoint manifest (and any new section blobs) atomically.
+
+    Blobs are written before the manifest, so a crash never leaves a
+    manifest referencing a missing blob.
+
+    Args:
+        state: Game state to store.
+        checkpoint_path: Destination turn_XXX.json path.
+        objects_dir: Object store directory for section blobs.
+
+    Returns:
+        Bytes written: the manifest plus any new blobs.
+
+    Raises:
+        OSError: If write fails (permissions, disk full, etc.).
+    """
+    blob_sizes: list[int] = []
+    manifest = _build_manifest(state, objects_dir, blob_sizes)
+    json_content = json.dumps(manifest, indent=2)
+    encoded = json_content.encode("utf-8")
+
+    # Atomic write: temp file then rename
+    # This protects against partial writes during crash
+    temp_fd, temp_path = tempfile.mkstemp(
+        dir=checkpoint_path.parent, suffix=".json.tmp"
+    )
+    try:
+        with os.fdopen(temp_fd, "wb") as f:
+            f.write(encoded)
+        # Atomic rename (on POSIX; Windows uses copy+delete if needed)
+        Path(temp_path).replace(checkpoint_path)
+    except Exception:
+        # Clean up temp file on error
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+    return len(encoded) + sum(blob_sizes)
+
+
+def _save_checkpoint_file(
+    state: GameState, checkpoint_path: Path, session_id: str
+) -> None:
+    """Write a session or fork checkpoint and record save metrics.
+
+    Args:
+        state: Game state to store.
+        checkpoint_path: Destination turn_XXX.json path.
+        session_id: Session whose object store holds the section blobs.
+
+    Raises:
+        OSError: If write fails (permissions, disk full, etc.).
+    """
+    start = time.perf_counter()
+    written = _write_checkpoint_file(
+        state, checkpoint_path, get_object_store_dir(session_id)
+    )
+    CHECKPOINT_SAVE_SECONDS.observe(time.perf_counter() - start, session=session_id)
+    CHECKPOINT_SAVE_BYTES.observe(written, session=session_id)
+
+
+def _collect_manifest_hashes(checkpoint_path: Path, referenced: set[str]) -> None:
+    """Add every blob hash referenced by a checkpoint file to a set.
+
+    Self-contained (pre-manifest) and unreadable files reference nothing.
+
+    Args:
+        checkpoint_path: Path to a turn_XXX.json file.
+        referenced: Set to add hashes to.
+    """
+    try:
+        data = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        return
+    if not isinstance(data, dict):
+        return
+    log_segments = data.get("log_segments")  # type: ignore[union-attr]
+    if isinstance(log_segments, list):
+        referenced.update(str(d) for d in log_segments)  # type: ignore[union-attr]
+    sections = data.get("sections")  # type: ignore[union-attr]
+    if not isinstance(sections, dict):
+        return
+    for ref in sections.values():  # type: ignore[union-attr]
+        if isinstance(ref, dict):
+            referenced.update(str(d) for d in ref.values())  # type: ignore[union-attr]
+        else:
+            referenced.add(str(ref))
+
+
+def collect_garbage(session_id: str, grace_seconds: float = GC_GRACE_SECONDS) -> int:
+    """Delete section blobs no longer referenced by any checkpoint.
+
+    Scans every manifest in the main timeline and all fork directories
+    of the session. Blobs modified within grace_seconds are kept so a
+    save running concurrently cannot lose blobs it has just written.
+
+    Args:
+        session_id: Session ID string.
+        grace_seconds: Minimum age of an unreferenced blob before removal.
+
+    Returns:
+        Number of blobs deleted.
+    """
+    session_dir = get_session_dir(session_id)
+    objects_dir = get_object_store_dir(session_id)
+    if not objects_dir.exists():
+        return 0
+
+    referenced: set[str] = set()
+    for path in session_dir.glob("turn_*.json"):
+        _collect_manifest_hashes(path, referenced)
+    for path in session_dir.glob("forks/fork_*/turn_*.json"):
+        _collect_manifest_hashes(path, referenced)
+
+    cutoff = time.time() - grace_seconds
+    deleted = 0
+    for blob_path in objects_dir.glob("*/*.json"):
+        if blob_path.stem in referenced:
+            continue
+        try:
+            if blob_path.stat().st_mtime > cutoff:
+                continue
+            blob_path.unlink()
+            deleted += 1
+        except OSError:
+            continue
+
+    # Remove fan-out directories left empty
+    for fan_dir in objects_dir.iterdir():
+        if fan_dir.is_dir():
+            try:
+                fan_dir.rmdir()  # Only removes if empty
+            except OSError:
+                pass
+
+    return deleted
+
+
 def save_checkpoint(
     state: GameState, session_id: str, turn_number: int, update_metadata: bool = True
 ) -> Path:
@@ -403,7 +915,9 @@ def save_checkpoint(
 
     Uses atomic write pattern: write to temp file first, then rename.
     This ensures checkpoint is either complete or doesn't exist,
-    protecting against corruption from unexpected shutdown.
+    protecting against corruption from unexpected shutdown. Bulky sections
+    are stored as content-addressed blobs, so only changed sections are
+    written.
 
     Also updates session metadata (config.yaml) with turn count and timestamp
     unless update_metadata is False (Story 4.3).
@@ -421,24 +935,12 @@ def save_checkpoint(
         OSError: If write fails (permissions, disk full, etc.).
     """
     # Ensure session directory exists
-    session_dir = ensure_session_dir(session_id)
+    ensure_session_dir(session_id)
     checkpoint_path = get_checkpoint_path(session_id, turn_number)
 
-    # Serialize state
-    json_content = serialize_game_state(state)
-
-    # Atomic write: temp file then rename
-    # This protects against partial writes during crash
-    temp_fd, temp_path = tempfile.mkstemp(dir=session_dir, suffix=".json.tmp")
-    try:
-        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-            f.write(json_content)
-        # Atomic rename (on POSIX; Windows uses copy+delete if needed)
-        Path(temp_path).replace(checkpoint_path)
-    except Exception:
-        # Clean up temp file on error
-        Path(temp_path).unlink(missing_ok=True)
-        raise
+    # Write changed section blobs, then the manifest (atomically)
+    _save_checkpoint_file(state, checkpoint_path, session_id)
+    _invalidate_cached_checkpoint(checkpoint_path)
 
     # Update session metadata (Story 4.3)
     if update_metadata:
@@ -469,10 +971,19 @@ def load_checkpoint(session_id: str, turn_number: int) -> GameState | None:
 
     try:
         json_content = checkpoint_path.read_text(encoding="utf-8")
-        return deserialize_game_state(json_content)
-    except (json.JSONDecodeError, KeyError, TypeError, AttributeError, ValidationError):
+        return deserialize_game_state(json_content, get_object_store_dir(session_id))
+    except (
+        json.JSONDecodeError,
+        KeyError,
+        TypeError,
+        AttributeError,
+        ValueError,
+        OSError,
+    ):
         # Invalid checkpoint - return None instead of crashing
         # AttributeError handles cases where JSON is null or array instead of object
+        # ValueError covers ValidationError and unresolvable manifests,
+        # OSError covers missing section blobs
         return None
 
 
@@ -534,6 +1045,114 @@ def get_latest_checkpoint(session_id: str) -> int | None:
     return turns[-1] if turns else None
 
 
+# =============================================================================
+# Checkpoint Read Cache
+# =============================================================================
+
+# Number of deserialized checkpoints kept for read-only API requests
+CHECKPOINT_CACHE_SIZE = 8
+
+# A directory modified this recently may change again within the same mtime
+# tick on coarse-timestamp filesystems, so its listing is not cached.
+_CHECKPOINT_CACHE_RACY_SECONDS = 2.0
+
+# checkpoint path -> ((inode, mtime_ns, size), state), least recent first.
+# Checkpoints are replaced by atomic rename, so any save changes the stamp.
+_checkpoint_cache: OrderedDict[str, tuple[tuple[int, int, int], GameState]] = (
+    OrderedDict()
+)
+# session dir path -> ((inode, mtime_ns), latest turn)
+_latest_turn_cache: dict[str, tuple[tuple[int, int], int | None]] = {}
+_checkpoint_cache_lock = threading.Lock()
+
+
+def _invalidate_cached_checkpoint(checkpoint_path: Path) -> None:
+    """Drop a checkpoint and its session's latest-turn entry from the cache."""
+    with _checkpoint_cache_lock:
+        _checkpoint_cache.pop(str(checkpoint_path), None)
+        _latest_turn_cache.pop(str(checkpoint_path.parent), None)
+
+
+def clear_checkpoint_cache() -> None:
+    """Clear the checkpoint read cache."""
+    with _checkpoint_cache_lock:
+        _checkpoint_cache.clear()
+        _latest_turn_cache.clear()
+
+
+def _get_latest_checkpoint_cached(session_id: str) -> int | None:
+    """Get the latest checkpoint turn, skipping the glob if the dir is unchanged.
+
+    Args:
+        session_id: Session ID string.
+
+    Returns:
+        Latest turn number, or None if no checkpoints.
+    """
+    session_dir = get_session_dir(session_id)
+    try:
+        st = session_dir.stat()
+    except OSError:
+        return None
+    stamp = (st.st_ino, st.st_mtime_ns)
+    key = str(session_dir)
+    with _checkpoint_cache_lock:
+        entry = _latest_turn_cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+
+    latest = get_latest_checkpoint(session_id)
+    if time.time() - st.st_mtime_ns / 1e9 >= _CHECKPOINT_CACHE_RACY_SECONDS:
+        with _checkpoint_cache_lock:
+            _latest_turn_cache[key] = (stamp, latest)
+    return latest
+
+
+def load_latest_checkpoint_cached(
+    session_id: str,
+) -> tuple[int | None, GameState | None]:
+    """Load the latest main-timeline checkpoint through a small LRU cache.
+
+    Intended for read-only API requests that would otherwise re-parse the
+    same checkpoint on every poll. Entries are validated against the
+    file's inode/mtime/size and dropped on save, so a stale state is never
+    served. The returned state is shared between callers and must not be
+    mutated; use load_checkpoint() to get a private copy.
+
+    Args:
+        session_id: Session ID string.
+
+    Returns:
+        Tuple of (latest turn, state). Turn is None if the session has no
+        checkpoints; state is None if there are none or loading failed.
+    """
+    latest = _get_latest_checkpoint_cached(session_id)
+    if latest is None:
+        return None, None
+
+    checkpoint_path = get_checkpoint_path(session_id, latest)
+    try:
+        st = checkpoint_path.stat()
+    except OSError:
+        return latest, None
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    key = str(checkpoint_path)
+    with _checkpoint_cache_lock:
+        entry = _checkpoint_cache.get(key)
+        if entry is not None and entry[0] == stamp:
+            _checkpoint_cache.move_to_end(key)
+            return latest, entry[1]
+
+    state = load_checkpoint(session_id, latest)
+    if state is not None:
+        with _checkpoint_cache_lock:
+            _checkpoint_cache[key] = (stamp, state)
+            _checkpoint_cache.move_to_end(key)
+            while len(_checkpoint_cache) > CHECKPOINT_CACHE_SIZE:
+                _checkpoint_cache.popitem(last=False)
+    return latest, state
+
+
 # =============================================================================
 # Checkpoint Metadata (Story 4.2)
 # =============================================================================
@@ -586,10 +1205,16 @@ def get_checkpoint_info(session_id: str, turn_number: int) -> CheckpointInfo | N
         data = json.loads(json_content)
 
         log = data.get("ground_truth_log", [])
-        message_count = len(log)
+        log_segments = data.get("log_segments") or []
+        message_count = len(log) + len(log_segments) * data.get(
+            "log_segment_size", LOG_SEGMENT_SIZE
+        )
 
         # Get brief context from last log entry
         brief_context = ""
+        if not log and log_segments:
+            # Tail is empty right after a segment seals
+            log = _read_blob(get_object_store_dir(session_id), log_segments[-1])
         if log:
             last_entry = log[-1]
             # Remove agent prefix [agent] if present
@@ -609,7 +1234,7 @@ def get_checkpoint_info(session_id: str, turn_number: int) -> CheckpointInfo | N
             brief_context=brief_context,
             message_count=message_count,
         )
-    except (json.JSONDecodeError, KeyError, OSError):
+    except (json.JSONDecodeError, KeyError, OSError, ValueError):
         return None
 
 
@@ -916,12 +1541,15 @@ def generate_recap_summary(
     if include_cross_session:
         agent_memories = state.get("agent_memories", {})
 
-        # Add DM's story summary if available
+        # Add DM's story summary (or latest memory episode) if available
         dm_memory = agent_memories.get("dm")
-        if dm_memory and dm_memory.long_term_summary:
-            recap_sections.append(
-                f"**Story So Far:**\n{dm_memory.long_term_summary[:300]}"
+        story = ""
+        if dm_memory:
+            story = dm_memory.long_term_summary or (
+                dm_memory.episodes[-1].summary if dm_memory.episodes else ""
             )
+        if story:
+            recap_sections.append(f"**Story So Far:**\n{story[:300]}")
 
         # Add key relationships from character facts
         relationships_parts: list[str] = []
@@ -947,25 +1575,15 @@ def generate_recap_summary(
 
         # Format recap entries (CSS provides bullet styling via .recap-item)
         summary_lines: list[str] = []
-        for entry in recent_entries:
+        first_index = len(log) - len(recent_entries)
+        for index, entry in enumerate(recent_entries, start=first_index):
             # Strip agent prefix for cleaner display
-            if entry.startswith("["):
-                bracket_end = entry.find("]")
-                if bracket_end > 0:
-                    content = entry[bracket_end + 1 :]
-                    # Strip leading colon and whitespace (format is "[agent]: content")
-                    content = content.lstrip(": ").strip()
-                    # Handle duplicate prefix: LLM sometimes echoes "[agent]:" in response
-                    if content.startswith("["):
-                        inner_bracket_end = content.find("]")
-                        if inner_bracket_end > 0:
-                            content = (
-                                content[inner_bracket_end + 1 :].lstrip(": ").strip()
-                            )
-                else:
-                    content = entry
-            else:
-                content = entry
+            content = parse_entry(entry, index).content.strip()
+            # Handle an echoed prefix naming another speaker: "[dm]: [Thorin]: ..."
+            if content.startswith("["):
+                inner_bracket_end = content.find("]")
+                if inner_bracket_end > 0:
+                    content = content[inner_bracket_end + 1 :].lstrip(": ").strip()
 
             # Skip empty entries (from empty LLM responses)
             if not content:
@@ -995,9 +1613,9 @@ def initialize_session_with_previous_memories(
 ) -> GameState:
     """Initialize a new session carrying over memories from a previous session.
 
-    This function copies long_term_summary and character_facts from the previous
-    session's agent memories to the new session, while keeping short_term_buffer
-    empty for a fresh start.
+    This function copies long_term_summary, episodes and character_facts from
+    the previous session's agent memories to the new session, while keeping
+    short_term_buffer empty for a fresh start.
 
     Story 5.4: Cross-Session Memory & Character Facts.
 
@@ -1022,19 +1640,25 @@ def initialize_session_with_previous_memories(
     prev_memories = prev_state.get("agent_memories", {})
     new_memories = new_state.get("agent_memories", {})
 
-    # Copy long_term_summary and character_facts from previous session
-    # while preserving token_limit from new state
+    # Copy long_term_summary, episodes and character_facts from previous
+    # session while preserving token_limit from new state
     for agent_name, new_memory in new_memories.items():
         if agent_name in prev_memories:
             prev_memory = prev_memories[agent_name]
 
             # Build new memory with:
-            # - long_term_summary from previous session
+            # - long_term_summary and episodes from previous session, with
+            #   episodes moved to turn 0 since their turns index the old
+            #   session's ground_truth_log
             # - character_facts from previous session
             # - token_limit from new session (may have changed)
             # - empty short_term_buffer (fresh start)
             new_memories[agent_name] = AgentMemory(
                 long_term_summary=prev_memory.long_term_summary,
+                episodes=[
+                    episode.model_copy(update={"turn_start": 0, "turn_end": 0})
+                    for episode in prev_memory.episodes
+                ],
                 short_term_buffer=[],  # Fresh start for new session
                 token_limit=new_memory.token_limit,
                 character_facts=prev_memory.character_facts,
@@ -1376,20 +2000,13 @@ def create_fork(
             f"Checkpoint at turn {turn_number} not found in session {session_id!r}"
         )
 
-    # Save as the starting checkpoint in the fork directory
+    # Save as the starting checkpoint in the fork directory. Its sections
+    # resolve to the blobs the source checkpoint already stored.
     fork_dir = get_fork_dir(session_id, fork_id)
     fork_checkpoint_path = fork_dir / f"turn_{turn_number:03d}.json"
-    json_content = serialize_game_state(source_state)
-
-    # Atomic write
-    temp_fd, temp_path_str = tempfile.mkstemp(dir=fork_dir, suffix=".json.tmp")
-    try:
-        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-            f.write(json_content)
-        Path(temp_path_str).replace(fork_checkpoint_path)
-    except Exception:
-        Path(temp_path_str).unlink(missing_ok=True)
-        raise
+    _write_checkpoint_file(
+        source_state, fork_checkpoint_path, get_object_store_dir(session_id)
+    )
 
     # Create fork metadata
     now = datetime.now(UTC).isoformat() + "Z"
@@ -1467,18 +2084,8 @@ def save_fork_checkpoint(
     fork_dir = ensure_fork_dir(session_id, fork_id)
     checkpoint_path = fork_dir / f"turn_{turn_number:03d}.json"
 
-    # Serialize state
-    json_content = serialize_game_state(state)
-
-    # Atomic write: temp file then rename
-    temp_fd, temp_path = tempfile.mkstemp(dir=fork_dir, suffix=".json.tmp")
-    try:
-        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-            f.write(json_content)
-        Path(temp_path).replace(checkpoint_path)
-    except Exception:
-        Path(temp_path).unlink(missing_ok=True)
-        raise
+    # Forks share the session's object store with the main timeline
+    _save_checkpoint_file(state, checkpoint_path, session_id)
 
     # Update fork metadata in registry
     registry = load_fork_registry(session_id)
@@ -1521,8 +2128,15 @@ def load_fork_checkpoint(
 
     try:
         json_content = checkpoint_path.read_text(encoding="utf-8")
-        return deserialize_game_state(json_content)
-    except (json.JSONDecodeError, KeyError, TypeError, AttributeError, ValidationError):
+        return deserialize_game_state(json_content, get_object_store_dir(session_id))
+    except (
+        json.JSONDecodeError,
+        KeyError,
+        TypeError,
+        AttributeError,
+        ValueError,
+        OSError,
+    ):
         return None
 
 
@@ -1654,6 +2268,9 @@ def delete_fork(
     registry.forks = [f for f in registry.forks if f.fork_id != fork_id]
     save_fork_registry(session_id, registry)
 
+    # Drop section blobs only the deleted fork referenced
+    collect_garbage(session_id)
+
     return True
 
 
@@ -1679,7 +2296,8 @@ def promote_fork(session_id: str, fork_id: str) -> int:
     4. Copy promoted fork's post-branch checkpoints to main directory
     5. Delete excess main checkpoints not covered by the fork
     6. Remove promoted fork from registry and delete its directory
-    7. Return latest turn number on new main timeline
+    7. Garbage-collect section blobs no checkpoint references
+    8. Return latest turn number on new main timeline
 
     Args:
         session_id: Session ID string.
@@ -1790,6 +2408,9 @@ def promote_fork(session_id: str, fork_id: str) -> int:
     # Step 6: Save updated registry
     save_fork_registry(session_id, registry)
 
+    # Step 7: Drop section blobs only the deleted checkpoints referenced
+    collect_garbage(session_id)
+
     # Return latest checkpoint on new main timeline
     latest = get_latest_checkpoint(session_id)
     return latest if latest is not None else branch_turn
@@ -1845,6 +2466,9 @@ def collapse_all_forks(session_id: str) -> int:
     if registry_path.exists():
         registry_path.unlink()
 
+    # Drop section blobs only the deleted forks referenced
+    collect_garbage(session_id)
+
     return fork_count
 
 
@@ -1853,7 +2477,9 @@ def collapse_all_forks(session_id: str) -> int:
 # =============================================================================
 
 
-def load_timeline_log_at_turn(session_id: str, turn_number: int) -> list[str] | None:
+def load_timeline_log_at_turn(
+    session_id: str, turn_number: int
+) -> Sequence[str] | None:
     """Load the ground_truth_log from a main timeline checkpoint.
 
     Story 12.3: Fork Comparison View.
@@ -1874,7 +2500,7 @@ def load_timeline_log_at_turn(session_id: str, turn_number: int) -> list[str] |
 
 def load_fork_log_at_turn(
     session_id: str, fork_id: str, turn_number: int
-) -> list[str] | None:
+) -> Sequence[str] | None:
     """Load the ground_truth_log from a fork checkpoint.
 
     Story 12.3: Fork Comparison View.
@@ -1895,7 +2521,7 @@ def load_fork_log_at_turn(
 
 
 def extract_turns_from_logs(
-    logs_by_checkpoint: dict[int, list[str]], start_turn: int
+    logs_by_checkpoint: Mapping[int, Sequence[str]], start_turn: int
 ) -> list[ComparisonTurn]:
     """Extract per-turn entries by diffing consecutive checkpoint logs.
 
@@ -1935,7 +2561,7 @@ def extract_turns_from_logs(
             prev_log_len = len(log)
         else:
             # Subsequent turns: entries added since previous checkpoint
-            entries = log[prev_log_len:]
+            entries = list(log[prev_log_len:])
             prev_log_len = len(log)
 
         result.append(
@@ -1950,7 +2576,7 @@ def extract_turns_from_logs(
 
 
 def extract_turns_from_single_log(
-    log: list[str], branch_log_count: int, total_turns: int
+    log: Sequence[str], branch_log_count: int, total_turns: int
 ) -> list[ComparisonTurn]:
     """Extract turns from a single log snapshot (fallback).
 
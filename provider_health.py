@@ -0,0 +1,455 @@
+"""Shared LLM provider health: circuit breakers and background probes.
+
+Every agent LLM call reports its outcome here (agents._invoke_llm). A
+per-provider circuit breaker opens after consecutive timeouts, rate
+limits or network errors, so later calls fail immediately instead of
+waiting out another client timeout. After a cooldown the breaker goes
+half-open: one trial call (or background probe) decides whether it
+closes again or stays open for another cooldown.
+
+Game engines consult the cached status before each round instead of
+probing providers themselves. ProviderHealthMonitor, started by the API,
+probes the providers in use on a fixed interval with cheap requests
+(Ollama's model list, the Gemini and Anthropic model list endpoints), so
+an outage is noticed between rounds rather than at the next LLM call.
+
+Tuned with ``provider_probe_interval``, ``circuit_breaker_threshold`` and
+``circuit_breaker_cooldown`` in config/defaults.yaml.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+logger = logging.getLogger("autodungeon")
+
+__all__ = [
+    "CircuitBreaker",
+    "PROBE_TIMEOUT",
+    "ProviderHealth",
+    "ProviderHealthMonitor",
+    "ProviderUnavailableError",
+    "TRIPPING_ERROR_TYPES",
+    "get_provider_health",
+    "reset_provider_health",
+]
+
+# Error categories (agents.categorize_error) that count toward opening a
+# breaker. Auth and response-format errors are not transient, so they do not.
+TRIPPING_ERROR_TYPES = frozenset({"timeout", "rate_limit", "network_error"})
+
+# Seconds to wait for a health probe response
+PROBE_TIMEOUT = 5.0
+
+
+class ProviderUnavailableError(Exception):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+    def __init__(self, provider: str, error_type: str, retry_after: float) -> None:
+        """Initialize the error.
+
+        Args:
+            provider: The unavailable provider.
+            error_type: Error category that opened the breaker.
+            retry_after: Seconds until the breaker allows a trial call.
+        """
+        self.provider = provider
+        self.error_type = error_type
+        self.retry_after = retry_after
+        # The message keeps the error category so categorize_error() maps
+        # this back to the failure that opened the breaker.
+        super().__init__(
+            f"{provider} unavailable after repeated {error_type} failures "
+            f"(circuit open, retry in {retry_after:.0f}s)"
+        )
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one provider.
+
+    States: "closed" (calls allowed), "open" (calls rejected until the
+    cooldown elapses) and "half_open" (one trial call allowed per
+    cooldown; success closes the breaker, failure re-opens it).
+
+    Attributes:
+        failure_threshold: Consecutive tripping failures that open it.
+        cooldown: Seconds the breaker stays open before half-opening.
+        consecutive_failures: Tripping failures since the last success.
+        last_error_type: Category of the most recent tripping failure.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive tripping failures that open it.
+            cooldown: Seconds the breaker stays open before half-opening.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.consecutive_failures = 0
+        self.last_error_type = ""
+        self._clock = clock
+        self._opened_at: float | None = None
+        self._trial_started: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at < self.cooldown:
+            return "open"
+        return "half_open"
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the breaker half-opens (0 unless open)."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self.cooldown - (self._clock() - self._opened_at))
+
+    def is_available(self) -> bool:
+        """Whether calls would currently be attempted (not open)."""
+        return self.state != "open"
+
+    def allow_request(self) -> bool:
+        """Decide whether a call may go ahead, claiming the half-open trial.
+
+        Returns:
+            True when closed, or when half-open and no trial call has
+            started within the last cooldown; False otherwise.
+        """
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "open":
+                return False
+            now = self._clock()
+            # A trial that never reported back (e.g. a cancelled round)
+            # stops blocking others after one cooldown.
+            if (
+                self._trial_started is not None
+                and now - self._trial_started < self.cooldown
+            ):
+                return False
+            self._trial_started = now
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful call or probe, closing the breaker."""
+        with self._lock:
+            self.consecutive_failures = 0
+            self._opened_at = None
+            self._trial_started = None
+
+    def record_failure(self, error_type: str) -> None:
+        """Record a failed call or probe.
+
+        Args:
+            error_type: Error category; only TRIPPING_ERROR_TYPES count.
+        """
+        if error_type not in TRIPPING_ERROR_TYPES:
+            return
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_error_type = error_type
+            if (
+                self._state() == "half_open"
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._trial_started = None
+
+
+class ProviderHealth:
+    """Registry of per-provider circuit breakers and probe timestamps.
+
+    Thread-safe: LLM calls report from graph worker threads while engines
+    read status on the API event loop.
+
+    Attributes:
+        probe_interval: Seconds between probes of a watched provider.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        probe_interval: float = 30.0,
+    ) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            failure_threshold: Breaker failure threshold for each provider.
+            cooldown: Breaker cooldown in seconds for each provider.
+            probe_interval: Seconds between probes of a watched provider.
+        """
+        self.probe_interval = probe_interval
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._watched: set[str] = set()
+        self._last_probe: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        """Get (creating if needed) the breaker for a provider."""
+        provider = provider.lower()
+        with self._lock:
+            breaker = self._breakers.get(provider)
+            if breaker is None:
+                breaker = CircuitBreaker(self._failure_threshold, self._cooldown)
+                self._breakers[provider] = breaker
+            return breaker
+
+    def watch(self, providers: Iterable[str]) -> None:
+        """Add providers to the set probed by the background monitor."""
+        with self._lock:
+            self._watched.update(p.lower() for p in providers if p)
+
+    @property
+    def watched(self) -> frozenset[str]:
+        """Providers probed by the background monitor."""
+        with self._lock:
+            return frozenset(self._watched)
+
+    def allow_request(self, provider: str) -> bool:
+        """Whether a call to provider may go ahead (see CircuitBreaker)."""
+        return self.breaker(provider).allow_request()
+
+    def record_success(self, provider: str) -> None:
+        """Record a successful call to provider."""
+        breaker = self.breaker(provider)
+        if breaker.state != "closed":
+            logger.info("Circuit closed for %s", provider)
+        breaker.record_success()
+
+    def record_failure(self, provider: str, error_type: str) -> None:
+        """Record a failed call to provider.
+
+        Args:
+            provider: Provider name.
+            error_type: Error category from agents.categorize_error().
+        """
+        breaker = self.breaker(provider)
+        breaker.record_failure(error_type)
+        if breaker.state == "open":
+            logger.warning(
+                "Circuit open for %s after %d consecutive %s failures",
+                provider,
+                breaker.consecutive_failures,
+                error_type,
+            )
+
+    def first_unavailable(self, providers: Iterable[str]) -> str | None:
+        """Return the first provider whose breaker is open, if any.
+
+        Args:
+            providers: Providers to check.
+
+        Returns:
+            An unavailable provider name, or None if all may be called.
+        """
+        for provider in providers:
+            if not self.breaker(provider).is_available():
+                return provider.lower()
+        return None
+
+    def is_stale(self, provider: str) -> bool:
+        """Whether provider has not been probed within probe_interval."""
+        with self._lock:
+            last = self._last_probe.get(provider.lower())
+        return last is None or time.monotonic() - last >= self.probe_interval
+
+    async def probe(self, provider: str, client: Any | None = None) -> bool | None:
+        """Probe a provider and feed the result to its breaker.
+
+        An open breaker is not probed until its cooldown has elapsed; the
+        probe then serves as the half-open trial.
+
+        Args:
+            provider: Provider name.
+            client: Shared httpx.AsyncClient; a temporary one if None.
+
+        Returns:
+            True if healthy, False if the probe failed, None if the provider
+            was not probed (no probe target, or breaker still open).
+        """
+        import httpx
+
+        provider = provider.lower()
+        request = await asyncio.to_thread(_probe_request, provider)
+        if request is None:
+            return None
+        breaker = self.breaker(provider)
+        if breaker.state != "closed" and not breaker.allow_request():
+            return None
+        with self._lock:
+            self._last_probe[provider] = time.monotonic()
+
+        url, headers = request
+        try:
+            if client is None:
+                async with httpx.AsyncClient(timeout=PROBE_TIMEOUT) as temp_client:
+                    resp = await temp_client.get(url, headers=headers)
+            else:
+                resp = await client.get(url, headers=headers, timeout=PROBE_TIMEOUT)
+        except httpx.TimeoutException:
+            error_type = "timeout"
+        except httpx.HTTPError:
+            error_type = "network_error"
+        else:
+            if resp.status_code == 429:
+                error_type = "rate_limit"
+            elif resp.status_code >= 500:
+                error_type = "network_error"
+            else:
+                # Any other answer (including 401/403) means the service is
+                # up; key problems surface from the calls themselves.
+                self.record_success(provider)
+                return True
+        logger.warning("Health probe failed for %s: %s", provider, error_type)
+        self.record_failure(provider, error_type)
+        return False
+
+    async def refresh(
+        self, providers: Iterable[str], client: Any | None = None
+    ) -> None:
+        """Probe whichever of providers are stale, concurrently.
+
+        Args:
+            providers: Providers to refresh.
+            client: Shared httpx.AsyncClient; temporary clients if None.
+            Does nothing when probe_interval is 0 (probes disabled).
+        """
+        if self.probe_interval <= 0:
+            return
+        stale = [p for p in providers if self.is_stale(p)]
+        if stale:
+            await asyncio.gather(*(self.probe(p, client) for p in stale))
+
+
+def _probe_request(provider: str) -> tuple[str, dict[str, str]] | None:
+    """Build the probe URL and headers for a provider.
+
+    Returns:
+        (url, headers), or None if the provider cannot be probed (unknown
+        provider or no API key configured).
+    """
+    from agents import _get_effective_api_key
+    from config import get_config
+
+    if provider == "ollama":
+        base_url = _get_effective_api_key("ollama") or get_config().ollama_base_url
+        return f"{base_url.rstrip('/')}/api/tags", {}
+    if provider == "gemini":
+        key = _get_effective_api_key("google")
+        if not key:
+            return None
+        return (
+            "https://generativelanguage.googleapis.com/v1beta/models?pageSize=1",
+            {"x-goog-api-key": key},
+        )
+    if provider == "claude":
+        key = _get_effective_api_key("anthropic")
+        if not key:
+            return None
+        return (
+            "https://api.anthropic.com/v1/models?limit=1",
+            {"x-api-key": key, "anthropic-version": "2023-06-01"},
+        )
+    return None
+
+
+class ProviderHealthMonitor:
+    """Background task that keeps watched providers' health fresh."""
+
+    def __init__(self, health: ProviderHealth) -> None:
+        """Initialize the monitor.
+
+        Args:
+            health: Registry whose watched providers are probed.
+        """
+        self._health = health
+        self._task: asyncio.Task[None] | None = None
+        self._client: Any | None = None
+
+    async def start(self) -> None:
+        """Start probing on the running event loop."""
+        if self._task is not None:
+            return
+        import httpx
+
+        self._client = httpx.AsyncClient(timeout=PROBE_TIMEOUT)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop probing and close the shared HTTP client."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _run(self) -> None:
+        # Wake often enough to probe each provider close to its interval
+        tick = max(1.0, self._health.probe_interval / 4)
+        while True:
+            try:
+                await self._health.refresh(self._health.watched, self._client)
+            except Exception:
+                logger.exception("Provider health probe failed")
+            await asyncio.sleep(tick)
+
+
+_health: ProviderHealth | None = None
+_health_lock = threading.Lock()
+
+
+def get_provider_health() -> ProviderHealth:
+    """Get the process-wide provider health registry.
+
+    Created on first use from the application config.
+    """
+    global _health
+    with _health_lock:
+        if _health is None:
+            from config import get_config
+
+            config = get_config()
+            _health = ProviderHealth(
+                failure_threshold=config.circuit_breaker_threshold,
+                cooldown=config.circuit_breaker_cooldown,
+                probe_interval=config.provider_probe_interval,
+            )
+        return _health
+
+
+def reset_provider_health() -> None:
+    """Discard the registry so the next use starts fresh (for tests)."""
+    global _health
+    with _health_lock:
+        _health = None
@@ -27,6 +27,38 @@ def reset_config_singleton() -> Generator[None, None, None]:
     config_module._config = None
 
 
+@pytest.fixture(autouse=True)
+def reset_provider_health() -> Generator[None, None, None]:
+    """Give each test fresh provider circuit breakers.
+
+    Tests that simulate LLM timeouts would otherwise open a breaker that
+    fails later tests' calls immediately.
+    """
+    import provider_health
+
+    provider_health.reset_provider_health()
+    yield
+    provider_health.reset_provider_health()
+
+
+@pytest.fixture(autouse=True)
+def isolate_scene_prompt_cache(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[None, None, None]:
+    """Give each test an empty scene prompt cache outside the repo.
+
+    Otherwise tests that mock the prompt-building LLM would be served
+    prompts cached by earlier tests, and would write into .cache/.
+    """
+    import image_gen
+
+    image_gen.clear_scene_prompt_cache()
+    cache_dir = tmp_path_factory.mktemp("scene_prompts")
+    with patch("image_gen.SCENE_PROMPT_CACHE_DIR", cache_dir):
+        yield
+    image_gen.clear_scene_prompt_cache()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def protect_user_settings_file() -> Generator[None, None, None]:
     """Backup and restore user-settings.yaml across the entire test session.
@@ -309,6 +309,13 @@ class TestModuleExports:
             "MODULE_DISCOVERY_MAX_RETRIES",
             "discover_modules",
             "_parse_module_json",
+            # Module discovery cache
+            "MODULE_DISCOVERY_CACHE_DIR",
+            "MODULE_DISCOVERY_CACHE_TTL",
+            "MODULE_DISCOVERY_PROMPT_VERSION",
+            "discover_modules_cached",
+            "prewarm_module_discovery",
+            "clear_module_discovery_cache",
             # Story 7.3: Module Context Injection
             "format_module_context",
             # Story 8.3: Character Sheet Context Injection
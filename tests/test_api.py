@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from collections.abc import AsyncIterator, Generator
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import yaml
@@ -173,6 +173,16 @@ class TestHealthEndpoint:
         data = resp.json()
         assert set(data.keys()) == {"status", "version"}
 
+    @pytest.mark.anyio
+    async def test_metrics_endpoint(self, client: AsyncClient) -> None:
+        """Metrics endpoint serves the Prometheus text format."""
+        resp = await client.get("/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE autodungeon_llm_request_duration_seconds histogram" in (
+            resp.text
+        )
+
 
 # =============================================================================
 # Session List Endpoint Tests
@@ -828,6 +838,56 @@ class TestCharacterDetailEndpoint:
         assert set(data.keys()) == expected_fields
 
 
+class TestCharacterLibraryRegistry:
+    """Tests for the cached character library index in api.routes."""
+
+    def test_unchanged_files_are_not_reparsed(self, temp_characters_dir: Path) -> None:
+        """A second lookup reuses parsed entries for settled files."""
+        from api import routes
+
+        with patch.object(routes, "_LIBRARY_RACY_SECONDS", 0.0):
+            routes._library_index()
+            with patch(
+                "api.routes._parse_library_file", wraps=routes._parse_library_file
+            ) as mock_parse:
+                index = routes._library_index()
+
+        assert "eden" in index
+        mock_parse.assert_not_called()
+
+    def test_external_edit_is_picked_up(self, temp_characters_dir: Path) -> None:
+        """Editing a file outside the API refreshes its entry."""
+        from api import routes
+
+        yaml_file = temp_characters_dir / "library" / "eden.yaml"
+        assert routes._load_library_backstory("eden") == ""
+
+        data = yaml.safe_load(yaml_file.read_text(encoding="utf-8"))
+        data["backstory"] = "Raised by a coven of hags."
+        yaml_file.write_text(yaml.safe_dump(data), encoding="utf-8")
+
+        assert routes._load_library_backstory("eden") == "Raised by a coven of hags."
+
+    def test_deleted_file_drops_out(self, temp_characters_dir: Path) -> None:
+        """Removing a file removes the character from the index."""
+        from api import routes
+
+        assert "eden" in routes._load_library_characters()
+        (temp_characters_dir / "library" / "eden.yaml").unlink()
+
+        assert "eden" not in routes._load_library_characters()
+
+    def test_invalid_character_still_locatable(self, temp_characters_dir: Path) -> None:
+        """Files that fail validation are not listed but can be found by name."""
+        from api import routes
+
+        bad_file = temp_characters_dir / "library" / "broken.yaml"
+        bad_file.write_text(yaml.safe_dump({"name": "Broken"}), encoding="utf-8")
+
+        assert "broken" not in routes._load_library_characters()
+        assert routes._find_library_file("broken") == bad_file
+
+
 # =============================================================================
 # CORS Tests
 # =============================================================================
@@ -1867,6 +1927,59 @@ class TestCheckpointEndpoints:
         assert resp.status_code == 404
 
 
+# =============================================================================
+# Transcript Search Endpoint Tests
+# =============================================================================
+
+
+class TestTranscriptSearchEndpoint:
+    """Tests for GET /api/sessions/{id}/search."""
+
+    @pytest.mark.anyio
+    async def test_search_returns_hits(
+        self, client: AsyncClient, temp_campaigns_dir: Path
+    ) -> None:
+        """Returns ranked hits with turn numbers and snippets."""
+        from models import TranscriptEntry
+        from persistence import append_transcript_entry
+
+        _create_test_session(temp_campaigns_dir, session_id="001")
+        for turn, content in enumerate(["The docks.", "Kalia waves hello."], 1):
+            append_transcript_entry(
+                "001",
+                TranscriptEntry(
+                    turn=turn,
+                    timestamp="2026-01-01T00:00:00Z",
+                    agent="dm",
+                    content=content,
+                ),
+            )
+
+        resp = await client.get("/api/sessions/001/search", params={"q": "kalia"})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["query"] == "kalia"
+        assert len(data["hits"]) == 1
+        assert data["hits"][0]["turn"] == 2
+        assert data["hits"][0]["agent"] == "dm"
+        assert "**Kalia**" in data["hits"][0]["snippet"]
+
+    @pytest.mark.anyio
+    async def test_search_rejects_bad_params(
+        self, client: AsyncClient, temp_campaigns_dir: Path
+    ) -> None:
+        """Returns 400 for an empty query or out-of-range limit, 404 for no session."""
+        _create_test_session(temp_campaigns_dir, session_id="001")
+        resp = await client.get("/api/sessions/001/search", params={"q": " "})
+        assert resp.status_code == 400
+        resp = await client.get(
+            "/api/sessions/001/search", params={"q": "x", "limit": 0}
+        )
+        assert resp.status_code == 400
+        resp = await client.get("/api/sessions/999/search", params={"q": "x"})
+        assert resp.status_code == 404
+
+
 # =============================================================================
 # Character Sheet Endpoint Tests (Story 16-10)
 # =============================================================================
@@ -1938,6 +2051,51 @@ class TestCharacterSheetEndpoint:
         assert data["hit_points_current"] == 40
         assert data["strength_modifier"] == 3
 
+    @pytest.mark.anyio
+    async def test_character_sheet_served_from_running_engine(
+        self, client: AsyncClient, temp_campaigns_dir: Path
+    ) -> None:
+        """Uses the live engine state instead of reading a checkpoint."""
+        from models import CharacterSheet
+
+        _create_test_session(temp_campaigns_dir, session_id="001")
+        state = create_initial_game_state()
+        state["character_sheets"] = {
+            "fighter": CharacterSheet(
+                name="Thorin",
+                race="Dwarf",
+                character_class="Fighter",
+                level=6,
+                strength=16,
+                dexterity=12,
+                constitution=14,
+                intelligence=10,
+                wisdom=13,
+                charisma=8,
+                armor_class=18,
+                hit_points_max=52,
+                hit_points_current=52,
+                hit_dice="6d10",
+                hit_dice_remaining=6,
+            )
+        }
+        mock_engine = MagicMock()
+        mock_engine.state = state
+
+        if not hasattr(app.state, "engines"):
+            app.state.engines = {}
+        original = dict(app.state.engines)
+        app.state.engines["001"] = mock_engine
+        try:
+            with patch("api.routes.load_latest_checkpoint_cached") as mock_load:
+                resp = await client.get("/api/sessions/001/character-sheets/fighter")
+        finally:
+            app.state.engines = original
+
+        assert resp.status_code == 200
+        assert resp.json()["level"] == 6
+        mock_load.assert_not_called()
+
     @pytest.mark.anyio
     async def test_character_sheet_invalid_session(
         self, client: AsyncClient, temp_campaigns_dir: Path
@@ -2355,6 +2513,31 @@ class TestModuleDiscovery:
         assert len(data["modules"]) == 0
         assert data["error"] is not None
 
+    @pytest.mark.anyio
+    async def test_discover_modules_cached_source(self, client: AsyncClient) -> None:
+        """Module discovery reports source='cache' for cached results."""
+        from models import ModuleDiscoveryResult, ModuleInfo
+
+        cached_result = ModuleDiscoveryResult(
+            modules=[
+                ModuleInfo(number=1, name="Tomb of Horrors", description="Deadly.")
+            ],
+            provider="gemini",
+            model="gemini-1.5-flash",
+            timestamp="2026-01-01T00:00:00Z",
+            cached=True,
+        )
+
+        with patch(
+            "api.routes.asyncio.to_thread", return_value=cached_result
+        ) as to_thread:
+            resp = await client.post("/api/modules/discover?refresh=true")
+
+        assert resp.status_code == 200
+        assert resp.json()["source"] == "cache"
+        # refresh flag is passed through as force_refresh
+        assert to_thread.call_args.args[2] is True
+
     @pytest.mark.anyio
     async def test_discover_modules_config_error(self, client: AsyncClient) -> None:
         """Module discovery returns error when DM config fails to load."""
@@ -633,6 +633,47 @@ class TestParseLogEntry:
         assert msg.message_type == "pc_dialogue"
 
 
+class TestParsedEntryCache:
+    """Tests for the shared parsed-entry cache (parse_entry)."""
+
+    def test_parse_entry_compact_form(self) -> None:
+        """Agent, content and segments are parsed into plain tuples."""
+        from models import parse_entry
+
+        parsed = parse_entry('[rogue]: "Quiet." *She slips away.*')
+        assert parsed.agent == "rogue"
+        assert parsed.content == '"Quiet." *She slips away.*'
+        assert parsed.segments == (
+            ("dialogue", "Quiet."),
+            ("narration", " "),
+            ("action", "She slips away."),
+        )
+        assert parsed.message_type == "pc_dialogue"
+
+    def test_parse_entry_matches_parse_log_entry(self) -> None:
+        """The cached parse agrees with parse_log_entry and parse_message_content."""
+        from models import parse_entry, parse_log_entry, parse_message_content
+
+        for entry in ["[SHEET]: HP 10/12", "No prefix", "[dm]: [dm]: Echoed"]:
+            parsed = parse_entry(entry)
+            message = parse_log_entry(entry)
+            assert (parsed.agent, parsed.content) == (message.agent, message.content)
+            assert parsed.message_type == message.message_type
+            assert [
+                (s.segment_type, s.text) for s in parse_message_content(parsed.content)
+            ] == list(parsed.segments)
+
+    def test_parse_entry_cached_by_index_and_text(self) -> None:
+        """Repeat parses of an entry reuse the cached result."""
+        from models import clear_parsed_entry_cache, parse_entry
+
+        clear_parsed_entry_cache()
+        first = parse_entry("[dm]: The door creaks.", 3)
+        assert parse_entry("[dm]: The door creaks.", 3) is first
+        # A different entry at the same index is parsed afresh
+        assert parse_entry("[dm]: The door slams.", 3).content == "The door slams."
+
+
 class TestParseMessageContent:
     """Tests for parse_message_content function (Story 2.3, Task 1.3)."""
 
@@ -2730,6 +2771,137 @@ class TestAutopilotLoop:
         assert DEFAULT_MAX_TURNS_PER_SESSION == 100
 
 
+class TestEngineBackedRounds:
+    """Tests for running rounds on the background GameEngine."""
+
+    def test_run_game_turn_starts_engine_round(self) -> None:
+        """run_game_turn hands the round to the engine and returns at once."""
+        from models import populate_game_state
+
+        game = populate_game_state(include_sample_messages=False)
+        mock_session_state = {"game": game, "engine_backed": True}
+
+        with (
+            patch("streamlit.session_state", mock_session_state),
+            patch("app.get_engine_host") as mock_host,
+            patch("app.run_single_round") as mock_run,
+        ):
+            mock_host.return_value.start_round.return_value = True
+            from app import run_game_turn
+
+            assert run_game_turn() is True
+
+        mock_run.assert_not_called()
+        mock_host.return_value.start_round.assert_called_once_with(
+            game.get("session_id", "001"), game
+        )
+        assert mock_session_state["is_generating"] is True
+
+    def test_sync_engine_state_applies_finished_round(self) -> None:
+        """A finished round's state and error land in session state."""
+        from api.engine_host import EngineUpdate
+        from models import create_user_error, populate_game_state
+
+        game = populate_game_state(include_sample_messages=False)
+        result = {**game, "ground_truth_log": ["[DM]: The door creaks."]}
+        error = create_user_error(error_type="timeout", provider="gemini", agent="dm")
+        mock_session_state = {
+            "game": game,
+            "engine_backed": True,
+            "is_generating": False,
+            "engine_autopilot_started": True,
+            "is_autopilot_running": True,
+        }
+
+        with (
+            patch("streamlit.session_state", mock_session_state),
+            patch("app.get_engine_host") as mock_host,
+        ):
+            mock_host.return_value.poll.return_value = EngineUpdate(
+                state=result,  # type: ignore[arg-type]
+                new_entries=["[DM]: The door creaks."],
+                busy=False,
+                last_error=error,
+            )
+            from app import sync_engine_state
+
+            assert sync_engine_state() is True
+
+        assert mock_session_state["game"] is result
+        assert mock_session_state["error"] is error
+        assert mock_session_state["is_autopilot_running"] is False
+        assert mock_session_state["engine_autopilot_started"] is False
+
+    def test_sync_engine_state_idle_leaves_game(self) -> None:
+        """Without a round in flight the engine's state is not pulled."""
+        mock_session_state = {
+            "game": {"session_id": "001"},
+            "engine_backed": True,
+            "is_generating": False,
+        }
+
+        with (
+            patch("streamlit.session_state", mock_session_state),
+            patch("app.get_engine_host") as mock_host,
+        ):
+            from app import sync_engine_state
+
+            assert sync_engine_state() is False
+
+        mock_host.return_value.poll.assert_not_called()
+
+    def test_run_autopilot_step_starts_engine_autopilot_once(self) -> None:
+        """Autopilot starts on the engine without rerunning the script."""
+        mock_session_state = {
+            "is_autopilot_running": True,
+            "is_paused": False,
+            "human_active": False,
+            "autopilot_turn_count": 0,
+            "max_turns_per_session": 100,
+            "playback_speed": "fast",
+            "engine_backed": True,
+            "game": {"session_id": "001", "turn_queue": ["dm"]},
+        }
+
+        with (
+            patch("streamlit.session_state", mock_session_state),
+            patch("app.get_engine_host") as mock_host,
+            patch("streamlit.rerun") as mock_rerun,
+        ):
+            mock_host.return_value.start_autopilot.return_value = True
+            from app import run_autopilot_step
+
+            run_autopilot_step()
+            run_autopilot_step()
+
+        mock_host.return_value.start_autopilot.assert_called_once_with(
+            "001", mock_session_state["game"], "fast", 100
+        )
+        mock_rerun.assert_not_called()
+        assert mock_session_state["engine_autopilot_started"] is True
+
+    def test_run_autopilot_step_stops_engine_when_paused(self) -> None:
+        """Pausing stops the engine's autopilot."""
+        mock_session_state = {
+            "is_autopilot_running": True,
+            "is_paused": True,
+            "engine_backed": True,
+            "engine_autopilot_started": True,
+            "game": {"session_id": "001"},
+        }
+
+        with (
+            patch("streamlit.session_state", mock_session_state),
+            patch("app.get_engine_host") as mock_host,
+        ):
+            from app import run_autopilot_step
+
+            run_autopilot_step()
+
+        mock_host.return_value.stop_autopilot.assert_called_once_with("001")
+        assert mock_session_state["is_autopilot_running"] is False
+
+
 class TestAutopilotToggle:
     """Tests for autopilot toggle button (Story 3.1, Task 3)."""
 
@@ -0,0 +1,141 @@
+"""Tests for the replay-based benchmark harness (benchmarks/)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+class TestReplayScript:
+    """Tests for ReplayScript and ReplayChatModel."""
+
+    def test_replays_in_order_and_wraps(self) -> None:
+        """Test responses are returned in order and cycle when exhausted."""
+        from benchmarks.replay import ReplayScript
+
+        script = ReplayScript("dm", [{"content": "one"}, {"content": "two"}])
+        contents = [script.next_message().content for _ in range(3)]
+        assert contents == ["one", "two", "one"]
+        assert script.calls == 3
+
+    def test_tool_calls_get_unique_deterministic_ids(self) -> None:
+        """Test recorded tool calls are replayed with stable, unique IDs."""
+        from benchmarks.replay import ReplayScript
+
+        recorded = {
+            "content": "",
+            "tool_calls": [{"name": "dm_roll_dice", "args": {"notation": "1d20"}}],
+        }
+        script = ReplayScript("dm", [recorded])
+        first = script.next_message()
+        second = script.next_message()
+        assert first.tool_calls[0]["name"] == "dm_roll_dice"
+        assert first.tool_calls[0]["args"] == {"notation": "1d20"}
+        assert first.tool_calls[0]["id"] != second.tool_calls[0]["id"]
+
+    def test_empty_recording_rejected(self) -> None:
+        """Test a role with no responses raises ValueError."""
+        from benchmarks.replay import ReplayScript
+
+        with pytest.raises(ValueError):
+            ReplayScript("dm", [])
+
+    def test_chat_model_bind_tools_returns_self(self) -> None:
+        """Test bind_tools is a no-op and invoke replays the script."""
+        from langchain_core.messages import HumanMessage
+
+        from benchmarks.replay import ReplayChatModel, ReplayScript
+
+        model = ReplayChatModel(script=ReplayScript("pc", [{"content": "hi"}]))
+        assert model.bind_tools([]) is model
+        assert model.invoke([HumanMessage(content="go")]).content == "hi"
+
+    def test_replay_llms_routes_by_model_name(self) -> None:
+        """Test get_llm is patched in agents and memory while active."""
+        import agents
+        import memory
+        from benchmarks.replay import ReplayChatModel, load_recording, replay_llms
+
+        with replay_llms(load_recording()):
+            assert isinstance(agents.get_llm("claude", "replay-dm"), ReplayChatModel)
+            assert isinstance(
+                memory.get_llm("claude", "replay-summarizer"), ReplayChatModel
+            )
+            with pytest.raises(ValueError):
+                agents.get_llm("claude", "replay-unknown")
+
+    def test_load_recording_rejects_non_object(self, tmp_path: Path) -> None:
+        """Test a recording that is not a JSON object raises ValueError."""
+        from benchmarks.replay import load_recording
+
+        path = tmp_path / "bad.json"
+        path.write_text(json.dumps([{"content": "x"}]))
+        with pytest.raises(ValueError):
+            load_recording(path)
+
+
+class TestSyntheticCampaign:
+    """Tests for build_synthetic_campaign."""
+
+    def test_campaign_has_requested_length(self) -> None:
+        """Test the log is pre-populated to the requested turn count."""
+        from benchmarks.harness import build_synthetic_campaign
+
+        state = build_synthetic_campaign(50)
+        assert len(state["ground_truth_log"]) == 50
+        assert state["dm_config"].model == "replay-dm"
+        assert all(c.model == "replay-pc" for c in state["characters"].values())
+
+
+class TestBenchmarkRuns:
+    """Smoke tests for the graph and engine drivers."""
+
+    def test_graph_benchmark_reports_timings(self) -> None:
+        """Test a graph run records node, I/O and round timings."""
+        from benchmarks.harness import run_graph_benchmark
+
+        result = run_graph_benchmark(10, rounds=1)
+
+        assert len(result.round_times) == 1
+        assert "node:dm" in result.timings
+        assert "node:context_manager" in result.timings
+        assert "io:checkpoint_save" in result.timings
+        assert "io:transcript_append" in result.timings
+        assert result.llm_calls["dm"] >= 1
+        assert result.llm_calls["pc"] >= 1
+
+    def test_graph_benchmark_is_deterministic(self) -> None:
+        """Test two runs replay the same number of LLM calls."""
+        from benchmarks.harness import run_graph_benchmark
+
+        first = run_graph_benchmark(30, rounds=2)
+        second = run_graph_benchmark(30, rounds=2)
+        assert first.llm_calls == second.llm_calls
+
+    def test_engine_benchmark_completes_rounds(self) -> None:
+        """Test the autopilot driver runs the requested number of rounds."""
+        from benchmarks.harness import run_engine_benchmark
+
+        result = run_engine_benchmark(10, rounds=2)
+
+        assert len(result.round_times) == 2
+        assert "engine:autopilot_total" in result.timings
+
+    def test_format_results(self) -> None:
+        """Test the text report includes driver and metric lines."""
+        from benchmarks.harness import BenchmarkResult, format_results
+
+        result = BenchmarkResult(
+            "graph",
+            10,
+            1,
+            round_times=[0.01],
+            timings={
+                "node:dm": {"count": 1, "total": 0.005, "mean": 0.005, "max": 0.005}
+            },
+            llm_calls={"dm": 2},
+        )
+        report = format_results([result])
+        assert "graph | 10 turns" in report
+        assert "node:dm" in report
+        assert "dm=2" in report
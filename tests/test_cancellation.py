@@ -0,0 +1,159 @@
+"""Tests for cooperative round cancellation (cancellation.py)."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from cancellation import (
+    CancellationToken,
+    RoundCancelled,
+    cancellation_scope,
+    check_cancelled,
+    current_token,
+    invoke_cancellable,
+)
+
+
+class _SlowModel:
+    """Runnable whose async call blocks until cancelled."""
+
+    def __init__(self) -> None:
+        self.aborted = False
+
+    def invoke(self, messages: object) -> str:
+        return "sync"
+
+    async def ainvoke(self, messages: object) -> str:
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            self.aborted = True
+            raise
+        return "async"
+
+
+class _LoopBoundModel:
+    """Runnable whose async client is tied to the loop it first runs on.
+
+    Mirrors ChatOllama's httpx AsyncClient, whose connection pool breaks
+    once the loop it was created on is closed.
+    """
+
+    def __init__(self) -> None:
+        self.loop: asyncio.AbstractEventLoop | None = None
+
+    def invoke(self, messages: object) -> str:
+        return "sync"
+
+    async def ainvoke(self, messages: object) -> str:
+        running = asyncio.get_running_loop()
+        if self.loop is None:
+            self.loop = running
+        elif self.loop is not running or self.loop.is_closed():
+            raise RuntimeError("Event loop is closed")
+        return "async"
+
+
+class TestCancellationToken:
+    """Tests for CancellationToken."""
+
+    def test_cancel_runs_callbacks_once(self) -> None:
+        """Callbacks run on the first cancel only and record the reason."""
+        token = CancellationToken()
+        callback = MagicMock()
+        token.add_callback(callback)
+
+        token.cancel("timeout")
+        token.cancel("stopped")
+
+        callback.assert_called_once()
+        assert token.cancelled
+        assert token.reason == "timeout"
+
+    def test_callback_added_after_cancel_runs_immediately(self) -> None:
+        """A late callback still runs."""
+        token = CancellationToken()
+        token.cancel()
+        callback = MagicMock()
+        token.add_callback(callback)
+        callback.assert_called_once()
+
+    def test_removed_callback_does_not_run(self) -> None:
+        """The function returned by add_callback unregisters it."""
+        token = CancellationToken()
+        callback = MagicMock()
+        remove = token.add_callback(callback)
+        remove()
+        token.cancel()
+        callback.assert_not_called()
+
+
+class TestCancellationScope:
+    """Tests for the current-token context."""
+
+    def test_scope_sets_and_restores_token(self) -> None:
+        """The token is current only inside the scope."""
+        token = CancellationToken()
+        with cancellation_scope(token):
+            assert current_token() is token
+            check_cancelled()
+            token.cancel("stopped")
+            with pytest.raises(RoundCancelled, match="stopped"):
+                check_cancelled()
+        assert current_token() is None
+        check_cancelled()
+
+
+class TestInvokeCancellable:
+    """Tests for invoke_cancellable()."""
+
+    def test_without_token_uses_sync_invoke(self) -> None:
+        """Outside a round the sync invoke() path is unchanged."""
+        assert invoke_cancellable(_SlowModel(), []) == "sync"
+
+    def test_with_token_uses_async_invoke(self) -> None:
+        """Inside a round the model's ainvoke() is used."""
+        model = MagicMock()
+
+        async def ainvoke(messages: object) -> str:
+            return "async"
+
+        model.ainvoke = ainvoke
+        with cancellation_scope(CancellationToken()):
+            assert invoke_cancellable(model, []) == "async"
+        model.invoke.assert_not_called()
+
+    def test_same_model_reused_across_calls(self) -> None:
+        """A cached model keeps working across calls and rounds."""
+        model = _LoopBoundModel()
+        with cancellation_scope(CancellationToken()):
+            assert invoke_cancellable(model, []) == "async"
+            assert invoke_cancellable(model, []) == "async"
+        with cancellation_scope(CancellationToken()):
+            assert invoke_cancellable(model, []) == "async"
+
+    def test_cancel_aborts_in_flight_call(self) -> None:
+        """Cancelling from another thread aborts the request promptly."""
+        model = _SlowModel()
+        token = CancellationToken()
+        timer = threading.Timer(0.1, token.cancel, args=("timeout",))
+
+        start = time.monotonic()
+        timer.start()
+        with cancellation_scope(token), pytest.raises(RoundCancelled):
+            invoke_cancellable(model, [])
+
+        assert time.monotonic() - start < 5
+        assert model.aborted
+
+    def test_cancelled_token_skips_call(self) -> None:
+        """No request is made once the round is cancelled."""
+        model = MagicMock()
+        token = CancellationToken()
+        token.cancel()
+        with cancellation_scope(token), pytest.raises(RoundCancelled):
+            invoke_cancellable(model, [])
+        model.ainvoke.assert_not_called()
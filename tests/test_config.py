@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,6 +10,9 @@ import pytest
 import yaml
 from pydantic import ValidationError
 
+# conftest replaces config.save_user_settings with a mock for every test
+from config import save_user_settings as _save_user_settings
+
 
 class TestEnvironmentVariables:
     """Tests for environment variable loading."""
@@ -271,3 +275,97 @@ class TestCharacterConfigLoading:
                     load_character_configs()
                 assert "Invalid character config" in str(exc_info.value)
                 assert "badprovider.yaml" in str(exc_info.value)
+
+
+class TestConfigStore:
+    """Tests for the cached, versioned configuration store."""
+
+    @pytest.fixture
+    def settings_path(self, tmp_path: Path) -> Generator[Path, None, None]:
+        """Point user-settings.yaml at a temp file."""
+        path = tmp_path / "user-settings.yaml"
+        path.write_text("api_keys:\n  google: key-1\n", encoding="utf-8")
+        with patch("config.USER_SETTINGS_PATH", path):
+            yield path
+
+    def test_file_parsed_once_until_changed(self, settings_path: Path) -> None:
+        """Repeated reads are served without parsing the YAML again."""
+        from config import load_user_settings
+
+        assert load_user_settings()["api_keys"]["google"] == "key-1"
+        with patch("config.yaml.safe_load") as mock_load:
+            for _ in range(5):
+                load_user_settings()
+        mock_load.assert_not_called()
+
+    def test_change_bumps_version_and_notifies(self, settings_path: Path) -> None:
+        """Editing the file reloads it and notifies subscribers once."""
+        from config import get_config_store, load_user_settings
+
+        store = get_config_store()
+        load_user_settings()
+        version = store.version
+        events: list[tuple[str, int]] = []
+        unsubscribe = store.subscribe(lambda source, v: events.append((source, v)))
+        try:
+            settings_path.write_text("api_keys:\n  google: key-22\n", encoding="utf-8")
+            assert load_user_settings()["api_keys"]["google"] == "key-22"
+            assert store.version == version + 1
+            assert events == [("user_settings", version + 1)]
+
+            # Rewriting the same content is not a change
+            settings_path.write_text("api_keys:\n  google: key-22\n", encoding="utf-8")
+            load_user_settings()
+            assert store.version == version + 1
+        finally:
+            unsubscribe()
+
+    def test_snapshots_are_frozen(self, settings_path: Path) -> None:
+        """Store values are read-only; load_user_settings() returns a copy."""
+        from config import get_config_store, load_user_settings
+
+        snapshot = get_config_store().snapshot()
+        with pytest.raises(TypeError):
+            snapshot.user_settings["api_keys"]["google"] = "x"  # type: ignore[index]
+
+        settings = load_user_settings()
+        settings["api_keys"]["google"] = "x"
+        assert load_user_settings()["api_keys"]["google"] == "key-1"
+
+    def test_save_invalidates_cached_settings(self, settings_path: Path) -> None:
+        """Saving reloads the settings even if the file's stat is unchanged."""
+        from config import get_config_store, load_user_settings
+
+        load_user_settings()
+        stat = settings_path.stat()
+        _save_user_settings({"api_keys": {"google": "key-2"}})
+        os.utime(settings_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert get_config_store().user_settings()["api_keys"]["google"] == "key-2"
+
+    def test_dnd5e_getters_share_one_parse(self) -> None:
+        """The D&D 5e getters read the cached data file."""
+        from config import get_config_store, get_dnd5e_classes, get_dnd5e_races
+
+        get_config_store().dnd5e_data()
+        with patch("config.yaml.safe_load") as mock_load:
+            races = get_dnd5e_races()
+            get_dnd5e_classes()
+        mock_load.assert_not_called()
+
+        races.append({"id": "mutated"})
+        assert {"id": "mutated"} not in get_dnd5e_races()
+
+    def test_settings_change_drops_cached_llm_clients(
+        self, settings_path: Path
+    ) -> None:
+        """Cached summarizers are rebuilt with the new API key."""
+        import memory
+        from config import load_user_settings
+
+        load_user_settings()
+        memory._summarizer_cache[("gemini", "flash")] = MagicMock()
+        settings_path.write_text("api_keys:\n  google: key-3\n", encoding="utf-8")
+        load_user_settings()
+
+        assert memory._summarizer_cache == {}
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import threading
 from collections.abc import Generator
 from pathlib import Path
 from typing import Any
@@ -372,6 +373,88 @@ class TestTurnExecution:
         assert result["type"] == "error"
         assert started_engine.last_error is not None
 
+    @pytest.mark.anyio
+    async def test_run_turn_timeout_cancels_round(
+        self, started_engine: GameEngine
+    ) -> None:
+        """A round past ROUND_TIMEOUT is cancelled and makes no late writes."""
+        from cancellation import CancellationToken, RoundCancelled
+
+        tokens: list[CancellationToken] = []
+        late_state = _make_result_state(started_engine._state)  # type: ignore[arg-type]
+
+        def hanging_round(
+            state: GameState,
+            on_node_complete: Any,
+            cancel_token: CancellationToken,
+        ) -> dict[str, Any]:
+            tokens.append(cancel_token)
+            for _ in range(500):
+                if cancel_token.cancelled:
+                    on_node_complete(late_state)
+                    raise RoundCancelled(cancel_token.reason)
+                threading.Event().wait(0.01)
+            raise AssertionError("round was not cancelled")
+
+        started_engine.ROUND_TIMEOUT = 0.05  # type: ignore[assignment]
+        with patch("graph.run_single_round", side_effect=hanging_round):
+            result = await started_engine.run_turn()
+            # Let the worker thread observe the cancellation and unwind
+            await asyncio.sleep(0.1)
+
+        assert result["type"] == "error"
+        assert tokens[0].cancelled
+        assert tokens[0].reason == "timeout"
+        # The late node callback did not publish its state
+        assert len(started_engine.state["ground_truth_log"]) == 1  # type: ignore[index]
+
+    @pytest.mark.anyio
+    async def test_run_turn_skipped_when_provider_circuit_open(
+        self, started_engine: GameEngine
+    ) -> None:
+        """An open circuit for a session provider fails the round instantly."""
+        from provider_health import get_provider_health
+
+        dm_provider = started_engine._state["dm_config"].provider  # type: ignore[index]
+        health = get_provider_health()
+        for _ in range(health.breaker(dm_provider).failure_threshold):
+            health.record_failure(dm_provider, "rate_limit")
+
+        with patch("graph.run_single_round") as mock_round:
+            result = await started_engine.run_turn()
+
+        mock_round.assert_not_called()
+        assert result["type"] == "error"
+        assert started_engine.last_error is not None
+        assert started_engine.last_error.error_type == "rate_limit"
+
+    def test_session_providers_cached_and_watched(
+        self, started_engine: GameEngine
+    ) -> None:
+        """Providers are rescanned only when the party changes."""
+        from provider_health import get_provider_health
+
+        state = started_engine._state
+        assert state is not None
+        state["characters"] = {
+            "fighter": MagicMock(provider="ollama"),
+            "rogue": MagicMock(provider="gemini"),
+        }
+        pcs, _ = started_engine._session_providers()
+        assert pcs == {"ollama", "gemini"}
+        assert "ollama" in get_provider_health().watched
+        assert started_engine._get_turn_delay() == started_engine.OLLAMA_MIN_DELAY
+
+        # Same characters object: cached result, even if mutated in place
+        state["characters"]["fighter"] = MagicMock(provider="claude")
+        assert started_engine._session_providers()[0] == pcs
+
+        # New party: rescanned
+        state["characters"] = {"fighter": MagicMock(provider="claude")}
+        assert started_engine._session_providers()[0] == {"claude"}
+        started_engine._speed = "normal"
+        assert started_engine._get_turn_delay() == 1.0
+
     @pytest.mark.anyio
     async def test_run_turn_no_state_raises(self, engine: GameEngine) -> None:
         """run_turn raises RuntimeError if no state loaded."""
@@ -424,6 +507,22 @@ class TestTurnExecution:
         # Nudge should be cleared after successful turn
         assert started_engine.pending_nudge is None
 
+    @pytest.mark.anyio
+    async def test_nudge_during_turn_kept_for_next(
+        self, started_engine: GameEngine
+    ) -> None:
+        """A nudge submitted while a turn runs is not cleared by it."""
+
+        def nudge_mid_round(state: Any, *_: Any) -> dict[str, Any]:
+            started_engine.submit_nudge("Try the tavern")
+            return _make_result_state(state)
+
+        with patch("graph.run_single_round", side_effect=nudge_mid_round):
+            await started_engine.run_turn()
+
+        assert started_engine.pending_nudge == "Try the tavern"
+        assert started_engine.state.get("pending_nudge") is None  # type: ignore[union-attr]
+
     @pytest.mark.anyio
     async def test_is_generating_during_turn(self, started_engine: GameEngine) -> None:
         """is_generating is True while turn is executing."""
@@ -569,6 +668,37 @@ class TestAutopilot:
 
         assert started_engine.is_running is False
 
+    @pytest.mark.anyio
+    async def test_stop_autopilot_cancels_in_flight_round(
+        self, started_engine: GameEngine
+    ) -> None:
+        """stop_autopilot cancels the round that is currently running."""
+        from cancellation import CancellationToken, RoundCancelled
+
+        tokens: list[CancellationToken] = []
+        started = threading.Event()
+
+        def hanging_round(
+            state: GameState,
+            on_node_complete: Any,
+            cancel_token: CancellationToken,
+        ) -> dict[str, Any]:
+            tokens.append(cancel_token)
+            started.set()
+            for _ in range(500):
+                if cancel_token.cancelled:
+                    raise RoundCancelled(cancel_token.reason)
+                threading.Event().wait(0.01)
+            raise AssertionError("round was not cancelled")
+
+        with patch("graph.run_single_round", side_effect=hanging_round):
+            await started_engine.start_autopilot()
+            await asyncio.to_thread(started.wait, 5)
+            await started_engine.stop_autopilot()
+
+        assert tokens[0].cancelled
+        assert tokens[0].reason == "stopped"
+
     @pytest.mark.anyio
     async def test_stop_autopilot_clears_pause(
         self, started_engine: GameEngine
@@ -730,6 +860,49 @@ class TestAutopilot:
             assert started_engine.is_running
             await started_engine.stop_autopilot()
 
+    @pytest.mark.anyio
+    async def test_autopilot_broadcasts_pacing(
+        self, engine_with_broadcast: GameEngine, broadcast_events: list[dict[str, Any]]
+    ) -> None:
+        """Each round is followed by a pacing event with a projected finish."""
+        engine_with_broadcast._max_turns = 2
+
+        def round_result(state: Any, *args: Any) -> dict[str, Any]:
+            return _make_result_state(state)
+
+        with patch("graph.run_single_round", side_effect=round_result):
+            await engine_with_broadcast.start_autopilot(speed="adaptive")
+            await asyncio.sleep(0.8)
+
+        pacing = [e for e in broadcast_events if e["type"] == "autopilot_pacing"]
+        assert [e["rounds_left"] for e in pacing] == [1, 0]
+        assert pacing[0]["projected_completion"] is not None
+        assert pacing[0]["delay_seconds"] == GameEngine.SPEED_DELAYS["adaptive"]
+
+    def test_adaptive_delay_backs_off_after_rate_limit(
+        self, started_engine: GameEngine
+    ) -> None:
+        """Rate limits lengthen the adaptive delay but not fixed speeds."""
+        started_engine._get_pacer().record_rate_limit()
+
+        started_engine.set_speed("fast")
+        assert started_engine._get_turn_delay() == 0.2
+        started_engine.set_speed("adaptive")
+        assert started_engine._get_turn_delay() == pytest.approx(
+            0.2 + started_engine._get_pacer().RATE_LIMIT_PENALTY_MIN
+        )
+
+    def test_pacer_uses_configured_targets(self, started_engine: GameEngine) -> None:
+        """The pacer is built from the autopilot targets in config."""
+        with patch("config.get_config") as mock_config:
+            mock_config.return_value.autopilot_rounds_per_hour = 30
+            mock_config.return_value.autopilot_daily_token_budget = 500000
+            pacer = started_engine._get_pacer()
+
+        assert pacer.rounds_per_hour == 30
+        assert pacer.daily_token_budget == 500000
+        assert started_engine._get_pacer() is pacer
+
 
 # =============================================================================
 # Test Human Intervention (AC7, AC8, AC9)
@@ -1058,7 +1231,12 @@ class TestConstants:
 
     def test_speed_delays(self) -> None:
         """SPEED_DELAYS has correct mapping."""
-        assert GameEngine.SPEED_DELAYS == {"slow": 3.0, "normal": 1.0, "fast": 0.2}
+        assert GameEngine.SPEED_DELAYS == {
+            "slow": 3.0,
+            "normal": 1.0,
+            "fast": 0.2,
+            "adaptive": 0.2,
+        }
 
     def test_max_retry_attempts(self) -> None:
         """MAX_RETRY_ATTEMPTS is 3."""
@@ -1078,7 +1256,9 @@ class TestConstants:
 
     def test_valid_speeds(self) -> None:
         """VALID_SPEEDS contains expected values."""
-        assert GameEngine.VALID_SPEEDS == frozenset({"slow", "normal", "fast"})
+        assert GameEngine.VALID_SPEEDS == frozenset(
+            {"slow", "normal", "fast", "adaptive"}
+        )
 
 
 # =============================================================================
@@ -0,0 +1,163 @@
+"""Tests for EngineHost, which runs GameEngines for the Streamlit app.
+
+Uses mocked run_single_round() -- no real LLM calls.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from api.engine_host import EngineHost
+from models import AgentMemory, GameState, create_initial_game_state
+
+
+def _make_game_state() -> GameState:
+    """Create a minimal GameState for testing."""
+    state = create_initial_game_state()
+    state["turn_queue"] = ["dm", "fighter"]
+    state["current_turn"] = "dm"
+    state["session_id"] = "001"
+    state["ground_truth_log"] = ["[dm]: The adventure begins."]
+    state["agent_memories"] = {
+        "dm": AgentMemory(token_limit=8000),
+        "fighter": AgentMemory(token_limit=4000),
+    }
+    return state
+
+
+def _wait_until_idle(host: EngineHost, session_id: str) -> None:
+    """Wait for a session's background work to finish."""
+    deadline = time.monotonic() + 5
+    while host.is_busy(session_id):
+        assert time.monotonic() < deadline, "engine did not finish"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def host() -> Generator[EngineHost, None, None]:
+    """Create an EngineHost and shut it down after the test."""
+    engine_host = EngineHost()
+    yield engine_host
+    engine_host.shutdown()
+
+
+class TestEngineHost:
+    """Tests for running rounds in the background and polling for them."""
+
+    def test_poll_without_engine(self, host: EngineHost) -> None:
+        """Sessions that never ran have nothing to poll."""
+        assert host.poll("001", 0) is None
+        assert host.is_busy("001") is False
+
+    def test_round_runs_in_background(self, host: EngineHost) -> None:
+        """start_round returns while the round is still running."""
+        state = _make_game_state()
+        release = threading.Event()
+
+        def slow_round(game: GameState, *_: Any) -> dict[str, Any]:
+            release.wait(5)
+            return {**game, "ground_truth_log": [*game["ground_truth_log"], "[dm]: Hi"]}
+
+        with patch("graph.run_single_round", side_effect=slow_round):
+            assert host.start_round("001", state) is True
+            assert host.is_busy("001") is True
+            # A second round is refused while the first runs
+            assert host.start_round("001", state) is False
+            release.set()
+            _wait_until_idle(host, "001")
+
+        update = host.poll("001", 1)
+        assert update is not None
+        assert update.new_entries == ["[dm]: Hi"]
+        assert update.busy is False
+        assert update.last_error is None
+
+    def test_round_starts_from_callers_state(self, host: EngineHost) -> None:
+        """Edits made between rounds reach the next round."""
+        state = _make_game_state()
+        seen: list[GameState] = []
+
+        def record_round(game: GameState, *_: Any) -> GameState:
+            seen.append(game)
+            return game
+
+        with patch("graph.run_single_round", side_effect=record_round):
+            host.start_round("001", state)
+            _wait_until_idle(host, "001")
+            edited = {**state, "pending_nudge": "Go north"}
+            host.start_round("001", edited)  # type: ignore[arg-type]
+            _wait_until_idle(host, "001")
+
+        assert seen[-1].get("pending_nudge") == "Go north"
+
+    def test_round_error_reported(self, host: EngineHost) -> None:
+        """Errors from the round are surfaced by poll."""
+        from models import create_user_error
+
+        state = _make_game_state()
+        error = create_user_error(error_type="timeout", provider="gemini", agent="dm")
+
+        with patch("graph.run_single_round", return_value={**state, "error": error}):
+            host.start_round("001", state)
+            _wait_until_idle(host, "001")
+
+        update = host.poll("001", 1)
+        assert update is not None
+        assert update.last_error is error
+        assert update.new_entries == []
+
+    def test_autopilot_start_and_stop(self, host: EngineHost) -> None:
+        """Autopilot runs on the host until stopped."""
+        state = _make_game_state()
+
+        def add_entry(game: GameState, *_: Any) -> dict[str, Any]:
+            time.sleep(0.01)
+            return {**game, "ground_truth_log": [*game["ground_truth_log"], "[dm]: On"]}
+
+        with patch("graph.run_single_round", side_effect=add_entry):
+            assert host.start_autopilot("001", state, "fast", max_turns=100) is True
+            assert host.is_busy("001") is True
+            host.stop_autopilot("001")
+
+        assert host.is_busy("001") is False
+
+    def test_input_during_round_reaches_next_round(self, host: EngineHost) -> None:
+        """Input submitted mid-round goes to the engine, not the live state."""
+        state = _make_game_state()
+        release = threading.Event()
+        seen: list[GameState] = []
+
+        def slow_round(game: GameState, *_: Any) -> GameState:
+            seen.append(dict(game))  # type: ignore[arg-type]
+            release.wait(5)
+            return {**game, "pending_nudge": None}  # type: ignore[typeddict-item]
+
+        with patch("graph.run_single_round", side_effect=slow_round):
+            # Idle sessions are left to the caller
+            assert host.submit_nudge("001", "Go north") is False
+
+            host.start_round("001", state)
+            assert host.submit_nudge("001", "Go north") is True
+            assert host.submit_whisper("001", "Is the innkeeper lying?") is True
+            assert host.submit_human_action("001", "I draw my sword") is True
+            release.set()
+            _wait_until_idle(host, "001")
+
+            update = host.poll("001", 0)
+            assert update is not None
+            host.start_round("001", update.state)
+            _wait_until_idle(host, "001")
+
+        assert seen[0].get("pending_nudge") is None
+        after = seen[-1]
+        assert after.get("pending_nudge") == "Go north"
+        assert after.get("pending_human_whisper") == "Is the innkeeper lying?"
+        assert after.get("human_pending_action") == "I draw my sword"
+        whispers = after["agent_secrets"]["dm"].whispers
+        assert [w.content for w in whispers] == ["Is the innkeeper lying?"]
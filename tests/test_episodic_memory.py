@@ -0,0 +1,160 @@
+"""Tests for episodic memory recall (episodic_memory.py)."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import memory as memory_module
+from episodic_memory import (
+    EPISODE_RECALL_LIMIT,
+    episode_entities,
+    format_episodes,
+    recall_episodes,
+    recall_text,
+    tokenize,
+)
+from memory import MemoryManager
+from models import (
+    AgentMemory,
+    CharacterConfig,
+    MemoryEpisode,
+    create_initial_game_state,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_summarizer_cache() -> None:
+    """Clear the summarizer cache before each test to ensure mock isolation."""
+    memory_module._summarizer_cache.clear()
+
+
+def _episodes(*summaries: str) -> list[MemoryEpisode]:
+    return [
+        MemoryEpisode(turn_start=i * 10 + 1, turn_end=i * 10 + 10, summary=summary)
+        for i, summary in enumerate(summaries)
+    ]
+
+
+class TestRecallEpisodes:
+    """Tests for recall_episodes()."""
+
+    def test_short_history_is_returned_whole(self) -> None:
+        """Up to the limit, every episode is recalled."""
+        episodes = _episodes("One.", "Two.")
+        assert recall_episodes(episodes, "anything") == episodes
+
+    def test_relevant_old_episode_is_recalled(self) -> None:
+        """An old episode matching the scene beats more recent filler."""
+        episodes = _episodes(
+            "The party bargained with Skrix the goblin for a silver key.",
+            *[f"The party walked the road, day {i}." for i in range(8)],
+            "They reached the gate of the keep.",
+        )
+
+        recalled = recall_episodes(episodes, "[DM]: Skrix appears at the gate.")
+
+        assert len(recalled) == EPISODE_RECALL_LIMIT
+        assert recalled[0] is episodes[0]
+        assert recalled[-1] is episodes[-1]
+
+    def test_no_match_falls_back_to_recent(self) -> None:
+        """Without matches the most recent episodes fill the slots."""
+        episodes = _episodes(*[f"Chapter {i} happened." for i in range(10)])
+        recalled = recall_episodes(episodes, "zzz", limit=3)
+        assert recalled == episodes[-3:]
+
+    def test_entities_boost_ranking(self) -> None:
+        """Episodes tagged with an entity outrank passing mentions."""
+        episodes = [
+            MemoryEpisode(summary="A merchant mentioned Vex once."),
+            MemoryEpisode(summary="The rogue duelled Vex.", entities=["Vex"]),
+            MemoryEpisode(summary="Rain."),
+            MemoryEpisode(summary="More rain."),
+        ]
+        recalled = recall_episodes(episodes, "Vex", limit=2)
+        assert recalled == [episodes[1], episodes[3]]
+
+
+class TestFormatting:
+    """Tests for tokenize(), format_episodes() and episode_entities()."""
+
+    def test_tokenize_drops_stop_words(self) -> None:
+        """Common words and the DM prefix are not index terms."""
+        assert tokenize("[DM]: The goblin's blade is RUSTED") == [
+            "goblin's",
+            "blade",
+            "rusted",
+        ]
+
+    def test_format_labels_turn_ranges(self) -> None:
+        """Each episode is labelled with the turns it covers."""
+        text = format_episodes(
+            [
+                MemoryEpisode(turn_start=1, turn_end=12, summary="Tavern."),
+                MemoryEpisode(turn_start=13, turn_end=13, summary="Ambush."),
+            ]
+        )
+        assert text == "[Turns 1-12] Tavern.\n\n[Turn 13] Ambush."
+
+    def test_format_labels_carried_over_episodes(self) -> None:
+        """Episodes from an earlier session have no turns in this one."""
+        text = format_episodes([MemoryEpisode(summary="The keep fell.")])
+        assert text == "[Previous session] The keep fell."
+
+    def test_entities_match_whole_words(self) -> None:
+        """Names are matched case-insensitively on word boundaries."""
+        summary = "Thorin argued with the innkeeper about the Amulet."
+        names = ["Thorin", "Inn", "amulet", "Thorin", "Elara"]
+        assert episode_entities(summary, names) == ["Thorin", "amulet"]
+
+    def test_recall_text_keeps_standing_summary_first(self) -> None:
+        """A carried-over summary precedes the recalled episodes."""
+        memory = AgentMemory(
+            long_term_summary="Last session: the keep fell.",
+            episodes=_episodes("They camped."),
+        )
+        assert recall_text(memory, "") == (
+            "Last session: the keep fell.\n\n[Turns 1-10] They camped."
+        )
+
+
+class TestCompressionEpisodes:
+    """Tests for MemoryManager storing and recalling episodes."""
+
+    def test_compress_buffer_records_turns_and_entities(self) -> None:
+        """Episodes carry the turn range and the names they mention."""
+        state = create_initial_game_state()
+        state["characters"]["fighter"] = CharacterConfig(
+            name="Thorin",
+            character_class="Fighter",
+            personality="Brave",
+            color="#C45C4A",
+        )
+        state["ground_truth_log"] = [f"[DM]: Entry {i}" for i in range(20)]
+        state["agent_memories"]["dm"] = AgentMemory(
+            short_term_buffer=[f"Event {i}" for i in range(8)],
+            episodes=_episodes("Earlier."),
+        )
+
+        with patch("memory.Summarizer") as MockSummarizer:
+            mock_instance = MagicMock()
+            mock_instance.generate_summary.return_value = "Thorin held the bridge."
+            MockSummarizer.return_value = mock_instance
+            MemoryManager(state).compress_buffer("dm")
+
+        episode = state["agent_memories"]["dm"].episodes[-1]
+        assert (episode.turn_start, episode.turn_end) == (11, 17)
+        assert episode.entities == ["Thorin"]
+
+    def test_context_prompt_stays_bounded(self) -> None:
+        """Only the recalled episodes reach the prompt."""
+        state = create_initial_game_state()
+        state["agent_memories"]["dm"] = AgentMemory(
+            episodes=_episodes(*[f"Chapter {i} happened." for i in range(30)])
+        )
+
+        context = MemoryManager(state).get_context("dm")
+
+        assert context.count("[Turns ") == EPISODE_RECALL_LIMIT
+        assert "Chapter 29 happened." in context
+        assert "Chapter 0 happened." not in context
@@ -350,6 +350,39 @@ class TestRunSingleRound:
         # After Story 4.5, return type changed to support error handling
         assert sig.return_annotation == dict[str, object]
 
+    def test_cancelled_round_stops_without_saving(self) -> None:
+        """Cancelling mid-round skips later nodes, callbacks and saves."""
+        from cancellation import CancellationToken, RoundCancelled
+
+        state = create_test_state(turn_queue=["dm", "fighter"], current_turn="dm")
+        token = CancellationToken()
+
+        async def dm_responds_then_cancel(messages: object) -> AIMessage:
+            token.cancel("stopped")
+            return AIMessage(content="The adventure begins!")
+
+        callback = MagicMock()
+        with (
+            patch("agents.get_llm") as mock_get_llm,
+            patch("persistence.save_checkpoint") as mock_save,
+            patch("graph._append_transcript_for_new_entries") as mock_transcript,
+        ):
+            mock_model = MagicMock()
+            mock_model.bind_tools.return_value = mock_model
+            mock_model.ainvoke.side_effect = dm_responds_then_cancel
+            mock_get_llm.return_value = mock_model
+
+            with pytest.raises(RoundCancelled):
+                run_single_round(state, callback, cancel_token=token)
+
+        mock_model.invoke.assert_not_called()
+        assert mock_model.ainvoke.call_count == 1
+        # Nothing after the cancel (the DM's narration) reached the callback
+        for call in callback.call_args_list:
+            assert call.args[0]["ground_truth_log"] == []
+        mock_save.assert_not_called()
+        mock_transcript.assert_not_called()
+
 
 # =============================================================================
 # Task 8: Integration tests
@@ -555,6 +588,36 @@ class TestTranscriptLogging:
             # Game should still work
             assert len(result["ground_truth_log"]) == 1
 
+    def test_transcript_uses_narrative_parsing(self, tmp_path: Path) -> None:
+        """Transcript entries are split the way the narrative shows them."""
+        from graph import _append_transcript_for_new_entries
+        from persistence import load_transcript
+
+        temp_campaigns = tmp_path / "campaigns"
+        temp_campaigns.mkdir()
+        before = create_test_state()
+        before["ground_truth_log"] = []
+        after = create_test_state()
+        after["ground_truth_log"] = [
+            "[Thorin]: [Thorin]: I hold the line.",
+            "[]: A bell tolls.",
+            "The wind howls.",
+        ]
+
+        with (
+            patch("persistence.CAMPAIGNS_DIR", temp_campaigns),
+            patch("transcript_search.index_transcript_entries"),
+        ):
+            _append_transcript_for_new_entries(before, after, "001")
+            loaded = load_transcript("001")
+
+        assert loaded is not None
+        assert [(e.agent, e.content) for e in loaded] == [
+            ("Thorin", "I hold the line."),
+            ("unknown", "A bell tolls."),
+            ("dm", "The wind howls."),
+        ]
+
 
 class TestHumanInterventionTranscriptLogging:
     """Tests for transcript logging in human_intervention_node."""
@@ -1437,6 +1500,32 @@ class TestContextManagerStateIntegrity:
 
         assert result["ground_truth_log"] == original_log
 
+    def test_context_manager_does_not_mutate_input_memories(self) -> None:
+        """Test compression updates a copy; unchanged memories are shared."""
+        from graph import context_manager
+
+        state = create_test_state(turn_queue=["dm", "fighter"])
+        dm_memory = state["agent_memories"]["dm"]
+        dm_memory.short_term_buffer = ["Event 1", "Event 2"]
+        fighter_memory = state["agent_memories"]["fighter"]
+
+        def make_manager(managed_state: GameState) -> MagicMock:
+            manager = MagicMock()
+            manager.is_near_limit.side_effect = lambda name: name == "dm"
+            manager.is_total_context_over_limit.return_value = False
+            manager.compress_buffer.side_effect = lambda name: managed_state[
+                "agent_memories"
+            ][name].short_term_buffer.clear()
+            return manager
+
+        with patch("graph.MemoryManager", side_effect=make_manager):
+            result = context_manager(state)
+
+        assert result["agent_memories"]["dm"].short_term_buffer == []
+        assert dm_memory.short_term_buffer == ["Event 1", "Event 2"]
+        assert state["agent_memories"]["dm"] is dm_memory
+        assert result["agent_memories"]["fighter"] is fighter_memory
+
     def test_context_manager_preserves_turn_queue(self) -> None:
         """Test that turn_queue is preserved through context_manager."""
         from graph import context_manager
@@ -0,0 +1,106 @@
+"""Tests for incremental best-scene highlight tracking."""
+
+from __future__ import annotations
+
+from highlights import HighlightReel, score_entry
+from models import (
+    CallbackEntry,
+    CallbackLog,
+    CombatState,
+    GameState,
+    create_initial_game_state,
+)
+
+
+def _state(log: list[str], **extra: object) -> GameState:
+    """Create a game state with the given log."""
+    state = create_initial_game_state()
+    state["ground_truth_log"] = log
+    state.update(extra)  # type: ignore[typeddict-item]
+    return state
+
+
+def _callback(turn_detected: int, story_moment: bool = False) -> CallbackEntry:
+    """Create a callback entry detected at a turn."""
+    return CallbackEntry(
+        id=f"cb{turn_detected}",
+        element_id="e1",
+        element_name="Skrix",
+        element_type="character",
+        turn_detected=turn_detected,
+        turn_gap=25 if story_moment else 2,
+        match_type="name_exact",
+        match_context="Skrix returns",
+        is_story_moment=story_moment,
+        session_detected=1,
+    )
+
+
+class TestScoreEntry:
+    """Tests for the local scoring heuristics."""
+
+    def test_plain_entries_score_zero(self) -> None:
+        """Entries with nothing dramatic, and sheet updates, never score."""
+        assert score_entry("[dm]: You walk down the road.") == 0.0
+        assert score_entry("[SHEET]: Thorin: HP 5/12, critical hit taken") == 0.0
+
+    def test_critical_outscores_scenery(self) -> None:
+        """A natural 20 outranks a merely scenic entry."""
+        critical = score_entry("[fighter]: Natural 20! My sword finds its mark.")
+        scenic = score_entry("[fighter]: I admire the ruins.")
+        assert critical > scenic > 0
+
+    def test_combat_and_dm_bonuses(self) -> None:
+        """Combat and DM narration add to an entry that already scores."""
+        pc = score_entry("[rogue]: The dragon roars.")
+        assert score_entry("[dm]: The dragon roars.") > pc
+        assert score_entry("[rogue]: The dragon roars.", in_combat=True) > pc
+
+
+class TestHighlightReel:
+    """Tests for incremental candidate ranking."""
+
+    def test_scores_only_new_entries(self) -> None:
+        """Each update scores the entries added since the last one."""
+        reel = HighlightReel()
+        log = ["[dm]: The gate.", "[dm]: A dragon lands in fire."]
+        reel.update(_state(log))
+        assert reel.candidates() == [1]
+
+        log = [
+            *log,
+            "[dm]: Calm.",
+            "[dm]: Calm.",
+            "[fighter]: Nat 20! The blade sings.",
+        ]
+        reel.update(_state(log, combat_state=CombatState(active=True)))
+        assert reel.candidates() == [4, 1]
+
+    def test_callbacks_and_story_moments(self) -> None:
+        """Callbacks boost the entry they were detected in."""
+        log = ["[dm]: A storm.", "[dm]: Calm.", "[dm]: Calm.", "[dm]: The storm ends."]
+        reel = HighlightReel()
+        reel.update(_state(log))
+        assert reel.candidates(1) == [3]
+
+        callbacks = CallbackLog(entries=[_callback(1, story_moment=True)])
+        reel.update(_state(log, callback_log=callbacks))
+        assert reel.candidates(1) == [0]
+
+    def test_nearby_candidates_are_one_scene(self) -> None:
+        """Only the best entry of a cluster is offered."""
+        log = (
+            ["[dm]: A dragon.", "[dm]: Dragon fire!", "[dm]: Calm."]
+            + ["[dm]: Calm."] * 3
+            + ["[dm]: A lone arrow."]
+        )
+        reel = HighlightReel()
+        reel.update(_state(log))
+        assert reel.candidates() == [1, 6]
+
+    def test_rewound_log_starts_over(self) -> None:
+        """A restored checkpoint or fork with a different log is rescored."""
+        reel = HighlightReel()
+        reel.update(_state(["[dm]: Calm.", "[dm]: Dragon fire!"]))
+        reel.update(_state(["[dm]: A lightning storm.", "[dm]: Calm."]))
+        assert reel.candidates() == [0]
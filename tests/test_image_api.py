@@ -6,7 +6,6 @@ background task error handling, and WebSocket event support.
 
 from __future__ import annotations
 
-import asyncio
 import json
 from collections.abc import AsyncIterator, Generator
 from pathlib import Path
@@ -16,6 +15,12 @@ import pytest
 import yaml
 from httpx import ASGITransport, AsyncClient
 
+from api.image_jobs import (
+    ImageJob,
+    get_image_job_queue,
+    image_job_key,
+    reset_image_job_queue,
+)
 from api.main import app
 from api.schemas import (
     ImageGenerateAccepted,
@@ -37,12 +42,10 @@ from persistence import save_checkpoint, save_session_metadata
 
 @pytest.fixture(autouse=True)
 def _clear_image_task_state() -> Generator[None, None, None]:
-    """Clear active image task tracking between tests to prevent leakage."""
-    from api.routes import _active_image_tasks
-
-    _active_image_tasks.clear()
+    """Reset the image job queue between tests to prevent leakage."""
+    reset_image_job_queue()
     yield
-    _active_image_tasks.clear()
+    reset_image_job_queue()
 
 
 @pytest.fixture
@@ -364,24 +367,55 @@ class TestGenerateCurrentSceneImage:
         image_gen_enabled_config: Path,
     ) -> None:
         """Returns 429 when concurrent image task limit is exceeded."""
-        from api.routes import _MAX_CONCURRENT_IMAGE_TASKS, _active_image_tasks
+        from api.routes import _MAX_CONCURRENT_IMAGE_TASKS
 
         _create_test_session(temp_campaigns_dir, "001")
         log_entries = [f"Turn {i}: Something happens." for i in range(15)]
         _create_test_checkpoint_with_log(temp_campaigns_dir, "001", 15, log_entries)
 
-        # Pre-fill active tasks to exceed limit
-        fake_tasks: set[asyncio.Task[None]] = set()
-        for _ in range(_MAX_CONCURRENT_IMAGE_TASKS):
-            mock_task = MagicMock()
-            mock_task.done.return_value = False
-            fake_tasks.add(mock_task)
-        _active_image_tasks["001"] = fake_tasks  # type: ignore[assignment]
+        # Pre-fill pending jobs to reach the limit
+        queue = get_image_job_queue()
+        for i in range(_MAX_CONCURRENT_IMAGE_TASKS):
+            job = ImageJob(
+                session_id="001", generation_mode="current", dedup_key=str(i)
+            )
+            queue._jobs[job.id] = job
 
         resp = await client.post("/api/sessions/001/images/generate-current")
         assert resp.status_code == 429
         assert "Too many concurrent" in resp.json()["detail"]
 
+    @pytest.mark.anyio
+    async def test_duplicate_at_limit_joins_existing_job(
+        self,
+        client: AsyncClient,
+        temp_campaigns_dir: Path,
+        image_gen_enabled_config: Path,
+    ) -> None:
+        """A repeat of queued work returns the existing job even at the limit."""
+        from api.routes import _MAX_CONCURRENT_IMAGE_TASKS
+
+        _create_test_session(temp_campaigns_dir, "001")
+        log_entries = [f"Turn {i}: Something happens." for i in range(15)]
+        _create_test_checkpoint_with_log(temp_campaigns_dir, "001", 15, log_entries)
+
+        queue = get_image_job_queue()
+        for i in range(_MAX_CONCURRENT_IMAGE_TASKS - 1):
+            job = ImageJob(
+                session_id="001", generation_mode="current", dedup_key=str(i)
+            )
+            queue._jobs[job.id] = job
+        queued = ImageJob(
+            session_id="001",
+            generation_mode="current",
+            dedup_key=image_job_key("001", "current", 14, log_entries[-10:]),
+        )
+        queue._jobs[queued.id] = queued
+
+        resp = await client.post("/api/sessions/001/images/generate-current")
+        assert resp.status_code == 202
+        assert resp.json()["task_id"] == queued.id
+
 
 # =============================================================================
 # Generate Turn Image Tests
@@ -474,6 +508,78 @@ class TestGenerateTurnImage:
         assert resp.status_code == 404
 
 
+# =============================================================================
+# Image Job Endpoint Tests
+# =============================================================================
+
+
+class TestImageJobEndpoints:
+    """Tests for the /api/sessions/{session_id}/images/jobs endpoints."""
+
+    @pytest.mark.anyio
+    async def test_duplicate_requests_share_a_job(
+        self,
+        client: AsyncClient,
+        temp_campaigns_dir: Path,
+        image_gen_enabled_config: Path,
+    ) -> None:
+        """Repeated requests for the same turn return one job, listed as pending."""
+        _create_test_session(temp_campaigns_dir, "001")
+        log_entries = [f"Turn {i}: Something happens." for i in range(20)]
+        _create_test_checkpoint_with_log(temp_campaigns_dir, "001", 20, log_entries)
+
+        with patch("api.routes.asyncio.create_task", return_value=MagicMock()):
+            first = await client.post("/api/sessions/001/images/generate-turn/10")
+            second = await client.post("/api/sessions/001/images/generate-turn/10")
+        task_id = first.json()["task_id"]
+        assert second.json()["task_id"] == task_id
+
+        resp = await client.get("/api/sessions/001/images/jobs")
+        assert resp.status_code == 200
+        jobs = resp.json()
+        assert [job["job_id"] for job in jobs] == [task_id]
+        assert jobs[0]["status"] == "pending"
+        assert jobs[0]["turn_number"] == 10
+
+        resp = await client.get(f"/api/sessions/001/images/jobs/{task_id}")
+        assert resp.json()["generation_mode"] == "specific"
+
+    @pytest.mark.anyio
+    async def test_cancel_pending_job(
+        self,
+        client: AsyncClient,
+        temp_campaigns_dir: Path,
+    ) -> None:
+        """Cancelling a pending job marks it cancelled; cancelling again is 409."""
+        _create_test_session(temp_campaigns_dir, "001")
+        job = ImageJob(session_id="001", generation_mode="current", dedup_key="k")
+        get_image_job_queue()._jobs[job.id] = job
+
+        resp = await client.post(f"/api/sessions/001/images/jobs/{job.id}/cancel")
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "cancelled"
+
+        resp = await client.post(f"/api/sessions/001/images/jobs/{job.id}/cancel")
+        assert resp.status_code == 409
+
+    @pytest.mark.anyio
+    async def test_unknown_job_returns_404(
+        self,
+        client: AsyncClient,
+        temp_campaigns_dir: Path,
+    ) -> None:
+        """Jobs of other sessions and unknown IDs are not found."""
+        _create_test_session(temp_campaigns_dir, "001")
+        _create_test_session(temp_campaigns_dir, "002")
+        job = ImageJob(session_id="002", generation_mode="current", dedup_key="k")
+        get_image_job_queue()._jobs[job.id] = job
+
+        resp = await client.get(f"/api/sessions/001/images/jobs/{job.id}")
+        assert resp.status_code == 404
+        resp = await client.post("/api/sessions/001/images/jobs/nope/cancel")
+        assert resp.status_code == 404
+
+
 # =============================================================================
 # List Session Images Tests
 # =============================================================================
@@ -578,6 +684,48 @@ class TestListSessionImages:
         data = resp.json()
         assert len(data) == 1  # Only the good one
 
+    @pytest.mark.anyio
+    async def test_includes_thumbnail_url(
+        self,
+        client: AsyncClient,
+        temp_campaigns_dir: Path,
+    ) -> None:
+        """Each image lists the URL of its gallery thumbnail."""
+        _create_test_session(temp_campaigns_dir, "001")
+        image_id = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+        _create_image_metadata(temp_campaigns_dir, "001", image_id=image_id)
+
+        resp = await client.get("/api/sessions/001/images")
+        assert resp.json()[0]["thumbnail_url"] == (
+            f"/api/sessions/001/images/{image_id}/thumbnail"
+        )
+
+    def test_sidecars_cached_until_directory_changes(
+        self, temp_campaigns_dir: Path
+    ) -> None:
+        """Parsed sidecars are reused until the images directory mtime moves."""
+        import os
+
+        from api.routes import _load_image_sidecars
+
+        _create_test_session(temp_campaigns_dir, "001")
+        _create_image_metadata(
+            temp_campaigns_dir, "001", image_id="a0000000-0000-0000-0000-000000000001"
+        )
+        images_dir = temp_campaigns_dir / "session_001" / "images"
+        # Age the directory past the racy-mtime window
+        os.utime(images_dir, (1_700_000_000, 1_700_000_000))
+
+        assert len(_load_image_sidecars(images_dir)) == 1
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            assert len(_load_image_sidecars(images_dir)) == 1
+
+        # Adding an image changes the directory mtime and invalidates the cache
+        _create_image_metadata(
+            temp_campaigns_dir, "001", image_id="a0000000-0000-0000-0000-000000000002"
+        )
+        assert len(_load_image_sidecars(images_dir)) == 2
+
 
 # =============================================================================
 # Serve Session Image Tests
@@ -641,6 +789,117 @@ class TestServeSessionImage:
         )
         assert resp.status_code == 404
 
+    @pytest.mark.anyio
+    async def test_sets_immutable_cache_headers(
+        self,
+        client: AsyncClient,
+        temp_campaigns_dir: Path,
+    ) -> None:
+        """Images are served with ETag, Last-Modified and immutable caching."""
+        _create_test_session(temp_campaigns_dir, "001")
+        image_id = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+        _create_image_metadata(temp_campaigns_dir, "001", image_id=image_id)
+
+        resp = await client.get(f"/api/sessions/001/images/{image_id}.png")
+        assert resp.status_code == 200
+        assert "immutable" in resp.headers["cache-control"]
+        assert resp.headers["etag"]
+        assert resp.headers["last-modified"]
+
+    @pytest.mark.anyio
+    async def test_conditional_request_returns_304(
+        self,
+        client: AsyncClient,
+        temp_campaigns_dir: Path,
+    ) -> None:
+        """Matching If-None-Match / If-Modified-Since returns 304."""
+        _create_test_session(temp_campaigns_dir, "001")
+        image_id = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+        _create_image_metadata(temp_campaigns_dir, "001", image_id=image_id)
+        url = f"/api/sessions/001/images/{image_id}.png"
+
+        first = await client.get(url)
+        etag = first.headers["etag"]
+
+        resp = await client.get(url, headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+        resp = await client.get(
+            url, headers={"If-Modified-Since": first.headers["last-modified"]}
+        )
+        assert resp.status_code == 304
+
+        resp = await client.get(url, headers={"If-None-Match": '"stale"'})
+        assert resp.status_code == 200
+
+
+class TestServeSessionImageThumbnail:
+    """Tests for GET /api/sessions/{session_id}/images/{image_id}/thumbnail."""
+
+    @pytest.mark.anyio
+    async def test_creates_and_serves_webp_thumbnail(
+        self,
+        client: AsyncClient,
+        temp_campaigns_dir: Path,
+    ) -> None:
+        """Thumbnail is generated lazily, cached on disk and served as WebP."""
+        from PIL import Image
+
+        _create_test_session(temp_campaigns_dir, "001")
+        image_id = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+        _create_image_metadata(temp_campaigns_dir, "001", image_id=image_id)
+        images_dir = temp_campaigns_dir / "session_001" / "images"
+        Image.new("RGB", (1600, 900)).save(images_dir / f"{image_id}.png")
+
+        resp = await client.get(f"/api/sessions/001/images/{image_id}/thumbnail")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "image/webp"
+        assert "immutable" in resp.headers["cache-control"]
+        assert (images_dir / "thumbs" / f"{image_id}.webp").exists()
+
+    @pytest.mark.anyio
+    async def test_rejects_invalid_image_id(
+        self,
+        client: AsyncClient,
+        temp_campaigns_dir: Path,
+    ) -> None:
+        """Non-UUID image IDs are rejected."""
+        _create_test_session(temp_campaigns_dir, "001")
+
+        resp = await client.get("/api/sessions/001/images/not-a-uuid/thumbnail")
+        assert resp.status_code == 400
+
+    @pytest.mark.anyio
+    async def test_returns_404_for_missing_image(
+        self,
+        client: AsyncClient,
+        temp_campaigns_dir: Path,
+    ) -> None:
+        """Returns 404 when the source image doesn't exist."""
+        _create_test_session(temp_campaigns_dir, "001")
+
+        resp = await client.get(
+            "/api/sessions/001/images/a1b2c3d4-e5f6-7890-abcd-ef1234567890/thumbnail"
+        )
+        assert resp.status_code == 404
+
+    @pytest.mark.anyio
+    async def test_returns_404_for_corrupt_image(
+        self,
+        client: AsyncClient,
+        temp_campaigns_dir: Path,
+    ) -> None:
+        """A PNG that cannot be decoded yields 404, not a server error."""
+        _create_test_session(temp_campaigns_dir, "001")
+        image_id = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+        # Helper writes a PNG signature followed by zeros (undecodable)
+        _create_image_metadata(temp_campaigns_dir, "001", image_id=image_id)
+
+        resp = await client.get(f"/api/sessions/001/images/{image_id}/thumbnail")
+        assert resp.status_code == 404
+
 
 # =============================================================================
 # Background Task Error Handling Tests
@@ -653,7 +912,7 @@ class TestBackgroundTaskErrorHandling:
     @pytest.mark.anyio
     async def test_handles_image_generation_error(self) -> None:
         """Background task catches ImageGenerationError and broadcasts error."""
-        from api.routes import _generate_image_background
+        from api.image_jobs import _generate_image_background
 
         mock_manager = AsyncMock()
 
@@ -690,7 +949,7 @@ class TestBackgroundTaskErrorHandling:
     @pytest.mark.anyio
     async def test_handles_unexpected_error(self) -> None:
         """Background task catches unexpected exceptions and broadcasts error."""
-        from api.routes import _generate_image_background
+        from api.image_jobs import _generate_image_background
 
         mock_manager = AsyncMock()
 
@@ -722,7 +981,7 @@ class TestBackgroundTaskErrorHandling:
     @pytest.mark.anyio
     async def test_success_saves_metadata_and_broadcasts(self) -> None:
         """Background task saves metadata and broadcasts image_ready on success."""
-        from api.routes import _generate_image_background
+        from api.image_jobs import _generate_image_background
 
         mock_manager = AsyncMock()
 
@@ -756,7 +1015,7 @@ class TestBackgroundTaskErrorHandling:
         with (
             patch("image_gen.ImageGenerator") as mock_gen_cls,
             patch("api.websocket.manager", mock_manager),
-            patch("api.routes.get_session_dir") as mock_session_dir,
+            patch("api.image_jobs.get_session_dir") as mock_session_dir,
         ):
             mock_gen = mock_gen_cls.return_value
             mock_gen.build_scene_prompt = AsyncMock(return_value="A dark corridor")
@@ -830,10 +1089,10 @@ class TestImageHelpers:
     """Tests for image-related helper functions."""
 
     def test_build_download_url(self) -> None:
-        """_build_download_url constructs correct URL."""
-        from api.routes import _build_download_url
+        """build_download_url constructs correct URL."""
+        from api.image_jobs import build_download_url
 
-        url = _build_download_url("001", "abc-123-def")
+        url = build_download_url("001", "abc-123-def")
         assert url == "/api/sessions/001/images/abc-123-def.png"
 
     def test_check_image_generation_enabled_raises_when_disabled(
@@ -1151,9 +1410,7 @@ class TestDownloadAllSessionImages:
         temp_campaigns_dir: Path,
     ) -> None:
         """Zip filename uses sanitized session name."""
-        _create_test_session(
-            temp_campaigns_dir, "001", name="My Campaign: Part 2!"
-        )
+        _create_test_session(temp_campaigns_dir, "001", name="My Campaign: Part 2!")
         _create_image_metadata(
             temp_campaigns_dir,
             "001",
@@ -1246,6 +1503,54 @@ class TestDownloadAllSessionImages:
         assert resp.status_code == 404
         assert "No images to download" in resp.json()["detail"]
 
+    @pytest.mark.anyio
+    async def test_download_all_stores_pngs_uncompressed(
+        self,
+        client: AsyncClient,
+        temp_campaigns_dir: Path,
+    ) -> None:
+        """PNG entries are stored, not deflated, and round-trip intact."""
+        import zipfile
+        from io import BytesIO
+
+        _create_test_session(temp_campaigns_dir, "001", name="Test")
+        image_id = "a0000000-0000-0000-0000-000000000001"
+        _create_image_metadata(
+            temp_campaigns_dir, "001", image_id=image_id, turn_number=0
+        )
+        # Larger than one stream chunk so the entry spans several pieces
+        payload = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 1024
+        png_path = temp_campaigns_dir / "session_001" / "images" / f"{image_id}.png"
+        png_path.write_bytes(payload)
+
+        resp = await client.get("/api/sessions/001/images/download-all")
+        assert resp.status_code == 200
+
+        zf = zipfile.ZipFile(BytesIO(resp.content))
+        info = zf.getinfo("Test_turn_1_current.png")
+        assert info.compress_type == zipfile.ZIP_STORED
+        assert zf.read(info) == payload
+        assert zf.testzip() is None
+        zf.close()
+
+    def test_zip_stream_yields_incrementally(self, tmp_path: Path) -> None:
+        """The archive generator yields pieces before reading every file."""
+        from api.routes import _iter_images_zip
+
+        png_files: list[Path] = []
+        for i in range(3):
+            png = tmp_path / f"a0000000-0000-0000-0000-00000000000{i}.png"
+            png.write_bytes(b"\x89PNG" + bytes([i]) * 200_000)
+            png_files.append(png)
+
+        stream = _iter_images_zip(png_files, tmp_path, "Test")
+        first = next(stream)
+        rest = b"".join(stream)
+
+        assert first.startswith(b"PK\x03\x04")
+        assert len(first) < 200_000
+        assert len(first) + len(rest) > 600_000
+
 
 # =============================================================================
 # Session Image Summary Endpoint Tests (Story 17-8)
@@ -1353,9 +1658,7 @@ class TestListSessionImageSummaries:
         temp_campaigns_dir: Path,
     ) -> None:
         """Uses session name from metadata when available."""
-        _create_test_session(
-            temp_campaigns_dir, "001", name="Curse of Strahd"
-        )
+        _create_test_session(temp_campaigns_dir, "001", name="Curse of Strahd")
         _create_image_metadata(
             temp_campaigns_dir,
             "001",
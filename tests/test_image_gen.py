@@ -8,11 +8,19 @@ from __future__ import annotations
 
 import io
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from image_gen import ImageGenerationError, ImageGenerator
+from image_gen import (
+    THUMBNAIL_MAX_SIZE,
+    ImageGenerationError,
+    ImageGenerator,
+    clear_scene_prompt_cache,
+    ensure_thumbnail,
+    get_thumbnail_path,
+)
 from models import ImageGenerationConfig
 
 # =============================================================================
@@ -133,6 +141,28 @@ class TestImageGeneratorApiKey:
         ):
             image_generator._get_api_key()
 
+    def test_client_reused_until_config_changes(
+        self, image_generator: ImageGenerator
+    ) -> None:
+        """The key is only resolved again after a config version bump."""
+        store = MagicMock(version=1)
+        with (
+            patch("config.get_config_store", return_value=store),
+            patch.object(
+                image_generator, "_get_api_key", side_effect=["key-1", "key-2"]
+            ) as mock_key,
+            patch("google.genai.Client") as mock_client,
+        ):
+            first = image_generator._get_client()
+            assert image_generator._get_client() is first
+            assert mock_key.call_count == 1
+
+            store.version = 2
+            image_generator._get_client()
+
+        assert mock_key.call_count == 2
+        mock_client.assert_called_with(api_key="key-2")
+
 
 # =============================================================================
 # ImageGenerator.generate_scene_image Tests
@@ -477,6 +507,80 @@ class TestBuildScenePrompt:
         assert "Wizard" in user_msg
 
 
+class TestScenePromptCache:
+    """Tests for the on-disk scene prompt cache."""
+
+    @staticmethod
+    async def _build(
+        generator: ImageGenerator,
+        entries: list[str],
+        characters: dict[str, Any],
+        llm: AsyncMock,
+        scanner_model: str = "gemini-3-flash-preview",
+    ) -> str:
+        """Build a scene prompt with a mocked LLM."""
+        config = ImageGenerationConfig(scanner_model=scanner_model)
+        with (
+            patch("agents.get_llm", return_value=llm),
+            patch.object(generator, "_get_image_config", return_value=config),
+        ):
+            return await generator.build_scene_prompt(entries, characters)
+
+    @staticmethod
+    def _llm(*prompts: str) -> AsyncMock:
+        """Create a mock LLM returning the given prompts in turn."""
+        llm = AsyncMock()
+        llm.ainvoke = AsyncMock(side_effect=[MagicMock(content=p) for p in prompts])
+        return llm
+
+    @pytest.mark.anyio
+    async def test_same_scene_skips_llm(self, image_generator: ImageGenerator) -> None:
+        """A repeated request is served from cache, also after a restart."""
+        entries = ["[dm] A dragon circles the tower."]
+        party = {"Thorin": {"character_class": "Fighter"}}
+        llm = self._llm("A dragon over a tower", "unused")
+
+        first = await self._build(image_generator, entries, party, llm)
+        assert await self._build(image_generator, entries, party, llm) == first
+
+        # A new process only has the disk cache
+        clear_scene_prompt_cache()
+        assert await self._build(ImageGenerator(), entries, party, llm) == first
+        llm.ainvoke.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_changed_inputs_rebuild(
+        self, image_generator: ImageGenerator
+    ) -> None:
+        """New entries, a different party or scanner model miss the cache."""
+        entries = ["[dm] A dragon circles the tower."]
+        party = {"Thorin": {"character_class": "Fighter"}}
+        llm = self._llm("one", "two", "three", "four")
+
+        await self._build(image_generator, entries, party, llm)
+        await self._build(image_generator, [*entries, "[dm] It lands."], party, llm)
+        await self._build(
+            image_generator, entries, {"Thorin": {"character_class": "Wizard"}}, llm
+        )
+        result = await self._build(
+            image_generator, entries, party, llm, scanner_model="other-model"
+        )
+        assert result == "four"
+        assert llm.ainvoke.call_count == 4
+
+    @pytest.mark.anyio
+    async def test_prompt_version_change_invalidates(
+        self, image_generator: ImageGenerator
+    ) -> None:
+        """Editing SCENE_PROMPT_SYSTEM makes cached prompts stale."""
+        entries = ["[dm] A dragon circles the tower."]
+        llm = self._llm("old", "new")
+
+        await self._build(image_generator, entries, {}, llm)
+        with patch("image_gen.SCENE_PROMPT_VERSION", "edited"):
+            assert await self._build(image_generator, entries, {}, llm) == "new"
+
+
 # =============================================================================
 # ImageGenerator._ensure_images_dir Tests
 # =============================================================================
@@ -513,6 +617,60 @@ class TestEnsureImagesDir:
         assert result1.exists()
 
 
+# =============================================================================
+# Thumbnail Derivative Tests
+# =============================================================================
+
+
+class TestThumbnails:
+    """Tests for WebP gallery thumbnail derivatives."""
+
+    @staticmethod
+    def _png_bytes(size: tuple[int, int] = (1600, 900)) -> bytes:
+        from PIL import Image
+
+        buf = io.BytesIO()
+        Image.new("RGB", size, color=(10, 20, 30)).save(buf, format="PNG")
+        return buf.getvalue()
+
+    def test_save_writes_thumbnail(self, tmp_path: Path) -> None:
+        """Saving a PNG also writes a bounded WebP thumbnail."""
+        from PIL import Image
+
+        image_path = tmp_path / "abc.png"
+        ImageGenerator._save_image_to_disk(self._png_bytes(), image_path)
+
+        thumb_path = get_thumbnail_path(image_path)
+        assert thumb_path == tmp_path / "thumbs" / "abc.webp"
+        with Image.open(thumb_path) as thumb:
+            assert thumb.format == "WEBP"
+            assert thumb.size == THUMBNAIL_MAX_SIZE
+
+    def test_thumbnail_failure_does_not_fail_save(self, tmp_path: Path) -> None:
+        """A thumbnail error is logged and the PNG is still saved."""
+        image_path = tmp_path / "abc.png"
+        with patch("image_gen._write_thumbnail", side_effect=OSError("disk full")):
+            ImageGenerator._save_image_to_disk(self._png_bytes(), image_path)
+
+        assert image_path.exists()
+        assert not get_thumbnail_path(image_path).exists()
+
+    def test_ensure_thumbnail_creates_lazily(self, tmp_path: Path) -> None:
+        """Missing thumbnails are created from the PNG on demand."""
+        image_path = tmp_path / "abc.png"
+        image_path.write_bytes(self._png_bytes((320, 180)))
+
+        thumb_path = ensure_thumbnail(image_path)
+
+        assert thumb_path.exists()
+        # Existing thumbnail is reused, not regenerated
+        mtime = thumb_path.stat().st_mtime_ns
+        with patch("image_gen._write_thumbnail") as mock_write:
+            assert ensure_thumbnail(image_path) == thumb_path
+        mock_write.assert_not_called()
+        assert thumb_path.stat().st_mtime_ns == mtime
+
+
 # =============================================================================
 # ImageGenerator._get_image_config Tests
 # =============================================================================
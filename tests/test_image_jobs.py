@@ -0,0 +1,217 @@
+"""Tests for the image generation job queue."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from api.image_jobs import FINISHED_JOBS_KEPT, ImageJob, ImageJobQueue, image_job_key
+from image_gen import reset_image_generator
+from models import ImageGenerationConfig, SceneImage
+
+
+@pytest.fixture(autouse=True)
+def temp_campaigns_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    """Isolate sessions in a temp dir, with one image job slot per provider."""
+    campaigns = tmp_path / "campaigns"
+    (campaigns / "session_001").mkdir(parents=True)
+    reset_image_generator()
+    with (
+        patch("persistence.CAMPAIGNS_DIR", campaigns),
+        patch(
+            "image_gen.ImageGenerator._get_image_config",
+            return_value=ImageGenerationConfig(provider_concurrency=1),
+        ),
+    ):
+        yield campaigns
+    reset_image_generator()
+
+
+def _job(turn: int, mode: str = "current") -> ImageJob:
+    """Create a scene job for a turn."""
+    entries = [f"[dm]: Turn {turn}."]
+    return ImageJob(
+        session_id="001",
+        generation_mode=mode,  # type: ignore[arg-type]
+        turn_number=turn,
+        dedup_key=image_job_key("001", mode, turn, entries),
+        log_entries=entries,
+    )
+
+
+def _image(turn: int) -> SceneImage:
+    """Create a generated image result."""
+    return SceneImage(
+        id=f"img-{turn}",
+        session_id="001",
+        turn_number=turn,
+        prompt="A scene",
+        image_path=f"images/img-{turn}.png",
+        provider="gemini",
+        model="imagen-4.0-generate-001",
+        generation_mode="current",
+        generated_at="2026-01-01T00:00:00Z",
+    )
+
+
+class _FakeRunner:
+    """Stands in for _generate_image_background, blocking until released."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.calls: list[int] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, **kwargs: Any) -> SceneImage | None:
+        self.calls.append(kwargs["turn_number"])
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.release.wait()
+        finally:
+            self.running -= 1
+        return _image(kwargs["turn_number"])
+
+
+async def _settle() -> None:
+    """Let queued tasks and their thread hops run."""
+    for _ in range(20):
+        await asyncio.sleep(0.01)
+
+
+class TestImageJobKey:
+    """Tests for job deduplication keys."""
+
+    def test_key_covers_turn_mode_and_scene(self) -> None:
+        """Keys differ when any input differs."""
+        key = image_job_key("001", "current", 3, ["a", "b"])
+        assert key == image_job_key("001", "current", 3, ["a", "b"])
+        assert key != image_job_key("001", "specific", 3, ["a", "b"])
+        assert key != image_job_key("001", "current", 4, ["a", "b"])
+        assert key != image_job_key("001", "current", 3, ["ab"])
+
+
+class TestImageJobQueue:
+    """Tests for ImageJobQueue."""
+
+    @pytest.mark.anyio
+    async def test_duplicate_requests_share_a_job(self) -> None:
+        """Submitting identical work while it is queued returns the same job."""
+        queue = ImageJobQueue()
+        runner = _FakeRunner()
+        with patch("api.image_jobs._generate_image_background", runner):
+            first, created = await queue.submit(_job(3))
+            again, created_again = await queue.submit(_job(3))
+            assert created and not created_again
+            assert again.id == first.id
+
+            runner.release.set()
+            await _settle()
+            assert runner.calls == [3]
+            assert first.status == "done"
+            assert first.image_id == "img-3"
+
+            # Finished work can be requested again
+            _, created = await queue.submit(_job(3))
+            assert created
+
+    @pytest.mark.anyio
+    async def test_provider_concurrency_limit(self) -> None:
+        """Jobs beyond provider_concurrency wait for a free slot."""
+        queue = ImageJobQueue()
+        runner = _FakeRunner()
+        with patch("api.image_jobs._generate_image_background", runner):
+            first, _ = await queue.submit(_job(1))
+            second, _ = await queue.submit(_job(2))
+            await _settle()
+            assert (first.status, second.status) == ("running", "pending")
+            assert queue.active_count("001") == 2
+
+            runner.release.set()
+            await _settle()
+            assert runner.max_running == 1
+            assert (first.status, second.status) == ("done", "done")
+
+    @pytest.mark.anyio
+    async def test_failed_generation(self) -> None:
+        """A runner that reports failure marks the job failed."""
+
+        async def fail(**kwargs: Any) -> None:
+            return None
+
+        queue = ImageJobQueue()
+        with patch("api.image_jobs._generate_image_background", fail):
+            job, _ = await queue.submit(_job(1))
+            await _settle()
+        assert job.status == "failed"
+        assert job.error
+
+    @pytest.mark.anyio
+    async def test_cancel(self, temp_campaigns_dir: Path) -> None:
+        """Cancelling stops the job and persists the new status."""
+        queue = ImageJobQueue()
+        runner = _FakeRunner()
+        with patch("api.image_jobs._generate_image_background", runner):
+            running, _ = await queue.submit(_job(1))
+            waiting, _ = await queue.submit(_job(2))
+            await _settle()
+            await queue.cancel(waiting.id)
+            await queue.cancel(running.id)
+            await _settle()
+
+        assert (running.status, waiting.status) == ("cancelled", "cancelled")
+        assert runner.calls == [1]
+        saved = json.loads(
+            (temp_campaigns_dir / "session_001" / "image_jobs.json").read_text()
+        )
+        assert {job["status"] for job in saved} == {"cancelled"}
+
+    @pytest.mark.anyio
+    async def test_shutdown_jobs_are_recovered(self) -> None:
+        """Jobs interrupted by shutdown run again in the next process."""
+        runner = _FakeRunner()
+        with patch("api.image_jobs._generate_image_background", runner):
+            old = ImageJobQueue()
+            running, _ = await old.submit(_job(1))
+            waiting, _ = await old.submit(_job(2))
+            await _settle()
+            await old.shutdown()
+            assert (running.status, waiting.status) == ("pending", "pending")
+
+            runner.release.set()
+            new = ImageJobQueue()
+            assert await new.recover() == 2
+            await _settle()
+
+        assert runner.calls == [1, 1, 2]
+        assert [job.status for job in new.list_jobs("001")] == ["done", "done"]
+        assert new.get(running.id) is not None
+
+    @pytest.mark.anyio
+    async def test_concurrent_persists_prune_once(
+        self, temp_campaigns_dir: Path
+    ) -> None:
+        """Overlapping saves prune old finished jobs without racing."""
+        queue = ImageJobQueue()
+        for turn in range(FINISHED_JOBS_KEPT + 5):
+            job = _job(turn)
+            job.status = "done"
+            job.created_at = f"2026-01-01T00:00:{turn:02d}Z"
+            queue._jobs[job.id] = job
+
+        await asyncio.gather(queue._persist("001"), queue._persist("001"))
+
+        kept = queue.list_jobs("001")
+        assert len(kept) == FINISHED_JOBS_KEPT
+        assert kept[-1].turn_number == 5
+        saved = json.loads(
+            (temp_campaigns_dir / "session_001" / "image_jobs.json").read_text()
+        )
+        assert [job["id"] for job in saved] == [j.id for j in reversed(kept)]
@@ -9,20 +9,24 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 from collections.abc import AsyncIterator, Generator
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import yaml
 from httpx import ASGITransport, AsyncClient
 
+from api.image_jobs import ImageJob, get_image_job_queue, reset_image_job_queue
 from api.main import app
 from api.schemas import BestSceneAccepted
 from image_gen import (
-    TOKENS_PER_WORD,
+    SCANNER_COMPARISON_FAN_IN,
     ImageGenerationError,
     ImageGenerator,
+    clear_chunk_winner_cache,
 )
 from models import (
     ImageGenerationConfig,
@@ -31,6 +35,7 @@ from models import (
     create_initial_game_state,
 )
 from persistence import save_checkpoint, save_session_metadata
+from token_counter import DEFAULT_TOKENS_PER_WORD
 
 # =============================================================================
 # Fixtures
@@ -39,12 +44,12 @@ from persistence import save_checkpoint, save_session_metadata
 
 @pytest.fixture(autouse=True)
 def _clear_image_task_state() -> Generator[None, None, None]:
-    """Clear active image task tracking between tests to prevent leakage."""
-    from api.routes import _active_image_tasks
-
-    _active_image_tasks.clear()
+    """Reset the image job queue between tests to prevent leakage."""
+    reset_image_job_queue()
+    clear_chunk_winner_cache()
     yield
-    _active_image_tasks.clear()
+    reset_image_job_queue()
+    clear_chunk_winner_cache()
 
 
 @pytest.fixture
@@ -163,7 +168,7 @@ class TestEstimateTokens:
         """Estimates tokens as words * 1.3."""
         text = "one two three four five"  # 5 words
         result = ImageGenerator._estimate_tokens(text)
-        assert result == int(5 * TOKENS_PER_WORD)
+        assert result == int(5 * DEFAULT_TOKENS_PER_WORD)
 
     def test_empty_string(self) -> None:
         """Empty string returns 0 tokens."""
@@ -171,14 +176,16 @@ class TestEstimateTokens:
 
     def test_single_word(self) -> None:
         """Single word returns int(1 * 1.3) = 1."""
-        assert ImageGenerator._estimate_tokens("hello") == int(1 * TOKENS_PER_WORD)
+        assert ImageGenerator._estimate_tokens("hello") == int(
+            1 * DEFAULT_TOKENS_PER_WORD
+        )
 
     def test_long_text(self) -> None:
         """Longer text scales linearly with word count."""
         words = ["word"] * 100
         text = " ".join(words)
         result = ImageGenerator._estimate_tokens(text)
-        assert result == int(100 * TOKENS_PER_WORD)
+        assert result == int(100 * DEFAULT_TOKENS_PER_WORD)
 
 
 # =============================================================================
@@ -573,6 +580,186 @@ class TestScanBestScene:
         assert turn == 4
 
 
+class TestConcurrentChunkScan:
+    """Tests for concurrent chunk scanning, winner caching and tree reduce."""
+
+    @staticmethod
+    def _config(token_limit: int, concurrency: int = 4) -> ImageGenerationConfig:
+        return ImageGenerationConfig(
+            scanner_provider="gemini",
+            scanner_model="gemini-3-flash-preview",
+            scanner_token_limit=token_limit,
+            scanner_concurrency=concurrency,
+        )
+
+    @staticmethod
+    def _echo_llm() -> AsyncMock:
+        """LLM mock that picks the first [Turn N] of each prompt."""
+
+        async def _ainvoke(messages: list[Any]) -> MagicMock:
+            text = messages[1].content
+            match = re.search(r"Turn (\d+)", text)
+            turn = int(match.group(1)) if match else 0
+            return MagicMock(
+                content=json.dumps({"turn_number": turn, "rationale": "scene"})
+            )
+
+        mock_llm = AsyncMock()
+        mock_llm.ainvoke = AsyncMock(side_effect=_ainvoke)
+        return mock_llm
+
+    @pytest.mark.anyio
+    async def test_chunks_scanned_concurrently_within_limit(
+        self, image_generator: ImageGenerator
+    ) -> None:
+        """Chunk scans overlap but never exceed scanner_concurrency."""
+        entries = [f"[dm] Entry {i} with some extra words here." for i in range(60)]
+        in_flight = 0
+        peak = 0
+
+        async def _ainvoke(messages: list[Any]) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(content=json.dumps({"turn_number": 1}))
+
+        mock_llm = AsyncMock()
+        mock_llm.ainvoke = AsyncMock(side_effect=_ainvoke)
+
+        with (
+            patch("agents.get_llm", return_value=mock_llm),
+            patch.object(
+                image_generator,
+                "_get_image_config",
+                return_value=self._config(50, concurrency=3),
+            ),
+        ):
+            await image_generator.scan_best_scene(entries)
+
+        assert peak == 3
+
+    @pytest.mark.anyio
+    async def test_rescan_only_scans_new_chunks(
+        self, image_generator: ImageGenerator
+    ) -> None:
+        """Cached winners are reused when the log grows."""
+        entries = [f"[dm] Entry {i} with some extra words here." for i in range(40)]
+        config = self._config(50)
+        first_chunks = ImageGenerator._chunk_log_entries(entries, 50)
+        mock_llm = self._echo_llm()
+
+        with (
+            patch("agents.get_llm", return_value=mock_llm),
+            patch.object(image_generator, "_get_image_config", return_value=config),
+        ):
+            await image_generator.scan_best_scene(entries)
+            first_calls = mock_llm.ainvoke.call_count
+
+            grown = entries + [
+                f"[dm] New entry {i} with extra words." for i in range(10)
+            ]
+            grown_chunks = ImageGenerator._chunk_log_entries(grown, 50)
+            mock_llm.ainvoke.reset_mock()
+            await image_generator.scan_best_scene(grown)
+
+        unchanged = len(set(map(str, first_chunks)) & set(map(str, grown_chunks)))
+        assert unchanged > 0
+        scanned = mock_llm.ainvoke.call_count
+        # Only changed chunks are scanned, plus the comparison stage
+        assert scanned < first_calls
+        assert scanned >= len(grown_chunks) - unchanged
+
+    @pytest.mark.anyio
+    async def test_many_winners_tree_reduced(
+        self, image_generator: ImageGenerator
+    ) -> None:
+        """More winners than the fan-in are compared in groups, then reduced."""
+        mock_llm = self._echo_llm()
+        winners = [(i, f"scene {i}") for i in range(SCANNER_COMPARISON_FAN_IN * 2 + 1)]
+
+        result = await image_generator._compare_winners(
+            mock_llm, winners, asyncio.Semaphore(4)
+        )
+
+        # 3 groups (the last a single pass-through) + 1 final comparison
+        assert mock_llm.ainvoke.call_count == 3
+        for call in mock_llm.ainvoke.call_args_list:
+            prompt = call[0][0][1].content
+            assert prompt.count("- Turn ") <= SCANNER_COMPARISON_FAN_IN
+        assert result[0] == 0
+
+    @pytest.mark.anyio
+    async def test_chunk_failure_raises_scanner_error(
+        self, image_generator: ImageGenerator
+    ) -> None:
+        """A failing chunk scan surfaces as ImageGenerationError."""
+        entries = [f"[dm] Entry {i} with some extra words here." for i in range(40)]
+        mock_llm = AsyncMock()
+        mock_llm.ainvoke = AsyncMock(side_effect=RuntimeError("LLM timeout"))
+
+        with (
+            patch("agents.get_llm", return_value=mock_llm),
+            patch.object(
+                image_generator, "_get_image_config", return_value=self._config(50)
+            ),
+            pytest.raises(ImageGenerationError, match="Scanner LLM failed"),
+        ):
+            await image_generator.scan_best_scene(entries)
+
+
+class TestScanCandidates:
+    """Tests for ImageGenerator.scan_candidates()."""
+
+    @staticmethod
+    def _llm_returning(turn: int) -> AsyncMock:
+        """Create a scanner LLM that picks the given turn."""
+        response = MagicMock()
+        response.content = json.dumps({"turn_number": turn, "rationale": "Dragon"})
+        llm = AsyncMock()
+        llm.ainvoke = AsyncMock(return_value=response)
+        return llm
+
+    @pytest.mark.anyio
+    async def test_only_candidate_excerpts_sent(
+        self, image_generator: ImageGenerator
+    ) -> None:
+        """The scanner sees excerpts around the candidates, not the whole log."""
+        entries = [f"[dm] Entry {i}" for i in range(200)]
+        llm = self._llm_returning(151)
+
+        with patch("agents.get_llm", return_value=llm):
+            turn, rationale = await image_generator.scan_candidates(entries, [150, 40])
+
+        assert (turn, rationale) == (151, "Dragon")
+        assert llm.ainvoke.call_count == 1
+        prompt = llm.ainvoke.call_args[0][0][1].content
+        assert "[Turn 38] [dm] Entry 38" in prompt
+        assert "[Turn 152] [dm] Entry 152" in prompt
+        assert "[Turn 100]" not in prompt
+
+    @pytest.mark.anyio
+    async def test_single_candidate_skips_llm(
+        self, image_generator: ImageGenerator
+    ) -> None:
+        """One candidate is the answer without a scanner call."""
+        with patch("agents.get_llm") as mock_get_llm:
+            turn, _ = await image_generator.scan_candidates(["[dm] A", "[dm] B"], [1])
+        assert turn == 1
+        mock_get_llm.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_reply_outside_excerpts_uses_top_candidate(
+        self, image_generator: ImageGenerator
+    ) -> None:
+        """A turn the scanner was not shown falls back to the best candidate."""
+        entries = [f"[dm] Entry {i}" for i in range(100)]
+        with patch("agents.get_llm", return_value=self._llm_returning(70)):
+            turn, _ = await image_generator.scan_candidates(entries, [10, 30])
+        assert turn == 10
+
+
 # =============================================================================
 # Generate Best Scene Endpoint Tests
 # =============================================================================
@@ -655,19 +842,19 @@ class TestGenerateBestSceneEndpoint:
         image_gen_enabled_config: Path,
     ) -> None:
         """Returns 429 when concurrent image task limit is exceeded."""
-        from api.routes import _MAX_CONCURRENT_IMAGE_TASKS, _active_image_tasks
+        from api.routes import _MAX_CONCURRENT_IMAGE_TASKS
 
         _create_test_session(temp_campaigns_dir, "001")
         log_entries = [f"Turn {i}: Something happens." for i in range(15)]
         _create_test_checkpoint_with_log(temp_campaigns_dir, "001", 15, log_entries)
 
-        # Pre-fill active tasks to exceed limit
-        fake_tasks: set[asyncio.Task[None]] = set()
-        for _ in range(_MAX_CONCURRENT_IMAGE_TASKS):
-            mock_task = MagicMock()
-            mock_task.done.return_value = False
-            fake_tasks.add(mock_task)
-        _active_image_tasks["001"] = fake_tasks  # type: ignore[assignment]
+        # Pre-fill pending jobs to reach the limit
+        queue = get_image_job_queue()
+        for i in range(_MAX_CONCURRENT_IMAGE_TASKS):
+            job = ImageJob(
+                session_id="001", generation_mode="current", dedup_key=str(i)
+            )
+            queue._jobs[job.id] = job
 
         resp = await client.post("/api/sessions/001/images/generate-best")
         assert resp.status_code == 429
@@ -715,7 +902,7 @@ class TestScanAndGenerateBestImageBackground:
     @pytest.mark.anyio
     async def test_scanner_failure_broadcasts_error(self) -> None:
         """Scanner failure broadcasts error event via WebSocket."""
-        from api.routes import _scan_and_generate_best_image
+        from api.image_jobs import _scan_and_generate_best_image
 
         mock_manager = AsyncMock()
 
@@ -748,7 +935,7 @@ class TestScanAndGenerateBestImageBackground:
     @pytest.mark.anyio
     async def test_image_gen_failure_after_scan_broadcasts_error(self) -> None:
         """Image generation failure after successful scan broadcasts error."""
-        from api.routes import _scan_and_generate_best_image
+        from api.image_jobs import _scan_and_generate_best_image
 
         mock_manager = AsyncMock()
 
@@ -778,7 +965,7 @@ class TestScanAndGenerateBestImageBackground:
     @pytest.mark.anyio
     async def test_unexpected_error_broadcasts_error(self) -> None:
         """Unexpected exception broadcasts error event."""
-        from api.routes import _scan_and_generate_best_image
+        from api.image_jobs import _scan_and_generate_best_image
 
         mock_manager = AsyncMock()
 
@@ -806,7 +993,7 @@ class TestScanAndGenerateBestImageBackground:
     @pytest.mark.anyio
     async def test_success_broadcasts_image_ready(self) -> None:
         """Successful flow broadcasts image_ready event with generation_mode=best."""
-        from api.routes import _scan_and_generate_best_image
+        from api.image_jobs import _scan_and_generate_best_image
 
         mock_manager = AsyncMock()
 
@@ -840,7 +1027,7 @@ class TestScanAndGenerateBestImageBackground:
         with (
             patch("image_gen.ImageGenerator") as mock_gen_cls,
             patch("api.websocket.manager", mock_manager),
-            patch("api.routes.get_session_dir") as mock_session_dir,
+            patch("api.image_jobs.get_session_dir") as mock_session_dir,
         ):
             mock_gen = mock_gen_cls.return_value
             mock_gen.scan_best_scene = AsyncMock(return_value=(7, "Epic dragon battle"))
@@ -876,7 +1063,7 @@ class TestScanAndGenerateBestImageBackground:
     @pytest.mark.anyio
     async def test_context_window_extraction(self) -> None:
         """Background task extracts correct context window around identified turn."""
-        from api.routes import _scan_and_generate_best_image
+        from api.image_jobs import _scan_and_generate_best_image
 
         mock_manager = AsyncMock()
 
@@ -901,7 +1088,7 @@ class TestScanAndGenerateBestImageBackground:
         with (
             patch("image_gen.ImageGenerator") as mock_gen_cls,
             patch("api.websocket.manager", mock_manager),
-            patch("api.routes.get_session_dir") as mock_session_dir,
+            patch("api.image_jobs.get_session_dir") as mock_session_dir,
         ):
             mock_gen = mock_gen_cls.return_value
             mock_gen.scan_best_scene = AsyncMock(return_value=(10, "Some scene"))
@@ -925,3 +1112,32 @@ class TestScanAndGenerateBestImageBackground:
         assert len(context_entries) == 11
         assert context_entries[0] == "Entry 5"
         assert context_entries[-1] == "Entry 15"
+
+    @pytest.mark.anyio
+    async def test_candidates_replace_full_scan(self) -> None:
+        """With highlight candidates, only they are scanned."""
+        from api.image_jobs import _scan_and_generate_best_image
+
+        mock_manager = AsyncMock()
+
+        with (
+            patch("image_gen.ImageGenerator") as mock_gen_cls,
+            patch("api.websocket.manager", mock_manager),
+        ):
+            mock_gen = mock_gen_cls.return_value
+            mock_gen.scan_best_scene = AsyncMock()
+            mock_gen.scan_candidates = AsyncMock(
+                side_effect=ImageGenerationError("Scanner timeout")
+            )
+
+            await _scan_and_generate_best_image(
+                session_id="001",
+                task_id="task-cand",
+                log_entries=[f"Entry {i}" for i in range(20)],
+                characters={},
+                candidates=[12, 3],
+            )
+
+        mock_gen.scan_candidates.assert_awaited_once()
+        assert mock_gen.scan_candidates.call_args[0][1] == [12, 3]
+        mock_gen.scan_best_scene.assert_not_called()
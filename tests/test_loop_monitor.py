@@ -0,0 +1,53 @@
+"""Tests for the event loop block monitor (api/loop_monitor.py)."""
+
+import asyncio
+import logging
+import time
+
+import pytest
+
+from api.loop_monitor import LoopBlockMonitor
+
+
+def _blocking_handler() -> None:
+    time.sleep(0.3)
+
+
+class TestLoopBlockMonitor:
+    """Tests for LoopBlockMonitor."""
+
+    def test_threshold_must_be_positive(self) -> None:
+        """A zero threshold is rejected."""
+        with pytest.raises(ValueError):
+            LoopBlockMonitor(0)
+
+    @pytest.mark.anyio
+    async def test_reports_blocking_call_with_stack(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A synchronous sleep on the loop is reported with its caller."""
+        monitor = LoopBlockMonitor(0.05)
+        await monitor.start()
+        try:
+            with caplog.at_level(logging.WARNING, logger="autodungeon"):
+                await asyncio.sleep(0.05)
+                _blocking_handler()
+                await asyncio.sleep(0.1)
+        finally:
+            await monitor.stop()
+
+        assert monitor.blocked_count == 1
+        assert monitor.max_blocked >= 0.05
+        assert "_blocking_handler" in caplog.text
+
+    @pytest.mark.anyio
+    async def test_idle_loop_is_not_reported(self) -> None:
+        """Awaiting without blocking produces no reports."""
+        monitor = LoopBlockMonitor(0.2)
+        await monitor.start()
+        try:
+            await asyncio.sleep(0.3)
+        finally:
+            await monitor.stop()
+
+        assert monitor.blocked_count == 0
@@ -20,10 +20,12 @@ Story 5.3: In-Session Memory References
 - Edge cases for session memory
 """
 
+from unittest.mock import MagicMock
+
 import pytest
 
 import memory as memory_module
-from memory import MemoryManager, estimate_tokens
+from memory import MemoryManager, Summarizer, estimate_tokens
 from models import AgentMemory, GameState, create_initial_game_state
 
 
@@ -133,18 +135,18 @@ class TestEstimateTokens:
         # "hello" "world" = 2 words, 2 * 1.3 = 2.6 -> 2
         assert result == 2
 
-    def test_estimate_tokens_cjk_text(self) -> None:
-        """Test token estimation with CJK-like (non-space-delimited) text.
-
-        CJK text is not space-delimited, so word-based heuristic
-        would fail. The function detects this and uses character-based
-        estimation instead.
-        """
-        # Simulate CJK-like text: long string without spaces (like Chinese)
+    def test_estimate_tokens_unbroken_latin_text(self) -> None:
+        """Long unbroken strings are counted by characters, not as one word."""
         no_space_text = "TheDragonEntersTheCave"  # 22 chars, treated as 1 word
         result = estimate_tokens(no_space_text)
-        # 1 word but 22 chars -> uses char-based: 22 * 0.5 = 11
-        assert result == 11
+        # Longer than LONG_WORD_CHARS -> char-based: 22 / 4 = 5.5 -> 5
+        assert result == 5
+
+    def test_estimate_tokens_cjk_text(self) -> None:
+        """CJK characters are counted individually, not as one word."""
+        result = estimate_tokens("竜が洞窟に入る")
+        # 7 CJK chars * 1.0 tokens each
+        assert result == 7
 
 
 class TestMemoryManagerInit:
@@ -1011,8 +1013,8 @@ class TestEstimateTokensExtended:
         # A single word of 50,000 characters
         long_word = "a" * 50_000
         result = estimate_tokens(long_word)
-        # 1 word but 50,000 chars -> uses char-based: 50,000 * 0.5 = 25,000
-        assert result == 25_000
+        # 1 word but 50,000 chars -> char-based: 50,000 / 4 = 12,500
+        assert result == 12_500
 
     def test_estimate_tokens_mixed_short_long_words(self) -> None:
         """Test token estimation with mix of short and long words."""
@@ -1085,11 +1087,11 @@ class TestEstimateTokensExtended:
         # Uses word-based: 2 * 1.3 = 2.6 -> 2
         assert result == 2
 
-        # At threshold: 1 word, 21 chars
+        # Past LONG_WORD_CHARS: 1 word, 21 chars
         one_long_word = "a" * 21
         result = estimate_tokens(one_long_word)
-        # Uses char-based: 21 * 0.5 = 10.5 -> 10
-        assert result == 10
+        # Uses char-based: 21 / 4 = 5.25 -> 5
+        assert result == 5
 
 
 # =============================================================================
@@ -2108,7 +2110,7 @@ class TestCompressBuffer:
     def test_compress_buffer_updates_long_term_summary(
         self, empty_game_state: GameState
     ) -> None:
-        """Test that compress_buffer updates the long_term_summary field."""
+        """Test that compress_buffer stores the summary as a memory episode."""
         from unittest.mock import MagicMock, patch
 
         state = empty_game_state
@@ -2127,7 +2129,8 @@ class TestCompressBuffer:
 
             manager.compress_buffer("dm")
 
-        assert "New summary content" in state["agent_memories"]["dm"].long_term_summary
+        episodes = state["agent_memories"]["dm"].episodes
+        assert [e.summary for e in episodes] == ["New summary content"]
 
     def test_compress_buffer_clears_old_entries(
         self, empty_game_state: GameState
@@ -2193,7 +2196,7 @@ class TestCompressBuffer:
     def test_compress_buffer_merges_with_existing_summary(
         self, empty_game_state: GameState
     ) -> None:
-        """Test that compress_buffer merges new summary with existing."""
+        """Test that compress_buffer leaves the standing summary alone."""
         from unittest.mock import MagicMock, patch
 
         state = empty_game_state
@@ -2212,9 +2215,9 @@ class TestCompressBuffer:
 
             manager.compress_buffer("dm")
 
-        summary = state["agent_memories"]["dm"].long_term_summary
-        assert "Previous events summary" in summary
-        assert "New events summary" in summary
+        memory = state["agent_memories"]["dm"]
+        assert memory.long_term_summary == "Previous events summary."
+        assert memory.episodes[-1].summary == "New events summary."
 
     def test_compress_buffer_missing_agent(self, empty_game_state: GameState) -> None:
         """Test that compress_buffer handles missing agent gracefully."""
@@ -2399,7 +2402,7 @@ class TestStory52AcceptanceCriteria:
     def test_ac4_summary_stored_in_long_term_summary(
         self, empty_game_state: GameState
     ) -> None:
-        """AC #4: Summary stored in AgentMemory.long_term_summary field."""
+        """AC #4: Summary stored as an AgentMemory episode."""
         from unittest.mock import MagicMock, patch
 
         state = empty_game_state
@@ -2418,9 +2421,10 @@ class TestStory52AcceptanceCriteria:
 
             manager.compress_buffer("dm")
 
-        # Verify summary is stored in long_term_summary field
+        # Verify summary is stored as the latest episode
         assert (
-            state["agent_memories"]["dm"].long_term_summary == "Generated summary text"
+            state["agent_memories"]["dm"].episodes[-1].summary
+            == "Generated summary text"
         )
 
     def test_ac5_summary_serialized_with_checkpoint(
@@ -2620,12 +2624,12 @@ class TestStory52EdgeCases:
 
             manager.compress_buffer("dm")
 
-        summary = state["agent_memories"]["dm"].long_term_summary
-        # Both summaries should be present
-        assert "First summary" in summary
-        assert "Second summary" in summary
-        # Should have separator
-        assert "---" in summary
+        memory = state["agent_memories"]["dm"]
+        # The standing summary is kept and the new one becomes an episode
+        assert memory.long_term_summary == "First summary: Party met in tavern."
+        assert [e.summary for e in memory.episodes] == [
+            "Second summary: Party fought goblins."
+        ]
 
     def test_context_manager_preserves_game_state_integrity(
         self, empty_game_state: GameState
@@ -2914,73 +2918,6 @@ class TestContextManagerTypeConsistency:
 # =============================================================================
 
 
-class TestMergeSummaries:
-    """Tests for _merge_summaries helper function."""
-
-    def test_merge_summaries_empty_existing(self) -> None:
-        """Test merge when existing summary is empty."""
-        from memory import _merge_summaries
-
-        result = _merge_summaries("", "New summary content")
-        assert result == "New summary content"
-
-    def test_merge_summaries_with_existing(self) -> None:
-        """Test merge appends new summary to existing with separator."""
-        from memory import _merge_summaries
-
-        result = _merge_summaries("Previous summary", "New summary")
-        assert "Previous summary" in result
-        assert "New summary" in result
-        assert "---" in result
-
-    def test_merge_summaries_preserves_order(self) -> None:
-        """Test that existing summary comes before new summary."""
-        from memory import _merge_summaries
-
-        result = _merge_summaries("First", "Second")
-        first_pos = result.find("First")
-        second_pos = result.find("Second")
-        assert first_pos < second_pos
-
-    def test_merge_summaries_very_long_existing(self) -> None:
-        """Test merge with very long existing summary (stress test)."""
-        from memory import _merge_summaries
-
-        # Create a 10KB existing summary
-        existing = "Long summary content. " * 500
-        new_summary = "New events summary"
-
-        result = _merge_summaries(existing, new_summary)
-
-        assert existing in result
-        assert new_summary in result
-        assert "---" in result
-
-    def test_merge_summaries_unicode_content(self) -> None:
-        """Test merge with unicode characters."""
-        from memory import _merge_summaries
-
-        result = _merge_summaries(
-            "The wizard cast fireball! ", "The dragon retreated to its lair "
-        )
-        assert "" in result
-        assert "" in result
-
-    def test_merge_summaries_multiline_content(self) -> None:
-        """Test merge with multiline summaries."""
-        from memory import _merge_summaries
-
-        existing = "Line 1\nLine 2\nLine 3"
-        new_summary = "New line 1\nNew line 2"
-
-        result = _merge_summaries(existing, new_summary)
-
-        assert "Line 1" in result
-        assert "New line 2" in result
-        # Should have double newline before and after separator
-        assert "\n\n---\n\n" in result
-
-
 class TestBufferRetentionAfterCompression:
     """Tests verifying buffer retention behavior after compression."""
 
@@ -3689,9 +3626,10 @@ class TestIntegrationRealCompression:
         # Verify summary was returned
         assert "party entered" in summary.lower()
 
-        # Verify long_term_summary was updated
+        # Verify an episode was recorded
         assert (
-            "party entered" in state["agent_memories"]["dm"].long_term_summary.lower()
+            "party entered"
+            in state["agent_memories"]["dm"].episodes[-1].summary.lower()
         )
 
         # Verify buffer was reduced to retained entries
@@ -3700,7 +3638,7 @@ class TestIntegrationRealCompression:
     def test_multiple_compression_cycles_accumulate_summaries(
         self, empty_game_state: GameState
     ) -> None:
-        """Test that multiple compressions accumulate in long_term_summary."""
+        """Test that multiple compressions accumulate as episodes."""
         from unittest.mock import MagicMock, patch
 
         state = empty_game_state
@@ -3720,8 +3658,8 @@ class TestIntegrationRealCompression:
 
             manager.compress_buffer("dm")
 
-        first_summary = state["agent_memories"]["dm"].long_term_summary
-        assert first_summary == "First batch summary"
+        episodes = state["agent_memories"]["dm"].episodes
+        assert [e.summary for e in episodes] == ["First batch summary"]
 
         # Add more entries
         state["agent_memories"]["dm"].short_term_buffer.extend(
@@ -3740,12 +3678,14 @@ class TestIntegrationRealCompression:
 
             manager.compress_buffer("dm")
 
-        final_summary = state["agent_memories"]["dm"].long_term_summary
+        episodes = state["agent_memories"]["dm"].episodes
 
-        # Both summaries should be present
-        assert "First batch summary" in final_summary
-        assert "Second batch summary" in final_summary
-        assert "---" in final_summary
+        # Both summaries should be present, in order
+        assert [e.summary for e in episodes] == [
+            "First batch summary",
+            "Second batch summary",
+        ]
+        assert episodes[1].turn_start == episodes[0].turn_end + 1
 
         # Cleanup
         memory._summarizer_cache.clear()
@@ -5422,3 +5362,284 @@ class TestUpdateCharacterFacts:
         assert "Cunning" in updated_facts.key_traits
         assert "Theros" in updated_facts.relationships
         assert "Found the key" in updated_facts.notable_events
+
+
+# =============================================================================
+# Shared Public-Event Summaries
+# =============================================================================
+
+
+class TestSharedEventSummary:
+    """Tests for summarizing public events once per compression window."""
+
+    @staticmethod
+    def _party_state(empty_game_state: GameState) -> GameState:
+        log = []
+        for i in range(6):
+            log += [f"[DM]: Scene {i}", f"[Thorin]: Swing {i}"]
+        empty_game_state["ground_truth_log"] = log
+        empty_game_state["agent_memories"]["dm"] = AgentMemory(
+            short_term_buffer=[e for e in log if e.startswith("[DM]")],
+            token_limit=20,
+        )
+        empty_game_state["agent_memories"]["fighter"] = AgentMemory(
+            short_term_buffer=[e for e in log if e.startswith("[Thorin]")],
+            token_limit=8000,
+        )
+        return empty_game_state
+
+    def test_public_window_summarized_once(self, empty_game_state: GameState) -> None:
+        """Agents compressed together share one summary of the window."""
+        from unittest.mock import MagicMock, patch
+
+        state = self._party_state(empty_game_state)
+        manager = MemoryManager(state)
+
+        with patch("memory.Summarizer") as MockSummarizer:
+            mock_instance = MagicMock()
+            mock_instance.generate_summary.return_value = "The party fought."
+            MockSummarizer.return_value = mock_instance
+
+            manager.compress_buffer("dm")
+            manager.compress_buffer("fighter")
+
+        mock_instance.generate_summary.assert_called_once_with(
+            "the party", state["ground_truth_log"][:9]
+        )
+        for agent in ("dm", "fighter"):
+            episode = state["agent_memories"][agent].episodes[-1]
+            assert (episode.turn_start, episode.turn_end) == (1, 9)
+            assert episode.summary == "The party fought."
+
+    def test_first_window_starts_at_oldest_buffered_turn(
+        self, empty_game_state: GameState
+    ) -> None:
+        """A long log saved before episodes existed is not summarized whole."""
+        from unittest.mock import MagicMock, patch
+
+        state = self._party_state(empty_game_state)
+        older = [f"[DM]: Old scene {i}" for i in range(500)]
+        state["ground_truth_log"] = older + state["ground_truth_log"]
+        manager = MemoryManager(state)
+
+        with patch("memory.Summarizer") as MockSummarizer:
+            mock_instance = MagicMock()
+            mock_instance.generate_summary.return_value = "The party fought."
+            MockSummarizer.return_value = mock_instance
+
+            manager.compress_buffer("dm")
+            manager.compress_buffer("fighter")
+
+        mock_instance.generate_summary.assert_called_once_with(
+            "the party", state["ground_truth_log"][500:509]
+        )
+        for agent in ("dm", "fighter"):
+            episode = state["agent_memories"][agent].episodes[-1]
+            assert (episode.turn_start, episode.turn_end) == (501, 509)
+
+    def test_private_entries_summarized_per_agent(
+        self, empty_game_state: GameState
+    ) -> None:
+        """Entries missing from the public log get the agent's own summary."""
+        from unittest.mock import MagicMock, patch
+
+        state = self._party_state(empty_game_state)
+        fighter = state["agent_memories"]["fighter"]
+        fighter.short_term_buffer.insert(0, "Thorin pockets the ruby unseen.")
+        manager = MemoryManager(state)
+
+        with patch("memory.Summarizer") as MockSummarizer:
+            mock_instance = MagicMock()
+            mock_instance.generate_summary.side_effect = [
+                "The party fought.",
+                "Thorin kept a ruby.",
+            ]
+            MockSummarizer.return_value = mock_instance
+
+            manager.compress_buffer("fighter")
+
+        assert mock_instance.generate_summary.call_args_list[1].args == (
+            "fighter",
+            ["Thorin pockets the ruby unseen."],
+        )
+        assert fighter.episodes[-1].summary == (
+            "The party fought.\n\nThorin kept a ruby."
+        )
+
+    def test_context_manager_compresses_party_together(
+        self, empty_game_state: GameState
+    ) -> None:
+        """One agent reaching its limit compresses the others alongside."""
+        from unittest.mock import MagicMock, patch
+
+        from graph import context_manager
+
+        state = self._party_state(empty_game_state)
+
+        with patch("memory.Summarizer") as MockSummarizer:
+            mock_instance = MagicMock()
+            mock_instance.generate_summary.return_value = "The party fought."
+            MockSummarizer.return_value = mock_instance
+
+            result = context_manager(state)
+
+        assert mock_instance.generate_summary.call_count == 1
+        assert len(result["agent_memories"]["fighter"].short_term_buffer) == 3
+        assert len(result["agent_memories"]["fighter"].episodes) == 1
+        # The input state's memories are untouched
+        assert len(state["agent_memories"]["fighter"].short_term_buffer) == 6
+
+
+# =============================================================================
+# Batched Summarization
+# =============================================================================
+
+
+class TestSummarizerBatching:
+    """Tests for summarizing several agents' entries in one request."""
+
+    @staticmethod
+    def _summarizer(*contents: str) -> tuple[Summarizer, MagicMock]:
+        summarizer = Summarizer(provider="gemini", model="gemini-1.5-flash")
+        mock_llm = MagicMock()
+        mock_llm.invoke.side_effect = [MagicMock(content=c) for c in contents]
+        summarizer._llm = mock_llm
+        return summarizer, mock_llm
+
+    def test_sections_summarized_in_one_call(self) -> None:
+        """Two requests share one LLM call with a section each."""
+        summarizer, mock_llm = self._summarizer(
+            '```json\n{"1": "The party fought.", "2": "Thorin kept a ruby."}\n```'
+        )
+
+        result = summarizer.generate_summaries(
+            [("the party", ["[DM]: Goblins attack."]), ("fighter", ["Ruby taken."])]
+        )
+
+        assert result == ["The party fought.", "Thorin kept a ruby."]
+        mock_llm.invoke.assert_called_once()
+        human_message = mock_llm.invoke.call_args[0][0][1]
+        assert "## Section 1: events for the party" in human_message.content
+        assert "## Section 2: events for fighter" in human_message.content
+
+    def test_batches_split_at_max_buffer_chars(self) -> None:
+        """Requests that do not fit together go in separate calls."""
+        from unittest.mock import patch
+
+        from memory import Summarizer
+
+        summarizer, mock_llm = self._summarizer('{"1": "A", "2": "B"}', "C")
+
+        with patch.object(Summarizer, "MAX_BUFFER_CHARS", 10):
+            result = summarizer.generate_summaries(
+                [("dm", ["aaaa"]), ("rogue", ["bbbb"]), ("fighter", ["cccc"])]
+            )
+
+        assert result == ["A", "B", "C"]
+        assert mock_llm.invoke.call_count == 2
+
+    def test_unparseable_response_falls_back_per_agent(self) -> None:
+        """A batch the LLM answers without JSON is summarized one by one."""
+        summarizer, mock_llm = self._summarizer(
+            "Here are your summaries!", "Summary one", "Summary two"
+        )
+
+        result = summarizer.generate_summaries(
+            [("dm", ["Event 1"]), ("rogue", ["Event 2"])]
+        )
+
+        assert result == ["Summary one", "Summary two"]
+        assert mock_llm.invoke.call_count == 3
+
+    def test_failed_batch_call_not_retried(self) -> None:
+        """A batch whose call fails is not retried agent by agent."""
+        summarizer = Summarizer(provider="gemini", model="gemini-1.5-flash")
+        mock_llm = MagicMock()
+        mock_llm.invoke.side_effect = TimeoutError("timed out")
+        summarizer._llm = mock_llm
+
+        result = summarizer.generate_summaries(
+            [("dm", ["Event 1"]), ("rogue", ["Event 2"])]
+        )
+
+        assert result == ["", ""]
+        mock_llm.invoke.assert_called_once()
+
+    def test_missing_section_falls_back(self) -> None:
+        """Only the sections the response left out are retried."""
+        summarizer, mock_llm = self._summarizer('{"1": "Summary one"}', "Summary two")
+
+        result = summarizer.generate_summaries(
+            [("dm", ["Event 1"]), ("rogue", ["Event 2"])]
+        )
+
+        assert result == ["Summary one", "Summary two"]
+        retry_message = mock_llm.invoke.call_args[0][0][1]
+        assert "for rogue" in retry_message.content
+
+    def test_prepared_buffer_compression_used(
+        self, empty_game_state: GameState
+    ) -> None:
+        """compress_buffer uses the batch instead of its own calls."""
+        from unittest.mock import MagicMock, patch
+
+        state = TestSharedEventSummary._party_state(empty_game_state)
+        fighter = state["agent_memories"]["fighter"]
+        fighter.short_term_buffer.insert(0, "Thorin pockets the ruby unseen.")
+        manager = MemoryManager(state)
+
+        with patch("memory.Summarizer") as MockSummarizer:
+            mock_instance = MagicMock()
+            mock_instance.generate_summaries.return_value = [
+                "The party fought.",
+                "Thorin kept a ruby.",
+            ]
+            MockSummarizer.return_value = mock_instance
+
+            manager.prepare_buffer_compression(["dm", "fighter"])
+            manager.compress_buffer("dm")
+            manager.compress_buffer("fighter")
+
+        mock_instance.generate_summaries.assert_called_once_with(
+            [
+                ("the party", state["ground_truth_log"][:9]),
+                ("fighter", ["Thorin pockets the ruby unseen."]),
+            ]
+        )
+        mock_instance.generate_summary.assert_not_called()
+        assert state["agent_memories"]["dm"].episodes[-1].summary == (
+            "The party fought."
+        )
+        assert fighter.episodes[-1].summary == (
+            "The party fought.\n\nThorin kept a ruby."
+        )
+
+    def test_prepared_summary_compression_used(
+        self, empty_game_state: GameState
+    ) -> None:
+        """compress_long_term_summary uses the batch unless the summary changed."""
+        from unittest.mock import MagicMock, patch
+
+        empty_game_state["agent_memories"]["dm"] = AgentMemory(
+            long_term_summary="Long DM summary"
+        )
+        empty_game_state["agent_memories"]["rogue"] = AgentMemory(
+            long_term_summary="Long rogue summary"
+        )
+        manager = MemoryManager(empty_game_state)
+
+        with patch("memory.Summarizer") as MockSummarizer:
+            mock_instance = MagicMock()
+            mock_instance.generate_summaries.return_value = ["DM", "Rogue"]
+            mock_instance.generate_summary.return_value = "Rogue again"
+            MockSummarizer.return_value = mock_instance
+
+            manager.prepare_summary_compression(["dm", "rogue"])
+            empty_game_state["agent_memories"]["rogue"].long_term_summary = "Changed"
+            manager.compress_long_term_summary("dm")
+            manager.compress_long_term_summary("rogue")
+
+        memories = empty_game_state["agent_memories"]
+        assert memories["dm"].long_term_summary == "DM"
+        assert memories["rogue"].long_term_summary == "Rogue again"
+        mock_instance.generate_summary.assert_called_once_with("rogue", ["Changed"])
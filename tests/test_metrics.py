@@ -0,0 +1,205 @@
+"""Tests for the in-process metrics registry (metrics.py) and its hooks."""
+
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from metrics import (
+    CHECKPOINT_SAVE_BYTES,
+    CHECKPOINT_SAVE_SECONDS,
+    LLM_TOKENS,
+    NODE_SECONDS,
+    WS_BROADCAST_LAG_SECONDS,
+    Counter,
+    Histogram,
+    _registry,
+    render_metrics,
+    reset_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_metrics() -> Generator[None, None, None]:
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+@pytest.fixture
+def scratch_metrics() -> Generator[list[Any], None, None]:
+    """Unregister metrics created by a test when it finishes."""
+    created: list[Any] = []
+    yield created
+    for metric in created:
+        _registry.remove(metric)
+
+
+class TestCounter:
+    """Tests for Counter."""
+
+    def test_increments_per_label_set(self, scratch_metrics: list[Any]) -> None:
+        """Each label combination is tracked separately."""
+        counter = Counter("test_calls_total", "Calls.", ("agent",))
+        scratch_metrics.append(counter)
+
+        counter.inc(agent="dm")
+        counter.inc(2, agent="dm")
+        counter.inc(agent="fighter")
+
+        assert counter.value(agent="dm") == 3
+        assert counter.value(agent="fighter") == 1
+        assert counter.value(agent="rogue") == 0
+
+    def test_rejects_negative_and_wrong_labels(
+        self, scratch_metrics: list[Any]
+    ) -> None:
+        """Counters only go up and require exactly their label names."""
+        counter = Counter("test_errors_total", "Errors.", ("agent",))
+        scratch_metrics.append(counter)
+
+        with pytest.raises(ValueError):
+            counter.inc(-1, agent="dm")
+        with pytest.raises(ValueError):
+            counter.inc(session="001")
+
+    def test_total_sums_matching_label_sets(self, scratch_metrics: list[Any]) -> None:
+        """total() sums over the labels that are not given."""
+        counter = Counter("test_tokens_total", "Tokens.", ("session", "direction"))
+        scratch_metrics.append(counter)
+
+        counter.inc(10, session="001", direction="input")
+        counter.inc(5, session="001", direction="output")
+        counter.inc(7, session="002", direction="input")
+
+        assert counter.total(session="001") == 15
+        assert counter.total(direction="input") == 17
+        assert counter.total() == 22
+        with pytest.raises(ValueError):
+            counter.total(agent="dm")
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_observations_land_in_cumulative_buckets(
+        self, scratch_metrics: list[Any]
+    ) -> None:
+        """Rendered buckets are cumulative and end with +Inf."""
+        hist = Histogram("test_seconds", "Durations.", ("node",), buckets=(1, 5))
+        scratch_metrics.append(hist)
+
+        for value in (0.5, 1.0, 3.0, 10.0):
+            hist.observe(value, node="dm")
+
+        text = hist.render()
+        assert 'test_seconds_bucket{node="dm",le="1"} 2' in text
+        assert 'test_seconds_bucket{node="dm",le="5"} 3' in text
+        assert 'test_seconds_bucket{node="dm",le="+Inf"} 4' in text
+        assert 'test_seconds_count{node="dm"} 4' in text
+        assert hist.sum(node="dm") == 14.5
+
+    def test_time_records_even_on_error(self, scratch_metrics: list[Any]) -> None:
+        """The timer observes the block's duration when it raises."""
+        hist = Histogram("test_block_seconds", "Durations.", ("node",))
+        scratch_metrics.append(hist)
+
+        with pytest.raises(RuntimeError), hist.time(node="dm"):
+            raise RuntimeError("boom")
+
+        assert hist.count(node="dm") == 1
+
+    def test_label_values_are_escaped(self, scratch_metrics: list[Any]) -> None:
+        """Quotes and backslashes in label values are escaped."""
+        hist = Histogram("test_escape_seconds", "Durations.", ("model",))
+        scratch_metrics.append(hist)
+
+        hist.observe(0.1, model='odd"name\\')
+
+        assert 'model="odd\\"name\\\\"' in hist.render()
+
+
+class TestHooks:
+    """Tests for metrics recorded by the game modules."""
+
+    def test_render_includes_help_and_type(self) -> None:
+        """Every game metric is exported even before it has samples."""
+        text = render_metrics()
+        assert "# TYPE autodungeon_round_duration_seconds histogram" in text
+        assert "# TYPE autodungeon_tool_calls_total counter" in text
+        assert text.endswith("\n")
+
+    def test_checkpoint_save_records_time_and_bytes(self, tmp_path: Path) -> None:
+        """save_checkpoint observes duration and bytes written per session."""
+        from models import create_initial_game_state
+        from persistence import save_checkpoint
+
+        campaigns = tmp_path / "campaigns"
+        campaigns.mkdir()
+        with patch("persistence.CAMPAIGNS_DIR", campaigns):
+            path = save_checkpoint(
+                create_initial_game_state(), "001", 1, update_metadata=False
+            )
+
+        blobs = (campaigns / "session_001" / "objects").rglob("*.json")
+        blob_bytes = sum(blob.stat().st_size for blob in blobs)
+        assert blob_bytes > 0
+        assert CHECKPOINT_SAVE_SECONDS.count(session="001") == 1
+        assert CHECKPOINT_SAVE_BYTES.sum(session="001") == (
+            path.stat().st_size + blob_bytes
+        )
+
+    def test_graph_nodes_are_timed(self) -> None:
+        """Wrapped graph nodes record their duration under the node name."""
+        from graph import _timed_node
+        from models import create_initial_game_state
+
+        state = create_initial_game_state()
+        state["session_id"] = "042"
+        node = _timed_node("dm", lambda s: s)
+
+        assert node(state) is state
+        assert NODE_SECONDS.count(session="042", node="dm") == 1
+
+    @pytest.mark.anyio
+    async def test_engine_broadcast_records_lag(self) -> None:
+        """Engine broadcasts record lag labelled by event type."""
+        from api.engine import GameEngine
+
+        engine = GameEngine(session_id="007")
+
+        async def collector(event: dict[str, Any]) -> None:
+            pass
+
+        engine.set_broadcast_callback(collector)
+        await engine._broadcast({"type": "turn_update"})
+
+        assert WS_BROADCAST_LAG_SECONDS.count(session="007", event="turn_update") == 1
+
+    def test_llm_calls_record_reported_tokens(self) -> None:
+        """_invoke_llm adds the response's usage metadata to LLM_TOKENS."""
+        from agents import _invoke_llm
+
+        model = MagicMock()
+        model.invoke.return_value = AIMessage(
+            content="ok",
+            usage_metadata={
+                "input_tokens": 120,
+                "output_tokens": 30,
+                "total_tokens": 150,
+            },
+        )
+        _invoke_llm(
+            model,
+            [],
+            session_id="009",
+            provider="gemini",
+            model="gemini-3-flash-preview",
+            agent_name="dm",
+        )
+
+        assert LLM_TOKENS.total(session="009", direction="input") == 120
+        assert LLM_TOKENS.total(session="009") == 150
@@ -549,6 +549,68 @@ class TestGameState:
         assert state["characters"]["shadowmere"].name == "Shadowmere"
 
 
+class TestGroundTruthLog:
+    """Tests for the segment-backed GroundTruthLog sequence."""
+
+    def test_behaves_like_a_list(self) -> None:
+        """Indexing, slicing, iteration and equality match a plain list."""
+        from models import LOG_SEGMENT_SIZE, GroundTruthLog
+
+        entries = [f"[dm]: {i}" for i in range(2 * LOG_SEGMENT_SIZE + 7)]
+        log = GroundTruthLog(entries)
+
+        assert len(log) == len(entries)
+        assert len(log.segments) == 2
+        assert log == entries
+        assert entries == log
+        assert log[-1] == entries[-1]
+        assert log[LOG_SEGMENT_SIZE] == entries[LOG_SEGMENT_SIZE]
+        for start, stop in [(0, None), (250, 260), (-15, None), (300, 100)]:
+            assert log[start:stop] == entries[start:stop]
+        assert log[::100] == entries[::100]
+        assert list(reversed(log)) == entries[::-1]
+        with pytest.raises(IndexError):
+            log[len(entries)]
+
+    def test_copy_shares_sealed_segments(self) -> None:
+        """Copies share sealed segments; appends do not leak between copies."""
+        from models import LOG_SEGMENT_SIZE, GroundTruthLog
+
+        log = GroundTruthLog(str(i) for i in range(LOG_SEGMENT_SIZE + 1))
+        copy = log.copy()
+        copy.append("new")
+
+        assert copy.segments[0] is log.segments[0]
+        assert len(log) == LOG_SEGMENT_SIZE + 1
+        assert copy[-1] == "new"
+        assert (log + ["x"])[-1] == "x"
+
+    def test_released_segment_pages_in_through_loader(self) -> None:
+        """A persisted segment drops its entries and reloads on demand."""
+        from models import (
+            LOG_SEGMENT_SIZE,
+            GroundTruthLog,
+            clear_log_segment_cache,
+        )
+
+        entries = [str(i) for i in range(LOG_SEGMENT_SIZE)]
+        loads: list[str] = []
+
+        def loader(digest: str) -> list[str]:
+            loads.append(digest)
+            return list(entries)
+
+        clear_log_segment_cache()
+        log = GroundTruthLog(entries)
+        log.segments[0].mark_persisted("a" * 64, loader)
+        log.release_persisted()
+
+        assert not log.segments[0].resident
+        assert log[3] == "3"
+        assert log[4] == "4"
+        assert loads == ["a" * 64]
+
+
 class TestFactoryFunctions:
     """Tests for state factory functions."""
 
@@ -585,6 +647,35 @@ class TestFactoryFunctions:
         memory = create_agent_memory(token_limit=4000)
         assert memory.token_limit == 4000
 
+    def test_append_to_memory_shares_other_agents(self) -> None:
+        """Test append_to_memory copies only the acting agent's memory."""
+        from models import AgentMemory, append_to_memory
+
+        dm = AgentMemory(short_term_buffer=["[DM]: Hello"])
+        rogue = AgentMemory(short_term_buffer=["[Shadowmere]: Hi"])
+        memories = {"dm": dm, "rogue": rogue}
+
+        result = append_to_memory(memories, "rogue", "[Shadowmere]: I hide")
+
+        assert result is not memories
+        assert result["dm"] is dm
+        assert result["rogue"].short_term_buffer == [
+            "[Shadowmere]: Hi",
+            "[Shadowmere]: I hide",
+        ]
+        # Input is unchanged
+        assert memories["rogue"] is rogue
+        assert rogue.short_term_buffer == ["[Shadowmere]: Hi"]
+
+    def test_append_to_memory_creates_missing_memory(self) -> None:
+        """Test append_to_memory creates a memory with the given token_limit."""
+        from models import append_to_memory
+
+        result = append_to_memory({}, "fighter", "[Theron]: Charge!", token_limit=4000)
+
+        assert result["fighter"].short_term_buffer == ["[Theron]: Charge!"]
+        assert result["fighter"].token_limit == 4000
+
 
 class TestGameStateInitialization:
     """Tests for initializing GameState with character configs."""
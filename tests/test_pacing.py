@@ -0,0 +1,89 @@
+"""Tests for adaptive autopilot pacing (api/pacing.py)."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from api.pacing import AutopilotPacer
+
+
+class _Clock:
+    """Manually advanced wall clock, starting at 12:00 UTC."""
+
+    def __init__(self) -> None:
+        self.now = datetime(2026, 3, 1, 12, 0, tzinfo=UTC).timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestNextDelay:
+    """Tests for AutopilotPacer.next_delay()."""
+
+    def test_no_targets_uses_floor(self) -> None:
+        """Without targets or rate limits the floor is the delay."""
+        pacer = AutopilotPacer(clock=_Clock())
+        pacer.record_round(40.0, 5000)
+        assert pacer.next_delay(3.0) == 3.0
+
+    def test_rounds_per_hour_fills_the_slot(self) -> None:
+        """The delay tops each round up to its share of the hour."""
+        pacer = AutopilotPacer(rounds_per_hour=60, clock=_Clock())
+        pacer.record_round(20.0, 0)
+        assert pacer.next_delay(0.2) == pytest.approx(40.0)
+
+        # Rounds slower than the target run back to back
+        slow = AutopilotPacer(rounds_per_hour=60, clock=_Clock())
+        slow.record_round(90.0, 0)
+        assert slow.next_delay(0.2) == 0.2
+
+    def test_token_budget_is_spread_over_the_day(self) -> None:
+        """The remaining budget is spread until midnight UTC."""
+        # 12 hours left, 1200 tokens per round, 12000 tokens left: 10 rounds
+        pacer = AutopilotPacer(daily_token_budget=13200, clock=_Clock())
+        pacer.record_round(60.0, 1200)
+        assert pacer.budget_remaining() == 12000
+        assert pacer.next_delay(0.2) == pytest.approx(12 * 3600 / 10 - 60)
+
+    def test_spent_budget_waits_for_reset(self) -> None:
+        """Once the budget is spent the autopilot waits for the next day."""
+        clock = _Clock()
+        pacer = AutopilotPacer(daily_token_budget=1000, clock=clock)
+        pacer.record_round(10.0, 1500)
+        assert pacer.next_delay(0.2) == pytest.approx(12 * 3600)
+
+        clock.now += 12 * 3600
+        assert pacer.tokens_today == 0
+        assert pacer.budget_remaining() == 1000
+
+    def test_rate_limits_add_a_decaying_penalty(self) -> None:
+        """Repeated 429s double the penalty; successful rounds halve it."""
+        pacer = AutopilotPacer(clock=_Clock())
+        pacer.record_rate_limit()
+        pacer.record_rate_limit()
+        assert pacer.next_delay(1.0) == 1.0 + 2 * AutopilotPacer.RATE_LIMIT_PENALTY_MIN
+
+        for _ in range(8):
+            pacer.record_round(10.0, 0)
+        assert pacer.rate_limit_penalty == 0.0
+
+
+class TestProjection:
+    """Tests for projected completion reporting."""
+
+    def test_no_projection_before_first_round(self) -> None:
+        """Nothing is projected until a round has been measured."""
+        assert AutopilotPacer().projected_completion(10, 1.0) is None
+
+    def test_snapshot_projects_completion(self) -> None:
+        """Remaining rounds take the average round time plus the delay."""
+        clock = _Clock()
+        pacer = AutopilotPacer(daily_token_budget=100000, clock=clock)
+        pacer.record_round(50.0, 2000)
+
+        snapshot = pacer.snapshot(rounds_left=36, delay=50.0)
+
+        assert snapshot["projected_completion"] == "2026-03-01T13:00:00+00:00"
+        assert snapshot["tokens_today"] == 2000
+        assert snapshot["token_budget_remaining"] == 98000
+        assert snapshot["avg_round_tokens"] == 2000
@@ -393,7 +393,7 @@ class TestSaveCheckpoint:
 
         assert isinstance(data, dict)
         assert "ground_truth_log" in data
-        assert "agent_memories" in data
+        assert "agent_memories" in data["sections"]
 
     def test_save_checkpoint_content_matches_state(
         self, temp_campaigns_dir: Path, sample_game_state: GameState
@@ -6279,6 +6279,28 @@ class TestInitializeSessionWithPreviousMemories:
         # But long_term_summary is preserved
         assert result["agent_memories"]["dm"].long_term_summary == "Previous summary"
 
+    def test_initialize_carries_over_episodes(self, temp_campaigns_dir: Path) -> None:
+        """Test that episodes carry over, renumbered to before the new log."""
+        from models import AgentMemory, MemoryEpisode
+        from persistence import (
+            initialize_session_with_previous_memories,
+            save_checkpoint,
+        )
+
+        episode = MemoryEpisode(turn_start=1, turn_end=40, summary="The keep fell.")
+        prev_state = create_initial_game_state()
+        prev_state["agent_memories"]["dm"] = AgentMemory(episodes=[episode])
+        new_state = create_initial_game_state()
+        new_state["agent_memories"]["dm"] = AgentMemory()
+
+        with patch("persistence.CAMPAIGNS_DIR", temp_campaigns_dir):
+            save_checkpoint(prev_state, "001", 40, update_metadata=False)
+            result = initialize_session_with_previous_memories("001", "002", new_state)
+
+        assert result["agent_memories"]["dm"].episodes == [
+            MemoryEpisode(turn_start=0, turn_end=0, summary="The keep fell.")
+        ]
+
     def test_initialize_no_previous_session_returns_state_unchanged(
         self, temp_campaigns_dir: Path
     ) -> None:
@@ -6485,3 +6507,354 @@ class TestGenerateRecapSummaryEnhanced:
 
         assert recap is not None
         assert "dungeon" in recap or "traps" in recap
+
+
+# =============================================================================
+# Content-Addressed Section Store
+# =============================================================================
+
+
+class TestContentAddressedStore:
+    """Tests for manifest checkpoints backed by the per-session blob store."""
+
+    @staticmethod
+    def _blob_count(campaigns_dir: Path, session_id: str = "001") -> int:
+        objects_dir = campaigns_dir / f"session_{session_id}" / "objects"
+        return len(list(objects_dir.glob("*/*.json")))
+
+    def test_checkpoint_is_manifest_with_inline_log(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Bulky sections are hash references; the log stays inline."""
+        path = save_checkpoint(sample_game_state, "001", 1, update_metadata=False)
+        data = json.loads(path.read_text(encoding="utf-8"))
+
+        assert data["manifest_version"] == 2
+        assert data["ground_truth_log"] == sample_game_state["ground_truth_log"]
+        assert data["log_segments"] == []
+        assert "characters" not in data
+        assert set(data["sections"]["agent_memories"]) == {"dm", "fighter"}
+        assert len(data["sections"]["game_config"]) == 64
+
+    def test_round_trip_through_manifest(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Loading a manifest checkpoint reproduces the saved state."""
+        save_checkpoint(sample_game_state, "001", 1, update_metadata=False)
+        loaded = load_checkpoint("001", 1)
+
+        assert loaded is not None
+        assert serialize_game_state(loaded) == serialize_game_state(sample_game_state)
+
+    def test_unchanged_sections_are_not_duplicated(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Saving a second turn only adds blobs for changed sections."""
+        save_checkpoint(sample_game_state, "001", 1, update_metadata=False)
+        first_count = self._blob_count(temp_campaigns_dir)
+
+        sample_game_state["ground_truth_log"].append("[rogue] I sneak ahead.")
+        sample_game_state["agent_memories"]["fighter"] = AgentMemory(
+            short_term_buffer=["I attacked the goblin.", "The goblin fled."],
+            token_limit=4000,
+        )
+        save_checkpoint(sample_game_state, "001", 2, update_metadata=False)
+
+        # Only the fighter's memory changed
+        assert self._blob_count(temp_campaigns_dir) == first_count + 1
+
+    def test_fork_shares_session_blobs(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Fork checkpoints reuse the session's existing blobs."""
+        from persistence import create_fork, load_fork_checkpoint
+
+        save_checkpoint(sample_game_state, "001", 1, update_metadata=False)
+        count = self._blob_count(temp_campaigns_dir)
+
+        fork = create_fork(sample_game_state, "001", "Side quest")
+
+        assert self._blob_count(temp_campaigns_dir) == count
+        assert load_fork_checkpoint("001", fork.fork_id, 1) is not None
+
+    def test_collect_garbage_removes_unreferenced_blobs(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Blobs referenced only by a deleted checkpoint are collected."""
+        from persistence import collect_garbage
+
+        save_checkpoint(sample_game_state, "001", 1, update_metadata=False)
+        sample_game_state["game_config"] = GameConfig(party_size=3)
+        path = save_checkpoint(sample_game_state, "001", 2, update_metadata=False)
+        before = self._blob_count(temp_campaigns_dir)
+
+        # Nothing is unreferenced yet
+        assert collect_garbage("001", grace_seconds=0) == 0
+
+        path.unlink()
+        assert collect_garbage("001", grace_seconds=0) == 1
+        assert self._blob_count(temp_campaigns_dir) == before - 1
+        assert load_checkpoint("001", 1) is not None
+
+    def test_collect_garbage_keeps_recent_blobs(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Unreferenced blobs inside the grace period survive collection."""
+        from persistence import collect_garbage
+
+        path = save_checkpoint(sample_game_state, "001", 1, update_metadata=False)
+        path.unlink()
+
+        assert collect_garbage("001") == 0
+        assert self._blob_count(temp_campaigns_dir) > 0
+
+    def test_missing_blob_returns_none(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """A manifest referencing a missing blob loads as None."""
+        import shutil
+
+        save_checkpoint(sample_game_state, "001", 1, update_metadata=False)
+        shutil.rmtree(temp_campaigns_dir / "session_001" / "objects")
+
+        assert load_checkpoint("001", 1) is None
+
+    def test_invalid_blob_hash_rejected(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Manifest hashes cannot be used for path traversal."""
+        path = save_checkpoint(sample_game_state, "001", 1, update_metadata=False)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["sections"]["game_config"] = "../../config"
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        assert load_checkpoint("001", 1) is None
+
+    def test_legacy_self_contained_checkpoint_loads(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Checkpoints written before the blob store still load."""
+        session_dir = ensure_session_dir("001")
+        (session_dir / "turn_001.json").write_text(
+            serialize_game_state(sample_game_state), encoding="utf-8"
+        )
+
+        loaded = load_checkpoint("001", 1)
+
+        assert loaded is not None
+        assert loaded["characters"]["fighter"].name == "Theron"
+
+
+class TestSegmentedLog:
+    """Tests for ground_truth_log segments stored in the blob store."""
+
+    @staticmethod
+    def _long_state(sample_game_state: GameState, entries: int) -> GameState:
+        from models import GroundTruthLog
+
+        sample_game_state["ground_truth_log"] = GroundTruthLog(
+            f"[dm] Entry {i}" for i in range(entries)
+        )
+        return sample_game_state
+
+    def test_sealed_segments_are_blobs_and_tail_is_inline(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Only entries after the last full segment are written inline."""
+        from models import LOG_SEGMENT_SIZE
+
+        state = self._long_state(sample_game_state, 2 * LOG_SEGMENT_SIZE + 10)
+        path = save_checkpoint(state, "001", 1, update_metadata=False)
+        data = json.loads(path.read_text(encoding="utf-8"))
+
+        assert len(data["log_segments"]) == 2
+        assert data["log_segment_size"] == LOG_SEGMENT_SIZE
+        assert data["ground_truth_log"] == state["ground_truth_log"][-10:]
+
+    def test_round_trip_pages_segments_in_on_demand(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Loading reads no segment blobs until old entries are indexed."""
+        import persistence
+        from models import clear_log_segment_cache
+
+        state = self._long_state(sample_game_state, 600)
+        save_checkpoint(state, "001", 1, update_metadata=False)
+        clear_log_segment_cache()
+
+        with patch.object(
+            persistence, "_read_blob", wraps=persistence._read_blob
+        ) as read_blob:
+            loaded = load_checkpoint("001", 1)
+            assert loaded is not None
+            section_reads = read_blob.call_count
+            log = loaded["ground_truth_log"]
+
+            assert len(log) == 600
+            assert log[-3:] == ["[dm] Entry 597", "[dm] Entry 598", "[dm] Entry 599"]
+            assert read_blob.call_count == section_reads
+            assert log[5] == "[dm] Entry 5"
+            assert read_blob.call_count == section_reads + 1
+
+        assert log == [f"[dm] Entry {i}" for i in range(600)]
+
+    def test_saved_segments_are_released_and_not_rewritten(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Later saves reuse stored segments instead of re-serializing them."""
+        import persistence
+
+        state = self._long_state(sample_game_state, 600)
+        save_checkpoint(state, "001", 1, update_metadata=False)
+        log = state["ground_truth_log"]
+        assert not any(segment.resident for segment in log.segments)  # type: ignore[union-attr]
+
+        log.append("[dm] One more")
+        with patch.object(
+            persistence, "_write_blob", wraps=persistence._write_blob
+        ) as write_blob:
+            save_checkpoint(state, "001", 2, update_metadata=False)
+
+        written = [c.args[1] for c in write_blob.call_args_list]
+        assert not any(isinstance(payload, list) for payload in written)
+        loaded = load_checkpoint("001", 2)
+        assert loaded is not None
+        assert loaded["ground_truth_log"][-1] == "[dm] One more"
+
+    def test_segments_from_another_store_are_copied(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Saving into a different session writes the segments it lacks."""
+        state = self._long_state(sample_game_state, 300)
+        save_checkpoint(state, "001", 1, update_metadata=False)
+        loaded = load_checkpoint("001", 1)
+        assert loaded is not None
+
+        save_checkpoint(loaded, "002", 1, update_metadata=False)
+        import shutil
+
+        shutil.rmtree(temp_campaigns_dir / "session_001")
+        from models import clear_log_segment_cache
+
+        clear_log_segment_cache()
+        copied = load_checkpoint("002", 1)
+
+        assert copied is not None
+        assert copied["ground_truth_log"][0] == "[dm] Entry 0"
+
+    def test_garbage_collection_keeps_referenced_segments(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Segments referenced by a manifest survive collection."""
+        from models import clear_log_segment_cache
+        from persistence import collect_garbage
+
+        state = self._long_state(sample_game_state, 300)
+        save_checkpoint(state, "001", 1, update_metadata=False)
+
+        assert collect_garbage("001", grace_seconds=0) == 0
+        clear_log_segment_cache()
+        loaded = load_checkpoint("001", 1)
+        assert loaded is not None
+        assert loaded["ground_truth_log"][0] == "[dm] Entry 0"
+
+    def test_checkpoint_info_counts_segmented_entries(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Checkpoint metadata counts segment entries without loading them."""
+        from models import LOG_SEGMENT_SIZE
+        from persistence import get_checkpoint_info
+
+        state = self._long_state(sample_game_state, LOG_SEGMENT_SIZE)
+        save_checkpoint(state, "001", 1, update_metadata=False)
+
+        info = get_checkpoint_info("001", 1)
+
+        assert info is not None
+        assert info.message_count == LOG_SEGMENT_SIZE
+        assert info.brief_context == f"Entry {LOG_SEGMENT_SIZE - 1}"
+
+
+class TestCheckpointReadCache:
+    """Tests for load_latest_checkpoint_cached."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Generator[None, None, None]:
+        from persistence import clear_checkpoint_cache
+
+        clear_checkpoint_cache()
+        yield
+        clear_checkpoint_cache()
+
+    def test_empty_session_returns_none(self, temp_campaigns_dir: Path) -> None:
+        """A session without checkpoints yields (None, None)."""
+        from persistence import load_latest_checkpoint_cached
+
+        ensure_session_dir("001")
+
+        assert load_latest_checkpoint_cached("001") == (None, None)
+
+    def test_repeat_read_reuses_state(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """An unchanged checkpoint is deserialized only once."""
+        from persistence import load_latest_checkpoint_cached
+
+        save_checkpoint(sample_game_state, "001", 1, update_metadata=False)
+
+        with patch("persistence.load_checkpoint", wraps=load_checkpoint) as mock_load:
+            turn, first = load_latest_checkpoint_cached("001")
+            _, second = load_latest_checkpoint_cached("001")
+
+        assert turn == 1
+        assert first is not None
+        assert second is first
+        assert mock_load.call_count == 1
+
+    def test_save_invalidates_cached_state(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Re-saving the same turn is picked up on the next read."""
+        from persistence import load_latest_checkpoint_cached
+
+        save_checkpoint(sample_game_state, "001", 1, update_metadata=False)
+        _, first = load_latest_checkpoint_cached("001")
+
+        sample_game_state["ground_truth_log"].append("[rogue] I pick the lock.")
+        save_checkpoint(sample_game_state, "001", 1, update_metadata=False)
+        _, second = load_latest_checkpoint_cached("001")
+
+        assert first is not None and second is not None
+        assert second is not first
+        assert second["ground_truth_log"][-1] == "[rogue] I pick the lock."
+
+    def test_new_turn_becomes_latest(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """Saving a later turn changes the turn served."""
+        from persistence import load_latest_checkpoint_cached
+
+        save_checkpoint(sample_game_state, "001", 1, update_metadata=False)
+        assert load_latest_checkpoint_cached("001")[0] == 1
+
+        save_checkpoint(sample_game_state, "001", 2, update_metadata=False)
+        assert load_latest_checkpoint_cached("001")[0] == 2
+
+    def test_least_recently_used_entry_evicted(
+        self, temp_campaigns_dir: Path, sample_game_state: GameState
+    ) -> None:
+        """The cache holds at most CHECKPOINT_CACHE_SIZE states."""
+        import persistence
+        from persistence import load_latest_checkpoint_cached
+
+        for n in range(1, 4):
+            save_checkpoint(sample_game_state, f"00{n}", 1, update_metadata=False)
+
+        with patch.object(persistence, "CHECKPOINT_CACHE_SIZE", 2):
+            _, first = load_latest_checkpoint_cached("001")
+            load_latest_checkpoint_cached("002")
+            load_latest_checkpoint_cached("003")
+            _, reloaded = load_latest_checkpoint_cached("001")
+
+            assert len(persistence._checkpoint_cache) == 2
+        assert reloaded is not first
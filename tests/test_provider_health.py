@@ -0,0 +1,193 @@
+"""Tests for provider circuit breakers and health probes (provider_health.py)."""
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from langchain_core.messages import AIMessage
+
+from provider_health import (
+    CircuitBreaker,
+    ProviderHealth,
+    ProviderUnavailableError,
+    get_provider_health,
+)
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_after_consecutive_tripping_failures(self) -> None:
+        """Timeouts and rate limits open the breaker at the threshold."""
+        breaker = CircuitBreaker(failure_threshold=3, cooldown=60, clock=_Clock())
+        breaker.record_failure("timeout")
+        breaker.record_failure("rate_limit")
+        assert breaker.state == "closed"
+        breaker.record_failure("timeout")
+
+        assert breaker.state == "open"
+        assert not breaker.allow_request()
+        assert breaker.last_error_type == "timeout"
+        assert breaker.retry_after == 60
+
+    def test_non_transient_errors_do_not_count(self) -> None:
+        """Auth errors never open the breaker."""
+        breaker = CircuitBreaker(failure_threshold=1, clock=_Clock())
+        breaker.record_failure("auth_error")
+        assert breaker.state == "closed"
+
+    def test_success_resets_failure_count(self) -> None:
+        """Failures must be consecutive to open the breaker."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=_Clock())
+        breaker.record_failure("timeout")
+        breaker.record_success()
+        breaker.record_failure("timeout")
+        assert breaker.state == "closed"
+
+    def test_half_open_allows_one_trial(self) -> None:
+        """After the cooldown one trial call goes through."""
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=60, clock=clock)
+        breaker.record_failure("network_error")
+        clock.now += 60
+
+        assert breaker.state == "half_open"
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.allow_request()
+
+    def test_failed_trial_reopens(self) -> None:
+        """A failed half-open trial starts a new cooldown."""
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=3, cooldown=60, clock=clock)
+        for _ in range(3):
+            breaker.record_failure("timeout")
+        clock.now += 60
+        assert breaker.allow_request()
+
+        breaker.record_failure("timeout")
+        assert breaker.state == "open"
+        assert breaker.retry_after == 60
+
+    def test_abandoned_trial_expires(self) -> None:
+        """A trial that never reports back stops blocking after a cooldown."""
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=60, clock=clock)
+        breaker.record_failure("timeout")
+        clock.now += 60
+        assert breaker.allow_request()
+        clock.now += 60
+        assert breaker.allow_request()
+
+
+class TestProviderHealth:
+    """Tests for the registry and its probes."""
+
+    def test_first_unavailable(self) -> None:
+        """Only providers with an open breaker are reported."""
+        health = ProviderHealth(failure_threshold=1)
+        health.record_failure("ollama", "timeout")
+        assert health.first_unavailable(["gemini", "ollama"]) == "ollama"
+        assert health.first_unavailable(["gemini"]) is None
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        ("status", "healthy"),
+        [(200, True), (401, True), (429, False), (503, False)],
+    )
+    async def test_probe_status_codes(self, status: int, healthy: bool) -> None:
+        """Rate limits and server errors fail a probe; other answers pass."""
+        health = ProviderHealth(failure_threshold=1)
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(status))
+        )
+        with patch(
+            "provider_health._probe_request",
+            return_value=("http://ollama:11434/api/tags", {}),
+        ):
+            assert await health.probe("ollama", client) is healthy
+        await client.aclose()
+
+        assert health.breaker("ollama").is_available() is healthy
+        assert not health.is_stale("ollama")
+
+    @pytest.mark.anyio
+    async def test_probe_connection_error(self) -> None:
+        """An unreachable server opens the breaker as a network error."""
+
+        def refuse(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection refused")
+
+        health = ProviderHealth(failure_threshold=1)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(refuse))
+        with patch(
+            "provider_health._probe_request",
+            return_value=("http://ollama:11434/api/tags", {}),
+        ):
+            assert await health.probe("ollama", client) is False
+        await client.aclose()
+
+        assert health.breaker("ollama").last_error_type == "network_error"
+
+    @pytest.mark.anyio
+    async def test_unprobeable_provider_is_skipped(self) -> None:
+        """Providers without a probe target (no API key) are not probed."""
+        health = ProviderHealth()
+        with patch("provider_health._probe_request", return_value=None):
+            assert await health.probe("claude") is None
+        assert health.is_stale("claude")
+
+
+class TestInvokeLlmIntegration:
+    """Tests for agents._invoke_llm feeding the breakers."""
+
+    _labels = {
+        "session_id": "001",
+        "provider": "ollama",
+        "model": "qwen3:14b",
+        "agent_name": "fighter",
+    }
+
+    def test_timeouts_open_breaker_and_fail_fast(self) -> None:
+        """After repeated timeouts the next call is not attempted."""
+        from agents import _invoke_llm
+
+        model = MagicMock()
+        model.invoke.side_effect = TimeoutError("Request timed out")
+        threshold = get_provider_health().breaker("ollama").failure_threshold
+
+        for _ in range(threshold):
+            with pytest.raises(TimeoutError):
+                _invoke_llm(model, [], **self._labels)
+        with pytest.raises(ProviderUnavailableError, match="timeout"):
+            _invoke_llm(model, [], **self._labels)
+
+        assert model.invoke.call_count == threshold
+
+    def test_success_is_recorded(self) -> None:
+        """A successful call resets the provider's failure count."""
+        from agents import _invoke_llm
+
+        model = MagicMock()
+        model.invoke.side_effect = [
+            TimeoutError("Request timed out"),
+            AIMessage(content="ok"),
+        ]
+        with pytest.raises(TimeoutError):
+            _invoke_llm(model, [], **self._labels)
+        _invoke_llm(model, [], **self._labels)
+
+        assert get_provider_health().breaker("ollama").consecutive_failures == 0
@@ -756,13 +756,17 @@ class TestCheckpointWithSecrets:
         with patch("persistence.CAMPAIGNS_DIR", temp_campaigns_dir):
             path = save_checkpoint(state, "001", 1)
 
-        # Verify file contains agent_secrets
+        # Verify the checkpoint references agent_secrets (stored as blobs)
         content = path.read_text(encoding="utf-8")
         data = json.loads(content)
 
-        assert "agent_secrets" in data
-        assert first_agent in data["agent_secrets"]
-        assert len(data["agent_secrets"][first_agent]["whispers"]) == 1
+        assert "agent_secrets" in data["sections"]
+        assert first_agent in data["sections"]["agent_secrets"]
+
+        with patch("persistence.CAMPAIGNS_DIR", temp_campaigns_dir):
+            loaded = load_checkpoint("001", 1)
+        assert loaded is not None
+        assert len(loaded["agent_secrets"][first_agent].whispers) == 1
 
     def test_load_checkpoint_restores_secrets(self, temp_campaigns_dir: Path) -> None:
         """Test load_checkpoint restores agent_secrets correctly."""
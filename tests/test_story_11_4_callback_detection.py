@@ -984,6 +984,52 @@ class TestExtractNarrativeElementsIntegration:
         assert elem is not None
         assert 30 in elem.turns_referenced
 
+    @patch("memory._extractor_cache", {})
+    @patch("memory.get_config")
+    def test_only_referenced_elements_are_copied(self, mock_config: MagicMock) -> None:
+        """Test untouched elements are shared and the input store is unchanged."""
+        mock_cfg = MagicMock()
+        mock_cfg.agents.extractor.provider = "gemini"
+        mock_cfg.agents.extractor.model = "gemini-1.5-flash"
+        mock_config.return_value = mock_cfg
+
+        skrix = _make_element(
+            name="Skrix the Goblin", turn_introduced=5, last_referenced_turn=25
+        )
+        key = _make_element(
+            name="Silver Key",
+            element_type="item",
+            description="Opens the vault door",
+            turn_introduced=20,
+            last_referenced_turn=25,
+        )
+        callback_db = NarrativeElementStore(elements=[skrix, key])
+        state = _make_game_state(
+            callback_database=callback_db,
+            callback_log=CallbackLog(),
+        )
+
+        with patch.object(
+            __import__("memory").NarrativeElementExtractor,
+            "extract_elements",
+            return_value=[],
+        ):
+            from memory import extract_narrative_elements
+
+            result = extract_narrative_elements(
+                state,
+                "The party spots Skrix the Goblin near the cave.",
+                turn_number=30,
+            )
+
+        updated_db = result["callback_database"]
+        assert updated_db is not callback_db
+        assert updated_db.elements[1] is key
+        assert updated_db.elements[0] is not skrix
+        assert 30 in updated_db.elements[0].turns_referenced
+        assert 30 not in skrix.turns_referenced
+        assert skrix.last_referenced_turn == 25
+
     @patch("memory._extractor_cache", {})
     @patch("memory.get_config")
     def test_detection_failure_does_not_block_extraction(
@@ -19,6 +19,7 @@ from persistence import (
     ensure_fork_dir,
     get_fork_dir,
     get_fork_registry_path,
+    get_object_store_dir,
     list_forks,
     load_checkpoint,
     load_fork_registry,
@@ -500,7 +501,9 @@ class TestCreateFork:
         fork_dir = get_fork_dir(session_id, "001")
         fork_checkpoint = fork_dir / "turn_001.json"
         json_content = fork_checkpoint.read_text(encoding="utf-8")
-        restored = deserialize_game_state(json_content)
+        restored = deserialize_game_state(
+            json_content, get_object_store_dir(session_id)
+        )
         assert restored["current_turn"] == sample_game_state["current_turn"]
 
     def test_fork_metadata_correct(
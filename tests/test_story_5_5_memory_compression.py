@@ -162,8 +162,8 @@ class TestGetTotalContextTokens:
         manager = MemoryManager(state)
         result = manager.get_total_context_tokens("dm")
 
-        # Should match estimate_tokens for the joined buffer
-        expected = estimate_tokens("\n".join(buffer))
+        # Should match estimate_tokens summed over the buffer entries
+        expected = sum(estimate_tokens(entry) for entry in buffer)
         assert result == expected
         assert result > 0
 
@@ -197,7 +197,7 @@ class TestGetTotalContextTokens:
         from agents import format_character_facts
 
         summary_tokens = estimate_tokens(memory.long_term_summary)
-        buffer_tokens = estimate_tokens("\n".join(memory.short_term_buffer))
+        buffer_tokens = sum(estimate_tokens(e) for e in memory.short_term_buffer)
         facts_tokens = estimate_tokens(format_character_facts(memory.character_facts))  # type: ignore[arg-type]
 
         expected = summary_tokens + buffer_tokens + facts_tokens
@@ -652,7 +652,8 @@ class TestPerAgentIsolation:
             manager.compress_buffer("fighter")
 
         # Fighter should still have been compressed despite DM failure
-        assert "Fighter summary" in state["agent_memories"]["fighter"].long_term_summary
+        fighter_episodes = state["agent_memories"]["fighter"].episodes
+        assert [e.summary for e in fighter_episodes] == ["Fighter summary"]
 
 
 # =============================================================================
@@ -943,8 +944,8 @@ class TestMemoryCompressionIntegration:
         # 1. Buffer should have only recent 3 entries
         assert len(state["agent_memories"]["dm"].short_term_buffer) == 3
 
-        # 2. Summary should be populated
-        assert state["agent_memories"]["dm"].long_term_summary != ""
+        # 2. An episode should be recorded
+        assert len(state["agent_memories"]["dm"].episodes) == 1
 
         # 3. Total context should be under limit
         assert manager.is_total_context_over_limit("dm") is False
@@ -977,7 +978,8 @@ class TestMemoryCompressionIntegration:
 
         # DM should have been compressed
         assert len(result["agent_memories"]["dm"].short_term_buffer) == 3
-        assert "Compressed summary" in result["agent_memories"]["dm"].long_term_summary
+        dm_episodes = result["agent_memories"]["dm"].episodes
+        assert [e.summary for e in dm_episodes] == ["Compressed summary"]
 
 
 # =============================================================================
@@ -1366,10 +1368,8 @@ class TestUnicodeAndSpecialCharacters:
 
         tokens = estimate_tokens(cjk_text)
 
-        # CJK uses character-based estimate (~0.5 tokens per char)
-        # 24 chars * 0.5 = ~12 tokens
-        assert tokens > 0
-        assert tokens < len(cjk_text)  # Should be less than char count
+        # CJK is counted per character, not as a single word
+        assert tokens >= len(cjk_text) // 2
 
     def test_mixed_script_text_estimation(self) -> None:
         """Test token estimation with mixed scripts."""
@@ -1570,15 +1570,14 @@ class TestTokenEstimationEdgeCases:
     def test_very_long_word(self) -> None:
         """Test token estimation for a very long single word.
 
-        When text has very few words but many characters (>20), the
-        estimate_tokens function uses character-based estimation (~0.5 per char)
-        to handle potential CJK or non-space-delimited text.
+        Words longer than LONG_WORD_CHARS are unbroken runs, so
+        estimate_tokens counts them by characters (~4 chars per token).
         """
         long_word = "a" * 1000
         result = estimate_tokens(long_word)
         # 1 word but 1000 chars triggers character-based estimate
-        # 1000 * 0.5 = 500 tokens
-        assert result == 500
+        # 1000 / 4 = 250 tokens
+        assert result == 250
 
     def test_mixed_whitespace_delimiters(self) -> None:
         """Test token estimation with mixed whitespace."""
@@ -1742,39 +1741,10 @@ class TestBoundaryConditions:
 
 
 class TestSummaryMerging:
-    """Tests for the _merge_summaries helper function."""
-
-    def test_merge_with_empty_existing(self) -> None:
-        """Test merging when existing summary is empty."""
-        from memory import _merge_summaries
-
-        result = _merge_summaries("", "New summary content")
-        assert result == "New summary content"
-
-    def test_merge_with_existing_summary(self) -> None:
-        """Test merging with existing summary content."""
-        from memory import _merge_summaries
-
-        result = _merge_summaries("Old summary", "New summary")
-        assert "Old summary" in result
-        assert "New summary" in result
-        assert "---" in result  # Separator
-
-    def test_merge_preserves_formatting(self) -> None:
-        """Test that merge preserves newlines in summaries."""
-        from memory import _merge_summaries
-
-        existing = "Line 1\nLine 2"
-        new = "Line 3\nLine 4"
-        result = _merge_summaries(existing, new)
-
-        assert "Line 1" in result
-        assert "Line 2" in result
-        assert "Line 3" in result
-        assert "Line 4" in result
+    """Tests for combining new summaries with the standing summary."""
 
     def test_multiple_merges_accumulate(self, empty_game_state: GameState) -> None:
-        """Test that multiple compress_buffer calls accumulate summaries."""
+        """Test that compress_buffer adds episodes beside the standing summary."""
         state = empty_game_state
         state["agent_memories"]["dm"] = AgentMemory(
             short_term_buffer=["Event " + str(i) for i in range(10)],
@@ -1791,10 +1761,9 @@ class TestSummaryMerging:
 
             manager.compress_buffer("dm")
 
-        final_summary = state["agent_memories"]["dm"].long_term_summary
-        assert "Initial summary" in final_summary
-        assert "New events summary" in final_summary
-        assert "---" in final_summary
+        memory = state["agent_memories"]["dm"]
+        assert memory.long_term_summary == "Initial summary"
+        assert [e.summary for e in memory.episodes] == ["New events summary"]
 
 
 # =============================================================================
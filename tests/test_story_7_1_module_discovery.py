@@ -10,12 +10,18 @@ This test file covers:
 """
 
 import json
+import threading
+from collections.abc import Generator
 from datetime import datetime
+from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import ValidationError
 
+from models import ModuleDiscoveryResult
+
 # =============================================================================
 # Task 1: ModuleInfo Model Tests
 # =============================================================================
@@ -784,6 +790,212 @@ class TestDiscoverModulesExports:
         assert "MODULE_DISCOVERY_RETRY_PROMPT" in agents.__all__
 
 
+# =============================================================================
+# Module Discovery Cache Tests
+# =============================================================================
+
+
+@pytest.fixture
+def discovery_cache_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    """Point the module discovery cache at a temp dir with a clean memory layer."""
+    import agents
+
+    cache_dir = tmp_path / "module_discovery"
+    agents.clear_module_discovery_cache()
+    with patch("agents.MODULE_DISCOVERY_CACHE_DIR", cache_dir):
+        yield cache_dir
+    agents.clear_module_discovery_cache()
+
+
+def _discovery_result(name: str = "Curse of Strahd") -> ModuleDiscoveryResult:
+    """Create a one-module discovery result."""
+    from models import ModuleInfo
+
+    return ModuleDiscoveryResult(
+        modules=[ModuleInfo(number=1, name=name, description="A module.")],
+        provider="gemini",
+        model="gemini-1.5-flash",
+        timestamp="2026-01-01T00:00:00Z",
+    )
+
+
+class TestModuleDiscoveryCache:
+    """Tests for the persistent stale-while-revalidate discovery cache."""
+
+    def test_miss_runs_discovery_and_persists(self, discovery_cache_dir: Path) -> None:
+        """Test a cache miss queries the LLM and writes the result to disk."""
+        from agents import discover_modules_cached
+        from models import DMConfig
+
+        with patch("agents.discover_modules", return_value=_discovery_result()) as m:
+            result = discover_modules_cached(DMConfig())
+
+        assert m.call_count == 1
+        assert result.cached is False
+        files = list(discovery_cache_dir.glob("*.json"))
+        assert len(files) == 1
+        assert json.loads(files[0].read_text())["result"]["modules"][0]["name"] == (
+            "Curse of Strahd"
+        )
+
+    def test_hit_served_without_llm(self, discovery_cache_dir: Path) -> None:
+        """Test a fresh cached result is returned without calling the LLM."""
+        from agents import discover_modules_cached
+        from models import DMConfig
+
+        with patch("agents.discover_modules", return_value=_discovery_result()):
+            discover_modules_cached(DMConfig())
+        with patch("agents.discover_modules") as m:
+            result = discover_modules_cached(DMConfig())
+
+        m.assert_not_called()
+        assert result.cached is True
+        assert result.modules[0].name == "Curse of Strahd"
+
+    def test_survives_restart(self, discovery_cache_dir: Path) -> None:
+        """Test the disk cache is used after the memory layer is cleared."""
+        from agents import clear_module_discovery_cache, discover_modules_cached
+        from models import DMConfig
+
+        with patch("agents.discover_modules", return_value=_discovery_result()):
+            discover_modules_cached(DMConfig())
+        clear_module_discovery_cache()
+        with patch("agents.discover_modules") as m:
+            result = discover_modules_cached(DMConfig())
+
+        m.assert_not_called()
+        assert result.cached is True
+
+    def test_keyed_on_provider_and_model(self, discovery_cache_dir: Path) -> None:
+        """Test a different DM model does not reuse another model's entry."""
+        from agents import discover_modules_cached
+        from models import DMConfig
+
+        with patch("agents.discover_modules", return_value=_discovery_result()) as m:
+            discover_modules_cached(DMConfig(model="model-a"))
+            discover_modules_cached(DMConfig(model="model-b"))
+            discover_modules_cached(DMConfig(provider="claude", model="model-a"))
+
+        assert m.call_count == 3
+
+    def test_prompt_version_change_invalidates(self, discovery_cache_dir: Path) -> None:
+        """Test entries written under an older prompt version are ignored."""
+        from agents import clear_module_discovery_cache, discover_modules_cached
+        from models import DMConfig
+
+        with patch("agents.discover_modules", return_value=_discovery_result()):
+            discover_modules_cached(DMConfig())
+        clear_module_discovery_cache()
+        with (
+            patch("agents.MODULE_DISCOVERY_PROMPT_VERSION", "changed"),
+            patch("agents.discover_modules", return_value=_discovery_result()) as m,
+        ):
+            result = discover_modules_cached(DMConfig())
+
+        assert m.call_count == 1
+        assert result.cached is False
+
+    def test_stale_entry_served_and_refreshed(self, discovery_cache_dir: Path) -> None:
+        """Test a stale entry is returned immediately and refreshed after."""
+        import agents
+        from agents import discover_modules_cached
+        from models import DMConfig
+
+        with patch("agents.discover_modules", return_value=_discovery_result()):
+            discover_modules_cached(DMConfig())
+
+        threads: list[threading.Thread] = []
+        real_thread = agents.threading.Thread
+
+        def _capture_thread(*args: Any, **kwargs: Any) -> threading.Thread:
+            thread = real_thread(*args, **kwargs)
+            threads.append(thread)
+            return thread
+
+        with (
+            patch("agents.MODULE_DISCOVERY_CACHE_TTL", -1),
+            patch("agents.threading.Thread", side_effect=_capture_thread),
+            patch(
+                "agents.discover_modules", return_value=_discovery_result("Tomb")
+            ) as m,
+        ):
+            stale = discover_modules_cached(DMConfig())
+            for thread in threads:
+                thread.join(timeout=5)
+
+        assert stale.modules[0].name == "Curse of Strahd"
+        assert m.call_count == 1
+        with patch("agents.discover_modules") as m2:
+            fresh = discover_modules_cached(DMConfig())
+        m2.assert_not_called()
+        assert fresh.modules[0].name == "Tomb"
+
+    def test_force_refresh_bypasses_cache(self, discovery_cache_dir: Path) -> None:
+        """Test force_refresh always queries the LLM."""
+        from agents import discover_modules_cached
+        from models import DMConfig
+
+        with patch("agents.discover_modules", return_value=_discovery_result()) as m:
+            discover_modules_cached(DMConfig())
+            result = discover_modules_cached(DMConfig(), force_refresh=True)
+
+        assert m.call_count == 2
+        assert result.cached is False
+
+    def test_empty_result_not_cached(self, discovery_cache_dir: Path) -> None:
+        """Test an empty module list is not persisted."""
+        from agents import discover_modules_cached
+        from models import DMConfig, ModuleDiscoveryResult
+
+        empty = ModuleDiscoveryResult(
+            modules=[], provider="gemini", model="m", timestamp="t"
+        )
+        with patch("agents.discover_modules", return_value=empty) as m:
+            discover_modules_cached(DMConfig())
+            discover_modules_cached(DMConfig())
+
+        assert m.call_count == 2
+        assert not discovery_cache_dir.exists() or not list(
+            discovery_cache_dir.glob("*.json")
+        )
+
+    def test_corrupt_cache_file_is_a_miss(self, discovery_cache_dir: Path) -> None:
+        """Test an unreadable cache file falls back to the LLM."""
+        from agents import (
+            _module_discovery_cache_key,
+            _module_discovery_cache_path,
+            discover_modules_cached,
+        )
+        from models import DMConfig
+
+        path = _module_discovery_cache_path(_module_discovery_cache_key(DMConfig()))
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+        with patch("agents.discover_modules", return_value=_discovery_result()) as m:
+            result = discover_modules_cached(DMConfig())
+
+        assert m.call_count == 1
+        assert result.modules[0].name == "Curse of Strahd"
+
+    def test_prewarm_skips_fresh_and_dedupes(self, discovery_cache_dir: Path) -> None:
+        """Test prewarm only refreshes missing entries, once per key."""
+        from agents import discover_modules_cached, prewarm_module_discovery
+        from models import DMConfig
+
+        with patch("agents.discover_modules", return_value=_discovery_result()):
+            discover_modules_cached(DMConfig(model="warm"))
+
+        with patch(
+            "agents._refresh_module_discovery_in_background", return_value=True
+        ) as refresh:
+            started = prewarm_module_discovery(
+                [DMConfig(model="warm"), DMConfig(model="cold"), DMConfig(model="cold")]
+            )
+
+        assert started == 1
+        assert refresh.call_args.args[0].model == "cold"
+
+
 # =============================================================================
 # Task 3: Session State Caching Tests
 # =============================================================================
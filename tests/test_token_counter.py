@@ -0,0 +1,136 @@
+"""Tests for token counting (token_counter.py)."""
+
+from collections.abc import Generator
+
+import pytest
+
+import token_counter
+from token_counter import (
+    HeuristicTokenCounter,
+    TokenCounter,
+    clear_token_count_cache,
+    count_tokens,
+    get_token_counter,
+    model_family,
+    register_token_counter,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_counters() -> Generator[None, None, None]:
+    clear_token_count_cache()
+    yield
+    token_counter._registered.clear()
+    clear_token_count_cache()
+
+
+@pytest.fixture
+def heuristic_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Resolve families to the heuristic even when tiktoken is installed."""
+
+    def _unavailable(encoding_name: str = "cl100k_base") -> TokenCounter:
+        raise ImportError("tiktoken disabled for this test")
+
+    monkeypatch.setattr(token_counter, "TiktokenTokenCounter", _unavailable)
+
+
+class _CountingCounter(TokenCounter):
+    """Counter that counts characters and records how often it ran."""
+
+    name = "test:chars"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def count(self, text: str) -> int:
+        self.calls += 1
+        return len(text)
+
+
+class TestTokenCounter:
+    """Tests for the TokenCounter base class."""
+
+    def test_subclass_must_implement_count(self) -> None:
+        """A counter without count() cannot be instantiated."""
+
+        class _Incomplete(TokenCounter):
+            name = "test:incomplete"
+
+        with pytest.raises(TypeError):
+            _Incomplete()  # type: ignore[abstract]
+
+
+class TestModelFamily:
+    """Tests for model_family()."""
+
+    @pytest.mark.parametrize(
+        ("provider", "model", "family"),
+        [
+            ("claude", "claude-3-haiku-20240307", "claude"),
+            ("gemini", "gemini-1.5-flash", "gemini"),
+            ("ollama", "qwen3:14b", "qwen"),
+            ("ollama", "library/llama3.1:8b", "llama"),
+            ("ollama", "", "default"),
+            ("", "", "default"),
+        ],
+    )
+    def test_families(self, provider: str, model: str, family: str) -> None:
+        """Hosted providers map to themselves, Ollama to the model base."""
+        assert model_family(provider, model) == family
+
+
+class TestHeuristicTokenCounter:
+    """Tests for the calibrated fallback estimate."""
+
+    def test_prose_uses_words(self) -> None:
+        """Ordinary prose is counted at 1.3 tokens per word."""
+        counter = HeuristicTokenCounter("test")
+        assert counter.count("hello world this is a test") == 7
+
+    def test_cjk_counted_per_character(self) -> None:
+        """CJK characters are counted individually alongside Latin words."""
+        counter = HeuristicTokenCounter("test", cjk_tokens_per_char=1.0)
+        # 2 Latin words (2.6) + 4 CJK chars (4.0) = 6.6 -> 6
+        assert counter.count("The 竜が来た dragon") == 6
+
+    @pytest.mark.usefixtures("heuristic_only")
+    def test_family_calibration(self) -> None:
+        """Claude's heuristic counts more tokens per character than default."""
+        text = "a" * 700  # one unbroken run, counted by characters
+        assert count_tokens(text, "claude", "claude-3-haiku") == 200
+        assert count_tokens(text) == 175
+
+
+class TestCountTokens:
+    """Tests for registration and the memo cache."""
+
+    @pytest.mark.usefixtures("heuristic_only")
+    def test_registered_counter_is_used_and_memoized(self) -> None:
+        """A registered counter serves its family; repeats hit the cache."""
+        counter = _CountingCounter()
+        register_token_counter("qwen", counter)
+
+        assert get_token_counter("ollama", "qwen3:14b") is counter
+        assert count_tokens("the goblin", "ollama", "qwen3:14b") == 10
+        assert count_tokens("the goblin", "ollama", "qwen3:14b") == 10
+        assert counter.calls == 1
+
+        # Other families are unaffected
+        assert count_tokens("the goblin", "gemini", "gemini-1.5-flash") == 2
+
+    def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Least recently used counts are evicted past the cache size."""
+        monkeypatch.setattr(token_counter, "TOKEN_COUNT_CACHE_SIZE", 2)
+        counter = _CountingCounter()
+        register_token_counter("default", counter)
+
+        for text in ("one", "two", "three"):
+            count_tokens(text)
+        count_tokens("three")
+        assert counter.calls == 3
+        count_tokens("one")
+        assert counter.calls == 4
+
+    def test_empty_text(self) -> None:
+        """Empty text is zero tokens without consulting a counter."""
+        assert count_tokens("", "claude", "claude-3-haiku") == 0
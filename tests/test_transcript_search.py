@@ -0,0 +1,124 @@
+"""Tests for the transcript full-text search index."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from models import TranscriptEntry
+from persistence import append_transcript_entry
+from transcript_search import (
+    find_turns,
+    get_search_index_path,
+    index_transcript_entries,
+    search_transcript,
+)
+
+
+@pytest.fixture
+def temp_campaigns_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    """Patch CAMPAIGNS_DIR to a temp directory for test isolation."""
+    temp_campaigns = tmp_path / "campaigns"
+    temp_campaigns.mkdir()
+    with patch("persistence.CAMPAIGNS_DIR", temp_campaigns):
+        yield temp_campaigns
+
+
+def _entry(turn: int, agent: str, content: str) -> TranscriptEntry:
+    """Create a transcript entry."""
+    return TranscriptEntry(
+        turn=turn, timestamp="2026-01-01T00:00:00Z", agent=agent, content=content
+    )
+
+
+def _append(session_id: str, entries: list[TranscriptEntry]) -> None:
+    """Append entries to the transcript and the index, as a round does."""
+    for entry in entries:
+        append_transcript_entry(session_id, entry)
+    index_transcript_entries(session_id, entries)
+
+
+class TestTranscriptSearch:
+    """Tests for indexing and searching transcripts."""
+
+    def test_search_ranks_and_snippets(self, temp_campaigns_dir: Path) -> None:
+        """Hits carry turn, agent and a highlighted snippet, best first."""
+        _append(
+            "001",
+            [
+                _entry(1, "dm", "You reach the docks at dusk."),
+                _entry(2, "dm", "A woman named Kalia waves from a boat."),
+                _entry(3, "rogue", "I ask Kalia about the Kalia family crest."),
+            ],
+        )
+
+        hits = search_transcript("001", "when did we meet Kalia?")
+
+        assert [hit.turn for hit in hits] == [3, 2]
+        assert hits[0].agent == "rogue"
+        assert "**Kalia**" in hits[1].snippet
+        assert hits[0].score > hits[1].score
+
+    def test_index_is_incremental(self, temp_campaigns_dir: Path) -> None:
+        """Re-indexing known turns adds nothing; new turns become searchable."""
+        first = [_entry(1, "dm", "The tower of Vex looms.")]
+        _append("001", first)
+        index_transcript_entries("001", first)
+        _append("001", [_entry(2, "fighter", "I climb the tower.")])
+
+        assert find_turns("001", "tower") == [1, 2]
+        assert len(search_transcript("001", "Vex")) == 1
+
+    def test_gap_filled_from_transcript(self, temp_campaigns_dir: Path) -> None:
+        """Turns missed by an earlier failed write are indexed later."""
+        append_transcript_entry("001", _entry(1, "dm", "A goblin ambush!"))
+        _append("001", [_entry(2, "dm", "The goblin flees.")])
+
+        assert find_turns("001", "goblin") == [1, 2]
+
+    def test_missing_index_rebuilt_on_search(self, temp_campaigns_dir: Path) -> None:
+        """Sessions that predate the index are indexed on first search."""
+        append_transcript_entry("001", _entry(1, "dm", "The dragon sleeps."))
+        assert not get_search_index_path("001").exists()
+
+        assert find_turns("001", "dragon") == [1]
+        assert get_search_index_path("001").exists()
+
+    def test_query_syntax_is_literal(self, temp_campaigns_dir: Path) -> None:
+        """FTS5 operators and punctuation in queries do not raise."""
+        _append("001", [_entry(1, "dm", "NEAR the gate, a guard.")])
+
+        assert find_turns("001", 'gate" OR NEAR(*') == [1]
+        assert search_transcript("001", "the of and") == []
+        assert search_transcript("002", "gate") == []
+
+    def test_rewind_replaces_abandoned_turns(self, temp_campaigns_dir: Path) -> None:
+        """After a checkpoint restore the index follows the new timeline."""
+        _append(
+            "001",
+            [
+                _entry(1, "dm", "The caravan sets out."),
+                _entry(2, "dm", "Bandits attack the caravan."),
+                _entry(3, "fighter", "I fight the bandits."),
+            ],
+        )
+        # Restored to turn 1; the transcript now repeats turn 2
+        _append("001", [_entry(2, "dm", "A storm forces the caravan back.")])
+
+        assert find_turns("001", "bandits") == []
+        assert find_turns("001", "caravan") == [1, 2]
+
+    def test_rebuild_after_rewind(self, temp_campaigns_dir: Path) -> None:
+        """A transcript with repeated turns builds an index on first search."""
+        for entry in [
+            _entry(1, "dm", "The caravan sets out."),
+            _entry(2, "dm", "Bandits attack the caravan."),
+            _entry(2, "dm", "A storm forces the caravan back."),
+        ]:
+            append_transcript_entry("001", entry)
+
+        assert find_turns("001", "storm") == [2]
+        assert find_turns("001", "bandits") == []
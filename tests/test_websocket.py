@@ -1015,6 +1015,24 @@ class TestSchemaValidation:
         assert dumped["type"] == "autopilot_stopped"
         assert dumped["reason"] == "user_request"
 
+    def test_ws_autopilot_pacing_schema(self) -> None:
+        """Engine pacing events map to WsAutopilotPacing."""
+        from api.websocket import _engine_event_to_schema
+
+        dumped = _engine_event_to_schema(
+            {
+                "type": "autopilot_pacing",
+                "delay_seconds": 42.0,
+                "avg_round_seconds": 18.5,
+                "rounds_left": 10,
+                "projected_completion": "2026-03-01T13:00:00+00:00",
+            }
+        )
+        assert dumped["type"] == "autopilot_pacing"
+        assert dumped["delay_seconds"] == 42.0
+        assert dumped["token_budget_remaining"] is None
+        assert dumped["projected_completion"] == "2026-03-01T13:00:00+00:00"
+
     def test_ws_error_schema(self) -> None:
         """WsError has correct fields."""
         from api.schemas import WsError
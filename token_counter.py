@@ -0,0 +1,273 @@
+"""Token counting for context budgeting.
+
+Memory compression and the best-scene scanner decide what fits in a
+model's context from token counts. This module picks a counter per
+provider/model family:
+
+1. A counter registered with register_token_counter() for the family
+   (e.g. an exact tokenizer shipped with a local model).
+2. tiktoken, if installed (the "tokenizer" extra): a real local BPE
+   tokenizer. It is exact for its own encodings and a close proxy for
+   Claude, Gemini and Llama-style vocabularies.
+3. A calibrated heuristic that counts words, characters and CJK
+   ideographs separately, so non-space-delimited text is not undercounted.
+
+Counts are memoized in an LRU keyed by (counter, text). Python caches a
+str's hash on the object, so recounting the same buffer entries and log
+lines costs a dictionary lookup (plus a string compare on a hit).
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+__all__ = [
+    "DEFAULT_TOKENS_PER_WORD",
+    "LONG_WORD_CHARS",
+    "TOKEN_COUNT_CACHE_SIZE",
+    "HeuristicTokenCounter",
+    "TiktokenTokenCounter",
+    "TokenCounter",
+    "clear_token_count_cache",
+    "count_tokens",
+    "get_token_counter",
+    "model_family",
+    "register_token_counter",
+]
+
+# Tokens per whitespace-delimited word for English prose
+DEFAULT_TOKENS_PER_WORD = 1.3
+
+# Words longer than this are unbroken runs (URLs, hashes, glued text) and
+# are counted by characters instead of as one word
+LONG_WORD_CHARS = 20
+
+# Counted strings remembered by count_tokens()
+TOKEN_COUNT_CACHE_SIZE = 8192
+
+# Hiragana/katakana, CJK ideographs, Hangul and compatibility ideographs:
+# scripts written without spaces, where BPE vocabularies spend roughly one
+# token per character.
+_CJK_RE = re.compile(
+    "[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]"
+)
+
+
+class TokenCounter(ABC):
+    """Base class for token counters.
+
+    Attributes:
+        name: Identifier used in the memo cache key; counters with the
+            same name must return the same counts.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Count the tokens in text.
+
+        Args:
+            text: Text to count.
+
+        Returns:
+            Token count.
+        """
+
+
+class HeuristicTokenCounter(TokenCounter):
+    """Calibrated estimate for when no local tokenizer is available.
+
+    Latin-script words count tokens_per_word each, except unbroken runs
+    longer than LONG_WORD_CHARS, which are counted by characters. CJK
+    characters are counted individually.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tokens_per_word: float = DEFAULT_TOKENS_PER_WORD,
+        chars_per_token: float = 4.0,
+        cjk_tokens_per_char: float = 1.0,
+    ) -> None:
+        """Initialize the counter.
+
+        Args:
+            name: Counter name for the memo cache.
+            tokens_per_word: Tokens per whitespace-delimited word.
+            chars_per_token: Non-space characters per token.
+            cjk_tokens_per_char: Tokens per CJK character.
+        """
+        self.name = name
+        self.tokens_per_word = tokens_per_word
+        self.chars_per_token = chars_per_token
+        self.cjk_tokens_per_char = cjk_tokens_per_char
+
+    def count(self, text: str) -> int:
+        """Estimate the tokens in text."""
+        if not text:
+            return 0
+        cjk_chars = len(_CJK_RE.findall(text))
+        if cjk_chars:
+            text = _CJK_RE.sub(" ", text)
+        words = 0
+        long_word_chars = 0
+        for word in text.split():
+            if len(word) > LONG_WORD_CHARS:
+                long_word_chars += len(word)
+            else:
+                words += 1
+        return int(
+            words * self.tokens_per_word
+            + long_word_chars / self.chars_per_token
+            + cjk_chars * self.cjk_tokens_per_char
+        )
+
+
+class TiktokenTokenCounter(TokenCounter):
+    """Counter backed by a tiktoken BPE encoding (optional dependency)."""
+
+    def __init__(self, encoding_name: str = "cl100k_base") -> None:
+        """Initialize the counter.
+
+        Args:
+            encoding_name: tiktoken encoding to load.
+
+        Raises:
+            ImportError: If tiktoken is not installed.
+        """
+        import tiktoken
+
+        self.name = f"tiktoken:{encoding_name}"
+        self._encoding: Any = tiktoken.get_encoding(encoding_name)
+
+    def count(self, text: str) -> int:
+        """Count the tokens in text with the BPE encoding."""
+        if not text:
+            return 0
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+# Heuristic calibration per family: (tokens/word, chars/token, tokens/CJK char).
+# Ratios follow the providers' published rules of thumb (Claude ~3.5
+# characters per token, Gemini and Llama-family models ~4).
+_HEURISTIC_CALIBRATION: dict[str, tuple[float, float, float]] = {
+    "claude": (DEFAULT_TOKENS_PER_WORD, 3.5, 1.2),
+    "gemini": (DEFAULT_TOKENS_PER_WORD, 4.0, 1.0),
+    "qwen": (DEFAULT_TOKENS_PER_WORD, 4.0, 0.8),
+    "default": (DEFAULT_TOKENS_PER_WORD, 4.0, 1.0),
+}
+
+_registered: dict[str, TokenCounter] = {}
+_resolved: dict[str, TokenCounter] = {}
+_cache: OrderedDict[tuple[str, str], int] = OrderedDict()
+_lock = threading.Lock()
+
+
+def model_family(provider: str, model: str) -> str:
+    """Map a provider/model pair to a tokenizer family name.
+
+    Args:
+        provider: LLM provider ("gemini", "claude", "ollama", ...).
+        model: Model name, e.g. "qwen3:14b".
+
+    Returns:
+        Family name: the provider for hosted models, the model's base
+        name for Ollama (e.g. "qwen", "llama"), or "default".
+    """
+    provider = provider.lower()
+    if provider in ("claude", "anthropic"):
+        return "claude"
+    if provider == "gemini":
+        return "gemini"
+    if provider == "ollama" and model:
+        base = re.match(r"[a-z]+", model.lower().rsplit("/", 1)[-1])
+        if base:
+            return base.group(0)
+    return "default"
+
+
+def register_token_counter(family: str, counter: TokenCounter) -> None:
+    """Use a specific counter for a model family.
+
+    Args:
+        family: Family name as returned by model_family().
+        counter: Counter to use for that family.
+    """
+    with _lock:
+        _registered[family] = counter
+        _resolved.clear()
+
+
+def _default_counter(family: str) -> TokenCounter:
+    try:
+        return TiktokenTokenCounter()
+    except Exception:
+        # tiktoken missing, or its encoding could not be loaded (offline)
+        pass
+    tokens_per_word, chars_per_token, cjk = _HEURISTIC_CALIBRATION.get(
+        family, _HEURISTIC_CALIBRATION["default"]
+    )
+    return HeuristicTokenCounter(
+        f"heuristic:{family}", tokens_per_word, chars_per_token, cjk
+    )
+
+
+def get_token_counter(provider: str = "", model: str = "") -> TokenCounter:
+    """Get the token counter for a provider/model.
+
+    Args:
+        provider: LLM provider; empty for the default family.
+        model: Model name.
+
+    Returns:
+        The registered counter for the model's family, else tiktoken if
+        installed, else the calibrated heuristic.
+    """
+    family = model_family(provider, model)
+    with _lock:
+        counter = _registered.get(family) or _resolved.get(family)
+    if counter is not None:
+        return counter
+    counter = _default_counter(family)
+    with _lock:
+        return _resolved.setdefault(family, counter)
+
+
+def count_tokens(text: str, provider: str = "", model: str = "") -> int:
+    """Count tokens in text for a provider/model, memoized.
+
+    Args:
+        text: Text to count.
+        provider: LLM provider; empty for the default family.
+        model: Model name.
+
+    Returns:
+        Token count.
+    """
+    if not text:
+        return 0
+    counter = get_token_counter(provider, model)
+    key = (counter.name, text)
+    with _lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return cached
+    tokens = counter.count(text)
+    with _lock:
+        _cache[key] = tokens
+        while len(_cache) > TOKEN_COUNT_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return tokens
+
+
+def clear_token_count_cache() -> None:
+    """Clear memoized counts and resolved per-family counters."""
+    with _lock:
+        _cache.clear()
+        _resolved.clear()
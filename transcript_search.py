@@ -0,0 +1,279 @@
+"""Full-text search over campaign transcripts.
+
+Each session keeps an SQLite FTS5 index of its transcript next to
+transcript.json. The index is fed incrementally: when a round's entries
+are appended to the transcript, index_transcript_entries() adds the same
+entries, so searching a multi-thousand-turn campaign never loads a
+checkpoint or re-reads the transcript.
+
+- Results are ranked with FTS5's BM25, speaker names weighted below the
+  entry text, and come with a highlighted snippet.
+- Queries are plain words, not FTS5 syntax: they are tokenized like
+  episodic memory recall (stop words dropped) and any word may match.
+- A missing or lagging index is rebuilt from transcript.json, so sessions
+  that predate the index, or whose index write failed, catch up on the
+  next write or search.
+- transcript.json is append-only, so after a checkpoint restore it holds
+  the same turn numbers more than once. The latest entry for a turn wins,
+  and turns past the newest entry (the abandoned timeline) are dropped.
+
+find_turns() is the lookup for other subsystems (image generation,
+callback detection) that only need the turns mentioning something.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from collections.abc import Sequence
+from contextlib import closing
+from pathlib import Path
+from typing import NamedTuple
+
+from episodic_memory import tokenize
+from models import TranscriptEntry
+from persistence import get_session_dir, load_transcript
+
+logger = logging.getLogger("autodungeon")
+
+__all__ = [
+    "SEARCH_RESULT_LIMIT",
+    "TranscriptSearchHit",
+    "find_turns",
+    "get_search_index_path",
+    "index_transcript_entries",
+    "rebuild_search_index",
+    "search_transcript",
+]
+
+# Default number of hits returned by search_transcript()
+SEARCH_RESULT_LIMIT = 20
+
+# Tokens of context around the matched words in a snippet
+_SNIPPET_TOKENS = 16
+
+# Markers around matched words in snippets (rendered as bold in markdown)
+_HIGHLIGHT_OPEN = "**"
+_HIGHLIGHT_CLOSE = "**"
+
+# BM25 column weights: entry text counts more than the speaker's name
+_CONTENT_WEIGHT = 1.0
+_AGENT_WEIGHT = 0.5
+
+# Seconds to wait for a concurrent writer (a round appending entries)
+_BUSY_TIMEOUT = 5.0
+
+# The transcript turn number is the rowid, so re-indexing a turn replaces
+# it and max(rowid) is the incremental cursor
+_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS entries USING fts5("
+    "content, agent, tokenize = 'porter unicode61')"
+)
+
+
+class TranscriptSearchHit(NamedTuple):
+    """A transcript entry matching a search.
+
+    Attributes:
+        turn: Transcript turn number (1-indexed, ground_truth_log index + 1).
+        agent: Agent who produced the entry.
+        snippet: Excerpt of the entry with matched words highlighted.
+        score: Relevance (higher is better; only comparable within a search).
+    """
+
+    turn: int
+    agent: str
+    snippet: str
+    score: float
+
+
+def get_search_index_path(session_id: str) -> Path:
+    """Get path to a session's search index.
+
+    Args:
+        session_id: Session ID string.
+
+    Returns:
+        Path to search_index.db in the session directory.
+
+    Raises:
+        ValueError: If session_id contains invalid characters.
+    """
+    return get_session_dir(session_id) / "search_index.db"
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Open a search index, creating its table if needed."""
+    conn = sqlite3.connect(path, timeout=_BUSY_TIMEOUT)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+def _indexed_turns(conn: sqlite3.Connection) -> int:
+    """Highest turn number in the index (0 when empty)."""
+    row = conn.execute("SELECT max(rowid) FROM entries").fetchone()
+    return row[0] or 0
+
+
+def _insert(
+    conn: sqlite3.Connection, entries: Sequence[TranscriptEntry], after: int
+) -> int:
+    """Index entries with turn numbers past the given turn.
+
+    Entries are in transcript order, so for a turn written more than once
+    the last one is kept. Turns after the last entry are removed, since
+    the last entry is the end of the current ground_truth_log.
+
+    Returns:
+        Number of entries added.
+    """
+    rows = [(e.turn, e.content, e.agent) for e in entries if e.turn > after]
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO entries (rowid, content, agent) VALUES (?, ?, ?)",
+            rows,
+        )
+        if entries:
+            conn.execute("DELETE FROM entries WHERE rowid > ?", (entries[-1].turn,))
+    return len(rows)
+
+
+def index_transcript_entries(
+    session_id: str, entries: Sequence[TranscriptEntry]
+) -> None:
+    """Add newly appended transcript entries to the session's index.
+
+    Entries for turns already indexed (after a checkpoint restore) replace
+    them. If the index is missing turns before the first entry (an earlier
+    write failed, or the session predates the index), the gap is filled
+    from transcript.json.
+
+    Errors are logged, not raised: search is a convenience and must not
+    interrupt the game.
+
+    Args:
+        session_id: Session ID string.
+        entries: Entries just appended to transcript.json, in turn order.
+    """
+    if not entries:
+        return
+    try:
+        with closing(_connect(get_search_index_path(session_id))) as conn:
+            indexed = _indexed_turns(conn)
+            if entries[0].turn > indexed + 1:
+                _insert(conn, load_transcript(session_id) or [], indexed)
+            else:
+                _insert(conn, entries, 0)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Failed to index transcript for session %s: %s", session_id, e)
+
+
+def rebuild_search_index(session_id: str) -> int:
+    """Build a session's search index from transcript.json.
+
+    Indexes whatever the index is missing, so calling it on an up-to-date
+    index is cheap. An index this call creates is removed again if the
+    build fails, so the next search retries instead of finding it empty.
+
+    Args:
+        session_id: Session ID string.
+
+    Returns:
+        Number of entries added.
+
+    Raises:
+        sqlite3.Error: If the index cannot be written.
+    """
+    transcript = load_transcript(session_id) or []
+    path = get_search_index_path(session_id)
+    created = not path.exists()
+    try:
+        with closing(_connect(path)) as conn:
+            return _insert(conn, transcript, _indexed_turns(conn))
+    except sqlite3.Error:
+        if created:
+            path.unlink(missing_ok=True)
+        raise
+
+
+def _match_expression(query: str) -> str:
+    """Turn a plain-words query into an FTS5 MATCH expression.
+
+    Every term is quoted, so punctuation and FTS5 operators in the query
+    are searched for literally rather than parsed.
+
+    Returns:
+        Terms joined with OR, or empty string if the query has no terms.
+    """
+    terms = dict.fromkeys(tokenize(query))
+    return " OR ".join(f'"{term}"' for term in terms)
+
+
+def search_transcript(
+    session_id: str, query: str, limit: int = SEARCH_RESULT_LIMIT
+) -> list[TranscriptSearchHit]:
+    """Search a session's transcript.
+
+    Args:
+        session_id: Session ID string.
+        query: Words to look for (e.g. "when did we meet Kalia?").
+        limit: Maximum hits to return.
+
+    Returns:
+        Best matches first; empty if nothing matches or the session has
+        no transcript.
+
+    Raises:
+        ValueError: If session_id contains invalid characters.
+        sqlite3.Error: If the index cannot be read.
+    """
+    expression = _match_expression(query)
+    if not expression or limit <= 0:
+        return []
+    path = get_search_index_path(session_id)
+    if not path.exists():
+        if not path.parent.exists():
+            return []
+        rebuild_search_index(session_id)
+    with closing(_connect(path)) as conn:
+        rows = conn.execute(
+            "SELECT rowid, agent, "
+            "snippet(entries, 0, ?, ?, '...', ?), "
+            "bm25(entries, ?, ?) AS rank "
+            "FROM entries WHERE entries MATCH ? ORDER BY rank LIMIT ?",
+            (
+                _HIGHLIGHT_OPEN,
+                _HIGHLIGHT_CLOSE,
+                _SNIPPET_TOKENS,
+                _CONTENT_WEIGHT,
+                _AGENT_WEIGHT,
+                expression,
+                limit,
+            ),
+        ).fetchall()
+    # FTS5's bm25() is lower-is-better; flip it so scores read naturally
+    return [
+        TranscriptSearchHit(turn=turn, agent=agent, snippet=snippet, score=-rank)
+        for turn, agent, snippet, rank in rows
+    ]
+
+
+def find_turns(
+    session_id: str, query: str, limit: int = SEARCH_RESULT_LIMIT
+) -> list[int]:
+    """Find the turns that best match a query.
+
+    Args:
+        session_id: Session ID string.
+        query: Words to look for.
+        limit: Maximum turns to return.
+
+    Returns:
+        Transcript turn numbers in ascending order; empty on any error.
+    """
+    try:
+        hits = search_transcript(session_id, query, limit)
+    except (sqlite3.Error, OSError, ValueError) as e:
+        logger.warning("Transcript search failed for session %s: %s", session_id, e)
+        return []
+    return sorted(hit.turn for hit in hits)